@@ -0,0 +1,29 @@
+Feature: Catalog cache
+  A corpus should reuse its parsed catalog until the catalog file or journal changes on disk.
+
+  Scenario: Repeated catalog reads reuse the cached view
+    Given I have an initialized corpus at "corpus"
+    When I ingest 2 notes via the Python application programming interface
+    And I load the corpus catalog twice
+    Then both catalog loads are private copies of the cached view
+
+  Scenario: Ingestion updates the cached view without re-reading the catalog
+    Given I have an initialized corpus at "corpus"
+    When I ingest 1 notes via the Python application programming interface
+    And I load the corpus catalog twice
+    And I ingest 1 notes via the Python application programming interface
+    Then the corpus catalog is served from the cache with 2 items
+
+  Scenario: Changes written by another corpus instance invalidate the cache
+    Given I have an initialized corpus at "corpus"
+    When I ingest 1 notes via the Python application programming interface
+    And I load the corpus catalog twice
+    And another corpus instance ingests a note into "corpus"
+    Then the loaded catalog lists 2 items
+
+  Scenario: A loaded catalog is not changed by later ingestion
+    Given I have an initialized corpus at "corpus"
+    When I ingest 1 notes via the Python application programming interface
+    And I load the corpus catalog twice
+    And I ingest 1 notes via the Python application programming interface
+    Then the first loaded catalog still lists 1 items
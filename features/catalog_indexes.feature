@@ -0,0 +1,40 @@
+Feature: Catalog secondary indexes
+  A corpus should look up items by source, content digest, tag, and media type without scanning
+  every catalog item.
+
+  Scenario: Items can be found by digest, tag, and media type
+    Given I have an initialized corpus at "corpus"
+    When I ingest bytes "alpha" with media type "text/plain" and tags "red,blue" via the Python application programming interface
+    And I ingest bytes "alpha" with media type "text/plain" and tags "red" via the Python application programming interface
+    And I ingest bytes "beta" with media type "application/json" and tags "blue" via the Python application programming interface
+    Then the corpus has 2 items with the digest of "alpha"
+    And the corpus has 2 items with tag "red"
+    And the corpus has 2 items with tag "blue"
+    And the corpus has 0 items with tag "green"
+    And the corpus has 2 items with media type "text/plain"
+    And the corpus has 1 items with media type "application/json"
+
+  Scenario: Indexes follow catalog updates and reindexing
+    Given I have an initialized corpus at "corpus"
+    When I ingest bytes "alpha" with media type "text/plain" and tags "red" via the Python application programming interface
+    Then the corpus has 1 items with tag "red"
+    When I replace the tags of the last ingested item with "green"
+    Then the corpus has 0 items with tag "red"
+    And the corpus has 1 items with tag "green"
+    When I reindex the corpus via the Python application programming interface
+    Then the corpus has 1 items with tag "red"
+    And the corpus has 0 items with tag "green"
+
+  Scenario: Source lookups use the source index
+    Given I have an initialized corpus at "corpus"
+    When I ingest bytes "alpha" with media type "text/plain" and tags "red" via the Python application programming interface
+    Then looking up the last ingested source uri returns the last ingested item
+    And looking up the source uri "https://example.com/missing" returns nothing
+
+  Scenario: Catalog index tolerates removing unknown items
+    When I build a catalog index and remove an item it never contained
+    Then the catalog index is empty
+
+  Scenario: Catalog index keeps items that share a key with a removed item
+    When I build a catalog index with two items sharing a digest and remove one
+    Then the catalog index still lists the remaining item under the shared digest
@@ -0,0 +1,55 @@
+Feature: Catalog journal
+  Ingestion should append catalog upserts to a journal instead of rewriting the catalog file,
+  and readers should merge the journal on load.
+
+  Scenario: Ingesting a note appends to the catalog journal
+    Given I have an initialized corpus at "corpus"
+    When I ingest 3 notes via the Python application programming interface
+    Then the catalog journal has 3 entries
+    And the catalog file lists 0 items
+    And the loaded catalog lists 3 items
+    And the loaded catalog order starts with the most recent note
+
+  Scenario: Compaction folds the catalog journal into the catalog file
+    Given I have an initialized corpus at "corpus"
+    When I ingest 2 notes via the Python application programming interface
+    And I compact the corpus catalog
+    Then the catalog journal does not exist
+    And the catalog file lists 2 items
+    And the loaded catalog lists 2 items
+
+  Scenario: Reaching the compaction threshold compacts the catalog journal
+    Given I have an initialized corpus at "corpus"
+    And the catalog journal compaction threshold is 2
+    When I ingest 3 notes via the Python application programming interface
+    Then the catalog journal has 1 entries
+    And the catalog file lists 2 items
+    And the loaded catalog lists 3 items
+
+  Scenario: Catalog journal replay ignores torn trailing writes
+    Given I have an initialized corpus at "corpus"
+    When I ingest 1 notes via the Python application programming interface
+    And I append a torn line to the catalog journal
+    Then the loaded catalog lists 1 items
+
+  Scenario: Writing a snapshot pointer folds the catalog journal
+    Given I have an initialized corpus at "corpus"
+    When I ingest 1 notes via the Python application programming interface
+    And I build a "scan" retrieval snapshot via the Python application programming interface
+    Then the catalog journal does not exist
+    And the catalog file lists 1 items
+
+  Scenario: Upserts after a torn trailing write start on a fresh journal line
+    Given I have an initialized corpus at "corpus"
+    When I ingest 1 notes via the Python application programming interface
+    And I append a torn line to the catalog journal
+    And I ingest 1 notes via the Python application programming interface
+    And I open the corpus via the Python application programming interface at "corpus"
+    Then the reopened corpus catalog lists 2 items
+
+  Scenario: Catalog journal replay ignores entries without an item
+    Given I have an initialized corpus at "corpus"
+    When I ingest 1 notes via the Python application programming interface
+    And I append an entry without an item to the catalog journal
+    And I open the corpus via the Python application programming interface at "corpus"
+    Then the reopened corpus catalog lists 1 items
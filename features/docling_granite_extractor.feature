@@ -136,6 +136,31 @@ Feature: DoclingGranite extractor plugin
     And the extraction snapshot error type for the first ingested item equals "RuntimeError"
     And the extraction snapshot stats include errored_items 1
 
+  Scenario: DoclingGranite extractor converts a batch of documents with one converter
+    Given I initialized a corpus at "corpus"
+    And a fake Docling library is available that returns text "first" for filename "first.pdf"
+    And a fake Docling library is available that raises a RuntimeError for filename "boom.pdf"
+    And a fake Docling library is available that returns text "second" for filename "second.pdf"
+    And a Portable Document Format file "first.pdf" exists with text "one"
+    And a Portable Document Format file "boom.pdf" exists with text "two"
+    And a Portable Document Format file "second.pdf" exists with text "three"
+    When I ingest the file "first.pdf" into corpus "corpus"
+    And I ingest the file "boom.pdf" into corpus "corpus"
+    And I ingest the file "second.pdf" into corpus "corpus"
+    And I ingest the text "plain" with title "Plain" and tags "note" into corpus "corpus"
+    And I extract every item of corpus "corpus" in one "docling-granite" batch
+    Then the batch extraction results in ingestion order are "first,RuntimeError,second,<none>"
+    And the fake Docling library created 1 converter
+
+  Scenario: DoclingGranite extractor skips the converter for a batch without documents
+    Given I initialized a corpus at "corpus"
+    And a fake Docling library is available
+    When I ingest the text "plain" with title "Plain" and tags "note" into corpus "corpus"
+    And I ingest the text "more" with title "More" and tags "note" into corpus "corpus"
+    And I extract every item of corpus "corpus" in one "docling-granite" batch
+    Then the batch extraction results in ingestion order are "<none>,<none>"
+    And the fake Docling library created 0 converters
+
   Scenario: DoclingGranite extractor uses transformers retriever when configured
     Given I initialized a corpus at "corpus"
     And a fake Docling library is available with transformers retriever that returns text "Transformers output" for filename "doc.pdf"
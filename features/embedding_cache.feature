@@ -0,0 +1,86 @@
+Feature: Corpus embedding cache
+  Embedding vectors are cached in the corpus by provider configuration and text hash, so
+  rebuilding a snapshot or building another embedding retriever reuses earlier vectors.
+
+  Background:
+    Given I have an initialized corpus at "corpus"
+
+  Scenario: Rebuilding an embedding index reuses cached vectors
+    When I ingest 12 notes via the Python application programming interface
+    And I build a cached "embedding-index-file" snapshot named "first" while counting embedding calls
+    Then the embedding calls embedded 12 chunks in total
+    And the latest snapshot reports 0 embedding cache hits and 12 misses
+    When I remember the latest snapshot as the exact snapshot
+    And I build a cached "embedding-index-file" snapshot named "second" while counting embedding calls
+    Then the embedding calls embedded 0 chunks in total
+    And the latest snapshot reports 12 embedding cache hits and 0 misses
+    And the latest embedding index artifacts match the exact snapshot
+
+  Scenario: Embedding retrievers share cached vectors
+    When I ingest 12 notes via the Python application programming interface
+    And I build a cached "embedding-index-file" snapshot named "file" while counting embedding calls
+    And I build a cached "embedding-index-inmemory" snapshot named "inmemory" while counting embedding calls
+    Then the embedding calls embedded 0 chunks in total
+    And the latest snapshot reports 12 embedding cache hits and 0 misses
+    When I build a cached "embedding-index-ann" snapshot named "ann" while counting embedding calls
+    Then the embedding calls embedded 0 chunks in total
+    And the latest snapshot reports 12 embedding cache hits and 0 misses
+
+  Scenario: Changing the embedding provider configuration misses the cache
+    When I ingest 12 notes via the Python application programming interface
+    And I build a cached "embedding-index-file" snapshot named "first" while counting embedding calls
+    And I build a cached "embedding-index-file" snapshot named "wider" with 32 dimensions while counting embedding calls
+    Then the embedding calls embedded 12 chunks in total
+    And the latest snapshot reports 0 embedding cache hits and 12 misses
+
+  Scenario: The cache evicts least recently used vectors beyond its size bound
+    When I ingest 12 notes via the Python application programming interface
+    And I build a cached "embedding-index-file" snapshot named "bounded" with at most 5 cache entries while counting embedding calls
+    Then the latest snapshot reports 7 embedding cache evictions
+    And the corpus embedding cache holds 5 vectors
+
+  Scenario: Builds can opt out of the embedding cache
+    When I ingest 12 notes via the Python application programming interface
+    And I build an uncached "embedding-index-inmemory" snapshot while counting embedding calls
+    Then the embedding calls embedded 12 chunks in total
+    And the latest snapshot reports no embedding cache statistics
+    And the corpus embedding cache does not exist
+
+  Scenario: Repeated texts within one request are embedded once
+    When I embed texts "alpha,beta,alpha" through the corpus embedding cache
+    Then the embedding calls embedded 2 chunks in total
+    And the embedding cache reports 1 hits and 2 misses
+    And the cached embeddings for "alpha" are identical
+
+  Scenario: Cached vectors keep the provider's data type
+    When I embed texts "alpha,beta" through the corpus embedding cache twice with a float64 provider
+    Then the embedding calls embedded 2 chunks in total
+    And the cached and freshly embedded vectors are identical float64 matrices
+
+  Scenario: Empty requests return an empty matrix
+    When I embed no texts through the corpus embedding cache
+    Then the cached embedding matrix has 0 rows
+    And the corpus embedding cache does not exist
+
+  Scenario: Invalid provider output is rejected
+    When I attempt to embed texts "alpha,beta" through the corpus embedding cache with a provider that drops a row
+    Then the embedding cache error is "Embedding provider returned an invalid embedding shape"
+
+  Scenario: The cache size bound must be positive
+    When I attempt to open the corpus embedding cache with at most 0 entries
+    Then the embedding cache error is "max_entries must be at least 1"
+
+  Scenario: Closing an unused cache is a no-op
+    When I open and close the corpus embedding cache without using it
+    Then the corpus embedding cache does not exist
+
+  Scenario: Provider embeddings reuse the corpus embedding cache
+    Given a fake OpenAI library is available that returns embedding vector "1.0,2.0" for input text "alpha"
+    And a fake OpenAI library is available that returns embedding vector "3.0,4.0" for input text "beta"
+    And a fake OpenAI library is available that returns embedding vector "5.0,6.0" for input text "gamma"
+    When I generate embeddings for texts "alpha,beta" with the corpus embedding cache
+    And I generate embeddings for texts "alpha,beta,gamma" with the corpus embedding cache
+    Then the fake embedding service last embedded "gamma"
+    And the embeddings output includes 3 vectors
+    And the first embedding vector equals "1.0,2.0"
+    And the second embedding vector equals "3.0,4.0"
@@ -0,0 +1,79 @@
+Feature: Approximate embedding retrieval
+  The embedding-index-ann retriever clusters chunk embeddings into inverted lists and scans only
+  the closest lists at query time, trading a tunable amount of recall for latency.
+
+  Background:
+    Given I have an initialized corpus at "corpus"
+    When I ingest 40 notes via the Python application programming interface
+
+  Scenario: Approximate index scans only the probed lists
+    When I build a "embedding-index-ann" retrieval snapshot in corpus "corpus" with config:
+      | key                            | value          |
+      | lists                          | 4              |
+      | probes                         | 1              |
+      | embedding_provider.provider_id | hash-embedding |
+      | embedding_provider.dimensions  | 16             |
+    Then the latest snapshot stats include chunks 40
+    And the latest snapshot stats include lists 4
+    When I query with the latest snapshot for "Note body 7" and budget:
+      | key                      | value |
+      | max_total_items          | 3     |
+      | maximum_total_characters | 1000  |
+      | max_items_per_source     | 5     |
+    Then the query returns evidence with stage "embedding-index-ann"
+    And the top query evidence text is "Note body 7"
+    And the query stats include probed_lists 1
+    And the query stats report fewer than 40 scanned chunks
+
+  Scenario: Probing every list matches the exact index
+    When I build a "embedding-index-file" retrieval snapshot in corpus "corpus" with config:
+      | key                            | value          |
+      | embedding_provider.provider_id | hash-embedding |
+      | embedding_provider.dimensions  | 16             |
+    And I remember the latest snapshot as the exact snapshot
+    And I build a "embedding-index-ann" retrieval snapshot in corpus "corpus" with config:
+      | key                            | value          |
+      | probes                         | 1              |
+      | embedding_provider.provider_id | hash-embedding |
+      | embedding_provider.dimensions  | 16             |
+    And I benchmark the latest snapshot against the exact snapshot with probes "1,40" for queries "Note body 3,Note body 21,unrelated words"
+    Then the benchmark reports 2 probe settings
+    And the benchmark recall at k for 40 probes is 1
+    And the benchmark recall at k for 1 probes is at most 1
+    When I benchmark the latest snapshot against the exact snapshot with the configured probes for queries "Note body 3"
+    Then the benchmark reports 1 probe settings
+
+  Scenario: Approximate index over a corpus without text returns no evidence
+    Given I have an initialized corpus at "empty"
+    When I build an "embedding-index-ann" snapshot for corpus "empty" via the Python application programming interface
+    Then the approximate snapshot for corpus "empty" has 0 lists and returns no evidence
+
+  Scenario: Approximate index rejects missing artifacts
+    When I build a "embedding-index-ann" retrieval snapshot in corpus "corpus" with config:
+      | key                            | value          |
+      | embedding_provider.provider_id | hash-embedding |
+      | embedding_provider.dimensions  | 16             |
+    And I delete the latest snapshot artifacts
+    And I attempt to query with the latest snapshot for "Note body 1" and budget:
+      | key             | value |
+      | max_total_items | 3     |
+    Then the command fails with exit code 2
+    And standard error includes "Embedding index artifacts are missing"
+
+  Scenario: Approximate index rejects inconsistent artifacts
+    When I build a "embedding-index-ann" retrieval snapshot in corpus "corpus" with config:
+      | key                            | value          |
+      | embedding_provider.provider_id | hash-embedding |
+      | embedding_provider.dimensions  | 16             |
+    And I attempt to query retriever "embedding-index-ann" with inconsistent artifacts
+    Then a ValueError is raised
+    And the ValueError message includes "inconsistent"
+
+  Scenario: Approximate index rejects invalid query embedding shapes
+    When I build a "embedding-index-ann" retrieval snapshot in corpus "corpus" with config:
+      | key                            | value          |
+      | embedding_provider.provider_id | hash-embedding |
+      | embedding_provider.dimensions  | 16             |
+    And I attempt to query retriever "embedding-index-ann" with an invalid query embedding shape
+    Then a ValueError is raised
+    And the ValueError message includes "invalid query embedding shape"
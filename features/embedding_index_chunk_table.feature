@@ -0,0 +1,55 @@
+Feature: Columnar chunk tables for embedding indexes
+  Embedding index snapshots store chunk metadata as fixed-width columns and an item identifier
+  table. Queries memory-map the columns and only materialize records for their top candidates.
+
+  Background:
+    Given I have an initialized corpus at "corpus"
+    When I ingest 30 notes via the Python application programming interface
+
+  Scenario Outline: Snapshots store chunk metadata as columns
+    When I build a "<retriever>" chunk table snapshot
+    Then the latest snapshot stores a chunk table of 30 rows over 30 items
+    And the latest snapshot stores no chunk records file
+
+    Examples:
+      | retriever                |
+      | embedding-index-file     |
+      | embedding-index-inmemory |
+      | embedding-index-ann      |
+
+  Scenario Outline: Queries only materialize records for top candidates
+    When I build a "<retriever>" chunk table snapshot
+    And I query the latest chunk table snapshot for "Note body 7" with at most 1 item while counting chunk records
+    Then the query materialized one chunk record per candidate
+    And the query materialized fewer than 30 chunk records
+
+    Examples:
+      | retriever                |
+      | embedding-index-file     |
+      | embedding-index-inmemory |
+
+  Scenario Outline: Snapshots with chunk records files still answer queries
+    When I build a "<retriever>" chunk table snapshot
+    And I query the latest chunk table snapshot for "Note body 7" with at most 5 items while counting chunk records
+    And I remember the chunk table query results
+    And I rewrite the latest snapshot chunk table as a chunk records file
+    And I query the latest chunk table snapshot for "Note body 7" with at most 5 items while counting chunk records
+    Then the chunk table query results match the remembered results
+
+    Examples:
+      | retriever                |
+      | embedding-index-file     |
+      | embedding-index-inmemory |
+      | embedding-index-ann      |
+
+  Scenario Outline: Queries fail when the chunk table is missing
+    When I build a "<retriever>" chunk table snapshot
+    And I delete the latest snapshot chunk table
+    And I attempt to query the latest chunk table snapshot for "Note body 7"
+    Then the chunk table query fails with "Embedding index artifacts are missing for this snapshot"
+
+    Examples:
+      | retriever                |
+      | embedding-index-file     |
+      | embedding-index-inmemory |
+      | embedding-index-ann      |
@@ -0,0 +1,59 @@
+Feature: Embedding index storage
+  File-backed embedding indexes should be stored as normalized rows and scored straight from the
+  memory map, one batch of rows at a time.
+
+  Scenario: File-backed index scores memory-mapped rows in batches
+    Given I initialized a corpus at "corpus"
+    When I ingest the text "alpha apple" with title "Alpha" and tags "a" into corpus "corpus"
+    And I ingest the text "beta banana" with title "Beta" and tags "b" into corpus "corpus"
+    And I ingest the text "gamma grape" with title "Gamma" and tags "c" into corpus "corpus"
+    And I build a "embedding-index-file" retrieval snapshot in corpus "corpus" with config:
+      | key                            | value          |
+      | maximum_cache_total_items      | 2              |
+      | embedding_provider.provider_id | hash-embedding |
+      | embedding_provider.dimensions  | 16             |
+    Then the latest embedding index artifact has element type "float32" and unit-length rows
+    When I record the embedding rows scored per batch
+    And I query with the latest snapshot for "beta banana" and budget:
+      | key                      | value |
+      | max_total_items          | 3     |
+      | maximum_total_characters | 1000  |
+      | max_items_per_source     | 5     |
+    Then the query returns evidence with stage "embedding-index-file"
+    And no scored embedding batch exceeded 2 rows
+    And the scored embedding batches were memory-mapped
+
+  Scenario: Half-precision file-backed index returns the same ranking
+    Given I initialized a corpus at "corpus"
+    When I ingest the text "alpha apple" with title "Alpha" and tags "a" into corpus "corpus"
+    And I ingest the text "beta banana" with title "Beta" and tags "b" into corpus "corpus"
+    And I ingest the text "gamma grape" with title "Gamma" and tags "c" into corpus "corpus"
+    And I build a "embedding-index-file" retrieval snapshot in corpus "corpus" with config:
+      | key                            | value          |
+      | embedding_dtype                | float16        |
+      | embedding_provider.provider_id | hash-embedding |
+      | embedding_provider.dimensions  | 16             |
+    Then the latest embedding index artifact has element type "float16" and unit-length rows
+    When I query with the latest snapshot for "beta banana" and budget:
+      | key                      | value |
+      | max_total_items          | 1     |
+      | maximum_total_characters | 1000  |
+      | max_items_per_source     | 5     |
+    Then the top query evidence text is "beta banana"
+
+  Scenario: Half-precision in-memory index is upcast when loaded
+    Given I initialized a corpus at "corpus"
+    When I ingest the text "alpha apple" with title "Alpha" and tags "a" into corpus "corpus"
+    And I ingest the text "beta banana" with title "Beta" and tags "b" into corpus "corpus"
+    And I build a "embedding-index-inmemory" retrieval snapshot in corpus "corpus" with config:
+      | key                            | value          |
+      | embedding_dtype                | float16        |
+      | embedding_provider.provider_id | hash-embedding |
+      | embedding_provider.dimensions  | 16             |
+    Then the latest embedding index artifact has element type "float16" and unit-length rows
+    When I query with the latest snapshot for "alpha apple" and budget:
+      | key                      | value |
+      | max_total_items          | 1     |
+      | maximum_total_characters | 1000  |
+      | max_items_per_source     | 5     |
+    Then the top query evidence text is "alpha apple"
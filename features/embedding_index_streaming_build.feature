@@ -0,0 +1,40 @@
+Feature: Streaming embedding index builds
+  File-backed embedding indexes are built by embedding chunks in batches and appending them to
+  partial artifacts with a checkpoint, so memory stays bounded and interrupted builds resume.
+
+  Background:
+    Given I have an initialized corpus at "corpus"
+
+  Scenario: Batched builds embed a bounded number of chunks per call
+    When I ingest 20 notes via the Python application programming interface
+    When I build a streaming embedding index with embedding batch size 256 while counting embedding calls
+    And I remember the latest snapshot as the exact snapshot
+    And I build a streaming embedding index with embedding batch size 6 while counting embedding calls
+    Then every embedding call embedded 6 chunks or fewer
+    And the embedding calls embedded 20 chunks in total
+    And the latest snapshot resumed 0 chunks
+    And the latest embedding index artifacts match the exact snapshot
+    And no partial embedding build remains
+
+  Scenario: Interrupted builds resume after the last completed batch
+    When I ingest 20 notes via the Python application programming interface
+    When I build a streaming embedding index with embedding batch size 256 while counting embedding calls
+    And I remember the latest snapshot as the exact snapshot
+    And I attempt a streaming embedding index build with embedding batch size 6 that fails on embedding call 3
+    Then the streaming build failed with "embedding service unavailable"
+    And a partial embedding build checkpoint records 12 chunks
+    When I build a streaming embedding index with embedding batch size 6 while counting embedding calls
+    Then the latest snapshot resumed 12 chunks
+    And the embedding calls embedded 8 chunks in total
+    And the latest embedding index artifacts match the exact snapshot
+    And no partial embedding build remains
+
+  Scenario: Providers that return the wrong number of rows are rejected
+    When I ingest 20 notes via the Python application programming interface
+    When I attempt a streaming embedding index build with a provider that drops rows
+    Then the streaming build failed with "invalid chunk embedding shape"
+
+  Scenario: Corpora without text produce an empty matrix
+    When I build a streaming embedding index with embedding batch size 4 while counting embedding calls
+    Then the latest snapshot has 0 chunks of 16 dimensions
+    And no partial embedding build remains
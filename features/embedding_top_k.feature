@@ -0,0 +1,17 @@
+Feature: Embedding top-k selection
+  Embedding index retrievers should select the best candidates with array operations and return
+  them ordered by score, breaking ties by chunk position.
+
+  Scenario: Batched selection matches a full sort
+    Given a random normalized embedding matrix with 500 rows and 8 dimensions
+    When I compute top indices in batches of 64 rows with limit 40
+    Then the top indices match a full sort of the scores
+
+  Scenario: Batched selection breaks ties by chunk position
+    Given an embedding matrix where rows 3, 7, 9, and 12 equal the query
+    When I compute top indices in batches of 4 rows with limit 3
+    Then the top indices are "3,7,9"
+
+  Scenario: In-memory selection breaks ties by chunk position
+    When I compute top indices for scores "0.5,0.9,0.9,0.1,0.9" with limit 2
+    Then the top indices are "1,2"
@@ -0,0 +1,84 @@
+Feature: Batched extraction
+  Extractors that load a model can override extract_batch to run several items through it at once.
+  Extraction builds pass such stages batches of items of one media type, up to the configured
+  batch size, record errors returned for single items, and fall back to one item at a time when
+  a batch returns the wrong number of results.
+
+  Background:
+    Given I have an initialized corpus at "corpus"
+    When I ingest 7 notes via the Python application programming interface
+
+  Scenario: A batching stage receives items in batches of the batch size
+    A single remaining item is extracted on its own.
+
+    When I build a batched extraction snapshot with batch size 3
+    Then the batching extractor received batches of sizes "3,3"
+    And the batching extractor extracted 1 items one at a time
+    And the batched extraction snapshot extracted 7 items
+    And the batched extraction snapshot reports 0 batch fallback items
+
+  Scenario: Batches hold items of one media type
+    When I ingest the plain text "Plain body 0" from source "first"
+    And I ingest the plain text "Plain body 1" from source "second"
+    And I build a batched extraction snapshot with batch size 8
+    Then the batching extractor received batches of sizes "7,2"
+    And every batch held items of one media type
+    And the batched extraction snapshot extracted 9 items
+
+  Scenario: Errors returned for single items are recorded for those items
+    When I build a batched extraction snapshot with batch size 8 whose batches return an error for one item
+    Then the batching extractor received batches of sizes "7"
+    And the batching extractor extracted 0 items one at a time
+    And the batched extraction snapshot extracted 6 items
+    And the batched extraction snapshot errored 1 item with "RuntimeError"
+    And the batched extraction snapshot reports 0 batch fallback items
+
+  Scenario: An error raised by a batch is recorded for every item
+    When I build a batched extraction snapshot with batch size 8 whose batches raise an error
+    Then the batching extractor received batches of sizes "7"
+    And the batching extractor extracted 0 items one at a time
+    And the batched extraction snapshot extracted 0 items
+    And the batched extraction snapshot errored 7 items with "RuntimeError"
+    And the batched extraction snapshot reports 0 batch fallback items
+    And the batched extraction build logged "[extract] batch of 7 items failed in batching-text: RuntimeError: batch failed"
+
+  Scenario: Items are extracted one at a time when a batch returns too few results
+    When I build a batched extraction snapshot with batch size 8 whose batches return too few results
+    Then the batching extractor received batches of sizes "7"
+    And the batching extractor extracted 7 items one at a time
+    And the batched extraction snapshot extracted 6 items
+    And the batched extraction snapshot errored 1 item with "RuntimeError"
+    And the batched extraction snapshot reports 7 batch fallback items
+    And the batched extraction build logged "[extract] batch of 7 items in batching-text returned 6 results; extracting items one at a time"
+
+  Scenario Outline: A fatal error in a batch stops the build
+    When I attempt to build a batched extraction snapshot whose batches <failure>
+    Then the batched extraction build failed with a fatal error
+
+    Examples:
+      | failure                           |
+      | raise a fatal error               |
+      | return a fatal error for one item |
+
+  Scenario Outline: Batches run on worker threads and processes
+    When I build a batched extraction snapshot with batch size 3, 2 <executor> workers
+    Then the batched extraction snapshot extracted 7 items
+
+    Examples:
+      | executor |
+      | thread   |
+      | process  |
+
+  Scenario: Batching extractors reuse extraction cache hits
+    When I build a batched extraction snapshot with batch size 8
+    And I build a batched extraction snapshot with batch size 8 and a new configuration name
+    Then the batching extractor received no batches
+    And the batched extraction snapshot reports 7 extraction cache hits
+
+  Scenario: The batch size must be positive
+    When I attempt to build a batched extraction snapshot with batch size 0
+    Then the batched extraction build failed with "batch_size must be at least 1"
+
+  Scenario: The default batch implementation extracts items one at a time
+    When I extract every item with the default batch implementation of "pass-through-text"
+    Then the default batch implementation returned what "pass-through-text" extracts for every item
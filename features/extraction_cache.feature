@@ -0,0 +1,112 @@
+Feature: Corpus extraction cache
+  Pipeline stage outputs are cached in the corpus by item content hash, extractor identifier, and
+  a hash of the stage configuration, media type, and earlier stage outputs. New snapshots and
+  re-ingested copies of the same bytes reuse earlier outputs instead of extracting again.
+
+  Background:
+    Given I have an initialized corpus at "corpus"
+    When I ingest 5 notes via the Python application programming interface
+
+  Scenario: A new pipeline reuses cached outputs of a shared first stage
+    When I build a cached extraction snapshot with stages "counting-cacheable-text"
+    Then the counting cacheable extractor ran for 5 items
+    And the latest extraction snapshot reports 0 extraction cache hits and 5 misses
+    When I build a cached extraction snapshot with stages "counting-cacheable-text,select-text"
+    Then the counting cacheable extractor ran for 0 items
+    And the latest extraction snapshot reports 5 extraction cache hits and 0 misses
+    And the latest extraction snapshot extracted the same text as the first
+
+  Scenario: Changing the stage configuration misses the cache
+    When I build a cached extraction snapshot with stages "counting-cacheable-text"
+    And I build a cached extraction snapshot with stages "counting-cacheable-text:variant=1"
+    Then the counting cacheable extractor ran for 5 items
+    And the latest extraction snapshot reports 0 extraction cache hits and 5 misses
+
+  Scenario: Re-ingested copies of the same bytes reuse cached outputs
+    When I ingest the plain text "Plain body" from source "first"
+    And I build a cached extraction snapshot with stages "counting-cacheable-text"
+    And I ingest the plain text "Plain body" from source "second"
+    And I build a cached extraction snapshot with stages "counting-cacheable-text"
+    Then the counting cacheable extractor ran for 0 items
+    And the latest extraction snapshot reports 7 extraction cache hits and 0 misses
+
+  Scenario: Forced builds extract again and refresh the cache
+    When I build a cached extraction snapshot with stages "counting-cacheable-text"
+    And I force a cached extraction snapshot with stages "counting-cacheable-text"
+    Then the counting cacheable extractor ran for 5 items
+    And the latest extraction snapshot reports 0 extraction cache hits and 5 misses
+    And the corpus extraction cache holds 5 entries
+
+  Scenario: Process workers share the corpus extraction cache
+    When I build a cached extraction snapshot with stages "counting-cacheable-text" using the process executor
+    And I build a cached extraction snapshot with stages "counting-cacheable-text,select-text"
+    Then the latest extraction snapshot reports 5 extraction cache hits and 0 misses
+
+  Scenario: Builds can opt out of the extraction cache
+    When I build an uncached extraction snapshot with stages "counting-cacheable-text"
+    Then the counting cacheable extractor ran for 5 items
+    And the latest extraction snapshot reports 0 extraction cache hits and 0 misses
+    And the corpus extraction cache does not exist
+
+  Scenario: Extractors that are not cacheable skip the cache
+    When I build a cached extraction snapshot with stages "pass-through-text"
+    Then the latest extraction snapshot reports 0 extraction cache hits and 0 misses
+    And the corpus extraction cache does not exist
+
+  Scenario: The cache evicts least recently used entries beyond its entry bound
+    When I open an extraction cache holding at most 2 entries
+    And I store extraction cache entries "alpha,beta"
+    And I read extraction cache entry "alpha"
+    And I store extraction cache entries "gamma"
+    Then the extraction cache evicted 1 entries
+    And the extraction cache holds entries "alpha,gamma"
+
+  Scenario: The cache evicts least recently used entries beyond its size bound
+    When I open an extraction cache holding at most 13 bytes
+    And I store extraction cache entries "alpha,beta,gamma"
+    Then the extraction cache evicted 1 entries
+    And the extraction cache holds entries "beta,gamma"
+
+  Scenario: Cache hits are written when the cache closes
+    When I open an extraction cache holding at most 2 entries
+    And I store extraction cache entries "alpha,beta"
+    And I read extraction cache entry "alpha"
+    And I reopen the extraction cache holding at most 2 entries
+    And I store extraction cache entries "gamma"
+    Then the extraction cache evicted 1 entries
+    And the extraction cache holds entries "alpha,gamma"
+
+  Scenario: Cache hits are written once a batch is pending
+    When extraction cache hits are written every 1 hits
+    And I open an extraction cache holding at most 2 entries
+    And I store extraction cache entries "alpha,beta"
+    And I read extraction cache entry "alpha"
+    Then another extraction cache connection sees entry "alpha" used after "beta"
+
+  Scenario: Replacing an entry does not count it twice
+    When I open an extraction cache holding at most 2 entries
+    And I store extraction cache entries "alpha,alpha,beta"
+    Then the extraction cache evicted 0 entries
+    And the extraction cache counts 2 entries and 13 bytes
+    And the extraction cache holds entries "alpha,beta"
+
+  Scenario: Outputs larger than the size bound are not cached
+    When I open an extraction cache holding at most 4 bytes
+    And I store extraction cache entries "alpha"
+    Then the extraction cache evicted 0 entries
+    And the extraction cache holds no entries
+
+  Scenario: Cached outputs keep their provenance and metadata
+    When I open an extraction cache holding at most 2 entries
+    And I store an extraction cache entry with confidence 0.5 and metadata
+    And I close and reopen the extraction cache
+    Then the extraction cache returns the entry with confidence 0.5 and metadata
+
+  Scenario Outline: Cache bounds must be positive
+    When I attempt to open an extraction cache with <setting> 0
+    Then the extraction cache error is "<setting> must be at least 1"
+
+    Examples:
+      | setting     |
+      | max_entries |
+      | max_bytes   |
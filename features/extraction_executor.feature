@@ -0,0 +1,37 @@
+Feature: Extraction executors
+  Extraction snapshot builds run items on worker threads by default. The process executor runs
+  them in worker processes that resolve the pipeline extractors once each. An item that crashes
+  its worker process is recorded as errored and the rest of the build continues. Both executors
+  keep a bounded number of items in flight instead of submitting the whole catalog at once.
+
+  Background:
+    Given I have an initialized corpus at "corpus"
+    When I ingest 6 notes via the Python application programming interface
+
+  Scenario: The process executor extracts the same text as the thread executor
+    When I build an extraction snapshot with the "thread" executor and 2 workers
+    And I build an extraction snapshot with the "process" executor and 2 workers
+    Then both executors extracted the same text for 6 items
+
+  Scenario: An item that crashes its worker process is recorded as errored
+    When I build an extraction snapshot with the "process" executor and 2 workers crashing on "Note body 3"
+    Then the extraction snapshot manifest records 5 extracted items and 1 errored item
+    And the errored extraction item has error type "BrokenProcessPool"
+
+  Scenario Outline: Executors keep a bounded number of items in flight
+    When I build an extraction snapshot with the "<executor>" executor and 2 workers while counting items in flight
+    Then at most 4 items were in flight
+    And the extraction snapshot manifest records 6 extracted items and 0 errored items
+
+    Examples:
+      | executor |
+      | thread   |
+      | process  |
+
+  Scenario: Unknown executors are rejected
+    When I attempt to build an extraction snapshot with the "fiber" executor
+    Then the extraction executor error is "executor must be one of: thread, process"
+
+  Scenario: The command line builds with the process executor
+    When I snapshot "extract build --executor process --stage pass-through-text" in corpus "corpus"
+    Then the command succeeds
@@ -0,0 +1,50 @@
+Feature: Extraction snapshot journal
+  Extraction snapshot builds append per-item results to a JSON Lines journal in batches instead
+  of rewriting the manifest after every item. An interrupted build resumes from the journal, and
+  the manifest is written once the build completes.
+
+  Background:
+    Given I have an initialized corpus at "corpus"
+    When I ingest 5 notes via the Python application programming interface
+
+  Scenario: A completed build folds the journal into the manifest
+    When I build a journaled extraction snapshot
+    Then the extraction snapshot manifest lists 5 items
+    And the extraction snapshot has no journal
+
+  Scenario: An interrupted build resumes from the journal
+    When I attempt to build a journaled extraction snapshot that fails at item 4
+    Then a fatal extraction error is raised
+    And the extraction snapshot journal holds 3 items
+    And the extraction snapshot has no manifest
+    When I build a journaled extraction snapshot
+    Then the journaled extractor ran for 2 items
+    And the extraction snapshot manifest lists 5 items
+    And the extraction snapshot has no journal
+
+  Scenario: A torn journal line is ignored on resume
+    When I attempt to build a journaled extraction snapshot that fails at item 4
+    And I append a torn line to the extraction snapshot journal
+    Then the extraction snapshot journal holds 3 items
+    When I build a journaled extraction snapshot
+    Then the journaled extractor ran for 2 items
+    And the extraction snapshot manifest lists 5 items
+
+  Scenario: Results appended after a torn journal line survive another interruption
+    When I attempt to build a journaled extraction snapshot that fails at item 4
+    And I append a torn line to the extraction snapshot journal
+    And I attempt to build a journaled extraction snapshot that fails at item 2
+    Then a fatal extraction error is raised
+    And the extraction snapshot journal holds 4 items
+    When I build a journaled extraction snapshot
+    Then the journaled extractor ran for 1 items
+    And the extraction snapshot manifest lists 5 items
+    And the extraction snapshot has no journal
+
+  Scenario: The journal is appended in batches
+    When I build a journaled extraction snapshot flushing every 2 items while counting journal appends
+    Then the extraction snapshot journal was appended 3 times
+
+  Scenario: The journal is appended when the flush interval elapses
+    When I build a journaled extraction snapshot flushing every 0 seconds while counting journal appends
+    Then the extraction snapshot journal was appended 5 times
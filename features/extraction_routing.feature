@@ -0,0 +1,66 @@
+Feature: Media type routing for extraction stages
+  Extractors declare the media types they can produce text for. Pipeline stages whose extractor
+  does not support an item's media type are recorded as skipped without calling the extractor,
+  items of the same media type are extracted together, and snapshot stats report throughput per
+  media type.
+
+  Background:
+    Given I have an initialized corpus at "corpus"
+    When I ingest 3 notes via the Python application programming interface
+
+  Scenario: Stages are not called for unsupported media types
+    When I build a routed extraction snapshot with an audio-only recording stage and "pass-through-text"
+    Then the recording extractor was called for 0 items
+    And every routed item records stage 1 as skipped
+    And the routed extraction snapshot extracted 3 items
+    And the routed snapshot reports 3 "text/markdown" items with 3 routed stage skips
+
+  Scenario: Items of one media type are extracted together
+    When I ingest the plain text "Plain body 0" from source "first"
+    And I ingest 2 notes via the Python application programming interface
+    And I ingest the plain text "Plain body 1" from source "second"
+    And I build a routed extraction snapshot with a recording stage and "pass-through-text"
+    Then the recording extractor saw media types in the order "text/markdown,text/markdown,text/markdown,text/markdown,text/markdown,text/plain,text/plain"
+    And the routed snapshot reports 5 "text/markdown" items with 0 routed stage skips
+    And the routed snapshot reports 2 "text/plain" items with 0 routed stage skips
+    And the routed snapshot reports extraction throughput for every media type
+
+  Scenario Outline: Built-in extractors declare their media types
+    Then the "<extractor>" extractor supports "<media_type>": <supported>
+
+    Examples:
+      | extractor             | media_type      | supported |
+      | pass-through-text     | text/markdown   | yes       |
+      | pass-through-text     | application/pdf | no        |
+      | pdf-text              | application/pdf | yes       |
+      | pdf-text              | image/png       | no        |
+      | stt-openai            | audio/mpeg      | yes       |
+      | stt-openai            | text/plain      | no        |
+      | ocr-rapidocr          | image/png       | yes       |
+      | ocr-rapidocr          | application/pdf | no        |
+      | docling-smol          | application/pdf | yes       |
+      | docling-smol          | image/heic      | yes       |
+      | docling-smol          | audio/mpeg      | no        |
+      | metadata-text         | audio/mpeg      | yes       |
+      | select-text           | image/png       | yes       |
+
+  Scenario Outline: Extractors called outside a pipeline skip media types they do not declare
+    When I call the "<extractor>" extractor directly for a "<media_type>" item
+    Then the direct extractor call returned no text for the undeclared media type
+
+    Examples:
+      | extractor              | media_type      |
+      | pdf-text               | image/png       |
+      | ocr-tesseract          | application/pdf |
+      | pass-through-text      | application/pdf |
+      | ocr-paddleocr-vl       | application/pdf |
+      | ocr-rapidocr           | application/pdf |
+      | docling-smol           | audio/mpeg      |
+      | docling-granite        | audio/mpeg      |
+      | stt-openai             | text/plain      |
+      | stt-openai-audio       | text/plain      |
+      | stt-google-speech      | text/plain      |
+      | stt-azure-speech       | text/plain      |
+      | stt-aws-transcribe     | text/plain      |
+      | stt-faster-whisper     | text/plain      |
+      | audio-format-converter | text/plain      |
@@ -0,0 +1,133 @@
+Feature: Hybrid retrieval fusion
+  Hybrid retrieval queries its lexical and embedding components concurrently, fuses their
+  evidence with raw, rank-based, or normalized scores, and reports per-component timing.
+
+  Background:
+    Given I have an initialized corpus at "corpus"
+    When I ingest 12 notes via the Python application programming interface
+
+  Scenario: Component retrievers are queried concurrently
+    When I build a hybrid snapshot with config:
+      | key | value |
+    And I query the hybrid snapshot for "Note body 7" while components wait for each other
+    Then the hybrid components ran concurrently
+    And the hybrid query reports timing for components "lexical,embedding"
+    And the hybrid query reports no timed out components
+    And the hybrid query returned evidence
+
+  Scenario: Component retrievers can be queried one after the other
+    When I build a hybrid snapshot with config:
+      | key                 | value |
+      | parallel_components | false |
+    And I query the hybrid snapshot for "Note body 7" while tracking component concurrency
+    Then the hybrid components ran one at a time
+    And the hybrid query reports timing for components "lexical,embedding"
+
+  Scenario Outline: Fusion modes rank evidence from both components
+    When I build a hybrid snapshot with config:
+      | key    | value    |
+      | fusion | <fusion> |
+    And I query the hybrid snapshot for "Note body 7"
+    Then the hybrid query reports fusion "<fusion>"
+    And the hybrid query returned evidence
+    And the hybrid evidence scores are in descending order
+
+    Examples:
+      | fusion          |
+      | weighted        |
+      | reciprocal_rank |
+      | min_max         |
+      | z_score         |
+
+  Scenario: Slow components are left out after the time limit
+    When I build a hybrid snapshot with config:
+      | key                       | value |
+      | component_timeout_seconds | 0.2   |
+    And I query the hybrid snapshot for "Note body 7" while the embedding component stalls
+    Then the hybrid query reports timed out components "embedding"
+    And the hybrid query reports timing for components "lexical"
+    And the hybrid query returned evidence
+
+  Scenario: Queries abandoned by the time limit do not pile up threads
+    When I build a hybrid snapshot with config:
+      | key                       | value |
+      | component_timeout_seconds | 0.1   |
+    And I query the hybrid snapshot for "Note body 7" 6 times while the embedding component stalls
+    Then every repeated hybrid query timed out the embedding component
+    And every repeated hybrid query reported timing for the lexical component
+    And at most 4 hybrid component threads were running
+    And the hybrid retriever keeps a component thread pool
+
+  Scenario: Sequential components that have not started by the time limit are left out
+    When I build a hybrid snapshot with config:
+      | key                       | value |
+      | parallel_components       | false |
+      | component_timeout_seconds | 0.1   |
+    And I query the hybrid snapshot for "Note body 7" while the lexical component takes 0.3 seconds
+    Then the hybrid query reports timed out components "embedding"
+    And the hybrid query reports timing for components "lexical"
+    And the hybrid retriever keeps no component thread pool
+
+  Scenario: Concurrent callers query their components at the same time
+    When I build a hybrid snapshot with config:
+      | key | value |
+    And 2 callers query the hybrid snapshot for "Note body 7" while all their components wait for each other
+    Then every concurrent hybrid query returned evidence
+
+  Scenario: Components run on the caller's thread when every component thread is busy
+    When I build a hybrid snapshot with config:
+      | key | value |
+    And I query the hybrid snapshot for "Note body 7" while 4 other callers' embedding components stall
+    Then the embedding component ran on the caller's thread
+    And the hybrid query reports no timed out components
+    And the hybrid query returned evidence
+
+  Scenario: Component errors are raised
+    When I build a hybrid snapshot with config:
+      | key | value |
+    And I attempt to query the hybrid snapshot for "Note body 7" while the lexical component fails
+    Then the hybrid query failed with "lexical component failed"
+
+  Scenario: Closing the hybrid retriever closes its components
+    When I build a hybrid snapshot with config:
+      | key | value |
+    And I query the hybrid snapshot for "Note body 7"
+    And I query the hybrid snapshot for "Note body 8"
+    Then the hybrid retriever keeps a component thread pool
+    When I close the hybrid retriever
+    Then the hybrid component retrievers were closed
+    And the hybrid retriever keeps no component thread pool
+    When I query the hybrid snapshot for "Note body 7"
+    Then the hybrid query returned evidence
+
+  Scenario: Hybrid retrieval rejects unknown fusion modes
+    When I attempt to build a hybrid snapshot with config:
+      | key    | value   |
+      | fusion | average |
+    Then the hybrid build failed with "fusion"
+
+  Scenario Outline: Fusion modes combine component scores
+    When I fuse lexical evidence "<lexical>" and embedding evidence "<embedding>" with "<fusion>" fusion and rank offset 1
+    Then the fused scores are "<fused>"
+
+    Examples:
+      | fusion          | lexical          | embedding       | fused                               |
+      | weighted        | a=-1.0,b=-3.0    | b=0.8,c=0.4     | a=-0.5,b=-1.1,c=0.2                 |
+      | weighted        | a=2.0,a=1.0      | c=0.4           | a=0.5,c=0.2                         |
+      | reciprocal_rank | a=-1.0,b=-3.0    | b=0.8,c=0.4     | a=0.25,b=0.4167,c=0.1667            |
+      | reciprocal_rank | a=2.0,a=1.0,b=0.5 | c=0.4          | a=0.25,b=0.1667,c=0.25              |
+      | min_max         | a=-1.0,b=-3.0    | b=0.8,c=0.4     | a=0.5,b=0.5,c=0.0                   |
+      | min_max         | a=-1.0           | <none>          | a=0.5                               |
+      | z_score         | a=-1.0,b=-3.0    | b=0.8,c=0.4     | a=0.0,b=0.0,c=-1.0                  |
+      | z_score         | a=-1.0           | b=0.8           | a=0.0,b=0.0                         |
+
+  Scenario Outline: Fusion modes take an item's stage scores from one chunk
+    When I fuse lexical evidence "a=2.0,a=1.0" and embedding evidence "c=0.4" with "<fusion>" fusion and rank offset 1
+    Then the fused lexical stage scores are "<stage_scores>"
+
+    Examples:
+      | fusion          | stage_scores  |
+      | weighted        | a=1.0,c=0.0   |
+      | reciprocal_rank | a=2.0,c=0.0   |
+      | min_max         | a=2.0,c=0.0   |
+      | z_score         | a=2.0,c=0.0   |
@@ -14,6 +14,18 @@ Feature: Layout extractors internal branches
     When I run the Heron layout extractor on a sample image
     Then Heron layout metadata includes regions
 
+  Scenario: Heron layout extractor detects a batch of images with one model
+    Given fake Heron layout dependencies are installed
+    When I run the Heron layout extractor on a batch of two images, a text item, and a missing image
+    Then the Heron layout batch results are "2 regions,<none>,FileNotFoundError,2 regions"
+    And the fake Heron model was loaded once for 2 images
+
+  Scenario: Heron layout extractor skips loading the model for a batch without images
+    Given fake Heron layout dependencies are installed
+    When I run the Heron layout extractor on a batch of one text item
+    Then the Heron layout batch results are "<none>"
+    And the fake Heron model was not loaded
+
   Scenario: Heron layout extractor handles non-image and base model
     Given fake Heron layout dependencies are installed
     When I run the Heron layout extractor on a non-image item
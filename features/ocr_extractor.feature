@@ -59,3 +59,46 @@ Feature: RapidOCR extractor plugin
     When I ingest the file "mixed.png" into corpus "corpus"
     And I build a "ocr-rapidocr" extraction snapshot in corpus "corpus"
     Then the extracted text for the last ingested item equals "ok"
+
+  Scenario: RapidOCR extractor recognizes a batch of items with one engine
+    Given I initialized a corpus at "corpus"
+    And a fake RapidOCR library is available that returns lines:
+      | filename   | text         | confidence |
+      | first.png  | First image  | 0.99       |
+      | second.png | Second image | 0.99       |
+    And a file "first.png" exists with bytes:
+      """
+      \x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0bIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82
+      """
+    And a file "second.png" exists with bytes:
+      """
+      \x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0bIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82
+      """
+    When I ingest the file "first.png" into corpus "corpus"
+    And I ingest the text "alpha" with title "Alpha" and tags "a" into corpus "corpus"
+    And I ingest the file "second.png" into corpus "corpus"
+    And I extract every item of corpus "corpus" in one "ocr-rapidocr" batch
+    Then the batch extraction results in ingestion order are "First image,<none>,Second image"
+    And the fake RapidOCR library created 1 engine
+
+  Scenario: RapidOCR extractor records the error of one failing item in a batch
+    Given I initialized a corpus at "corpus"
+    And a fake RapidOCR library is available that returns lines:
+      | filename   | text         | confidence |
+      | first.png  | First image  | 0.99       |
+      | second.png | Second image | 0.99       |
+    And a fake RapidOCR library is available that fails for filename "first.png"
+    And a file "first.png" exists with bytes:
+      """
+      \x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0bIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82
+      """
+    And a file "second.png" exists with bytes:
+      """
+      \x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0bIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82
+      """
+    When I ingest the file "first.png" into corpus "corpus"
+    And I ingest the text "alpha" with title "Alpha" and tags "a" into corpus "corpus"
+    And I ingest the file "second.png" into corpus "corpus"
+    And I extract every item of corpus "corpus" in one "ocr-rapidocr" batch
+    Then the batch extraction results in ingestion order are "RuntimeError,<none>,Second image"
+    And the fake RapidOCR library created 1 engine
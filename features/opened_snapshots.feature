@@ -0,0 +1,81 @@
+Feature: Opened snapshot registry
+  Long-lived query processes keep retrieval snapshots open. The registry keeps one retriever per
+  snapshot, and the retriever keeps the configuration and artifacts it loaded for that snapshot,
+  so repeated queries skip reloading them.
+
+  Background:
+    Given I have an initialized corpus at "corpus"
+    When I ingest 12 notes via the Python application programming interface
+
+  Scenario Outline: Repeated queries reuse the opened snapshot state
+    When I build a "<retriever>" snapshot named "first" for the opened snapshot registry
+    And I query snapshot "first" for "Note body 7" 3 times through an opened snapshot registry
+    Then later queries loaded no snapshot state
+    And every query through the registry returned the same evidence
+    And the opened snapshot registry reports 1 snapshots opened and 2 reuses
+
+    Examples:
+      | retriever                |
+      | scan                     |
+      | tf-vector                |
+      | sqlite-full-text-search  |
+      | embedding-index-inmemory |
+      | embedding-index-file     |
+      | embedding-index-ann      |
+      | hybrid                   |
+
+  Scenario: The least recently used snapshot is closed beyond the registry limit
+    When I build a "scan" snapshot named "first" for the opened snapshot registry
+    And I build a "scan" snapshot named "second" for the opened snapshot registry
+    And I open snapshots "first,second,first" through an opened snapshot registry holding 1 snapshot
+    Then the opened snapshot registry reports 3 snapshots opened and 0 reuses
+    And the opened snapshot registry reports 2 evictions and 1 open snapshots
+    And 2 opened snapshot retrievers were closed
+
+  Scenario: Closing the registry closes every opened snapshot
+    When I build a "scan" snapshot named "first" for the opened snapshot registry
+    And I build a "scan" snapshot named "second" for the opened snapshot registry
+    And I open snapshots "first,second" through an opened snapshot registry holding 2 snapshots
+    And I close the opened snapshot registry
+    Then the opened snapshot registry reports 0 evictions and 0 open snapshots
+    And 2 opened snapshot retrievers were closed
+
+  Scenario: Evicting a snapshot waits for queries still running against it
+    When I build a "scan" snapshot named "first" for the opened snapshot registry
+    And I build a "scan" snapshot named "second" for the opened snapshot registry
+    And I query snapshot "first" on another thread while opening "second" evicts it from an opened snapshot registry holding 1 snapshot
+    Then no opened snapshot retriever was closed while it was leased
+    And every query through the registry returned the same evidence
+    And the opened snapshot registry reports 1 evictions and 1 open snapshots
+    And 1 opened snapshot retrievers were closed
+
+  Scenario: Closing the registry waits for leased snapshots to be released
+    When I build a "scan" snapshot named "first" for the opened snapshot registry
+    And I lease snapshot "first" from an opened snapshot registry and close the registry
+    Then no opened snapshot retriever was closed while it was leased
+    When I release the opened snapshot lease twice
+    Then 1 opened snapshot retrievers were closed
+    When I attempt to query the released opened snapshot lease
+    Then the opened snapshot registry error is "Opened snapshot lease was already released"
+
+  Scenario: The registry limit must be positive
+    When I attempt to create an opened snapshot registry holding 0 snapshots
+    Then the opened snapshot registry error is "max_snapshots must be at least 1"
+
+  Scenario: The process-wide registry is shared
+    Then the process-wide opened snapshot registry is shared
+
+  Scenario: A retriever keeps state for a bounded number of snapshot manifests
+    When I build a "scan" snapshot named "first" for the opened snapshot registry
+    And I query 5 variants of snapshot "first" and then the first variant again with one retriever
+    Then the retriever loaded snapshot state 6 times
+
+  Scenario: Closing a retriever drops its snapshot state
+    When I build a "scan" snapshot named "first" for the opened snapshot registry
+    And I query snapshot "first" with one retriever, close it, and query again
+    Then the retriever loaded snapshot state 2 times
+
+  Scenario: Retrievers that skip the base initializer still keep snapshot state
+    When I build a "scan" snapshot named "first" for the opened snapshot registry
+    And I query snapshot "first" twice, close, and query again with a retriever that skips the base initializer
+    Then the retriever loaded snapshot state 2 times
@@ -0,0 +1,44 @@
+Feature: Parallel reindex and import
+  Reindex and folder tree import should spread hashing and parsing across worker processes while
+  producing the same catalog as a sequential run.
+
+  Scenario: Reindex with several workers catalogs every file
+    Given I initialized a corpus at "corpus"
+    And a raw file with universally unique identifier "00000000-0000-0000-0000-000000000001" exists in corpus "corpus" named "alpha.txt" with contents "alpha"
+    And a raw file with universally unique identifier "00000000-0000-0000-0000-000000000002" exists in corpus "corpus" named "beta.txt" with contents "beta"
+    And a raw file named "notes.txt" exists in corpus "corpus" with contents "no identifier"
+    When I snapshot "reindex --workers 2" in corpus "corpus"
+    Then the command succeeds
+    And the corpus "corpus" catalog has 2 items
+
+  Scenario: Reindex rejects a worker count below one
+    Given I initialized a corpus at "corpus"
+    When I snapshot "reindex --max-workers 0" in corpus "corpus"
+    Then the command fails with exit code 2
+    And standard error includes "max_workers must be at least 1"
+
+  Scenario: Import a folder tree with several workers
+    Given I initialized a corpus at "corpus"
+    And the directory "source_tree" contains files:
+      | relpath        | contents |
+      | a.txt          | alpha    |
+      | docs/b.md      | bravo    |
+      | docs/notes.md  | ---\ntitle: Note\n---\nbody\n |
+    When I snapshot "import-tree corpus/source_tree --tags imported --workers 2" in corpus "corpus"
+    Then the command succeeds
+    And the corpus "corpus" has at least 3 items
+    And the corpus "corpus" has an item with source suffix "/source_tree/a.txt"
+    And the corpus "corpus" has an item with source suffix "/source_tree/docs/notes.md"
+
+  Scenario: Parallel import reports invalid Markdown bytes
+    Given I initialized a corpus at "corpus"
+    And the directory "source_tree" contains a markdown file "bad.md" with invalid Unicode Transformation Format 8 bytes
+    When I snapshot "import-tree corpus/source_tree --workers 2" in corpus "corpus"
+    Then the command fails with exit code 2
+    And standard error includes "Markdown file must be Unicode Transformation Format 8"
+
+  Scenario: Import rejects a worker count below one
+    Given I initialized a corpus at "corpus"
+    When I snapshot "import-tree corpus --max-workers 0" in corpus "corpus"
+    Then the command fails with exit code 2
+    And standard error includes "max_workers must be at least 1"
@@ -0,0 +1,117 @@
+Feature: Batched retrieval queries
+  Retrievers answer several queries in one call so evaluation and batch jobs can share loaded
+  artifacts, one embedding provider call, and one database connection across queries.
+
+  Background:
+    Given I have an initialized corpus at "corpus"
+    When I ingest 12 notes via the Python application programming interface
+
+  Scenario Outline: Batched embedding queries match single queries
+    When I build a "<retriever>" retrieval snapshot in corpus "corpus" with config:
+      | key                            | value          |
+      | embedding_provider.provider_id | hash-embedding |
+      | embedding_provider.dimensions  | 16             |
+    Then batched queries "Note body 3|Note body 9|Note body 11" match single queries
+
+    Examples:
+      | retriever                |
+      | embedding-index-file     |
+      | embedding-index-inmemory |
+      | embedding-index-ann      |
+
+  Scenario Outline: Batched lexical queries match single queries
+    When I build a "<retriever>" retrieval snapshot in corpus "corpus"
+    Then batched queries "Note body 3|body 9|unrelated" match single queries
+
+    Examples:
+      | retriever               |
+      | sqlite-full-text-search |
+      | scan                    |
+      | tf-vector               |
+
+  Scenario: The default batch loop answers each query in order
+    When I run batched queries "alpha|beta|gamma" through a retriever without a batch implementation
+    Then the default batch loop answered "alpha|beta|gamma" in order
+
+  Scenario: Full-text search batch mixes stop-word and keyword queries
+    When I build a "sqlite-full-text-search" retrieval snapshot in corpus "corpus" with config:
+      | key        | value   |
+      | stop_words | english |
+    Then batched queries "the|Note body 3|a|body 9" match single queries
+
+  Scenario: Full-text search batch opens a single connection
+    When I build a "sqlite-full-text-search" retrieval snapshot in corpus "corpus"
+    And I run batched queries "Note body 3|Note body 4|Note body 5" while counting database connections
+    Then 1 database connection was opened
+
+  Scenario: Full-text search batch of stop words opens no connection
+    When I build a "sqlite-full-text-search" retrieval snapshot in corpus "corpus" with config:
+      | key        | value   |
+      | stop_words | english |
+    And I run batched queries "the|a" while counting database connections
+    Then 0 database connections were opened
+
+  Scenario: Embedding batch calls the provider once
+    When I build a "embedding-index-file" retrieval snapshot in corpus "corpus" with config:
+      | key                            | value          |
+      | embedding_provider.provider_id | hash-embedding |
+      | embedding_provider.dimensions  | 16             |
+    And I run batched queries "Note body 1|Note body 2|Note body 3" while counting embedding calls
+    Then the embedding provider was called 1 time
+
+  Scenario: Embedding batch rejects a provider that drops queries
+    When I build a "embedding-index-inmemory" retrieval snapshot in corpus "corpus" with config:
+      | key                            | value          |
+      | embedding_provider.provider_id | hash-embedding |
+      | embedding_provider.dimensions  | 16             |
+    And I attempt batched queries "Note body 1|Note body 2" with a provider that drops queries
+    Then the batched query fails with "invalid query embedding shape"
+
+  Scenario: Query command runs a query file as JSON Lines
+    When I build a "scan" retrieval snapshot in corpus "corpus"
+    And I write the query file "queries.txt" with lines "Note body 2||Note body 7"
+    And I snapshot "query --query-file queries.txt --max-total-items 1" in corpus "corpus"
+    Then the command succeeds
+    And the query output has 2 JSON lines with query texts "Note body 2|Note body 7"
+
+  Scenario: Evaluation sends queries in batches
+    When I ingest the text "zeta apple" with title "Zeta" and tags "x" into corpus "corpus"
+    And I build a "scan" retrieval snapshot in corpus "corpus"
+    And I create an evaluation dataset at "dataset.json" with queries:
+      | query_text | expected_item |
+      | zeta       | last_ingested |
+      | apple      | last_ingested |
+      | zeta apple | last_ingested |
+    And I evaluate the latest snapshot with dataset "dataset.json" and budget:
+      | key                      | value |
+      | max_total_items          | 3     |
+      | maximum_total_characters | 2000  |
+      | max_items_per_source     | 5     |
+      | batch_size               | 2     |
+    Then the evaluation reports mean reciprocal rank 1.0
+    And the evaluation system metrics record a query batch size of 2
+
+  Scenario: Evaluation measures single queries by default
+    When I ingest the text "zeta apple" with title "Zeta" and tags "x" into corpus "corpus"
+    And I build a "scan" retrieval snapshot in corpus "corpus"
+    And I create an evaluation dataset at "dataset.json" with queries:
+      | query_text | expected_item |
+      | zeta       | last_ingested |
+      | apple      | last_ingested |
+    And I evaluate the latest snapshot with dataset "dataset.json" and budget:
+      | key                      | value |
+      | max_total_items          | 3     |
+      | maximum_total_characters | 2000  |
+      | max_items_per_source     | 5     |
+    Then the evaluation reports mean reciprocal rank 1.0
+    And the evaluation system metrics do not record a query batch size
+
+  Scenario: Evaluation rejects a batch size below one
+    When I ingest the text "zeta apple" with title "Zeta" and tags "x" into corpus "corpus"
+    And I build a "scan" retrieval snapshot in corpus "corpus"
+    And I create an evaluation dataset at "dataset.json" with queries:
+      | query_text | expected_item |
+      | zeta       | last_ingested |
+    And I snapshot "eval --dataset dataset.json --batch-size 0" in corpus "corpus"
+    Then the command fails with exit code 2
+    And standard error includes "batch_size must be at least 1"
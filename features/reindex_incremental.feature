@@ -0,0 +1,55 @@
+Feature: Incremental reindex
+  Reindexing a large corpus should only re-read files whose stat signature changed since the
+  previous reindex.
+
+  Scenario: Incremental reindex keeps unchanged files without re-reading them
+    Given I initialized a corpus at "corpus"
+    And a raw file with universally unique identifier "00000000-0000-0000-0000-000000000001" exists in corpus "corpus" named "alpha.txt" with contents "alpha"
+    And a raw file with universally unique identifier "00000000-0000-0000-0000-000000000002" exists in corpus "corpus" named "beta.txt" with contents "beta"
+    When I reindex corpus "corpus"
+    Then reindex stats include inserted 2
+    When I incrementally reindex corpus "corpus"
+    Then reindex stats include unchanged 2
+    And reindex stats include updated 0
+
+  Scenario: Incremental reindex re-reads edited files and detects removals
+    Given I initialized a corpus at "corpus"
+    And a raw file with universally unique identifier "00000000-0000-0000-0000-000000000001" exists in corpus "corpus" named "alpha.txt" with contents "alpha"
+    And a raw file with universally unique identifier "00000000-0000-0000-0000-000000000002" exists in corpus "corpus" named "beta.txt" with contents "beta"
+    And a raw file named "notes.txt" exists in corpus "corpus" with contents "no identifier"
+    When I reindex corpus "corpus"
+    And I rewrite the raw file "00000000-0000-0000-0000-000000000001--alpha.txt" in corpus "corpus" with contents "alpha, revised"
+    And I delete the raw file "00000000-0000-0000-0000-000000000002--beta.txt" in corpus "corpus"
+    And I incrementally reindex corpus "corpus"
+    Then reindex stats include updated 1
+    And reindex stats include unchanged 0
+    And reindex stats include removed 1
+    And reindex stats include skipped 1
+    And the corpus "corpus" catalog has 1 items
+
+  Scenario: Incremental reindex re-reads files whose sidecar changed
+    Given I initialized a corpus at "corpus"
+    And a raw file named "report.txt" exists in corpus "corpus" with contents "report"
+    And a sidecar for raw file "report.txt" exists in corpus "corpus" with Yet Another Markup Language:
+      """
+      biblicus:
+        id: 00000000-0000-0000-0000-000000000003
+      tags: [draft]
+      """
+    When I reindex corpus "corpus"
+    And I rewrite the sidecar for raw file "report.txt" in corpus "corpus" with Yet Another Markup Language:
+      """
+      biblicus:
+        id: 00000000-0000-0000-0000-000000000003
+      tags: [final]
+      """
+    And I incrementally reindex corpus "corpus"
+    Then reindex stats include updated 1
+    And reindex stats include unchanged 0
+
+  Scenario: Incremental reindex without previous state reads every file
+    Given I initialized a corpus at "corpus"
+    And a raw file with universally unique identifier "00000000-0000-0000-0000-000000000001" exists in corpus "corpus" named "alpha.txt" with contents "alpha"
+    When I incrementally reindex corpus "corpus"
+    Then reindex stats include inserted 1
+    And reindex stats include unchanged 0
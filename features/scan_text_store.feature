@@ -0,0 +1,84 @@
+Feature: Scan retriever packed text store
+  The scan retriever packs item text into a lowercase blob with an offset table when a snapshot
+  is built, so queries scan one memory-mapped file instead of opening and decoding every item.
+
+  Background:
+    Given I have an initialized corpus at "corpus"
+    When I ingest 12 notes via the Python application programming interface
+    And I ingest the text "Über ZETA zeta café" with title "Zeta" and tags "x" into corpus "corpus"
+
+  Scenario: Building a snapshot packs text into the store
+    When I build a "scan" retrieval snapshot in corpus "corpus"
+    Then the latest snapshot stats include documents 13
+    And the latest snapshot records 3 scan text store artifacts
+
+  Scenario: Packed store scores match reading every item
+    Given a binary file "data.bin" exists
+    When I ingest the file "data.bin" into corpus "corpus"
+    And I build a "scan" retrieval snapshot in corpus "corpus"
+    Then scan queries "note body 4|zeta|über CAFÉ|zeta zeta|unseen|   " match a snapshot without a text store
+
+  Scenario Outline: Packed matches are counted per document
+    Then counting "<tokens>" in packed documents "<documents>" gives "<counts>"
+
+    Examples:
+      | tokens | documents       | counts  |
+      | ab     | xa\|bab\|ab     | 0,1,1   |
+      | aa     | a\|aaa\|a       | 0,1,0   |
+      | aba    | ab\|a\|aba      | 0,0,1   |
+      | a\|b   | ab\|\|ba        | 2,0,2   |
+      | a      | \|              | 0,0     |
+
+  Scenario: Parallel scoring matches single-process scoring
+    When I build a "scan" retrieval snapshot in corpus "corpus" with config:
+      | key             | value |
+      | scoring_workers | 3     |
+    Then scan queries "note|body 7|zeta" match a snapshot without a text store
+
+  Scenario: Parallel scoring keeps one process pool between queries
+    When I build a "scan" retrieval snapshot in corpus "corpus" with config:
+      | key             | value |
+      | scoring_workers | 2     |
+    And I run 3 scan queries for "zeta" with one retriever while counting process pools
+    Then 1 scoring process pool was started
+    When I run a scan query for "zeta" with 3 scoring workers on the same retriever
+    Then 2 scoring process pools were started
+    And the replaced scoring process pool stays open until the retriever closes
+    When I close the scan retriever
+    Then the scan retriever holds no scoring process pool
+    And every scoring process pool was shut down
+
+  Scenario: Text items are counted while the store is packed
+    Given a binary file "data.bin" exists
+    And a file "empty.md" exists with markdown front matter:
+      | key   | value |
+      | title | Empty |
+    When I ingest the file "data.bin" into corpus "corpus"
+    And I ingest the file "empty.md" into corpus "corpus"
+    And I build a "scan" retrieval snapshot in corpus "corpus"
+    Then the latest snapshot stats include documents 13
+    And the latest snapshot stats include text items 14
+
+  Scenario: Queries do not open item files
+    When I build a "scan" retrieval snapshot in corpus "corpus"
+    And I query the latest scan snapshot for "zeta" while counting item file reads
+    Then 0 item files were read
+    And the scan query returned evidence text "Über ZETA zeta café"
+
+  Scenario: Text store over a corpus without text returns no evidence
+    Given I have an initialized corpus at "empty"
+    When I build a scan snapshot for corpus "empty" via the Python application programming interface
+    Then the scan snapshot for corpus "empty" has 0 documents and returns no evidence
+
+  Scenario: Text store evidence skips removed items
+    When I build a "scan" retrieval snapshot in corpus "corpus"
+    Then scan text store evidence for a removed item is empty
+
+  Scenario: Querying fails when the text store is missing
+    When I build a "scan" retrieval snapshot in corpus "corpus"
+    And I delete the latest snapshot artifacts
+    And I attempt to query with the latest snapshot for "zeta" and budget:
+      | key             | value |
+      | max_total_items | 3     |
+    Then the command fails with exit code 2
+    And standard error includes "Scan text store artifacts are missing"
@@ -0,0 +1,37 @@
+Feature: Bulk SQLite full-text search index builds
+  Index builds batch chunk inserts, run with build-time pragmas in one transaction, merge the
+  index segments when done, and can load and chunk item text in worker threads.
+
+  Background:
+    Given I have an initialized corpus at "corpus"
+    When I ingest 30 notes via the Python application programming interface
+    And I ingest the text "zeta alpha bravo charlie delta echo foxtrot" with title "Zeta" and tags "x" into corpus "corpus"
+
+  Scenario: Threaded batched builds match a sequential build
+    When I build a "sqlite-full-text-search" retrieval snapshot in corpus "corpus" with config:
+      | key           | value |
+      | chunk_size    | 8     |
+      | chunk_overlap | 2     |
+    And I remember the latest snapshot as the exact snapshot
+    And I build a "sqlite-full-text-search" retrieval snapshot in corpus "corpus" with config:
+      | key               | value |
+      | chunk_size        | 8     |
+      | chunk_overlap     | 2     |
+      | build_workers     | 3     |
+      | insert_batch_size | 4     |
+    Then the latest snapshot has the same chunk count as the exact snapshot
+    And full-text search queries "zeta|body 17|delta|note|17" match the exact snapshot
+
+  Scenario: Builds use bulk pragmas, batched inserts, and a final optimize
+    When I build a full-text search snapshot with insert batch size 7 while tracing statements
+    Then the traced statements include "PRAGMA synchronous=OFF"
+    And the traced statements include "PRAGMA journal_mode=OFF"
+    And the traced statements include "VALUES ('optimize')"
+    And the traced build ran 5 batched inserts
+
+  Scenario: Builds reject fewer than one worker
+    When I attempt to build a "sqlite-full-text-search" retrieval snapshot in corpus "corpus" with config:
+      | key           | value |
+      | build_workers | 0     |
+    Then the command fails with exit code 2
+    And standard error includes "build_workers"
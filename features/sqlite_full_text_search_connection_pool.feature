@@ -0,0 +1,29 @@
+Feature: Pooled SQLite full-text search connections
+  The full-text search retriever keeps one read-only connection per snapshot and thread, reuses
+  it across queries, reports how often connections were reused, and closes them on request.
+
+  Background:
+    Given I have an initialized corpus at "corpus"
+    When I ingest 5 notes via the Python application programming interface
+    And I build a "sqlite-full-text-search" retrieval snapshot in corpus "corpus"
+
+  Scenario: Repeated queries reuse one connection
+    When I query the pooled retriever 4 times for "note"
+    Then the pooled retriever returned evidence
+    And the pooled retriever opened 1 connections and reused them 3 times
+
+  Scenario: Each thread gets its own connection
+    When I query the pooled retriever for "note" from 3 threads
+    Then the pooled retriever opened 3 connections and reused them 0 times
+
+  Scenario: Closing the retriever releases connections and later queries reopen them
+    When I query the pooled retriever 2 times for "note"
+    And I close the pooled retriever
+    And I query the pooled retriever 1 times for "note"
+    Then the pooled retriever returned evidence
+    And the pooled retriever opened 2 connections and reused them 1 times
+
+  Scenario: Pooled connections are read-only
+    Then the pooled retriever opened 0 connections and reused them 0 times
+    And pooled connections reject writes
+    And closing a retriever without pooled resources succeeds
@@ -0,0 +1,97 @@
+Feature: Incremental SQLite full-text search builds
+  A full-text search snapshot can be built from a parent snapshot. The parent database is copied,
+  chunks of changed and removed items are deleted, and only new or changed items are re-chunked.
+
+  Background:
+    Given I initialized a corpus at "corpus"
+    And a raw file with universally unique identifier "00000000-0000-0000-0000-000000000001" exists in corpus "corpus" named "alpha.txt" with contents "alpha apple orchard harvest"
+    And a raw file with universally unique identifier "00000000-0000-0000-0000-000000000002" exists in corpus "corpus" named "beta.txt" with contents "beta banana plantation"
+    And a raw file with universally unique identifier "00000000-0000-0000-0000-000000000003" exists in corpus "corpus" named "gamma.txt" with contents "gamma grape vineyard"
+    And a binary raw file named "00000000-0000-0000-0000-000000000004--blob.bin" of 64 bytes exists in corpus "corpus"
+    When I reindex corpus "corpus"
+
+  Scenario: Incremental builds reindex only changed items and match a full rebuild
+    When I build a full-text search snapshot with config:
+      | key           | value |
+      | chunk_size    | 8     |
+      | chunk_overlap | 2     |
+    And I remember the latest snapshot as the parent snapshot
+    And I rewrite the raw file "00000000-0000-0000-0000-000000000001--alpha.txt" in corpus "corpus" with contents "alpha apricot orchard revised"
+    And I delete the raw file "00000000-0000-0000-0000-000000000002--beta.txt" in corpus "corpus"
+    And I delete the raw file "00000000-0000-0000-0000-000000000004--blob.bin" in corpus "corpus"
+    And I rewrite the raw file "00000000-0000-0000-0000-000000000005--delta.txt" in corpus "corpus" with contents "delta date grove"
+    And I incrementally reindex corpus "corpus"
+    And I build a full-text search snapshot with config:
+      | key             | value  |
+      | chunk_size      | 8      |
+      | chunk_overlap   | 2      |
+      | parent_snapshot | latest |
+    Then the latest snapshot was built from the parent snapshot
+    And the latest snapshot reused 1 items, reindexed 2, and removed 2
+    When I remember the latest snapshot as the exact snapshot
+    And I build a full-text search snapshot with config:
+      | key           | value |
+      | chunk_size    | 8     |
+      | chunk_overlap | 2     |
+    Then the latest snapshot has no parent snapshot
+    And the latest snapshot has the same chunk count as the exact snapshot
+    And full-text search queries "apricot|apple|banana|grape|date" match the exact snapshot
+
+  Scenario: Building from latest without a previous snapshot is a full build
+    When I build a full-text search snapshot with config:
+      | key             | value  |
+      | parent_snapshot | latest |
+    Then the latest snapshot has no parent snapshot
+    And the latest snapshot reused 0 items, reindexed 4, and removed 0
+
+  Scenario: Parents with a different chunking configuration are rebuilt in full
+    When I build a full-text search snapshot with config:
+      | key           | value |
+      | chunk_size    | 8     |
+      | chunk_overlap | 2     |
+    And I build a full-text search snapshot with config:
+      | key             | value  |
+      | parent_snapshot | latest |
+    Then the latest snapshot has no parent snapshot
+    And the latest snapshot reused 0 items, reindexed 4, and removed 0
+
+  Scenario: Parents without a database are rebuilt in full
+    When I build a full-text search snapshot with config:
+      | key        | value |
+      | chunk_size | 800   |
+    And I remember the latest snapshot as the parent snapshot
+    And I delete the latest snapshot artifacts
+    And I build a full-text search snapshot from the parent snapshot
+    Then the latest snapshot has no parent snapshot
+    And the latest snapshot reused 0 items, reindexed 4, and removed 0
+
+  Scenario: Parents without item fingerprints are rebuilt in full
+    When I build a full-text search snapshot with config:
+      | key        | value |
+      | chunk_size | 800   |
+    And I remember the latest snapshot as the parent snapshot
+    And I drop the item fingerprints from the latest snapshot database
+    And I build a full-text search snapshot from the parent snapshot
+    Then the latest snapshot has no parent snapshot
+
+  Scenario: Unchanged corpora reuse every item of the parent
+    When I build a full-text search snapshot with config:
+      | key        | value |
+      | chunk_size | 800   |
+    And I remember the latest snapshot as the parent snapshot
+    And I build a full-text search snapshot from the parent snapshot
+    Then the latest snapshot was built from the parent snapshot
+    And the latest snapshot reused 4 items, reindexed 0, and removed 0
+
+  Scenario: Parents built by another retriever are rebuilt in full
+    When I build a "scan" retrieval snapshot in corpus "corpus"
+    And I remember the latest snapshot as the parent snapshot
+    And I build a full-text search snapshot from the parent snapshot
+    Then the latest snapshot has no parent snapshot
+
+  Scenario: Missing parent snapshots are rejected
+    When I attempt to build a "sqlite-full-text-search" retrieval snapshot in corpus "corpus" with config:
+      | key             | value   |
+      | parent_snapshot | missing |
+    Then the command fails with exit code 2
+    And standard error includes "Missing snapshot manifest for: missing"
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from behave import then, when
+
+from biblicus.corpus import Corpus
+
+
+@when("I load the corpus catalog twice")
+def step_load_catalog_twice(context) -> None:
+    context.first_catalog = context.corpus.load_catalog()
+    context.second_catalog = context.corpus.load_catalog()
+
+
+@when('another corpus instance ingests a note into "{name}"')
+def step_other_instance_ingests(context, name: str) -> None:
+    other = Corpus.open(context.workdir / name)
+    other.ingest_note("Written elsewhere", title="Elsewhere")
+
+
+@then("both catalog loads are private copies of the cached view")
+def step_catalog_loads_private_copies(context) -> None:
+    cached = context.corpus._catalog_cache
+    assert context.first_catalog is not context.second_catalog
+    assert context.first_catalog is not cached
+    assert context.first_catalog.items is not cached.items
+    assert context.first_catalog.order is not cached.order
+    assert context.first_catalog == context.second_catalog == cached
+
+
+@then("the first loaded catalog still lists {count:d} items")
+def step_first_catalog_unchanged(context, count: int) -> None:
+    assert len(context.first_catalog.items) == count, len(context.first_catalog.items)
+    assert len(context.first_catalog.order) == count, context.first_catalog.order
+
+
+@then("the corpus catalog is served from the cache with {count:d} items")
+def step_catalog_served_from_cache(context, count: int) -> None:
+    original_load = context.corpus._load_catalog
+
+    def _fail_load():
+        raise AssertionError("catalog was re-read from disk")
+
+    context.corpus._load_catalog = _fail_load
+    try:
+        catalog = context.corpus.load_catalog()
+    finally:
+        context.corpus._load_catalog = original_load
+    assert len(catalog.items) == count, len(catalog.items)
+    assert catalog.order[0] == context.ingested_note_ids[-1]
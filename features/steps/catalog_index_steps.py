@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import hashlib
+
+from behave import then, when
+
+from biblicus.catalog_index import CatalogIndex
+from biblicus.models import CatalogItem
+
+
+@when(
+    'I ingest bytes "{text}" with media type "{media_type}" and tags "{tags}" '
+    "via the Python application programming interface"
+)
+def step_ingest_bytes_with_tags(context, text: str, media_type: str, tags: str) -> None:
+    count = len(getattr(context, "indexed_item_ids", []))
+    source_uri = f"https://example.com/items/{count}"
+    result = context.corpus.ingest_item(
+        text.encode("utf-8"),
+        filename=f"item-{count}.txt",
+        media_type=media_type,
+        tags=[tag for tag in tags.split(",") if tag],
+        source_uri=source_uri,
+    )
+    if not hasattr(context, "indexed_item_ids"):
+        context.indexed_item_ids = []
+    context.indexed_item_ids.append(result.item_id)
+    context.last_ingested_source_uri = source_uri
+
+
+@when('I replace the tags of the last ingested item with "{tags}"')
+def step_replace_last_item_tags(context, tags: str) -> None:
+    item = context.corpus.get_item(context.indexed_item_ids[-1])
+    updated_metadata = dict(item.metadata)
+    updated_metadata["tags"] = tags.split(",")
+    context.corpus._upsert_catalog_item(
+        item.model_copy(update={"tags": tags.split(","), "metadata": updated_metadata})
+    )
+
+
+@when("I reindex the corpus via the Python application programming interface")
+def step_reindex_python(context) -> None:
+    context.reindex_stats = context.corpus.reindex()
+
+
+def _index_item(item_id: str) -> CatalogItem:
+    return CatalogItem(
+        id=item_id,
+        relpath=f"{item_id}.txt",
+        sha256="0" * 64,
+        bytes=0,
+        media_type="text/plain",
+        created_at="2024-01-01T00:00:00Z",
+    )
+
+
+@when("I build a catalog index and remove an item it never contained")
+def step_catalog_index_remove_unknown(context) -> None:
+    context.catalog_index = CatalogIndex()
+    context.catalog_index.remove(_index_item("missing"))
+
+
+@when("I build a catalog index with two items sharing a digest and remove one")
+def step_catalog_index_remove_shared(context) -> None:
+    context.catalog_index = CatalogIndex()
+    context.catalog_index.add(_index_item("first"))
+    context.catalog_index.add(_index_item("second"))
+    context.catalog_index.remove(_index_item("first"))
+
+
+@then('the corpus has {count:d} items with the digest of "{text}"')
+def step_items_with_digest(context, count: int, text: str) -> None:
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    items = context.corpus.find_by_sha256(digest)
+    assert len(items) == count, items
+
+
+@then('the corpus has {count:d} items with tag "{tag}"')
+def step_items_with_tag(context, count: int, tag: str) -> None:
+    items = context.corpus.items_with_tag(tag)
+    assert len(items) == count, items
+
+
+@then('the corpus has {count:d} items with media type "{media_type}"')
+def step_items_with_media_type(context, count: int, media_type: str) -> None:
+    items = context.corpus.items_by_media_type(media_type)
+    assert len(items) == count, items
+
+
+@then("looking up the last ingested source uri returns the last ingested item")
+def step_lookup_last_source_uri(context) -> None:
+    item = context.corpus._find_item_by_source_uri(context.last_ingested_source_uri)
+    assert item is not None
+    assert item.id == context.indexed_item_ids[-1]
+
+
+@then('looking up the source uri "{source_uri}" returns nothing')
+def step_lookup_missing_source_uri(context, source_uri: str) -> None:
+    assert context.corpus._find_item_by_source_uri(source_uri) is None
+
+
+@then("the catalog index is empty")
+def step_catalog_index_empty(context) -> None:
+    index = context.catalog_index
+    assert not index.by_sha256 and not index.by_tag and not index.by_media_type
+    assert index.first_by_source_uri("anything") is None
+
+
+@then("the catalog index still lists the remaining item under the shared digest")
+def step_catalog_index_shared_digest(context) -> None:
+    index = context.catalog_index
+    assert CatalogIndex.lookup(index.by_sha256, "0" * 64) == ["second"]
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+
+from behave import given, then, when
+
+from biblicus import corpus as corpus_module
+from biblicus.retrievers import get_retriever
+
+
+@given("the catalog journal compaction threshold is {threshold:d}")
+def step_catalog_journal_threshold(context, threshold: int) -> None:
+    original_threshold = corpus_module.CATALOG_JOURNAL_COMPACTION_THRESHOLD
+    corpus_module.CATALOG_JOURNAL_COMPACTION_THRESHOLD = threshold
+
+    def _restore() -> None:
+        corpus_module.CATALOG_JOURNAL_COMPACTION_THRESHOLD = original_threshold
+
+    context.add_cleanup(_restore)
+
+
+@when("I ingest {count:d} notes via the Python application programming interface")
+def step_ingest_notes_python(context, count: int) -> None:
+    if not hasattr(context, "ingested_note_ids"):
+        context.ingested_note_ids = []
+    for _ in range(count):
+        index = len(context.ingested_note_ids)
+        result = context.corpus.ingest_note(f"Note body {index}", title=f"Note {index}")
+        context.ingested_note_ids.append(result.item_id)
+
+
+@when("I compact the corpus catalog")
+def step_compact_catalog(context) -> None:
+    context.corpus.compact_catalog()
+
+
+@when("I append a torn line to the catalog journal")
+def step_append_torn_journal_line(context) -> None:
+    with context.corpus.catalog_journal_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"op": "upsert", "item": {"id"')
+
+
+@when("I append an entry without an item to the catalog journal")
+def step_append_itemless_journal_entry(context) -> None:
+    with context.corpus.catalog_journal_path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"op": "upsert", "generated_at": "2024-01-01T00:00:00Z"}) + "\n")
+
+
+@when(
+    'I build a "{retriever_id}" retrieval snapshot via the Python application programming interface'
+)
+def step_build_snapshot_python(context, retriever_id: str) -> None:
+    retriever = get_retriever(retriever_id)
+    context.snapshot = retriever.build_snapshot(
+        context.corpus, configuration_name="default", configuration={}
+    )
+
+
+@then("the catalog journal has {count:d} entries")
+def step_catalog_journal_entries(context, count: int) -> None:
+    lines = context.corpus.catalog_journal_path.read_text(encoding="utf-8").splitlines()
+    assert len([line for line in lines if line.strip()]) == count, lines
+
+
+@then("the catalog journal does not exist")
+def step_catalog_journal_missing(context) -> None:
+    assert not context.corpus.catalog_journal_path.exists()
+
+
+@then("the catalog file lists {count:d} items")
+def step_catalog_file_items(context, count: int) -> None:
+    data = json.loads(context.corpus.catalog_path.read_text(encoding="utf-8"))
+    assert len(data["items"]) == count, len(data["items"])
+
+
+@then("the loaded catalog lists {count:d} items")
+def step_loaded_catalog_items(context, count: int) -> None:
+    catalog = context.corpus.load_catalog()
+    assert len(catalog.items) == count, len(catalog.items)
+    assert len(catalog.order) == count, catalog.order
+
+
+@then("the reopened corpus catalog lists {count:d} items")
+def step_reopened_catalog_items(context, count: int) -> None:
+    catalog = context.opened_corpus.load_catalog()
+    assert len(catalog.items) == count, len(catalog.items)
+    assert len(catalog.order) == count, catalog.order
+
+
+@then("the loaded catalog order starts with the most recent note")
+def step_loaded_catalog_order(context) -> None:
+    catalog = context.corpus.load_catalog()
+    assert catalog.order[0] == context.ingested_note_ids[-1]
+    assert catalog.order == list(reversed(context.ingested_note_ids))
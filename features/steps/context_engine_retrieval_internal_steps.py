@@ -32,13 +32,16 @@ class FakeCorpus:
     Minimal corpus stub that tracks retrieval snapshots.
     """
 
-    def __init__(self, snapshot):
+    def __init__(self, snapshot, root):
         """
         Initialize the stub with a latest snapshot.
 
         :param snapshot: Retrieval snapshot to treat as latest.
         :type snapshot: RetrievalSnapshot
+        :param root: Directory where retrievers may write snapshot artifacts.
+        :type root: Path
         """
+        self.root = root
         self.latest_snapshot_id = snapshot.snapshot_id
         self._snapshot = snapshot
         self._snapshots = {}
@@ -107,7 +110,7 @@ def _build_snapshot(retriever_id: str) -> RetrievalSnapshot:
 @when("I resolve a context retrieval snapshot with a mismatched latest retriever")
 def step_resolve_snapshot_mismatch(context) -> None:
     latest_snapshot = _build_snapshot("other")
-    corpus = FakeCorpus(latest_snapshot)
+    corpus = FakeCorpus(latest_snapshot, context.workdir)
     resolved = _resolve_snapshot(
         corpus,
         retriever_id="scan",
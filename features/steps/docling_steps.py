@@ -12,7 +12,7 @@ from dataclasses import dataclass, field
 from typing import Dict, Optional
 from urllib.parse import unquote
 
-from behave import given
+from behave import given, then
 
 
 @dataclass
@@ -101,8 +101,14 @@ def _install_fake_docling_module(context, *, with_mlx: bool = True) -> None:
     class _FakeConversionResult:
         """Fake Docling conversion result."""
 
-        def __init__(self, text: str, output_formats: Dict[str, str]) -> None:
+        def __init__(
+            self, text: str, output_formats: Dict[str, str], *, failed: bool = False
+        ) -> None:
             self.document = _FakeDocument(text, output_formats)
+            self.status = types.SimpleNamespace(name="FAILURE" if failed else "SUCCESS")
+            self.errors = (
+                [types.SimpleNamespace(error_message="fake docling error")] if failed else []
+            )
 
     class DocumentConverterOptions:
         """Fake DocumentConverterOptions."""
@@ -156,8 +162,28 @@ def _install_fake_docling_module(context, *, with_mlx: bool = True) -> None:
 
         def __init__(self, *, format_options=None) -> None:
             self.format_options = format_options
+            context.fake_docling_converters_created = (
+                getattr(context, "fake_docling_converters_created", 0) + 1
+            )
 
         def convert(self, filename: str) -> _FakeConversionResult:
+            behavior = self._behavior(filename)
+            if behavior is not None and behavior.mode == "error":
+                raise RuntimeError("fake docling error")
+            return self._result(behavior)
+
+        def convert_all(self, sources, raises_on_error: bool = True):
+            for source in sources:
+                behavior = self._behavior(source)
+                if behavior is not None and behavior.mode == "error":
+                    if raises_on_error:
+                        raise RuntimeError("fake docling error")
+                    yield _FakeConversionResult("", {}, failed=True)
+                else:
+                    yield self._result(behavior)
+
+        @staticmethod
+        def _behavior(filename: str) -> Optional[_FakeDoclingBehavior]:
             base_name = filename.rsplit("/", 1)[-1]
             normalized_name = base_name.split("--", 1)[-1] if "--" in base_name else base_name
             behavior = behaviors.get(normalized_name)
@@ -167,10 +193,12 @@ def _install_fake_docling_module(context, *, with_mlx: bool = True) -> None:
                 behavior = behaviors.get(decoded_basename)
                 if behavior is None:
                     behavior = behaviors.get(decoded_basename.split("--")[-1])
+            return behavior
+
+        @staticmethod
+        def _result(behavior: Optional[_FakeDoclingBehavior]) -> _FakeConversionResult:
             if behavior is None:
                 return _FakeConversionResult("", {})
-            if behavior.mode == "error":
-                raise RuntimeError("fake docling error")
             if behavior.mode == "empty":
                 return _FakeConversionResult("", behavior.output_formats)
             if behavior.mode == "text":
@@ -378,3 +406,18 @@ def step_docling_dependency_unavailable(context) -> None:
     :type context: behave.runner.Context
     """
     _install_docling_unavailable_module(context)
+
+
+@then("the fake Docling library created {count:d} converter")
+@then("the fake Docling library created {count:d} converters")
+def step_fake_docling_converters(context, count: int) -> None:
+    """
+    Check how many fake Docling converters were created.
+
+    :param context: Behave context.
+    :type context: behave.runner.Context
+    :param count: Expected number of converters.
+    :type count: int
+    """
+    created = getattr(context, "fake_docling_converters_created", 0)
+    assert created == count, created
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import sqlite3
+import sys
+
+import numpy as np
+from behave import then, when
+
+from biblicus.ai.embeddings import generate_embeddings_batch
+from biblicus.ai.models import AiProvider, EmbeddingsClientConfig
+from biblicus.constants import EMBEDDING_CACHE_FILENAME
+from biblicus.corpus import Corpus
+from biblicus.embedding_cache import EmbeddingCache
+from biblicus.embedding_providers import HashEmbeddingProvider
+from biblicus.retrievers import get_retriever
+
+
+def _corpus(context) -> Corpus:
+    return Corpus.open((context.workdir / "corpus").resolve())
+
+
+def _record_embed_texts(context) -> None:
+    context.embedding_call_sizes = []
+    if getattr(context, "cached_embed_texts_patched", False):
+        return
+    original_embed_texts = HashEmbeddingProvider.embed_texts
+
+    def recording_embed_texts(self, texts):
+        context.embedding_call_sizes.append(len(texts))
+        return original_embed_texts(self, texts)
+
+    HashEmbeddingProvider.embed_texts = recording_embed_texts
+    context.cached_embed_texts_patched = True
+    context.add_cleanup(setattr, HashEmbeddingProvider, "embed_texts", original_embed_texts)
+
+
+def _build_snapshot(context, retriever_id: str, name: str, **overrides) -> None:
+    _record_embed_texts(context)
+    configuration = {
+        "embedding_provider": {"provider_id": "hash-embedding", "dimensions": 16},
+        **overrides,
+    }
+    snapshot = get_retriever(retriever_id).build_snapshot(
+        _corpus(context), configuration_name=name, configuration=configuration
+    )
+    context.last_snapshot = snapshot.model_dump()
+    context.last_snapshot_id = snapshot.snapshot_id
+
+
+def _cache_hash_provider(context, texts):
+    context.embedding_call_sizes.append(len(texts))
+    return HashEmbeddingProvider(dimensions=8).embed_texts(texts)
+
+
+@when('I build a cached "{retriever_id}" snapshot named "{name}" while counting embedding calls')
+def step_build_cached_snapshot(context, retriever_id: str, name: str) -> None:
+    _build_snapshot(context, retriever_id, name)
+
+
+@when(
+    'I build a cached "{retriever_id}" snapshot named "{name}" with {dimensions:d} dimensions '
+    "while counting embedding calls"
+)
+def step_build_cached_snapshot_dimensions(
+    context, retriever_id: str, name: str, dimensions: int
+) -> None:
+    _build_snapshot(
+        context,
+        retriever_id,
+        name,
+        embedding_provider={"provider_id": "hash-embedding", "dimensions": dimensions},
+    )
+
+
+@when(
+    'I build a cached "{retriever_id}" snapshot named "{name}" with at most {entries:d} cache '
+    "entries while counting embedding calls"
+)
+def step_build_cached_snapshot_bounded(context, retriever_id: str, name: str, entries: int) -> None:
+    _build_snapshot(
+        context, retriever_id, name, embedding_batch_size=4, embedding_cache_max_entries=entries
+    )
+
+
+@when('I build an uncached "{retriever_id}" snapshot while counting embedding calls')
+def step_build_uncached_snapshot(context, retriever_id: str) -> None:
+    _build_snapshot(context, retriever_id, "uncached", embedding_cache=False)
+
+
+@when('I embed texts "{texts}" through the corpus embedding cache')
+def step_embed_through_cache(context, texts: str) -> None:
+    context.embedding_call_sizes = []
+    cache = EmbeddingCache.for_corpus(_corpus(context))
+    try:
+        context.cached_embeddings = cache.embed(
+            "test", texts.split(","), lambda missing: _cache_hash_provider(context, missing)
+        )
+    finally:
+        cache.close()
+    context.embedding_cache_stats = cache.stats
+    context.cached_texts = texts.split(",")
+
+
+@when('I embed texts "{texts}" through the corpus embedding cache twice with a float64 provider')
+def step_embed_through_cache_float64(context, texts: str) -> None:
+    context.embedding_call_sizes = []
+
+    def provider(missing):
+        return _cache_hash_provider(context, missing).astype(np.float64) / 3.0
+
+    cache = EmbeddingCache.for_corpus(_corpus(context))
+    try:
+        context.fresh_embeddings = cache.embed("test", texts.split(","), provider)
+        context.cached_embeddings = cache.embed("test", texts.split(","), provider)
+    finally:
+        cache.close()
+
+
+@when("I embed no texts through the corpus embedding cache")
+def step_embed_nothing_through_cache(context) -> None:
+    context.embedding_call_sizes = []
+    cache = EmbeddingCache.for_corpus(_corpus(context))
+    context.cached_embeddings = cache.embed(
+        "test", [], lambda missing: _cache_hash_provider(context, missing)
+    )
+    cache.close()
+
+
+@when(
+    'I attempt to embed texts "{texts}" through the corpus embedding cache with a provider that '
+    "drops a row"
+)
+def step_embed_through_cache_dropping_row(context, texts: str) -> None:
+    context.embedding_call_sizes = []
+    cache = EmbeddingCache.for_corpus(_corpus(context))
+    try:
+        cache.embed(
+            "test", texts.split(","), lambda missing: _cache_hash_provider(context, missing)[:-1]
+        )
+    except ValueError as exc:
+        context.embedding_cache_error = exc
+    finally:
+        cache.close()
+
+
+@when("I attempt to open the corpus embedding cache with at most {entries:d} entries")
+def step_open_cache_with_bound(context, entries: int) -> None:
+    try:
+        EmbeddingCache.for_corpus(_corpus(context), max_entries=entries)
+    except ValueError as exc:
+        context.embedding_cache_error = exc
+
+
+@when("I open and close the corpus embedding cache without using it")
+def step_open_close_cache(context) -> None:
+    EmbeddingCache.for_corpus(_corpus(context)).close()
+
+
+@when('I generate embeddings for texts "{texts}" with the corpus embedding cache')
+def step_generate_embeddings_with_cache(context, texts: str) -> None:
+    client = EmbeddingsClientConfig(
+        provider=AiProvider.OPENAI,
+        model="openai/text-embedding-3-small",
+        api_key="test-key",
+        batch_size=16,
+        parallelism=4,
+    )
+    cache = EmbeddingCache.for_corpus(_corpus(context))
+    try:
+        context.embeddings_vectors = generate_embeddings_batch(
+            client=client, texts=texts.split(","), cache=cache
+        )
+    finally:
+        cache.close()
+
+
+@then("the latest snapshot reports {hits:d} embedding cache hits and {misses:d} misses")
+def step_latest_cache_hits_misses(context, hits: int, misses: int) -> None:
+    stats = context.last_snapshot["stats"]
+    assert stats["embedding_cache_hits"] == hits, stats
+    assert stats["embedding_cache_misses"] == misses, stats
+
+
+@then("the latest snapshot reports {evictions:d} embedding cache evictions")
+def step_latest_cache_evictions(context, evictions: int) -> None:
+    stats = context.last_snapshot["stats"]
+    assert stats["embedding_cache_evictions"] == evictions, stats
+
+
+@then("the latest snapshot reports no embedding cache statistics")
+def step_latest_no_cache_stats(context) -> None:
+    stats = context.last_snapshot["stats"]
+    assert not [key for key in stats if key.startswith("embedding_cache_")], stats
+
+
+@then("the corpus embedding cache holds {count:d} vectors")
+def step_cache_holds_vectors(context, count: int) -> None:
+    path = _corpus(context).meta_dir / EMBEDDING_CACHE_FILENAME
+    connection = sqlite3.connect(str(path))
+    try:
+        stored = connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+    finally:
+        connection.close()
+    assert stored == count, stored
+
+
+@then("the corpus embedding cache does not exist")
+def step_cache_missing(context) -> None:
+    assert not (_corpus(context).meta_dir / EMBEDDING_CACHE_FILENAME).exists()
+
+
+@then("the embedding cache reports {hits:d} hits and {misses:d} misses")
+def step_cache_hits_misses(context, hits: int, misses: int) -> None:
+    stats = context.embedding_cache_stats
+    assert (stats.hits, stats.misses) == (hits, misses), stats
+
+
+@then('the cached embeddings for "{text}" are identical')
+def step_cached_embeddings_identical(context, text: str) -> None:
+    rows = [
+        context.cached_embeddings[index]
+        for index, value in enumerate(context.cached_texts)
+        if value == text
+    ]
+    assert len(rows) > 1
+    assert all(np.array_equal(rows[0], row) for row in rows[1:])
+    assert context.cached_embeddings.dtype == np.float32
+
+
+@then("the cached and freshly embedded vectors are identical float64 matrices")
+def step_cached_vectors_float64(context) -> None:
+    assert context.fresh_embeddings.dtype == np.float64, context.fresh_embeddings.dtype
+    assert context.cached_embeddings.dtype == np.float64, context.cached_embeddings.dtype
+    assert np.array_equal(context.fresh_embeddings, context.cached_embeddings)
+
+
+@then("the cached embedding matrix has {count:d} rows")
+def step_cached_matrix_rows(context, count: int) -> None:
+    assert context.cached_embeddings.shape[0] == count, context.cached_embeddings.shape
+
+
+@then('the embedding cache error is "{message}"')
+def step_cache_error(context, message: str) -> None:
+    assert str(context.embedding_cache_error) == message, context.embedding_cache_error
+
+
+@then('the fake embedding service last embedded "{texts}"')
+def step_fake_service_last_embedded(context, texts: str) -> None:
+    assert sys.modules["dspy"].last_embedding_inputs == texts.split(","), sys.modules[
+        "dspy"
+    ].last_embedding_inputs
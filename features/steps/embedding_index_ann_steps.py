@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from behave import then, when
+
+from biblicus.corpus import Corpus
+from biblicus.evaluation.retrieval import benchmark_approximate_snapshot
+from biblicus.models import QueryBudget
+from biblicus.retrievers.embedding_index_ann import EmbeddingIndexAnnRetriever
+
+_BUDGET = QueryBudget(max_total_items=3, maximum_total_characters=1000, max_items_per_source=5)
+
+
+def _corpus_path(context, name: str) -> Path:
+    return (context.workdir / name).resolve()
+
+
+def _run_benchmark(context, probes: list[int], queries: str) -> None:
+    corpus = Corpus.open(_corpus_path(context, "corpus"))
+    context.ann_benchmark = benchmark_approximate_snapshot(
+        corpus=corpus,
+        approximate_snapshot=corpus.load_snapshot(context.last_snapshot_id),
+        exact_snapshot=corpus.load_snapshot(context.exact_snapshot_id),
+        query_texts=[query.strip() for query in queries.split(",")],
+        budget=_BUDGET,
+        probes=probes,
+    )
+
+
+@then("the latest snapshot stats include lists {count:d}")
+def step_snapshot_stats_lists(context, count: int) -> None:
+    assert context.last_snapshot["stats"]["lists"] == count, context.last_snapshot["stats"]
+
+
+@then("the query stats include probed_lists {count:d}")
+def step_query_stats_probed_lists(context, count: int) -> None:
+    assert context.last_query["stats"]["probed_lists"] == count, context.last_query["stats"]
+
+
+@then("the query stats report fewer than {count:d} scanned chunks")
+def step_query_stats_scanned_chunks(context, count: int) -> None:
+    assert context.last_query["stats"]["scanned_chunks"] < count, context.last_query["stats"]
+
+
+@when("I remember the latest snapshot as the exact snapshot")
+def step_remember_exact_snapshot(context) -> None:
+    context.exact_snapshot_id = context.last_snapshot_id
+
+
+@when(
+    'I benchmark the latest snapshot against the exact snapshot with probes "{probes}" '
+    'for queries "{queries}"'
+)
+def step_benchmark_with_probes(context, probes: str, queries: str) -> None:
+    _run_benchmark(context, [int(value) for value in probes.split(",")], queries)
+
+
+@when(
+    "I benchmark the latest snapshot against the exact snapshot with the configured probes "
+    'for queries "{queries}"'
+)
+def step_benchmark_configured_probes(context, queries: str) -> None:
+    _run_benchmark(context, [], queries)
+
+
+@then("the benchmark reports {count:d} probe settings")
+def step_benchmark_probe_settings(context, count: int) -> None:
+    assert len(context.ann_benchmark) == count
+    for result in context.ann_benchmark:
+        assert result.k == _BUDGET.max_total_items
+        assert result.approximate_latency["average_milliseconds"] >= 0.0
+        assert result.exact_latency["percentile_95_milliseconds"] >= 0.0
+
+
+@then("the benchmark recall at k for {probes:d} probes is {recall:g}")
+def step_benchmark_recall(context, probes: int, recall: float) -> None:
+    result = next(item for item in context.ann_benchmark if item.probes == probes)
+    assert result.recall_at_k == recall, result
+
+
+@then("the benchmark recall at k for {probes:d} probes is at most {recall:g}")
+def step_benchmark_recall_at_most(context, probes: int, recall: float) -> None:
+    result = next(item for item in context.ann_benchmark if item.probes == probes)
+    assert 0.0 <= result.recall_at_k <= recall, result
+
+
+@when(
+    'I build an "{retriever_id}" snapshot for corpus "{name}" via the Python application '
+    "programming interface"
+)
+def step_build_ann_snapshot_python(context, retriever_id: str, name: str) -> None:
+    assert retriever_id == EmbeddingIndexAnnRetriever.retriever_id
+    corpus = Corpus.open(_corpus_path(context, name))
+    context.ann_snapshot = EmbeddingIndexAnnRetriever().build_snapshot(
+        corpus,
+        configuration_name="default",
+        configuration={
+            "embedding_provider": {"provider_id": "hash-embedding", "dimensions": 8},
+        },
+    )
+
+
+@then('the approximate snapshot for corpus "{name}" has 0 lists and returns no evidence')
+def step_ann_snapshot_empty(context, name: str) -> None:
+    corpus = Corpus.open(_corpus_path(context, name))
+    assert context.ann_snapshot.stats["lists"] == 0
+    result = EmbeddingIndexAnnRetriever().query(
+        corpus, snapshot=context.ann_snapshot, query_text="anything", budget=_BUDGET
+    )
+    assert result.evidence == []
+    assert result.stats["scanned_chunks"] == 0
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+
+import numpy as np
+from behave import then, when
+
+from biblicus.corpus import Corpus
+from biblicus.models import QueryBudget
+from biblicus.retrievers import get_retriever
+from biblicus.retrievers.embedding_index_common import (
+    ChunkTable,
+    artifact_paths_for_snapshot,
+    read_chunk_table,
+    write_chunks_jsonl,
+)
+
+
+def _corpus(context) -> Corpus:
+    return Corpus.open((context.workdir / "corpus").resolve())
+
+
+def _latest_paths(context):
+    snapshot = context.chunk_table_snapshot
+    paths = artifact_paths_for_snapshot(
+        snapshot_id=snapshot.snapshot_id, retriever_id=snapshot.configuration.retriever_id
+    )
+    corpus = _corpus(context)
+    return {key: corpus.root / relpath for key, relpath in paths.items()}
+
+
+@when('I build a "{retriever_id}" chunk table snapshot')
+def step_build_chunk_table_snapshot(context, retriever_id: str) -> None:
+    context.chunk_table_snapshot = get_retriever(retriever_id).build_snapshot(
+        _corpus(context),
+        configuration_name="chunk-table",
+        configuration={
+            "embedding_cache": False,
+            "embedding_provider": {"provider_id": "hash-embedding", "dimensions": 16},
+        },
+    )
+
+
+@when(
+    'I query the latest chunk table snapshot for "{query_text}" with at most {count:d} '
+    "{noun} while counting chunk records"
+)
+def step_query_chunk_table_snapshot(context, query_text: str, count: int, noun: str) -> None:
+    context.materialized_chunk_records = 0
+    original_getitem = ChunkTable.__getitem__
+
+    def counting_getitem(self, index):
+        context.materialized_chunk_records += 1
+        return original_getitem(self, index)
+
+    ChunkTable.__getitem__ = counting_getitem
+    try:
+        snapshot = context.chunk_table_snapshot
+        context.chunk_table_result = get_retriever(snapshot.configuration.retriever_id).query(
+            _corpus(context),
+            snapshot=snapshot,
+            query_text=query_text,
+            budget=QueryBudget(
+                max_total_items=count, maximum_total_characters=5000, max_items_per_source=5
+            ),
+        )
+    finally:
+        ChunkTable.__getitem__ = original_getitem
+
+
+@when("I remember the chunk table query results")
+def step_remember_chunk_table_results(context) -> None:
+    context.remembered_chunk_table_result = context.chunk_table_result
+
+
+@when("I rewrite the latest snapshot chunk table as a chunk records file")
+def step_rewrite_chunk_table_as_jsonl(context) -> None:
+    paths = _latest_paths(context)
+    table = read_chunk_table(paths["chunks"], paths["chunk_item_ids"])
+    write_chunks_jsonl(paths["legacy_chunks"], [table[index] for index in range(len(table))])
+    del table
+    paths["chunks"].unlink()
+    paths["chunk_item_ids"].unlink()
+
+
+@when("I delete the latest snapshot chunk table")
+def step_delete_chunk_table(context) -> None:
+    paths = _latest_paths(context)
+    paths["chunks"].unlink()
+    paths["chunk_item_ids"].unlink()
+
+
+@when('I attempt to query the latest chunk table snapshot for "{query_text}"')
+def step_attempt_query_chunk_table_snapshot(context, query_text: str) -> None:
+    snapshot = context.chunk_table_snapshot
+    try:
+        get_retriever(snapshot.configuration.retriever_id).query(
+            _corpus(context),
+            snapshot=snapshot,
+            query_text=query_text,
+            budget=QueryBudget(
+                max_total_items=1, maximum_total_characters=5000, max_items_per_source=5
+            ),
+        )
+    except FileNotFoundError as exc:
+        context.chunk_table_query_error = exc
+
+
+@then("the latest snapshot stores a chunk table of {rows:d} rows over {items:d} items")
+def step_latest_chunk_table_shape(context, rows: int, items: int) -> None:
+    paths = _latest_paths(context)
+    spans = np.load(paths["chunks"])
+    item_ids = json.loads(paths["chunk_item_ids"].read_text(encoding="utf-8"))
+    assert spans.shape == (rows, 3), spans.shape
+    assert spans.dtype == np.int64, spans.dtype
+    assert len(item_ids) == items, item_ids
+    assert set(item_ids) == set(_corpus(context).load_catalog().items)
+    assert bool(np.all(spans[:, 2] > spans[:, 1]))
+    artifacts = context.chunk_table_snapshot.snapshot_artifacts
+    assert str(paths["chunks"].relative_to(_corpus(context).root)) in artifacts, artifacts
+
+
+@then("the latest snapshot stores no chunk records file")
+def step_latest_no_chunk_records_file(context) -> None:
+    assert not _latest_paths(context)["legacy_chunks"].exists()
+
+
+@then("the query materialized one chunk record per candidate")
+def step_materialized_per_candidate(context) -> None:
+    candidates = context.chunk_table_result.stats["candidates"]
+    assert context.materialized_chunk_records == candidates, (
+        context.materialized_chunk_records,
+        candidates,
+    )
+
+
+@then("the query materialized fewer than {count:d} chunk records")
+def step_materialized_fewer_than(context, count: int) -> None:
+    assert context.materialized_chunk_records < count, context.materialized_chunk_records
+
+
+@then("the chunk table query results match the remembered results")
+def step_chunk_table_results_match(context) -> None:
+    def summary(result):
+        return [
+            (evidence.item_id, evidence.span_start, evidence.span_end, evidence.text)
+            for evidence in result.evidence
+        ]
+
+    remembered = summary(context.remembered_chunk_table_result)
+    assert remembered
+    assert summary(context.chunk_table_result) == remembered
+
+
+@then('the chunk table query fails with "{message}"')
+def step_chunk_table_query_fails(context, message: str) -> None:
+    assert str(context.chunk_table_query_error) == message, context.chunk_table_query_error
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+from behave import then, when
+
+from biblicus.retrievers import embedding_index_file
+
+
+def _latest_embeddings_path(context) -> Path:
+    corpus = (context.workdir / "corpus").resolve()
+    artifacts = context.last_snapshot.get("snapshot_artifacts") or []
+    embeddings = [relpath for relpath in artifacts if relpath.endswith(".embeddings.npy")]
+    assert embeddings, artifacts
+    return corpus / embeddings[0]
+
+
+@then('the latest embedding index artifact has element type "{dtype}" and unit-length rows')
+def step_embedding_artifact_dtype(context, dtype: str) -> None:
+    matrix = np.load(_latest_embeddings_path(context))
+    assert str(matrix.dtype) == dtype, matrix.dtype
+    norms = np.linalg.norm(matrix.astype(np.float32), axis=1)
+    assert np.allclose(norms, 1.0, atol=1e-2), norms
+
+
+@when("I record the embedding rows scored per batch")
+def step_record_scored_batches(context) -> None:
+    original_float32_rows = embedding_index_file.float32_rows
+    context.scored_embedding_batches = []
+
+    def recording_float32_rows(embeddings: np.ndarray, start: int, end: int) -> np.ndarray:
+        context.scored_embedding_batches.append((type(embeddings), end - start))
+        return original_float32_rows(embeddings, start, end)
+
+    embedding_index_file.float32_rows = recording_float32_rows
+    context.add_cleanup(setattr, embedding_index_file, "float32_rows", original_float32_rows)
+
+
+@then("no scored embedding batch exceeded {rows:d} rows")
+def step_scored_batches_bounded(context, rows: int) -> None:
+    batches = context.scored_embedding_batches
+    assert batches
+    assert max(size for _, size in batches) <= rows, batches
+
+
+@then("the scored embedding batches were memory-mapped")
+def step_scored_batches_memory_mapped(context) -> None:
+    for matrix_type, _ in context.scored_embedding_batches:
+        assert issubclass(matrix_type, np.memmap), matrix_type
+
+
+@then('the top query evidence text is "{text}"')
+def step_top_evidence_text(context, text: str) -> None:
+    evidence = context.last_query.get("evidence") or []
+    assert evidence, context.last_query
+    assert evidence[0].get("text") == text, evidence[0]
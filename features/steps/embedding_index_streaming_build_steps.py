@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+from behave import then, when
+
+from biblicus.corpus import Corpus
+from biblicus.embedding_providers import HashEmbeddingProvider
+from biblicus.models import QueryBudget
+from biblicus.retrievers.embedding_index_file import EmbeddingIndexFileRetriever
+
+_BUDGET = QueryBudget(max_total_items=5, maximum_total_characters=5000, max_items_per_source=5)
+
+
+def _corpus(context) -> Corpus:
+    return Corpus.open((context.workdir / "corpus").resolve())
+
+
+def _partial_build_dirs(context) -> list[Path]:
+    partial_root = _corpus(context).retrieval_dir / "embedding-index-file" / ".partial"
+    return sorted(partial_root.iterdir()) if partial_root.is_dir() else []
+
+
+def _patch_embed_texts(context, *, fail_on_call: int = 0, drop_rows: bool = False) -> None:
+    context.embedding_call_sizes = []
+    context.embedding_fail_on_call = fail_on_call
+    context.embedding_drop_rows = drop_rows
+    if getattr(context, "embed_texts_patched", False):
+        return
+    original_embed_texts = HashEmbeddingProvider.embed_texts
+
+    def recording_embed_texts(self, texts):
+        context.embedding_call_sizes.append(len(texts))
+        if len(context.embedding_call_sizes) == context.embedding_fail_on_call:
+            raise RuntimeError("embedding service unavailable")
+        embeddings = original_embed_texts(self, texts)
+        return embeddings[:-1] if context.embedding_drop_rows else embeddings
+
+    HashEmbeddingProvider.embed_texts = recording_embed_texts
+    context.embed_texts_patched = True
+    context.add_cleanup(setattr, HashEmbeddingProvider, "embed_texts", original_embed_texts)
+
+
+def _build_streaming_snapshot(context, batch_size: int) -> None:
+    snapshot = EmbeddingIndexFileRetriever().build_snapshot(
+        _corpus(context),
+        configuration_name="streaming",
+        configuration={
+            "embedding_batch_size": batch_size,
+            "embedding_cache": False,
+            "embedding_provider": {"provider_id": "hash-embedding", "dimensions": 16},
+        },
+    )
+    context.last_snapshot = snapshot.model_dump()
+    context.last_snapshot_id = snapshot.snapshot_id
+
+
+@when(
+    "I build a streaming embedding index with embedding batch size {batch_size:d} while "
+    "counting embedding calls"
+)
+def step_build_streaming_counting(context, batch_size: int) -> None:
+    _patch_embed_texts(context)
+    _build_streaming_snapshot(context, batch_size)
+
+
+@when(
+    "I attempt a streaming embedding index build with embedding batch size {batch_size:d} that "
+    "fails on embedding call {call:d}"
+)
+def step_attempt_streaming_failing(context, batch_size: int, call: int) -> None:
+    _patch_embed_texts(context, fail_on_call=call)
+    try:
+        _build_streaming_snapshot(context, batch_size)
+    except RuntimeError as error:
+        context.build_error = error
+    else:
+        raise AssertionError("streaming build did not fail")
+
+
+@when("I attempt a streaming embedding index build with a provider that drops rows")
+def step_attempt_streaming_dropping_rows(context) -> None:
+    _patch_embed_texts(context, drop_rows=True)
+    try:
+        _build_streaming_snapshot(context, 4)
+    except ValueError as error:
+        context.build_error = error
+    else:
+        raise AssertionError("streaming build did not fail")
+
+
+@then('the streaming build failed with "{message}"')
+def step_streaming_build_failed(context, message: str) -> None:
+    assert message in str(context.build_error), context.build_error
+
+
+@then("every embedding call embedded {count:d} chunks or fewer")
+def step_embedding_calls_bounded(context, count: int) -> None:
+    assert context.embedding_call_sizes, context.embedding_call_sizes
+    assert max(context.embedding_call_sizes) <= count, context.embedding_call_sizes
+
+
+@then("the embedding calls embedded {count:d} chunks in total")
+def step_embedding_calls_total(context, count: int) -> None:
+    assert sum(context.embedding_call_sizes) == count, context.embedding_call_sizes
+
+
+@then("a partial embedding build checkpoint records {count:d} chunks")
+def step_partial_checkpoint(context, count: int) -> None:
+    build_dirs = _partial_build_dirs(context)
+    assert len(build_dirs) == 1, build_dirs
+    checkpoint = json.loads((build_dirs[0] / "checkpoint.json").read_text(encoding="utf-8"))
+    assert checkpoint["chunks"] == count, checkpoint
+
+
+@then("no partial embedding build remains")
+def step_no_partial_build(context) -> None:
+    assert _partial_build_dirs(context) == []
+
+
+@then("the latest snapshot resumed {count:d} chunks")
+def step_latest_resumed_chunks(context, count: int) -> None:
+    assert context.last_snapshot["stats"]["resumed_chunks"] == count, context.last_snapshot
+
+
+@then("the latest snapshot has {chunks:d} chunks of {dimensions:d} dimensions")
+def step_latest_chunks_dimensions(context, chunks: int, dimensions: int) -> None:
+    stats = context.last_snapshot["stats"]
+    assert stats["chunks"] == chunks, stats
+    assert stats["dimensions"] == dimensions, stats
+    corpus = _corpus(context)
+    matrix = np.load(corpus.root / context.last_snapshot["snapshot_artifacts"][0])
+    assert matrix.shape == (chunks, dimensions), matrix.shape
+
+
+@then("the latest embedding index artifacts match the exact snapshot")
+def step_embedding_artifacts_match_exact(context) -> None:
+    corpus = _corpus(context)
+    exact = corpus.load_snapshot(context.exact_snapshot_id)
+    latest = corpus.load_snapshot(context.last_snapshot_id)
+    assert len(exact.snapshot_artifacts) == len(latest.snapshot_artifacts)
+    for exact_relpath, latest_relpath in zip(exact.snapshot_artifacts, latest.snapshot_artifacts):
+        exact_path, latest_path = corpus.root / exact_relpath, corpus.root / latest_relpath
+        if exact_path.suffix == ".npy":
+            assert np.array_equal(np.load(exact_path), np.load(latest_path)), latest_relpath
+        else:
+            assert exact_path.read_bytes() == latest_path.read_bytes(), latest_relpath
+    assert latest.stats["text_items"] == exact.stats["text_items"]
+    retriever = EmbeddingIndexFileRetriever()
+    exact_result = retriever.query(corpus, snapshot=exact, query_text="Note body 7", budget=_BUDGET)
+    latest_result = retriever.query(
+        corpus, snapshot=latest, query_text="Note body 7", budget=_BUDGET
+    )
+    assert [evidence.item_id for evidence in latest_result.evidence] == [
+        evidence.item_id for evidence in exact_result.evidence
+    ]
+    assert latest_result.evidence
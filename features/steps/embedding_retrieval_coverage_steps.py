@@ -26,6 +26,7 @@ from biblicus.embedding_providers import (
     HashEmbeddingProvider,
 )
 from biblicus.models import ExtractionSnapshotReference, QueryBudget
+from biblicus.retrievers.embedding_index_ann import EmbeddingIndexAnnRetriever
 from biblicus.retrievers.embedding_index_common import (
     ChunkRecord,
     EmbeddingIndexConfiguration,
@@ -307,6 +308,8 @@ def step_attempt_query_invalid_query_embedding_shape(context, backend_id: str) -
         retriever = EmbeddingIndexFileRetriever()
     elif backend_id == EmbeddingIndexInMemoryRetriever.retriever_id:
         retriever = EmbeddingIndexInMemoryRetriever()
+    elif backend_id == EmbeddingIndexAnnRetriever.retriever_id:
+        retriever = EmbeddingIndexAnnRetriever()
     else:
         raise AssertionError(f"Unsupported retriever in this scenario: {backend_id}")
     budget = QueryBudget(max_total_items=5, maximum_total_characters=1000, max_items_per_source=5)
@@ -343,17 +346,19 @@ def step_attempt_query_inconsistent_artifacts(context, backend_id: str) -> None:
         retriever = EmbeddingIndexFileRetriever()
     elif backend_id == EmbeddingIndexInMemoryRetriever.retriever_id:
         retriever = EmbeddingIndexInMemoryRetriever()
+    elif backend_id == EmbeddingIndexAnnRetriever.retriever_id:
+        retriever = EmbeddingIndexAnnRetriever()
     else:
         raise AssertionError(f"Unsupported retriever in this scenario: {backend_id}")
 
     chunks_relpath = next(
-        (p for p in snapshot.snapshot_artifacts if p.endswith(".chunks.jsonl")), None
+        (p for p in snapshot.snapshot_artifacts if p.endswith(".chunks.npy")), None
     )
     assert isinstance(chunks_relpath, str)
     chunks_path = corpus.root / chunks_relpath
-    raw_lines = chunks_path.read_text(encoding="utf-8").splitlines()
-    assert raw_lines
-    chunks_path.write_text("\n".join(raw_lines[:-1]) + "\n", encoding="utf-8")
+    spans = np.load(chunks_path)
+    assert spans.shape[0]
+    np.save(chunks_path, spans[:-1])
 
     budget = QueryBudget(max_total_items=5, maximum_total_characters=1000, max_items_per_source=5)
     try:
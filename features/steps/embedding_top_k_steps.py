@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import numpy as np
+from behave import given, then, when
+
+from biblicus.retrievers.embedding_index_common import cosine_similarity_scores
+from biblicus.retrievers.embedding_index_file import _top_indices_batched
+from biblicus.retrievers.embedding_index_inmemory import _top_indices
+
+
+@given("a random normalized embedding matrix with {rows:d} rows and {dimensions:d} dimensions")
+def step_random_embedding_matrix(context, rows: int, dimensions: int) -> None:
+    generator = np.random.default_rng(7)
+    matrix = generator.normal(size=(rows, dimensions)).astype(np.float32)
+    context.top_k_embeddings = matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+    context.top_k_query = context.top_k_embeddings[0]
+
+
+@given(
+    "an embedding matrix where rows {first:d}, {second:d}, {third:d}, and {fourth:d} equal the query"
+)
+def step_tied_embedding_matrix(context, first: int, second: int, third: int, fourth: int) -> None:
+    matrix = np.tile(np.array([[0.0, 1.0]], dtype=np.float32), (16, 1))
+    for row in (fourth, third, second, first):
+        matrix[row] = [1.0, 0.0]
+    context.top_k_embeddings = matrix
+    context.top_k_query = np.array([1.0, 0.0], dtype=np.float32)
+
+
+@when("I compute top indices in batches of {batch_rows:d} rows with limit {limit:d}")
+def step_compute_top_indices_batches(context, batch_rows: int, limit: int) -> None:
+    context.top_k_limit = limit
+    context.last_top_indices = _top_indices_batched(
+        embeddings=context.top_k_embeddings,
+        query_vector=context.top_k_query,
+        limit=limit,
+        batch_rows=batch_rows,
+    )
+
+
+@when('I compute top indices for scores "{scores}" with limit {limit:d}')
+def step_compute_top_indices_scores(context, scores: str, limit: int) -> None:
+    values = np.array([float(value) for value in scores.split(",")], dtype=np.float32)
+    context.last_top_indices = _top_indices(values, limit=limit)
+
+
+@then("the top indices match a full sort of the scores")
+def step_top_indices_match_full_sort(context) -> None:
+    scores = cosine_similarity_scores(context.top_k_embeddings, context.top_k_query)
+    expected = sorted(range(scores.size), key=lambda index: (-float(scores[index]), index))
+    assert context.last_top_indices == expected[: context.top_k_limit]
+
+
+@then('the top indices are "{indices}"')
+def step_top_indices_are(context, indices: str) -> None:
+    assert context.last_top_indices == [int(index) for index in indices.split(",")]
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import contextlib
+import io
+from unittest import mock
+
+from behave import then, when
+
+from biblicus.corpus import Corpus
+from biblicus.errors import ExtractionSnapshotFatalError
+from biblicus.extraction import build_extraction_snapshot
+from biblicus.extractors import get_extractor as resolve_extractor
+from biblicus.extractors.pass_through_text import PassThroughTextExtractor
+from biblicus.models import ExtractedText
+
+
+def _unreadable(text: str) -> bool:
+    return "Note body 1\n" in text or text.endswith("Note body 1")
+
+
+class _BatchingExtractor(PassThroughTextExtractor):
+    """
+    Extractor test double that overrides extract_batch and records how it is called.
+
+    Items whose text contains "Note body 1" fail when extracted one at a time, and batches that
+    return an error for one item return it for those items.
+    """
+
+    extractor_id = "batching-text"
+    cacheable = True
+
+    def __init__(self, context, failure=None) -> None:
+        self._context = context
+        self._failure = failure
+
+    def extract_text(self, *, corpus, item, config, previous_extractions):
+        extracted = super().extract_text(
+            corpus=corpus, item=item, config=config, previous_extractions=previous_extractions
+        )
+        self._context.single_item_extractions += 1
+        if _unreadable(extracted.text):
+            raise RuntimeError("unreadable item")
+        return ExtractedText(text=extracted.text, producer_extractor_id=self.extractor_id)
+
+    def extract_batch(self, *, corpus, items, config, previous_extractions):
+        self._context.batches.append([item.media_type for item in items])
+        if self._failure == "raise an error":
+            raise RuntimeError("batch failed")
+        if self._failure == "raise a fatal error":
+            raise ExtractionSnapshotFatalError("model unavailable")
+        texts = [
+            ExtractedText(
+                text=(corpus.root / item.relpath).read_text(encoding="utf-8"),
+                producer_extractor_id=self.extractor_id,
+            )
+            for item in items
+        ]
+        if self._failure == "return too few results":
+            return texts[:-1]
+        if self._failure == "return an error for one item":
+            return [
+                RuntimeError("unreadable item") if _unreadable(text.text) else text
+                for text in texts
+            ]
+        if self._failure == "return a fatal error for one item":
+            return [ExtractionSnapshotFatalError("model unavailable"), *texts[1:]]
+        return texts
+
+
+def _corpus(context) -> Corpus:
+    return Corpus.open((context.workdir / "corpus").resolve())
+
+
+def _build(
+    context,
+    *,
+    batch_size: int = 8,
+    failure=None,
+    configuration_name: str = "batching",
+    max_workers: int = 1,
+    executor: str = "thread",
+) -> None:
+    extractor = _BatchingExtractor(context, failure)
+    context.batches = []
+    context.single_item_extractions = 0
+
+    def _resolve_extractor(extractor_id: str):
+        if extractor_id == extractor.extractor_id:
+            return extractor
+        return resolve_extractor(extractor_id)
+
+    stderr = io.StringIO()
+    context.batched_stderr = stderr
+    patch = mock.patch("biblicus.extraction.get_extractor", side_effect=_resolve_extractor)
+    with patch, contextlib.redirect_stderr(stderr):
+        context.batched_manifest = build_extraction_snapshot(
+            _corpus(context),
+            extractor_id="pipeline",
+            configuration_name=configuration_name,
+            configuration={"stages": [{"extractor_id": extractor.extractor_id, "config": {}}]},
+            max_workers=max_workers,
+            executor=executor,
+            batch_size=batch_size,
+        )
+
+
+@when("I build a batched extraction snapshot with batch size {batch_size:d}")
+def step_build_batched(context, batch_size: int) -> None:
+    _build(context, batch_size=batch_size)
+
+
+@when(
+    "I build a batched extraction snapshot with batch size {batch_size:d} and a new configuration "
+    "name"
+)
+def step_build_batched_renamed(context, batch_size: int) -> None:
+    _build(context, batch_size=batch_size, configuration_name="batching-renamed")
+
+
+@when(
+    "I build a batched extraction snapshot with batch size {batch_size:d} whose batches {failure}"
+)
+def step_build_batched_failing(context, batch_size: int, failure: str) -> None:
+    _build(context, batch_size=batch_size, failure=failure)
+
+
+@when(
+    "I build a batched extraction snapshot with batch size {batch_size:d}, {workers:d} {executor} "
+    "workers"
+)
+def step_build_batched_workers(context, batch_size: int, workers: int, executor: str) -> None:
+    _build(context, batch_size=batch_size, max_workers=workers, executor=executor)
+
+
+@when("I attempt to build a batched extraction snapshot whose batches {failure}")
+def step_build_batched_fatal(context, failure: str) -> None:
+    try:
+        _build(context, failure=failure)
+    except ExtractionSnapshotFatalError as exc:
+        context.batched_build_error = exc
+
+
+@when("I attempt to build a batched extraction snapshot with batch size {batch_size:d}")
+def step_build_batched_invalid(context, batch_size: int) -> None:
+    try:
+        _build(context, batch_size=batch_size)
+    except ValueError as exc:
+        context.batched_build_error = exc
+
+
+@when('I extract every item with the default batch implementation of "{extractor_id}"')
+def step_default_extract_batch(context, extractor_id: str) -> None:
+    extractor = resolve_extractor(extractor_id)
+    corpus = _corpus(context)
+    context.default_batch_items = list(corpus.load_catalog().items.values())
+    context.default_batch_results = extractor.extract_batch(
+        corpus=corpus,
+        items=context.default_batch_items,
+        config=extractor.validate_config({}),
+        previous_extractions=[[] for _ in context.default_batch_items],
+    )
+
+
+@then('the batching extractor received batches of sizes "{sizes}"')
+def step_batch_sizes(context, sizes: str) -> None:
+    actual = [len(batch) for batch in context.batches]
+    assert actual == [int(size) for size in sizes.split(",")], actual
+
+
+@then("every batch held items of one media type")
+def step_batches_one_media_type(context) -> None:
+    for batch in context.batches:
+        assert len(set(batch)) == 1, batch
+
+
+@then("the batching extractor received no batches")
+def step_no_batches(context) -> None:
+    assert context.batches == [], context.batches
+
+
+@then("the batching extractor extracted {count:d} items one at a time")
+def step_single_item_extractions(context, count: int) -> None:
+    assert context.single_item_extractions == count, context.single_item_extractions
+
+
+@then("the batched extraction snapshot extracted {count:d} items")
+def step_batched_extracted(context, count: int) -> None:
+    stats = context.batched_manifest.stats
+    assert stats["extracted_items"] == count, stats
+    assert stats["total_items"] == count + stats["errored_items"], stats
+
+
+@then('the batched extraction snapshot errored {count:d} item with "{error_type}"')
+@then('the batched extraction snapshot errored {count:d} items with "{error_type}"')
+def step_batched_errored(context, count: int, error_type: str) -> None:
+    errored = [item for item in context.batched_manifest.items if item.status == "errored"]
+    assert len(errored) == count, errored
+    assert all(item.error_type == error_type for item in errored), errored
+
+
+@then("the batched extraction snapshot reports {count:d} batch fallback items")
+def step_batched_fallback_items(context, count: int) -> None:
+    assert context.batched_manifest.stats["batch_fallback_items"] == count
+
+
+@then('the batched extraction build logged "{message}"')
+def step_batched_logged(context, message: str) -> None:
+    logged = context.batched_stderr.getvalue()
+    assert message in logged, logged
+
+
+@then("the batched extraction snapshot reports {count:d} extraction cache hits")
+def step_batched_cache_hits(context, count: int) -> None:
+    assert context.batched_manifest.stats["extraction_cache_hits"] == count
+
+
+@then("the batched extraction build failed with a fatal error")
+def step_batched_fatal(context) -> None:
+    assert isinstance(context.batched_build_error, ExtractionSnapshotFatalError)
+    assert str(context.batched_build_error) == "model unavailable"
+
+
+@then('the batched extraction build failed with "{message}"')
+def step_batched_failed(context, message: str) -> None:
+    assert str(context.batched_build_error) == message
+
+
+@then('the default batch implementation returned what "{extractor_id}" extracts for every item')
+def step_default_batch_texts(context, extractor_id: str) -> None:
+    extractor = resolve_extractor(extractor_id)
+    corpus = _corpus(context)
+    expected = [
+        extractor.extract_text(
+            corpus=corpus, item=item, config=extractor.validate_config({}), previous_extractions=[]
+        ).text
+        for item in context.default_batch_items
+    ]
+    assert [result.text for result in context.default_batch_results] == expected
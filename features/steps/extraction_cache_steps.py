@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import Any, Dict, List
+from unittest import mock
+
+from behave import then, when
+from pydantic import BaseModel, ConfigDict
+
+from biblicus import extraction_cache
+from biblicus.constants import EXTRACTION_CACHE_FILENAME
+from biblicus.corpus import Corpus
+from biblicus.extraction import ExtractionSnapshotManifest, build_extraction_snapshot
+from biblicus.extraction_cache import EXTRACTION_CACHE_TOUCH_BATCH, ExtractionCache
+from biblicus.extractors import get_extractor as resolve_extractor
+from biblicus.extractors.pass_through_text import PassThroughTextExtractor
+from biblicus.models import ExtractedText
+
+
+class _CountingCacheableConfig(BaseModel):
+    """
+    Configuration for the counting cacheable extractor test double.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    variant: int = 0
+
+
+class _CountingCacheableExtractor(PassThroughTextExtractor):
+    """
+    Pass-through extractor test double that uses the extraction cache and counts its calls.
+    """
+
+    extractor_id = "counting-cacheable-text"
+    cacheable = True
+
+    def __init__(self, context) -> None:
+        self._context = context
+
+    def validate_config(self, config: Dict[str, Any]) -> BaseModel:
+        return _CountingCacheableConfig.model_validate(config)
+
+    def extract_text(self, *, corpus, item, config, previous_extractions):
+        self._context.counting_cacheable_calls += 1
+        return super().extract_text(
+            corpus=corpus, item=item, config=config, previous_extractions=previous_extractions
+        )
+
+
+def _corpus(context) -> Corpus:
+    return Corpus.open((context.workdir / "corpus").resolve())
+
+
+def _stages(spec: str) -> List[Dict[str, Any]]:
+    stages = []
+    for stage_spec in spec.split(","):
+        extractor_id, _, option = stage_spec.partition(":")
+        config: Dict[str, Any] = {}
+        if option:
+            key, _, value = option.partition("=")
+            config[key] = int(value)
+        stages.append({"extractor_id": extractor_id, "config": config})
+    return stages
+
+
+def _build(
+    context, spec: str, *, cache: bool = True, force: bool = False, executor: str = "thread"
+) -> ExtractionSnapshotManifest:
+    context.counting_cacheable_calls = 0
+    extractor = _CountingCacheableExtractor(context)
+
+    def _resolve_extractor(extractor_id: str):
+        if extractor_id == extractor.extractor_id:
+            return extractor
+        return resolve_extractor(extractor_id)
+
+    with mock.patch("biblicus.extraction.get_extractor", side_effect=_resolve_extractor):
+        manifest = build_extraction_snapshot(
+            _corpus(context),
+            extractor_id="pipeline",
+            configuration_name="cache",
+            configuration={"stages": _stages(spec)},
+            force=force,
+            max_workers=2 if executor == "process" else 1,
+            executor=executor,
+            cache=cache,
+        )
+    context.cached_extraction_manifests = [
+        *getattr(context, "cached_extraction_manifests", []),
+        manifest,
+    ]
+    return manifest
+
+
+def _final_texts(context, manifest: ExtractionSnapshotManifest) -> Dict[str, str]:
+    snapshot_dir = _corpus(context).extraction_snapshot_dir(
+        extractor_id="pipeline", snapshot_id=manifest.snapshot_id
+    )
+    return {
+        item.item_id: (snapshot_dir / item.final_text_relpath).read_text(encoding="utf-8")
+        for item in manifest.items
+    }
+
+
+def _cache_path(context):
+    return _corpus(context).meta_dir / EXTRACTION_CACHE_FILENAME
+
+
+def _entry(text: str) -> ExtractedText:
+    return ExtractedText(text=text, producer_extractor_id="counting-cacheable-text")
+
+
+def _discard_cache(cache: ExtractionCache) -> None:
+    # Cleanups run after the scenario directory is removed, so pending hits cannot be written.
+    cache._touched.clear()
+    cache.close()
+
+
+def _stored_texts(cache: ExtractionCache, texts) -> List[str]:
+    return [
+        text
+        for text in texts
+        if cache.get(f"sha-{text}", "counting-cacheable-text", "stage") is not None
+    ]
+
+
+@when('I build a cached extraction snapshot with stages "{spec}"')
+def step_build_cached(context, spec: str) -> None:
+    _build(context, spec)
+
+
+@when('I build a cached extraction snapshot with stages "{spec}" using the process executor')
+def step_build_cached_process(context, spec: str) -> None:
+    _build(context, spec, executor="process")
+
+
+@when('I force a cached extraction snapshot with stages "{spec}"')
+def step_force_cached(context, spec: str) -> None:
+    _build(context, spec, force=True)
+
+
+@when('I build an uncached extraction snapshot with stages "{spec}"')
+def step_build_uncached(context, spec: str) -> None:
+    _build(context, spec, cache=False)
+
+
+@when('I ingest the plain text "{text}" from source "{source}"')
+def step_ingest_plain_text(context, text: str, source: str) -> None:
+    context.corpus.ingest_item(
+        text.encode("utf-8"),
+        filename=f"{source}.txt",
+        media_type="text/plain",
+        source_uri=f"test:{source}",
+    )
+
+
+@when("I open an extraction cache holding at most {count:d} entries")
+def step_open_cache_entries(context, count: int) -> None:
+    context.extraction_cache = ExtractionCache.for_corpus(_corpus(context), max_entries=count)
+    context.add_cleanup(_discard_cache, context.extraction_cache)
+    context.extraction_cache_evictions = 0
+
+
+@when("I open an extraction cache holding at most {count:d} bytes")
+def step_open_cache_bytes(context, count: int) -> None:
+    context.extraction_cache = ExtractionCache.for_corpus(_corpus(context), max_bytes=count)
+    context.add_cleanup(_discard_cache, context.extraction_cache)
+    context.extraction_cache_evictions = 0
+
+
+@when('I store extraction cache entries "{texts}"')
+def step_store_cache_entries(context, texts: str) -> None:
+    for text in texts.split(","):
+        context.extraction_cache_evictions += context.extraction_cache.put(
+            f"sha-{text}", "counting-cacheable-text", "stage", _entry(text)
+        )
+
+
+@when('I read extraction cache entry "{text}"')
+def step_read_cache_entry(context, text: str) -> None:
+    cached = context.extraction_cache.get(f"sha-{text}", "counting-cacheable-text", "stage")
+    assert cached is not None and cached.text == text
+
+
+@when("I store an extraction cache entry with confidence {confidence:f} and metadata")
+def step_store_cache_entry_with_metadata(context, confidence: float) -> None:
+    context.extraction_cache.put(
+        "sha-rich",
+        "counting-cacheable-text",
+        "stage",
+        ExtractedText(
+            text="rich",
+            producer_extractor_id="select-text",
+            source_stage_index=1,
+            confidence=confidence,
+            metadata={"pages": [1, 2]},
+        ),
+    )
+
+
+@when("I close and reopen the extraction cache")
+def step_reopen_cache(context) -> None:
+    context.extraction_cache.close()
+    context.extraction_cache.close()
+    context.extraction_cache = ExtractionCache.for_corpus(_corpus(context))
+    context.add_cleanup(_discard_cache, context.extraction_cache)
+
+
+@when("I reopen the extraction cache holding at most {count:d} entries")
+def step_reopen_cache_entries(context, count: int) -> None:
+    context.extraction_cache.close()
+    step_open_cache_entries(context, count)
+
+
+@when("extraction cache hits are written every {count:d} hits")
+def step_cache_touch_batch(context, count: int) -> None:
+    context.add_cleanup(
+        setattr, extraction_cache, "EXTRACTION_CACHE_TOUCH_BATCH", EXTRACTION_CACHE_TOUCH_BATCH
+    )
+    extraction_cache.EXTRACTION_CACHE_TOUCH_BATCH = count
+
+
+@when("I attempt to open an extraction cache with {setting} 0")
+def step_open_invalid_cache(context, setting: str) -> None:
+    try:
+        ExtractionCache(_cache_path(context), **{setting: 0})
+    except ValueError as exc:
+        context.extraction_cache_error = exc
+
+
+@then("the counting cacheable extractor ran for {count:d} items")
+def step_counting_calls(context, count: int) -> None:
+    assert context.counting_cacheable_calls == count, context.counting_cacheable_calls
+
+
+@then("the latest extraction snapshot reports {hits:d} extraction cache hits and {misses:d} misses")
+def step_snapshot_cache_stats(context, hits: int, misses: int) -> None:
+    stats = context.cached_extraction_manifests[-1].stats
+    assert stats["extraction_cache_hits"] == hits, stats
+    assert stats["extraction_cache_misses"] == misses, stats
+    assert stats["extraction_cache_evictions"] == 0, stats
+
+
+@then("the latest extraction snapshot extracted the same text as the first")
+def step_snapshot_texts_match(context) -> None:
+    first, latest = context.cached_extraction_manifests[0], context.cached_extraction_manifests[-1]
+    assert first.snapshot_id != latest.snapshot_id
+    assert _final_texts(context, latest) == _final_texts(context, first)
+
+
+@then("the corpus extraction cache holds {count:d} entries")
+def step_cache_holds(context, count: int) -> None:
+    cache = ExtractionCache.for_corpus(_corpus(context))
+    try:
+        assert cache._connect().execute("SELECT COUNT(*) FROM extractions").fetchone()[0] == count
+    finally:
+        cache.close()
+
+
+@then("the corpus extraction cache does not exist")
+def step_cache_missing(context) -> None:
+    assert not _cache_path(context).exists()
+
+
+@then("the extraction cache evicted {count:d} entries")
+def step_cache_evicted(context, count: int) -> None:
+    assert context.extraction_cache_evictions == count, context.extraction_cache_evictions
+
+
+@then('the extraction cache holds entries "{texts}"')
+def step_cache_holds_entries(context, texts: str) -> None:
+    stored = _stored_texts(context.extraction_cache, ["alpha", "beta", "gamma"])
+    assert stored == texts.split(","), stored
+
+
+@then("the extraction cache holds no entries")
+def step_cache_holds_no_entries(context) -> None:
+    assert _stored_texts(context.extraction_cache, ["alpha", "beta", "gamma"]) == []
+
+
+@then("the extraction cache returns the entry with confidence {confidence:f} and metadata")
+def step_cache_returns_rich_entry(context, confidence: float) -> None:
+    cached = context.extraction_cache.get("sha-rich", "counting-cacheable-text", "stage")
+    assert cached == ExtractedText(
+        text="rich",
+        producer_extractor_id="select-text",
+        source_stage_index=1,
+        confidence=confidence,
+        metadata={"pages": [1, 2]},
+    )
+
+
+@then('another extraction cache connection sees entry "{first}" used after "{second}"')
+def step_cache_recency_visible(context, first: str, second: str) -> None:
+    connection = sqlite3.connect(str(_cache_path(context)))
+    try:
+        last_used = dict(
+            connection.execute("SELECT item_sha256, last_used FROM extractions").fetchall()
+        )
+    finally:
+        connection.close()
+    assert last_used[f"sha-{first}"] > last_used[f"sha-{second}"], last_used
+
+
+@then("the extraction cache counts {entries:d} entries and {size:d} bytes")
+def step_cache_counts(context, entries: int, size: int) -> None:
+    cache = context.extraction_cache
+    assert (cache._entries, cache._bytes) == (entries, size), (cache._entries, cache._bytes)
+
+
+@then('the extraction cache error is "{message}"')
+def step_cache_error(context, message: str) -> None:
+    assert str(context.extraction_cache_error) == message
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import mock
+
+from behave import then, when
+
+from biblicus import extraction
+from biblicus.corpus import Corpus
+from biblicus.extraction import ExtractionSnapshotManifest, build_extraction_snapshot
+from biblicus.extractors import get_extractor as resolve_extractor
+from biblicus.extractors.pass_through_text import PassThroughTextExtractor
+
+
+class _CrashingExtractor(PassThroughTextExtractor):
+    """
+    Pass-through extractor test double that exits its process on items with a given text.
+    """
+
+    extractor_id = "crashing-pass-through-text"
+
+    def __init__(self, crash_on: str) -> None:
+        self._crash_on = crash_on
+
+    def extract_text(self, *, corpus, item, config, previous_extractions):
+        extracted = super().extract_text(
+            corpus=corpus, item=item, config=config, previous_extractions=previous_extractions
+        )
+        if extracted is not None and self._crash_on in extracted.text:
+            os._exit(1)
+        return extracted
+
+
+class _SlowExtractor(PassThroughTextExtractor):
+    """
+    Pass-through extractor test double that takes a moment per item.
+    """
+
+    extractor_id = "slow-pass-through-text"
+
+    def extract_text(self, *, corpus, item, config, previous_extractions):
+        time.sleep(0.02)
+        return super().extract_text(
+            corpus=corpus, item=item, config=config, previous_extractions=previous_extractions
+        )
+
+
+def _corpus(context) -> Corpus:
+    return Corpus.open((context.workdir / "corpus").resolve())
+
+
+def _build(
+    context, *, executor: str, max_workers: int, extractor=None
+) -> ExtractionSnapshotManifest:
+    extractor = extractor or PassThroughTextExtractor()
+
+    def _resolve_extractor(extractor_id: str):
+        if extractor_id == extractor.extractor_id:
+            return extractor
+        return resolve_extractor(extractor_id)
+
+    with mock.patch("biblicus.extraction.get_extractor", side_effect=_resolve_extractor):
+        manifest = build_extraction_snapshot(
+            _corpus(context),
+            extractor_id="pipeline",
+            configuration_name=f"executor-{executor}",
+            configuration={"stages": [{"extractor_id": extractor.extractor_id, "config": {}}]},
+            force=True,
+            max_workers=max_workers,
+            executor=executor,
+        )
+    context.executor_manifests = {**getattr(context, "executor_manifests", {}), executor: manifest}
+    context.executor_manifest = manifest
+    return manifest
+
+
+def _extracted_texts(context, manifest: ExtractionSnapshotManifest) -> dict:
+    snapshot_dir = _corpus(context).extraction_snapshot_dir(
+        extractor_id="pipeline", snapshot_id=manifest.snapshot_id
+    )
+    return {
+        item.item_id: (snapshot_dir / item.final_text_relpath).read_text(encoding="utf-8")
+        for item in manifest.items
+        if item.final_text_relpath
+    }
+
+
+def _count_in_flight(context, executor_class, name: str) -> None:
+    context.max_items_in_flight = 0
+    in_flight = [0]
+    counter_lock = threading.Lock()
+
+    class CountingExecutor(executor_class):
+        def submit(self, fn, /, *args, **kwargs):
+            future = super().submit(fn, *args, **kwargs)
+            with counter_lock:
+                in_flight[0] += 1
+                context.max_items_in_flight = max(context.max_items_in_flight, in_flight[0])
+            future.add_done_callback(_release)
+            return future
+
+    def _release(_future) -> None:
+        with counter_lock:
+            in_flight[0] -= 1
+
+    context.add_cleanup(setattr, extraction, name, getattr(extraction, name))
+    setattr(extraction, name, CountingExecutor)
+
+
+@when('I build an extraction snapshot with the "{executor}" executor and {count:d} workers')
+def step_build_with_executor(context, executor: str, count: int) -> None:
+    _build(context, executor=executor, max_workers=count)
+
+
+@when(
+    'I build an extraction snapshot with the "{executor}" executor and {count:d} workers '
+    'crashing on "{text}"'
+)
+def step_build_with_crashing_item(context, executor: str, count: int, text: str) -> None:
+    _build(context, executor=executor, max_workers=count, extractor=_CrashingExtractor(text))
+
+
+@when(
+    'I build an extraction snapshot with the "{executor}" executor and {count:d} workers while '
+    "counting items in flight"
+)
+def step_build_counting_in_flight(context, executor: str, count: int) -> None:
+    if executor == "process":
+        _count_in_flight(context, ProcessPoolExecutor, "ProcessPoolExecutor")
+    else:
+        _count_in_flight(context, ThreadPoolExecutor, "ThreadPoolExecutor")
+    _build(context, executor=executor, max_workers=count, extractor=_SlowExtractor())
+
+
+@when('I attempt to build an extraction snapshot with the "{executor}" executor')
+def step_attempt_build_with_executor(context, executor: str) -> None:
+    try:
+        _build(context, executor=executor, max_workers=1)
+    except ValueError as exc:
+        context.extraction_executor_error = exc
+
+
+@then("both executors extracted the same text for {count:d} items")
+def step_executors_match(context, count: int) -> None:
+    thread_texts = _extracted_texts(context, context.executor_manifests["thread"])
+    process_texts = _extracted_texts(context, context.executor_manifests["process"])
+    assert len(thread_texts) == count, thread_texts
+    assert process_texts == thread_texts
+
+
+@then(
+    "the extraction snapshot manifest records {extracted:d} extracted items and {errored:d} "
+    "errored item"
+)
+@then(
+    "the extraction snapshot manifest records {extracted:d} extracted items and {errored:d} "
+    "errored items"
+)
+def step_manifest_records_statuses(context, extracted: int, errored: int) -> None:
+    manifest = context.executor_manifest
+    statuses = [item.status for item in manifest.items]
+    assert statuses.count("extracted") == extracted, statuses
+    assert statuses.count("errored") == errored, statuses
+    assert manifest.stats["extracted_items"] == extracted, manifest.stats
+    assert manifest.stats["errored_items"] == errored, manifest.stats
+
+
+@then('the errored extraction item has error type "{error_type}"')
+def step_errored_item_type(context, error_type: str) -> None:
+    (errored,) = [item for item in context.executor_manifest.items if item.status == "errored"]
+    assert errored.error_type == error_type, errored
+
+
+@then("at most {count:d} items were in flight")
+def step_items_in_flight(context, count: int) -> None:
+    assert 1 <= context.max_items_in_flight <= count, context.max_items_in_flight
+
+
+@then('the extraction executor error is "{message}"')
+def step_executor_error(context, message: str) -> None:
+    assert str(context.extraction_executor_error) == message
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest import mock
+
+from behave import then, when
+
+from biblicus import extraction
+from biblicus.corpus import Corpus
+from biblicus.errors import ExtractionSnapshotFatalError
+from biblicus.extraction import (
+    EXTRACTION_JOURNAL_FILENAME,
+    build_extraction_snapshot,
+    read_extraction_journal,
+)
+from biblicus.extractors import get_extractor as resolve_extractor
+from biblicus.extractors.pass_through_text import PassThroughTextExtractor
+
+
+class _JournaledExtractor(PassThroughTextExtractor):
+    """
+    Pass-through extractor test double that counts calls and can fail at a given call.
+    """
+
+    extractor_id = "journaled-pass-through-text"
+
+    def __init__(self, context, fail_at: int = 0) -> None:
+        self._context = context
+        self._fail_at = fail_at
+
+    def extract_text(self, *, corpus, item, config, previous_extractions):
+        self._context.journaled_extractor_calls += 1
+        if self._context.journaled_extractor_calls == self._fail_at:
+            raise ExtractionSnapshotFatalError("Journaled extractor interrupted")
+        return super().extract_text(
+            corpus=corpus, item=item, config=config, previous_extractions=previous_extractions
+        )
+
+
+def _corpus(context) -> Corpus:
+    return Corpus.open((context.workdir / "corpus").resolve())
+
+
+def _snapshot_dir(context) -> Path:
+    pipeline_dir = (context.workdir / "corpus").resolve() / "extracted" / "pipeline"
+    (snapshot_dir,) = [path for path in pipeline_dir.iterdir() if path.is_dir()]
+    return snapshot_dir
+
+
+def _build(context, *, fail_at: int = 0) -> None:
+    context.journaled_extractor_calls = 0
+    extractor = _JournaledExtractor(context, fail_at=fail_at)
+
+    def _resolve_extractor(extractor_id: str):
+        if extractor_id == _JournaledExtractor.extractor_id:
+            return extractor
+        return resolve_extractor(extractor_id)
+
+    with mock.patch("biblicus.extraction.get_extractor", side_effect=_resolve_extractor):
+        build_extraction_snapshot(
+            _corpus(context),
+            extractor_id="pipeline",
+            configuration_name="journal",
+            configuration={
+                "stages": [{"extractor_id": _JournaledExtractor.extractor_id, "config": {}}]
+            },
+        )
+
+
+def _count_journal_appends(context) -> None:
+    context.journal_appends = 0
+    original_append = extraction.append_extraction_journal
+
+    def counting_append(path, items):
+        if items:
+            context.journal_appends += 1
+        original_append(path, items)
+
+    extraction.append_extraction_journal = counting_append
+    context.add_cleanup(setattr, extraction, "append_extraction_journal", original_append)
+
+
+def _set_flush_policy(context, *, items: int, seconds: float) -> None:
+    for name, value in (
+        ("EXTRACTION_JOURNAL_FLUSH_ITEMS", items),
+        ("EXTRACTION_JOURNAL_FLUSH_SECONDS", seconds),
+    ):
+        context.add_cleanup(setattr, extraction, name, getattr(extraction, name))
+        setattr(extraction, name, value)
+
+
+@when("I build a journaled extraction snapshot")
+def step_build_journaled_snapshot(context) -> None:
+    _build(context)
+
+
+@when("I attempt to build a journaled extraction snapshot that fails at item {index:d}")
+def step_attempt_journaled_snapshot(context, index: int) -> None:
+    context.extraction_fatal_error = None
+    try:
+        _build(context, fail_at=index)
+    except ExtractionSnapshotFatalError as exc:
+        context.extraction_fatal_error = exc
+
+
+@when(
+    "I build a journaled extraction snapshot flushing every {count:d} items while counting "
+    "journal appends"
+)
+def step_build_journaled_snapshot_batched(context, count: int) -> None:
+    _set_flush_policy(context, items=count, seconds=3600.0)
+    _count_journal_appends(context)
+    _build(context)
+
+
+@when(
+    "I build a journaled extraction snapshot flushing every {seconds:d} seconds while counting "
+    "journal appends"
+)
+def step_build_journaled_snapshot_timed(context, seconds: int) -> None:
+    _set_flush_policy(context, items=1000, seconds=float(seconds))
+    _count_journal_appends(context)
+    _build(context)
+
+
+@when("I append a torn line to the extraction snapshot journal")
+def step_append_torn_journal_line(context) -> None:
+    journal_path = _snapshot_dir(context) / EXTRACTION_JOURNAL_FILENAME
+    with journal_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"item_id": "tor')
+
+
+@then("the extraction snapshot journal holds {count:d} items")
+def step_journal_holds_items(context, count: int) -> None:
+    items = read_extraction_journal(_snapshot_dir(context) / EXTRACTION_JOURNAL_FILENAME)
+    # A resumed build appends the results it reuses again, so count distinct items.
+    item_ids = {item.item_id for item in items}
+    assert len(item_ids) == count, item_ids
+
+
+@then("the extraction snapshot has no journal")
+def step_no_journal(context) -> None:
+    assert not (_snapshot_dir(context) / EXTRACTION_JOURNAL_FILENAME).exists()
+
+
+@then("the extraction snapshot has no manifest")
+def step_no_manifest(context) -> None:
+    assert not (_snapshot_dir(context) / "manifest.json").exists()
+
+
+@then("the extraction snapshot manifest lists {count:d} items")
+def step_manifest_lists_items(context, count: int) -> None:
+    snapshot_dir = _snapshot_dir(context)
+    manifest = _corpus(context).load_extraction_snapshot_manifest(
+        extractor_id="pipeline", snapshot_id=snapshot_dir.name
+    )
+    assert len(manifest.items) == count, manifest.items
+    assert len({item.item_id for item in manifest.items}) == count
+    assert manifest.stats["extracted_items"] == count, manifest.stats
+
+
+@then("the journaled extractor ran for {count:d} items")
+def step_journaled_extractor_calls(context, count: int) -> None:
+    assert context.journaled_extractor_calls == count, context.journaled_extractor_calls
+
+
+@then("the extraction snapshot journal was appended {count:d} times")
+def step_journal_appends(context, count: int) -> None:
+    assert context.journal_appends == count, context.journal_appends
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from behave import then, when
+
+from biblicus.corpus import Corpus
+from biblicus.extraction import build_extraction_snapshot
+from biblicus.extractors import get_extractor as resolve_extractor
+from biblicus.extractors.pass_through_text import PassThroughTextExtractor
+from biblicus.models import CatalogItem
+from biblicus.time import utc_now_iso
+
+
+class _RecordingExtractor(PassThroughTextExtractor):
+    """
+    Extractor test double that records the media types it is called for and skips every item.
+    """
+
+    extractor_id = "recording-text"
+
+    def __init__(self, context, supported_media_types=None) -> None:
+        self._context = context
+        self.supported_media_types = supported_media_types
+
+    def extract_text(self, *, corpus, item, config, previous_extractions):
+        self._context.recorded_media_types.append(item.media_type)
+        return None
+
+
+def _build(context, extractor: _RecordingExtractor, final_stage: str) -> None:
+    context.recorded_media_types = []
+
+    def _resolve_extractor(extractor_id: str):
+        if extractor_id == extractor.extractor_id:
+            return extractor
+        return resolve_extractor(extractor_id)
+
+    with mock.patch("biblicus.extraction.get_extractor", side_effect=_resolve_extractor):
+        context.routed_manifest = build_extraction_snapshot(
+            Corpus.open((context.workdir / "corpus").resolve()),
+            extractor_id="pipeline",
+            configuration_name="routing",
+            configuration={
+                "stages": [
+                    {"extractor_id": extractor.extractor_id, "config": {}},
+                    {"extractor_id": final_stage, "config": {}},
+                ]
+            },
+        )
+
+
+@when('I build a routed extraction snapshot with an audio-only recording stage and "{final_stage}"')
+def step_build_routed_audio_only(context, final_stage: str) -> None:
+    _build(context, _RecordingExtractor(context, ("audio/*",)), final_stage)
+
+
+@when('I build a routed extraction snapshot with a recording stage and "{final_stage}"')
+def step_build_routed(context, final_stage: str) -> None:
+    _build(context, _RecordingExtractor(context), final_stage)
+
+
+@when('I call the "{extractor_id}" extractor directly for a "{media_type}" item')
+def step_call_extractor_directly(context, extractor_id: str, media_type: str) -> None:
+    context.direct_extractor = resolve_extractor(extractor_id)
+    context.direct_media_type = media_type
+    # The extractor returns before reading the item, so its file does not need to exist.
+    item = CatalogItem(
+        id="direct-item",
+        relpath="raw/direct-item",
+        sha256="0" * 64,
+        bytes=0,
+        media_type=media_type,
+        title=None,
+        tags=[],
+        metadata={},
+        created_at=utc_now_iso(),
+        source_uri=None,
+    )
+    context.direct_extraction = context.direct_extractor.extract_text(
+        corpus=Corpus.open((context.workdir / "corpus").resolve()),
+        item=item,
+        config={},
+        previous_extractions=[],
+    )
+
+
+@then("the direct extractor call returned no text for the undeclared media type")
+def step_direct_extraction_skipped(context) -> None:
+    assert not context.direct_extractor.supports_media_type(context.direct_media_type)
+    assert context.direct_extraction is None, context.direct_extraction
+
+
+@then("the recording extractor was called for {count:d} items")
+def step_recording_calls(context, count: int) -> None:
+    assert len(context.recorded_media_types) == count, context.recorded_media_types
+
+
+@then('the recording extractor saw media types in the order "{media_types}"')
+def step_recording_order(context, media_types: str) -> None:
+    assert context.recorded_media_types == media_types.split(","), context.recorded_media_types
+
+
+@then("every routed item records stage {stage_index:d} as skipped")
+def step_routed_stage_skipped(context, stage_index: int) -> None:
+    for item in context.routed_manifest.items:
+        stage_result = item.stage_results[stage_index - 1]
+        assert stage_result.stage_index == stage_index
+        assert stage_result.status == "skipped", stage_result
+
+
+@then("the routed extraction snapshot extracted {count:d} items")
+def step_routed_extracted(context, count: int) -> None:
+    assert context.routed_manifest.stats["extracted_items"] == count
+
+
+@then(
+    'the routed snapshot reports {items:d} "{media_type}" items with {skips:d} routed stage skips'
+)
+def step_routed_media_type_stats(context, items: int, media_type: str, skips: int) -> None:
+    media_type_stats = context.routed_manifest.stats["media_types"][media_type]
+    assert media_type_stats["items"] == items, media_type_stats
+    assert media_type_stats["routed_stage_skips"] == skips, media_type_stats
+
+
+@then("the routed snapshot reports extraction throughput for every media type")
+def step_routed_throughput(context) -> None:
+    for media_type_stats in context.routed_manifest.stats["media_types"].values():
+        assert media_type_stats["extraction_seconds"] > 0, media_type_stats
+        assert media_type_stats["items_per_second"] > 0, media_type_stats
+
+
+@then('the "{extractor_id}" extractor supports "{media_type}": {supported}')
+def step_extractor_supports(context, extractor_id: str, media_type: str, supported: str) -> None:
+    assert resolve_extractor(extractor_id).supports_media_type(media_type) is (supported == "yes")
@@ -50,6 +50,7 @@ def _install_fake_faster_whisper_module(context) -> None:
             faster_whisper_module.last_model_size = model_size  # type: ignore[attr-defined]
             faster_whisper_module.last_device = device  # type: ignore[attr-defined]
             faster_whisper_module.last_compute_type = compute_type  # type: ignore[attr-defined]
+            faster_whisper_module.models_loaded += 1  # type: ignore[attr-defined]
 
         def transcribe(
             self,
@@ -63,6 +64,9 @@ def _install_fake_faster_whisper_module(context) -> None:
 
             # Extract filename from path
             filename = audio_path.rsplit("/", 1)[-1]
+            failing_filenames = faster_whisper_module.failing_filenames  # type: ignore[attr-defined]
+            if any(filename.endswith(failing) for failing in failing_filenames):
+                raise RuntimeError("transcription failed")
 
             # Find behavior for this filename
             behavior = behaviors.get(filename)
@@ -87,6 +91,8 @@ def _install_fake_faster_whisper_module(context) -> None:
     faster_whisper_module.last_audio_path = None
     faster_whisper_module.last_language = None
     faster_whisper_module.last_beam_size = None
+    faster_whisper_module.models_loaded = 0
+    faster_whisper_module.failing_filenames = []
 
     sys.modules["faster_whisper"] = faster_whisper_module
 
@@ -113,6 +119,14 @@ def _install_faster_whisper_unavailable_module(context) -> None:
 @given("a fake faster-whisper library is available")
 def step_fake_faster_whisper_available(context) -> None:
     _install_fake_faster_whisper_module(context)
+    sys.modules["faster_whisper"].models_loaded = 0  # type: ignore[attr-defined]
+    sys.modules["faster_whisper"].failing_filenames = []  # type: ignore[attr-defined]
+
+
+@given('the fake faster-whisper library fails for filename "{filename}"')
+def step_fake_faster_whisper_fails(context, filename: str) -> None:
+    _ = context
+    sys.modules["faster_whisper"].failing_filenames.append(filename)  # type: ignore[attr-defined]
 
 
 @given(
@@ -183,3 +197,11 @@ def step_faster_whisper_used_beam_size(context, beam_size: int) -> None:
     assert faster_whisper_module is not None
     actual = getattr(faster_whisper_module, "last_beam_size", None)
     assert actual == beam_size
+
+
+@then("the faster-whisper model was loaded {count:d} times")
+def step_faster_whisper_models_loaded(context, count: int) -> None:
+    _ = context
+    faster_whisper_module = sys.modules.get("faster_whisper")
+    assert faster_whisper_module is not None
+    assert faster_whisper_module.models_loaded == count
@@ -0,0 +1,460 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from behave import then, when
+
+from biblicus.corpus import Corpus
+from biblicus.models import Evidence, QueryBudget
+from biblicus.retrievers.hybrid import HybridRetriever, _fuse_evidence
+
+_BUDGET = QueryBudget(max_total_items=5, maximum_total_characters=5000, max_items_per_source=5)
+
+
+def _corpus(context) -> Corpus:
+    return Corpus.open((context.workdir / "corpus").resolve())
+
+
+def _table_configuration(context) -> dict:
+    configuration = {}
+    for row in context.table:
+        try:
+            configuration[row["key"]] = json.loads(row["value"])
+        except json.JSONDecodeError:
+            configuration[row["key"]] = row["value"]
+    return configuration
+
+
+def _components(context):
+    retriever = context.hybrid_retriever
+    configuration = context.hybrid_snapshot.configuration.configuration
+    return {
+        "lexical": retriever._component(configuration["lexical_retriever"]),
+        "embedding": retriever._component(configuration["embedding_retriever"]),
+    }
+
+
+def _wrap_component_queries(context, wrapper) -> None:
+    for name, component in _components(context).items():
+        component.query = wrapper(name, component.query)
+        context.add_cleanup(component.__dict__.pop, "query", None)
+
+
+def _query(context, query_text: str) -> None:
+    context.hybrid_result = context.hybrid_retriever.query(
+        _corpus(context), snapshot=context.hybrid_snapshot, query_text=query_text, budget=_BUDGET
+    )
+
+
+def _evidence(spec: str, stage: str):
+    if spec == "<none>":
+        return []
+    evidence = []
+    for rank, entry in enumerate(spec.split(","), start=1):
+        item_id, score = entry.split("=")
+        evidence.append(
+            Evidence(
+                item_id=item_id,
+                source_uri=None,
+                media_type="text/plain",
+                score=float(score),
+                rank=rank,
+                text=item_id,
+                content_ref=None,
+                span_start=None,
+                span_end=None,
+                stage=stage,
+                configuration_id="",
+                snapshot_id="",
+                metadata={},
+                hash="",
+            )
+        )
+    return evidence
+
+
+@when("I build a hybrid snapshot with config:")
+def step_build_hybrid_snapshot(context) -> None:
+    context.hybrid_retriever = HybridRetriever()
+    context.hybrid_snapshot = context.hybrid_retriever.build_snapshot(
+        _corpus(context), configuration_name="hybrid", configuration=_table_configuration(context)
+    )
+    context.add_cleanup(context.hybrid_retriever.close)
+
+
+@when("I attempt to build a hybrid snapshot with config:")
+def step_attempt_build_hybrid_snapshot(context) -> None:
+    try:
+        HybridRetriever().build_snapshot(
+            _corpus(context),
+            configuration_name="hybrid",
+            configuration=_table_configuration(context),
+        )
+        context.hybrid_error = None
+    except ValueError as exc:
+        context.hybrid_error = exc
+
+
+@when('I query the hybrid snapshot for "{query_text}"')
+def step_query_hybrid_snapshot(context, query_text: str) -> None:
+    _query(context, query_text)
+
+
+@when('I query the hybrid snapshot for "{query_text}" while components wait for each other')
+def step_query_hybrid_with_barrier(context, query_text: str) -> None:
+    barrier = threading.Barrier(2, timeout=10)
+
+    def wrapper(name, query):
+        def waiting_query(*args, **kwargs):
+            barrier.wait()
+            return query(*args, **kwargs)
+
+        return waiting_query
+
+    _wrap_component_queries(context, wrapper)
+    _query(context, query_text)
+    context.hybrid_peak_concurrency = 2
+
+
+@when('I query the hybrid snapshot for "{query_text}" while tracking component concurrency')
+def step_query_hybrid_tracking_concurrency(context, query_text: str) -> None:
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def wrapper(name, query):
+        def tracking_query(*args, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            try:
+                return query(*args, **kwargs)
+            finally:
+                with lock:
+                    state["active"] -= 1
+
+        return tracking_query
+
+    _wrap_component_queries(context, wrapper)
+    _query(context, query_text)
+    context.hybrid_peak_concurrency = state["peak"]
+
+
+@when('I query the hybrid snapshot for "{query_text}" while the embedding component stalls')
+def step_query_hybrid_with_stalled_component(context, query_text: str) -> None:
+    release = threading.Event()
+    context.add_cleanup(release.set)
+
+    def wrapper(name, query):
+        def stalling_query(*args, **kwargs):
+            if name == "embedding":
+                release.wait(10)
+            return query(*args, **kwargs)
+
+        return stalling_query
+
+    _wrap_component_queries(context, wrapper)
+    _query(context, query_text)
+
+
+@when(
+    'I query the hybrid snapshot for "{query_text}" {count:d} times while the embedding '
+    "component stalls"
+)
+def step_query_hybrid_repeatedly_with_stalled_component(context, query_text: str, count: int):
+    release = threading.Event()
+    context.add_cleanup(release.set)
+
+    def wrapper(name, query):
+        def stalling_query(*args, **kwargs):
+            if name == "embedding":
+                release.wait(10)
+            return query(*args, **kwargs)
+
+        return stalling_query
+
+    _wrap_component_queries(context, wrapper)
+    context.hybrid_timed_out = []
+    context.hybrid_component_seconds = []
+    for _ in range(count):
+        _query(context, query_text)
+        context.hybrid_timed_out.append(context.hybrid_result.stats["timed_out_components"])
+        context.hybrid_component_seconds.append(context.hybrid_result.stats["component_seconds"])
+    context.hybrid_component_threads = [
+        thread for thread in threading.enumerate() if thread.name.startswith("biblicus-hybrid")
+    ]
+    release.set()
+
+
+@when(
+    'I query the hybrid snapshot for "{query_text}" while the {name} component takes '
+    "{seconds:f} seconds"
+)
+def step_query_hybrid_with_slow_component(context, query_text: str, name: str, seconds: float):
+    def wrapper(component_name, query):
+        def slow_query(*args, **kwargs):
+            if component_name == name:
+                time.sleep(seconds)
+            return query(*args, **kwargs)
+
+        return slow_query
+
+    _wrap_component_queries(context, wrapper)
+    _query(context, query_text)
+
+
+@when(
+    '{callers:d} callers query the hybrid snapshot for "{query_text}" while all their components '
+    "wait for each other"
+)
+def step_concurrent_callers_with_barrier(context, callers: int, query_text: str) -> None:
+    barrier = threading.Barrier(callers * 2, timeout=10)
+
+    def wrapper(name, query):
+        def waiting_query(*args, **kwargs):
+            barrier.wait()
+            return query(*args, **kwargs)
+
+        return waiting_query
+
+    _wrap_component_queries(context, wrapper)
+    retriever = context.hybrid_retriever
+    corpus = _corpus(context)
+
+    def query(_index: int):
+        return retriever.query(
+            corpus, snapshot=context.hybrid_snapshot, query_text=query_text, budget=_BUDGET
+        )
+
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        context.concurrent_hybrid_results = list(executor.map(query, range(callers)))
+
+
+@when(
+    'I query the hybrid snapshot for "{query_text}" while {callers:d} other callers\' embedding '
+    "components stall"
+)
+def step_query_hybrid_with_busy_pool(context, query_text: str, callers: int) -> None:
+    release = threading.Event()
+    context.add_cleanup(release.set)
+    stalled = threading.Semaphore(0)
+    lock = threading.Lock()
+    state = {"stalling": callers}
+    context.embedding_threads = []
+
+    def wrapper(name, query):
+        def stalling_query(*args, **kwargs):
+            if name == "embedding":
+                with lock:
+                    stall = state["stalling"] > 0
+                    state["stalling"] -= 1
+                if stall:
+                    stalled.release()
+                    release.wait(10)
+                else:
+                    context.embedding_threads.append(threading.current_thread())
+            return query(*args, **kwargs)
+
+        return stalling_query
+
+    _wrap_component_queries(context, wrapper)
+    retriever = context.hybrid_retriever
+    corpus = _corpus(context)
+    others = [
+        threading.Thread(
+            target=retriever.query,
+            args=(corpus,),
+            kwargs={
+                "snapshot": context.hybrid_snapshot,
+                "query_text": query_text,
+                "budget": _BUDGET,
+            },
+        )
+        for _ in range(callers)
+    ]
+    for thread in others:
+        thread.start()
+    for _ in range(callers):
+        assert stalled.acquire(timeout=10)
+    try:
+        _query(context, query_text)
+    finally:
+        release.set()
+        for thread in others:
+            thread.join(timeout=10)
+
+
+@when('I attempt to query the hybrid snapshot for "{query_text}" while the lexical component fails')
+def step_query_hybrid_with_failing_component(context, query_text: str) -> None:
+    def wrapper(name, query):
+        def failing_query(*args, **kwargs):
+            if name == "lexical":
+                raise RuntimeError("lexical component failed")
+            return query(*args, **kwargs)
+
+        return failing_query
+
+    _wrap_component_queries(context, wrapper)
+    try:
+        _query(context, query_text)
+        context.hybrid_error = None
+    except RuntimeError as exc:
+        context.hybrid_error = exc
+
+
+@when("I close the hybrid retriever")
+def step_close_hybrid_retriever(context) -> None:
+    context.closed_components = []
+    for name, component in _components(context).items():
+        original_close = component.close
+
+        def recording_close(name=name, original_close=original_close):
+            context.closed_components.append(name)
+            original_close()
+
+        component.close = recording_close
+    context.hybrid_retriever.close()
+
+
+@when(
+    'I fuse lexical evidence "{lexical}" and embedding evidence "{embedding}" with "{fusion}" '
+    "fusion and rank offset {rank_offset:d}"
+)
+def step_fuse_evidence(context, lexical: str, embedding: str, fusion: str, rank_offset: int):
+    context.fused_evidence = _fuse_evidence(
+        _evidence(lexical, "lexical"),
+        _evidence(embedding, "embedding"),
+        lexical_weight=0.5,
+        embedding_weight=0.5,
+        fusion=fusion,
+        reciprocal_rank_k=rank_offset,
+    )
+
+
+@then("the hybrid components ran concurrently")
+def step_hybrid_components_concurrent(context) -> None:
+    assert context.hybrid_peak_concurrency == 2
+
+
+@then("the hybrid components ran one at a time")
+def step_hybrid_components_sequential(context) -> None:
+    assert context.hybrid_peak_concurrency == 1, context.hybrid_peak_concurrency
+
+
+@then('the hybrid query reports timing for components "{names}"')
+def step_hybrid_component_timing(context, names: str) -> None:
+    component_seconds = context.hybrid_result.stats["component_seconds"]
+    assert sorted(component_seconds) == sorted(names.split(",")), component_seconds
+    assert all(seconds >= 0 for seconds in component_seconds.values()), component_seconds
+
+
+@then("the hybrid query reports no timed out components")
+def step_hybrid_no_timeouts(context) -> None:
+    assert context.hybrid_result.stats["timed_out_components"] == []
+
+
+@then('the hybrid query reports timed out components "{names}"')
+def step_hybrid_timeouts(context, names: str) -> None:
+    assert context.hybrid_result.stats["timed_out_components"] == names.split(",")
+
+
+@then('the hybrid query reports fusion "{fusion}"')
+def step_hybrid_fusion(context, fusion: str) -> None:
+    assert context.hybrid_result.stats["fusion"] == fusion
+
+
+@then("the hybrid query returned evidence")
+def step_hybrid_returned_evidence(context) -> None:
+    evidence = context.hybrid_result.evidence
+    assert evidence
+    assert all(item.stage == "hybrid" for item in evidence)
+
+
+@then("the hybrid evidence scores are in descending order")
+def step_hybrid_scores_descending(context) -> None:
+    scores = [item.score for item in context.hybrid_result.evidence]
+    assert scores == sorted(scores, reverse=True), scores
+
+
+@then('the hybrid query failed with "{message}"')
+def step_hybrid_query_failed(context, message: str) -> None:
+    assert message in str(context.hybrid_error), context.hybrid_error
+
+
+@then('the hybrid build failed with "{message}"')
+def step_hybrid_build_failed(context, message: str) -> None:
+    assert message in str(context.hybrid_error), context.hybrid_error
+
+
+@then("the hybrid component retrievers were closed")
+def step_hybrid_components_closed(context) -> None:
+    assert sorted(context.closed_components) == ["embedding", "lexical"]
+    assert context.hybrid_retriever._components == {}
+
+
+@then("every repeated hybrid query timed out the embedding component")
+def step_hybrid_repeated_timeouts(context) -> None:
+    assert all(
+        names == ["embedding"] for names in context.hybrid_timed_out
+    ), context.hybrid_timed_out
+
+
+@then("every repeated hybrid query reported timing for the lexical component")
+def step_hybrid_repeated_lexical_timing(context) -> None:
+    assert all(
+        list(seconds) == ["lexical"] for seconds in context.hybrid_component_seconds
+    ), context.hybrid_component_seconds
+
+
+@then("every concurrent hybrid query returned evidence")
+def step_concurrent_hybrid_evidence(context) -> None:
+    for result in context.concurrent_hybrid_results:
+        assert result.evidence
+        assert result.stats["timed_out_components"] == []
+
+
+@then("the embedding component ran on the caller's thread")
+def step_embedding_on_caller_thread(context) -> None:
+    assert context.embedding_threads == [threading.current_thread()], context.embedding_threads
+
+
+@then("at most {count:d} hybrid component threads were running")
+def step_hybrid_component_threads(context, count: int) -> None:
+    assert len(context.hybrid_component_threads) <= count, context.hybrid_component_threads
+
+
+@then("the hybrid retriever keeps a component thread pool")
+def step_hybrid_keeps_pool(context) -> None:
+    assert context.hybrid_retriever._component_pool is not None
+
+
+@then("the hybrid retriever keeps no component thread pool")
+def step_hybrid_keeps_no_pool(context) -> None:
+    assert context.hybrid_retriever._component_pool is None
+
+
+@then("the hybrid retriever keeps {count:d} component executors")
+def step_hybrid_component_executors(context, count: int) -> None:
+    assert len(context.hybrid_retriever._component_executors) == count
+
+
+@then('the fused lexical stage scores are "{expected}"')
+def step_fused_lexical_stage_scores(context, expected: str) -> None:
+    fused = {item.item_id: item.stage_scores["lexical"] for item in context.fused_evidence}
+    wanted = {
+        item_id: float(score)
+        for item_id, score in (entry.split("=") for entry in expected.split(","))
+    }
+    assert fused == wanted, fused
+
+
+@then('the fused scores are "{expected}"')
+def step_fused_scores(context, expected: str) -> None:
+    fused = {item.item_id: round(item.score, 4) for item in context.fused_evidence}
+    wanted = {
+        item_id: float(score)
+        for item_id, score in (entry.split("=") for entry in expected.split(","))
+    }
+    assert fused == wanted, fused
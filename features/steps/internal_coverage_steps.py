@@ -62,7 +62,6 @@ from biblicus.retrievers.tf_vector import (
     TfVectorConfiguration,
     TfVectorRetriever,
     _build_snippet as build_tf_snippet,
-    _count_text_items as count_tf_text_items,
     _cosine_similarity,
     _find_first_match,
     _load_text_from_item as load_tf_text,
@@ -76,7 +75,6 @@ from biblicus.retrievers.scan import (
     ScanConfiguration,
     ScanRetriever,
     _build_snippet as build_scan_snippet,
-    _count_text_items as count_scan_text_items,
     _find_first_match as find_scan_match,
     _load_text_from_item as load_scan_text,
     _resolve_extraction_reference as resolve_scan_reference,
@@ -951,8 +949,12 @@ def step_vector_retriever_edge_cases(context) -> None:
     text_dir = extraction_dir / "text"
     text_dir.mkdir(parents=True, exist_ok=True)
     text_dir.joinpath(f"{text_item.id}.txt").write_text("extracted", encoding="utf-8")
-    config_with_snapshot = TfVectorConfiguration(extraction_snapshot="pipeline:snap")
-    assert count_tf_text_items(corpus, items, config_with_snapshot) >= 1
+    extracted_snapshot = retriever.build_snapshot(
+        corpus,
+        configuration_name="extracted",
+        configuration={"extraction_snapshot": "pipeline:snap"},
+    )
+    assert extracted_snapshot.stats["text_items"] >= 1
     merged = TfVectorConfiguration.model_validate(
         {
             "pipeline": {
@@ -1011,8 +1013,12 @@ def step_vector_retriever_edge_cases(context) -> None:
     except FileNotFoundError:
         pass
 
-    scan_config = ScanConfiguration(extraction_snapshot="pipeline:snap")
-    assert count_scan_text_items(corpus, items, scan_config) >= 1
+    scan_extracted_snapshot = ScanRetriever().build_snapshot(
+        corpus,
+        configuration_name="extracted",
+        configuration={"extraction_snapshot": "pipeline:snap"},
+    )
+    assert scan_extracted_snapshot.stats["text_items"] >= 1
     assert load_scan_text(
         corpus,
         item_id=str(getattr(markdown_item, "id")),
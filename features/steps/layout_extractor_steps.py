@@ -46,6 +46,7 @@ def _install_fake_heron_dependencies(context) -> None:
 
         @classmethod
         def from_pretrained(cls, _name: str):
+            context.fake_heron_models_loaded = getattr(context, "fake_heron_models_loaded", 0) + 1
             return cls()
 
     class _FakeImageProcessor:
@@ -54,22 +55,24 @@ def _install_fake_heron_dependencies(context) -> None:
             return cls()
 
         def __call__(self, images=None, return_tensors: str = "pt"):
-            _ = images
             _ = return_tensors
+            context.fake_heron_image_batches = [
+                *getattr(context, "fake_heron_image_batches", []),
+                len(images),
+            ]
             return {}
 
         def post_process_object_detection(self, _outputs, target_sizes=None, threshold: float = 0.0):
-            _ = target_sizes
             _ = threshold
             if getattr(context, "_fake_heron_empty_results", False):
-                return []
+                return [{"boxes": [], "scores": [], "labels": []} for _ in target_sizes]
             boxes = [
                 [_FakeTensor(10), _FakeTensor(20), _FakeTensor(30), _FakeTensor(40)],
                 [_FakeTensor(5), _FakeTensor(15), _FakeTensor(25), _FakeTensor(35)],
             ]
             scores = [_FakeTensor(0.9), _FakeTensor(0.8)]
             labels = [_FakeTensor(0), _FakeTensor(1)]
-            return [{"boxes": boxes, "scores": scores, "labels": labels}]
+            return [{"boxes": boxes, "scores": scores, "labels": labels} for _ in target_sizes]
 
     class _NoGrad:
         def __enter__(self):
@@ -96,7 +99,9 @@ def _install_fake_heron_dependencies(context) -> None:
                 return None
             return self
 
-    def _open(_path: str):
+    def _open(path):
+        if not Path(path).is_file():
+            raise FileNotFoundError(str(path))
         return _FakeImage()
 
     transformers_module = types.ModuleType("transformers")
@@ -372,6 +377,64 @@ def step_run_heron_layout_missing_image(context) -> None:
         context._heron_layout_error = exc
 
 
+@when("I run the Heron layout extractor on a batch of two images, a text item, and a missing image")
+def step_run_heron_layout_batch(context) -> None:
+    corpus = Corpus.init(context.workdir / "corpus", force=True)
+    image_bytes = _sample_image_path(context).read_bytes()
+    _write_bytes(corpus.root / "first.png", image_bytes)
+    _write_bytes(corpus.root / "second.png", image_bytes)
+    items = [
+        _sample_item(context, "first.png", "image/png"),
+        _sample_item(context, "file.txt", "text/plain"),
+        _sample_item(context, "missing.png", "image/png"),
+        _sample_item(context, "second.png", "image/png"),
+    ]
+    extractor = HeronLayoutExtractor()
+    context._heron_batch_results = extractor.extract_batch(
+        corpus=corpus,
+        items=items,
+        config=extractor.validate_config({}),
+        previous_extractions=[[] for _ in items],
+    )
+
+
+@when("I run the Heron layout extractor on a batch of one text item")
+def step_run_heron_layout_text_batch(context) -> None:
+    corpus = Corpus.init(context.workdir / "corpus", force=True)
+    items = [_sample_item(context, "file.txt", "text/plain")]
+    extractor = HeronLayoutExtractor()
+    context._heron_batch_results = extractor.extract_batch(
+        corpus=corpus,
+        items=items,
+        config=extractor.validate_config({}),
+        previous_extractions=[[]],
+    )
+
+
+@then("the fake Heron model was not loaded")
+def step_heron_model_not_loaded(context) -> None:
+    assert getattr(context, "fake_heron_models_loaded", 0) == 0
+
+
+@then('the Heron layout batch results are "{kinds}"')
+def step_heron_layout_batch_results(context, kinds: str) -> None:
+    actual = []
+    for result in context._heron_batch_results:
+        if result is None:
+            actual.append("<none>")
+        elif isinstance(result, Exception):
+            actual.append(type(result).__name__)
+        else:
+            actual.append(f"{result.metadata['num_regions']} regions")
+    assert actual == kinds.split(","), actual
+
+
+@then("the fake Heron model was loaded once for {count:d} images")
+def step_heron_model_loaded_once(context, count: int) -> None:
+    assert context.fake_heron_models_loaded == 1, context.fake_heron_models_loaded
+    assert context.fake_heron_image_batches == [count], context.fake_heron_image_batches
+
+
 @then("Heron layout metadata includes regions")
 def step_heron_layout_has_regions(context) -> None:
     result = context._heron_layout_result
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import threading
+
+from behave import then, when
+
+from biblicus.corpus import Corpus
+from biblicus.models import QueryBudget
+from biblicus.retrievers import get_retriever
+from biblicus.retrievers.base import Retriever
+from biblicus.retrievers.opened_snapshots import OpenedSnapshotRegistry, opened_snapshots
+
+_BUDGET = QueryBudget(max_total_items=3, maximum_total_characters=1000, max_items_per_source=5)
+
+_EMBEDDING_CONFIGURATION = {
+    "embedding_cache": False,
+    "embedding_provider": {"provider_id": "hash-embedding", "dimensions": 16},
+}
+
+
+def _corpus(context) -> Corpus:
+    return Corpus.open((context.workdir / "corpus").resolve())
+
+
+def _configuration(retriever_id: str) -> dict:
+    if retriever_id.startswith("embedding-index"):
+        return dict(_EMBEDDING_CONFIGURATION)
+    return {}
+
+
+class _StatefulRetriever(Retriever):
+    retriever_id = "stateful"
+
+    def __init__(self) -> None:
+        self.loads = 0
+
+    def build_snapshot(self, corpus, *, configuration_name, configuration):
+        raise NotImplementedError
+
+    def query(self, corpus, *, snapshot, query_text, budget):
+        return self.snapshot_state(snapshot, self._load)
+
+    def _load(self) -> int:
+        self.loads += 1
+        return self.loads
+
+
+def _count_snapshot_state_loads(context) -> None:
+    context.snapshot_state_loads = 0
+    original_snapshot_state = Retriever.snapshot_state
+
+    def counting_snapshot_state(self, snapshot, load):
+        def counting_load():
+            context.snapshot_state_loads += 1
+            return load()
+
+        return original_snapshot_state(self, snapshot, counting_load)
+
+    Retriever.snapshot_state = counting_snapshot_state
+    context.add_cleanup(setattr, Retriever, "snapshot_state", original_snapshot_state)
+
+
+def _count_retriever_closes(context, registry: OpenedSnapshotRegistry, snapshot_ids) -> None:
+    context.closed_retrievers = 0
+    corpus = _corpus(context)
+    for snapshot_id in snapshot_ids:
+        with registry.open(corpus, snapshot_id) as opened:
+            _count_closes(context, opened.retriever)
+
+
+def _count_closes(context, retriever: Retriever) -> None:
+    if getattr(retriever, "close_counted", False):
+        return
+    original_close = retriever.close
+
+    def counting_close():
+        context.closed_retrievers += 1
+        original_close()
+
+    retriever.close = counting_close
+    retriever.close_counted = True
+
+
+@when('I build a "{retriever_id}" snapshot named "{name}" for the opened snapshot registry')
+def step_build_registry_snapshot(context, retriever_id: str, name: str) -> None:
+    snapshot = get_retriever(retriever_id).build_snapshot(
+        _corpus(context), configuration_name=name, configuration=_configuration(retriever_id)
+    )
+    context.registry_snapshot_ids = {
+        **getattr(context, "registry_snapshot_ids", {}),
+        name: snapshot.snapshot_id,
+    }
+
+
+@when(
+    'I query snapshot "{name}" for "{query_text}" {count:d} times through an opened snapshot '
+    "registry"
+)
+def step_query_through_registry(context, name: str, query_text: str, count: int) -> None:
+    _count_snapshot_state_loads(context)
+    registry = OpenedSnapshotRegistry()
+    context.add_cleanup(registry.close)
+    corpus = _corpus(context)
+    context.registry_results = []
+    for index in range(count):
+        with registry.open(corpus, context.registry_snapshot_ids[name]) as opened:
+            context.registry_results.append(opened.query(query_text, budget=_BUDGET))
+        if index == 0:
+            context.snapshot_state_loads_after_first_query = context.snapshot_state_loads
+    context.opened_snapshot_registry = registry
+
+
+@when('I open snapshots "{names}" through an opened snapshot registry holding {limit:d} snapshot')
+@when('I open snapshots "{names}" through an opened snapshot registry holding {limit:d} snapshots')
+def step_open_through_bounded_registry(context, names: str, limit: int) -> None:
+    registry = OpenedSnapshotRegistry(max_snapshots=limit)
+    context.add_cleanup(registry.close)
+    snapshot_ids = [context.registry_snapshot_ids[name] for name in names.split(",")]
+    _count_retriever_closes(context, registry, snapshot_ids)
+    context.opened_snapshot_registry = registry
+
+
+@when(
+    'I query snapshot "{name}" on another thread while opening "{other}" evicts it from an opened '
+    "snapshot registry holding 1 snapshot"
+)
+def step_query_during_eviction(context, name: str, other: str) -> None:
+    registry = OpenedSnapshotRegistry(max_snapshots=1)
+    context.add_cleanup(registry.close)
+    context.opened_snapshot_registry = registry
+    context.closed_retrievers = 0
+    corpus = _corpus(context)
+    query_started = threading.Event()
+    eviction_done = threading.Event()
+    outcome = {}
+
+    def query() -> None:
+        with registry.open(corpus, context.registry_snapshot_ids[name]) as opened:
+            _count_closes(context, opened.retriever)
+            query_started.set()
+            eviction_done.wait(timeout=10)
+            outcome["closes_during_query"] = context.closed_retrievers
+            outcome["result"] = opened.query("Note body 7", budget=_BUDGET)
+
+    worker = threading.Thread(target=query)
+    worker.start()
+    assert query_started.wait(timeout=10)
+    with registry.open(corpus, context.registry_snapshot_ids[other]) as opened:
+        _count_closes(context, opened.retriever)
+    context.closes_after_eviction = context.closed_retrievers
+    eviction_done.set()
+    worker.join(timeout=10)
+    context.registry_results = [outcome["result"]]
+    context.closes_during_query = outcome["closes_during_query"]
+
+
+@when('I lease snapshot "{name}" from an opened snapshot registry and close the registry')
+def step_close_registry_while_leased(context, name: str) -> None:
+    registry = OpenedSnapshotRegistry()
+    context.opened_snapshot_registry = registry
+    context.closed_retrievers = 0
+    context.registry_lease = registry.open(_corpus(context), context.registry_snapshot_ids[name])
+    context.add_cleanup(context.registry_lease.release)
+    _count_closes(context, context.registry_lease.retriever)
+    registry.close()
+    context.closes_after_eviction = context.closed_retrievers
+
+
+@when("I release the opened snapshot lease twice")
+def step_release_lease_twice(context) -> None:
+    context.registry_lease.release()
+    context.registry_lease.release()
+
+
+@when("I attempt to query the released opened snapshot lease")
+def step_query_released_lease(context) -> None:
+    try:
+        context.registry_lease.query("Note body 7", budget=_BUDGET)
+    except ValueError as exc:
+        context.opened_snapshot_registry_error = exc
+
+
+@when("I close the opened snapshot registry")
+def step_close_registry(context) -> None:
+    context.opened_snapshot_registry.close()
+
+
+@when("I attempt to create an opened snapshot registry holding {limit:d} snapshots")
+def step_create_invalid_registry(context, limit: int) -> None:
+    try:
+        OpenedSnapshotRegistry(max_snapshots=limit)
+    except ValueError as exc:
+        context.opened_snapshot_registry_error = exc
+
+
+@when(
+    'I query {count:d} variants of snapshot "{name}" and then the first variant again with one '
+    "retriever"
+)
+def step_query_snapshot_variants(context, count: int, name: str) -> None:
+    _count_snapshot_state_loads(context)
+    corpus = _corpus(context)
+    snapshot = corpus.load_snapshot(context.registry_snapshot_ids[name])
+    variants = []
+    for index in range(count):
+        configuration = snapshot.configuration.model_copy(
+            update={
+                "configuration_id": f"{snapshot.configuration.configuration_id}-{index}",
+                "configuration": {
+                    **snapshot.configuration.configuration,
+                    "snippet_characters": 100 + index,
+                },
+            }
+        )
+        variants.append(snapshot.model_copy(update={"configuration": configuration}))
+    retriever = get_retriever(snapshot.configuration.retriever_id)
+    for variant in [*variants, variants[0]]:
+        retriever.query(corpus, snapshot=variant, query_text="Note body 3", budget=_BUDGET)
+
+
+@when('I query snapshot "{name}" with one retriever, close it, and query again')
+def step_query_close_query(context, name: str) -> None:
+    _count_snapshot_state_loads(context)
+    corpus = _corpus(context)
+    snapshot = corpus.load_snapshot(context.registry_snapshot_ids[name])
+    retriever = get_retriever(snapshot.configuration.retriever_id)
+    retriever.query(corpus, snapshot=snapshot, query_text="Note body 3", budget=_BUDGET)
+    retriever.close()
+    retriever.query(corpus, snapshot=snapshot, query_text="Note body 3", budget=_BUDGET)
+
+
+@when(
+    'I query snapshot "{name}" twice, close, and query again with a retriever that skips the base '
+    "initializer"
+)
+def step_query_without_base_initializer(context, name: str) -> None:
+    _count_snapshot_state_loads(context)
+    corpus = _corpus(context)
+    snapshot = corpus.load_snapshot(context.registry_snapshot_ids[name])
+    retriever = _StatefulRetriever()
+    for _ in range(2):
+        retriever.query(corpus, snapshot=snapshot, query_text="Note body 3", budget=_BUDGET)
+    retriever.close()
+    retriever.query(corpus, snapshot=snapshot, query_text="Note body 3", budget=_BUDGET)
+
+
+@then("later queries loaded no snapshot state")
+def step_later_queries_loaded_nothing(context) -> None:
+    assert context.snapshot_state_loads_after_first_query > 0
+    assert context.snapshot_state_loads == context.snapshot_state_loads_after_first_query
+
+
+@then("every query through the registry returned the same evidence")
+def step_registry_results_match(context) -> None:
+    first = [(item.item_id, item.score) for item in context.registry_results[0].evidence]
+    assert first
+    for result in context.registry_results[1:]:
+        assert [(item.item_id, item.score) for item in result.evidence] == first
+
+
+@then("the opened snapshot registry reports {opened:d} snapshots opened and {reuses:d} reuses")
+def step_registry_opened_reuses(context, opened: int, reuses: int) -> None:
+    stats = context.opened_snapshot_registry.stats()
+    assert stats["snapshots_opened"] == opened, stats
+    assert stats["snapshot_reuses"] == reuses, stats
+
+
+@then("the opened snapshot registry reports {evictions:d} evictions and {count:d} open snapshots")
+def step_registry_evictions(context, evictions: int, count: int) -> None:
+    stats = context.opened_snapshot_registry.stats()
+    assert stats["snapshot_evictions"] == evictions, stats
+    assert stats["open_snapshots"] == count, stats
+
+
+@then("{count:d} opened snapshot retrievers were closed")
+def step_retrievers_closed(context, count: int) -> None:
+    assert context.closed_retrievers == count, context.closed_retrievers
+
+
+@then("no opened snapshot retriever was closed while it was leased")
+def step_no_close_while_leased(context) -> None:
+    assert context.closes_after_eviction == 0, context.closes_after_eviction
+    assert getattr(context, "closes_during_query", 0) == 0, context.closes_during_query
+
+
+@then('the opened snapshot registry error is "{message}"')
+def step_registry_error(context, message: str) -> None:
+    assert str(context.opened_snapshot_registry_error) == message
+
+
+@then("the process-wide opened snapshot registry is shared")
+def step_process_registry_shared(context) -> None:
+    assert opened_snapshots() is opened_snapshots()
+
+
+@then("the retriever loaded snapshot state {count:d} times")
+def step_snapshot_state_loads(context, count: int) -> None:
+    assert context.snapshot_state_loads == count, context.snapshot_state_loads
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+from behave import then, when
+
+from biblicus.corpus import Corpus
+from biblicus.embedding_providers import HashEmbeddingProvider
+from biblicus.models import QueryBudget
+from biblicus.retrievers import get_retriever
+from biblicus.retrievers.base import Retriever
+
+_BUDGET = QueryBudget(max_total_items=3, maximum_total_characters=1000, max_items_per_source=5)
+
+
+def _corpus_path(context, name: str) -> Path:
+    return (context.workdir / name).resolve()
+
+
+def _split_queries(queries: str) -> list[str]:
+    return queries.split("|")
+
+
+def _run_batch(context, queries: str):
+    corpus = Corpus.open(_corpus_path(context, "corpus"))
+    snapshot = corpus.load_snapshot(context.last_snapshot_id)
+    retriever = get_retriever(snapshot.configuration.retriever_id)
+    return (
+        corpus,
+        snapshot,
+        retriever,
+        retriever.query_batch(
+            corpus, snapshot=snapshot, query_texts=_split_queries(queries), budget=_BUDGET
+        ),
+    )
+
+
+def _evidence_keys(result) -> list[tuple]:
+    return [
+        (evidence.item_id, evidence.rank, round(evidence.score, 5), evidence.text)
+        for evidence in result.evidence
+    ]
+
+
+@then('batched queries "{queries}" match single queries')
+def step_batched_queries_match_single(context, queries: str) -> None:
+    corpus, snapshot, retriever, batched = _run_batch(context, queries)
+    query_texts = _split_queries(queries)
+    assert [result.query_text for result in batched] == query_texts
+    for query_text, batched_result in zip(query_texts, batched):
+        single = retriever.query(corpus, snapshot=snapshot, query_text=query_text, budget=_BUDGET)
+        assert _evidence_keys(batched_result) == _evidence_keys(single)
+        assert batched_result.stats == single.stats
+
+
+@when('I run batched queries "{queries}" while counting database connections')
+def step_batched_queries_count_connections(context, queries: str) -> None:
+    original_connect = sqlite3.connect
+    context.database_connections = 0
+
+    def counting_connect(*args, **kwargs):
+        context.database_connections += 1
+        return original_connect(*args, **kwargs)
+
+    sqlite3.connect = counting_connect
+    try:
+        _run_batch(context, queries)
+    finally:
+        sqlite3.connect = original_connect
+
+
+@then("{count:d} database connection was opened")
+@then("{count:d} database connections were opened")
+def step_database_connections_opened(context, count: int) -> None:
+    assert context.database_connections == count, context.database_connections
+
+
+@when('I run batched queries "{queries}" while counting embedding calls')
+def step_batched_queries_count_embedding_calls(context, queries: str) -> None:
+    original_embed_texts = HashEmbeddingProvider.embed_texts
+    context.embedding_calls = 0
+
+    def counting_embed_texts(self, texts):
+        context.embedding_calls += 1
+        return original_embed_texts(self, texts)
+
+    HashEmbeddingProvider.embed_texts = counting_embed_texts
+    context.add_cleanup(setattr, HashEmbeddingProvider, "embed_texts", original_embed_texts)
+    _run_batch(context, queries)
+
+
+@then("the embedding provider was called {count:d} time")
+def step_embedding_provider_called(context, count: int) -> None:
+    assert context.embedding_calls == count, context.embedding_calls
+
+
+@when('I attempt batched queries "{queries}" with a provider that drops queries')
+def step_batched_queries_with_dropping_provider(context, queries: str) -> None:
+    original_embed_texts = HashEmbeddingProvider.embed_texts
+
+    def dropping_embed_texts(self, texts):
+        return original_embed_texts(self, list(texts)[:-1])
+
+    HashEmbeddingProvider.embed_texts = dropping_embed_texts
+    context.add_cleanup(setattr, HashEmbeddingProvider, "embed_texts", original_embed_texts)
+    context.batch_error = None
+    try:
+        _run_batch(context, queries)
+    except ValueError as exc:
+        context.batch_error = exc
+
+
+@then('the batched query fails with "{message}"')
+def step_batched_query_fails(context, message: str) -> None:
+    assert context.batch_error is not None
+    assert message in str(context.batch_error)
+
+
+@when('I write the query file "{filename}" with lines "{lines}"')
+def step_write_query_file(context, filename: str, lines: str) -> None:
+    path = context.workdir / filename
+    path.write_text("\n".join(lines.split("|")) + "\n", encoding="utf-8")
+
+
+@then('the query output has {count:d} JSON lines with query texts "{queries}"')
+def step_query_output_json_lines(context, count: int, queries: str) -> None:
+    lines = context.last_result.stdout.strip().splitlines()
+    assert len(lines) == count, lines
+    results = [json.loads(line) for line in lines]
+    assert [result["query_text"] for result in results] == _split_queries(queries)
+    assert all(len(result["evidence"]) <= 1 for result in results)
+
+
+class _RecordingRetriever(Retriever):
+    retriever_id = "recording"
+
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    def build_snapshot(self, corpus, *, configuration_name, configuration):
+        raise NotImplementedError
+
+    def query(self, corpus, *, snapshot, query_text, budget):
+        self.queries.append(query_text)
+        return query_text
+
+
+@when('I run batched queries "{queries}" through a retriever without a batch implementation')
+def step_batched_queries_default_loop(context, queries: str) -> None:
+    context.recording_retriever = _RecordingRetriever()
+    context.default_batch_results = context.recording_retriever.query_batch(
+        None, snapshot=None, query_texts=_split_queries(queries), budget=_BUDGET
+    )
+
+
+@then('the default batch loop answered "{queries}" in order')
+def step_default_batch_loop_answered(context, queries: str) -> None:
+    assert context.recording_retriever.queries == _split_queries(queries)
+    assert context.default_batch_results == _split_queries(queries)
+
+
+@then("the evaluation system metrics record a query batch size of {batch_size:d}")
+def step_eval_records_batch_size(context, batch_size: int) -> None:
+    system = context.last_eval.get("system") or {}
+    assert system.get("query_batch_size") == batch_size, system
+
+
+@then("the evaluation system metrics do not record a query batch size")
+def step_eval_records_no_batch_size(context) -> None:
+    system = context.last_eval.get("system") or {}
+    assert "query_batch_size" not in system, system
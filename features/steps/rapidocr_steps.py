@@ -6,7 +6,10 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional
 from urllib.parse import unquote
 
-from behave import given
+from behave import given, then, when
+
+from biblicus.corpus import Corpus
+from biblicus.extractors import get_extractor
 
 
 @dataclass
@@ -43,6 +46,9 @@ def _install_fake_rapidocr_module(context) -> None:
             original_modules[name] = sys.modules[name]
 
     class RapidOCR:
+        def __init__(self) -> None:
+            rapidocr_module.engines_created += 1  # type: ignore[attr-defined]
+
         def __call__(self, path: str):  # type: ignore[no-untyped-def]
             # Look up behaviors from context dynamically to support per-scenario reset
             behaviors = _ensure_fake_rapidocr_behaviors(context)
@@ -59,6 +65,8 @@ def _install_fake_rapidocr_module(context) -> None:
                 return (None, 0.0)
             if behavior.mode == "empty":
                 return (None, 0.0)
+            if behavior.mode == "error":
+                raise RuntimeError("recognition failed")
             if behavior.mode == "mixed":
                 return (
                     [
@@ -83,6 +91,7 @@ def _install_fake_rapidocr_module(context) -> None:
 
     rapidocr_module = types.ModuleType("rapidocr_onnxruntime")
     rapidocr_module.RapidOCR = RapidOCR
+    rapidocr_module.engines_created = 0  # type: ignore[attr-defined]
 
     sys.modules["rapidocr_onnxruntime"] = rapidocr_module
 
@@ -145,8 +154,55 @@ def step_rapidocr_dependency_unavailable(context) -> None:
     _install_rapidocr_unavailable_module(context)
 
 
+@given('a fake RapidOCR library is available that fails for filename "{filename}"')
+def step_fake_rapidocr_fails(context, filename: str) -> None:
+    _install_fake_rapidocr_module(context)
+    behaviors = _ensure_fake_rapidocr_behaviors(context)
+    behaviors[filename] = _FakeRapidOcrBehavior(mode="error", lines=None)
+
+
 @given('a fake RapidOCR library is available that returns a mixed result for filename "{filename}"')
 def step_fake_rapidocr_returns_mixed(context, filename: str) -> None:
     _install_fake_rapidocr_module(context)
     behaviors = _ensure_fake_rapidocr_behaviors(context)
     behaviors[filename] = _FakeRapidOcrBehavior(mode="mixed", lines=None)
+
+
+@when('I extract every item of corpus "{corpus_name}" in one "{extractor_id}" batch')
+def step_extract_corpus_batch(context, corpus_name: str, extractor_id: str) -> None:
+    corpus = Corpus.open((context.workdir / corpus_name).resolve())
+    catalog = corpus.load_catalog()
+    items = [catalog.items[item_id] for item_id in reversed(catalog.order)]
+    extractor = get_extractor(extractor_id)
+    context.batch_extraction_results = extractor.extract_batch(
+        corpus=corpus,
+        items=items,
+        config=extractor.validate_config({}),
+        previous_extractions=[[] for _ in items],
+    )
+
+
+@then('the batch extraction results in ingestion order are "{texts}"')
+def step_batch_extraction_results(context, texts: str) -> None:
+    actual = [
+        (
+            "<none>"
+            if result is None
+            else type(result).__name__ if isinstance(result, Exception) else result.text
+        )
+        for result in context.batch_extraction_results
+    ]
+    assert actual == texts.split(","), actual
+
+
+@then('the batch extraction result types in ingestion order are "{type_names}"')
+def step_batch_extraction_result_types(context, type_names: str) -> None:
+    actual = [type(result).__name__ for result in context.batch_extraction_results]
+    assert actual == type_names.split(","), actual
+
+
+@then("the fake RapidOCR library created {count:d} engine")
+@then("the fake RapidOCR library created {count:d} engines")
+def step_fake_rapidocr_engines(context, count: int) -> None:
+    engines_created = sys.modules["rapidocr_onnxruntime"].engines_created
+    assert engines_created == count, engines_created
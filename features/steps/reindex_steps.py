@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from behave import then, when
+
+from features.environment import run_biblicus
+
+
+def _corpus_path(context, name: str) -> Path:
+    return (context.workdir / name).resolve()
+
+
+@when('I incrementally reindex corpus "{corpus_name}"')
+def step_incremental_reindex(context, corpus_name: str) -> None:
+    corpus = _corpus_path(context, corpus_name)
+    res = run_biblicus(context, ["--corpus", str(corpus), "reindex", "--incremental"])
+    assert res.returncode == 0, res.stderr
+    context.last_reindex_stats = json.loads(res.stdout)
+
+
+@when('I rewrite the raw file "{filename}" in corpus "{corpus_name}" with contents "{contents}"')
+def step_rewrite_raw_file(context, filename: str, corpus_name: str, contents: str) -> None:
+    corpus = _corpus_path(context, corpus_name)
+    (corpus / filename).write_text(contents, encoding="utf-8")
+
+
+@when('I delete the raw file "{filename}" in corpus "{corpus_name}"')
+def step_delete_raw_file(context, filename: str, corpus_name: str) -> None:
+    corpus = _corpus_path(context, corpus_name)
+    (corpus / filename).unlink()
+
+
+@when(
+    'I rewrite the sidecar for raw file "{raw_filename}" in corpus "{corpus_name}" '
+    "with Yet Another Markup Language:"
+)
+def step_rewrite_sidecar(context, raw_filename: str, corpus_name: str) -> None:
+    corpus = _corpus_path(context, corpus_name)
+    sidecar_path = corpus / f"{raw_filename}.biblicus.yml"
+    sidecar_path.write_text(context.text.strip() + "\n", encoding="utf-8")
+
+
+@then("reindex stats include unchanged {count:d}")
+def step_reindex_stats_unchanged(context, count: int) -> None:
+    assert context.last_reindex_stats is not None
+    assert context.last_reindex_stats.get("unchanged") == count, context.last_reindex_stats
+
+
+@then("reindex stats include updated {count:d}")
+def step_reindex_stats_updated(context, count: int) -> None:
+    assert context.last_reindex_stats is not None
+    assert context.last_reindex_stats.get("updated") == count, context.last_reindex_stats
+
+
+@then("reindex stats include removed {count:d}")
+def step_reindex_stats_removed(context, count: int) -> None:
+    assert context.last_reindex_stats is not None
+    assert context.last_reindex_stats.get("removed") == count, context.last_reindex_stats
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+from behave import then, when
+
+import biblicus.retrievers.scan as scan
+from biblicus.corpus import Corpus
+from biblicus.models import QueryBudget
+from biblicus.retrievers.scan import ScanRetriever
+
+_BUDGET = QueryBudget(max_total_items=20, maximum_total_characters=20000, max_items_per_source=5)
+
+
+def _corpus_path(context, name: str) -> Path:
+    return (context.workdir / name).resolve()
+
+
+def _evidence_keys(result) -> list[tuple]:
+    return [
+        (
+            evidence.item_id,
+            evidence.rank,
+            evidence.score,
+            evidence.text,
+            evidence.span_start,
+            evidence.span_end,
+        )
+        for evidence in result.evidence
+    ]
+
+
+@then("the latest snapshot records {count:d} scan text store artifacts")
+def step_scan_text_store_artifacts(context, count: int) -> None:
+    artifacts = context.last_snapshot.get("snapshot_artifacts") or []
+    assert len(artifacts) == count, artifacts
+    for relpath in artifacts:
+        assert (_corpus_path(context, "corpus") / relpath).is_file()
+    stats = context.last_snapshot.get("stats") or {}
+    assert stats.get("text_bytes", 0) > 0
+
+
+@then('scan queries "{queries}" match a snapshot without a text store')
+def step_scan_matches_item_reads(context, queries: str) -> None:
+    corpus = Corpus.open(_corpus_path(context, "corpus"))
+    snapshot = corpus.load_snapshot(context.last_snapshot_id)
+    legacy_snapshot = snapshot.model_copy(update={"snapshot_artifacts": []})
+    retriever = ScanRetriever()
+    query_texts = queries.split("|")
+    packed = retriever.query_batch(
+        corpus, snapshot=snapshot, query_texts=query_texts, budget=_BUDGET
+    )
+    scanned = retriever.query_batch(
+        corpus, snapshot=legacy_snapshot, query_texts=query_texts, budget=_BUDGET
+    )
+    for packed_result, scanned_result in zip(packed, scanned):
+        assert _evidence_keys(packed_result) == _evidence_keys(scanned_result)
+        assert packed_result.stats == scanned_result.stats
+    assert any(result.evidence for result in packed)
+
+
+@when('I query the latest scan snapshot for "{query_text}" while counting item file reads')
+def step_scan_query_counting_reads(context, query_text: str) -> None:
+    corpus = Corpus.open(_corpus_path(context, "corpus"))
+    snapshot = corpus.load_snapshot(context.last_snapshot_id)
+    original_load = scan._load_text_from_item
+    context.item_file_reads = 0
+
+    def counting_load(*args, **kwargs):
+        context.item_file_reads += 1
+        return original_load(*args, **kwargs)
+
+    scan._load_text_from_item = counting_load
+    context.add_cleanup(setattr, scan, "_load_text_from_item", original_load)
+    context.scan_result = ScanRetriever().query(
+        corpus, snapshot=snapshot, query_text=query_text, budget=_BUDGET
+    )
+
+
+@then("{count:d} item files were read")
+def step_scan_item_file_reads(context, count: int) -> None:
+    assert context.item_file_reads == count, context.item_file_reads
+
+
+@then('the scan query returned evidence text "{text}"')
+def step_scan_query_evidence_text(context, text: str) -> None:
+    assert [evidence.text for evidence in context.scan_result.evidence] == [text]
+    assert context.scan_result.evidence[0].score == 2.0
+
+
+@when(
+    'I build a scan snapshot for corpus "{name}" via the Python application programming interface'
+)
+def step_build_scan_snapshot_python(context, name: str) -> None:
+    corpus = Corpus.open(_corpus_path(context, name))
+    context.scan_snapshot = ScanRetriever().build_snapshot(
+        corpus, configuration_name="default", configuration={}
+    )
+
+
+@then('the scan snapshot for corpus "{name}" has 0 documents and returns no evidence')
+def step_scan_snapshot_empty(context, name: str) -> None:
+    corpus = Corpus.open(_corpus_path(context, name))
+    assert context.scan_snapshot.stats["documents"] == 0
+    result = ScanRetriever().query(
+        corpus, snapshot=context.scan_snapshot, query_text="anything", budget=_BUDGET
+    )
+    assert result.evidence == []
+    assert result.stats["candidates"] == 0
+
+
+@then("scan text store evidence for a removed item is empty")
+def step_scan_evidence_skips_removed(context) -> None:
+    corpus = Corpus.open(_corpus_path(context, "corpus"))
+    snapshot = corpus.load_snapshot(context.last_snapshot_id)
+    text_store = scan._load_text_store(corpus, snapshot)
+    evidence = list(
+        scan._iter_text_store_evidence(
+            text_store,
+            {},
+            ranked_documents=[(text_store.item_ids[0], 1)],
+            query_tokens=["note"],
+            snippet_characters=100,
+        )
+    )
+    assert evidence == []
+
+
+@then('counting "{tokens}" in packed documents "{documents}" gives "{counts}"')
+def step_count_packed_matches(context, tokens: str, documents: str, counts: str) -> None:
+    encoded = [document.encode("utf-8") for document in documents.split("|")]
+    lower_path = context.workdir / "packed.lower"
+    lower_path.write_bytes(b"".join(encoded))
+    offsets = np.cumsum([0] + [len(document) for document in encoded]).astype(np.int64)
+    actual = scan._count_packed_matches(
+        str(lower_path), offsets, [token.encode("utf-8") for token in tokens.split("|")]
+    )
+    assert [int(count) for count in actual] == [int(count) for count in counts.split(",")], actual
+
+
+class _CountingProcessPool:
+    def __init__(self, context, max_workers: int) -> None:
+        self._pool = _ORIGINAL_PROCESS_POOL(max_workers=max_workers)
+        self.shut_down = False
+        context.scoring_pools.append(self)
+
+    def map(self, *args, **kwargs):
+        return self._pool.map(*args, **kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.shut_down = True
+        self._pool.shutdown(wait=wait)
+
+
+_ORIGINAL_PROCESS_POOL = scan.ProcessPoolExecutor
+
+
+@when(
+    'I run {count:d} scan queries for "{query_text}" with one retriever while counting process pools'
+)
+def step_scan_queries_counting_pools(context, count: int, query_text: str) -> None:
+    context.scoring_pools = []
+    scan.ProcessPoolExecutor = lambda max_workers: _CountingProcessPool(context, max_workers)
+    context.add_cleanup(setattr, scan, "ProcessPoolExecutor", _ORIGINAL_PROCESS_POOL)
+    corpus = Corpus.open(_corpus_path(context, "corpus"))
+    context.scan_retriever = ScanRetriever()
+    context.add_cleanup(context.scan_retriever.close)
+    snapshot = corpus.load_snapshot(context.last_snapshot_id)
+    for _ in range(count):
+        result = context.scan_retriever.query(
+            corpus, snapshot=snapshot, query_text=query_text, budget=_BUDGET
+        )
+        assert result.evidence
+
+
+@when(
+    'I run a scan query for "{query_text}" with {workers:d} scoring workers on the same retriever'
+)
+def step_scan_query_more_workers(context, query_text: str, workers: int) -> None:
+    corpus = Corpus.open(_corpus_path(context, "corpus"))
+    snapshot = corpus.load_snapshot(context.last_snapshot_id)
+    configuration = snapshot.configuration.model_copy(
+        update={
+            "configuration_id": f"{snapshot.configuration.configuration_id}-{workers}",
+            "configuration": {**snapshot.configuration.configuration, "scoring_workers": workers},
+        }
+    )
+    wider_snapshot = snapshot.model_copy(update={"configuration": configuration})
+    result = context.scan_retriever.query(
+        corpus, snapshot=wider_snapshot, query_text=query_text, budget=_BUDGET
+    )
+    assert result.evidence
+
+
+@when("I close the scan retriever")
+def step_close_scan_retriever(context) -> None:
+    context.scan_retriever.close()
+
+
+@then("{count:d} scoring process pool was started")
+@then("{count:d} scoring process pools were started")
+def step_scoring_pools_started(context, count: int) -> None:
+    assert len(context.scoring_pools) == count, context.scoring_pools
+
+
+@then("the replaced scoring process pool stays open until the retriever closes")
+def step_replaced_pool_open(context) -> None:
+    assert not any(pool.shut_down for pool in context.scoring_pools)
+    assert context.scan_retriever._scoring_pool is context.scoring_pools[-1]
+
+
+@then("the scan retriever holds no scoring process pool")
+def step_scan_retriever_no_pool(context) -> None:
+    assert context.scan_retriever._scoring_pool is None
+    assert context.scan_retriever._retired_scoring_pools == []
+
+
+@then("every scoring process pool was shut down")
+def step_every_pool_shut_down(context) -> None:
+    assert all(pool.shut_down for pool in context.scoring_pools)
+
+
+@then("the latest snapshot stats include text items {count:d}")
+def step_snapshot_stats_text_items(context, count: int) -> None:
+    stats = context.last_snapshot.get("stats") or {}
+    assert stats.get("text_items") == count, stats
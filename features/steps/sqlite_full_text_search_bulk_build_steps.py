@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import sqlite3
+
+from behave import then, when
+
+from biblicus.corpus import Corpus
+from biblicus.models import QueryBudget
+from biblicus.retrievers.sqlite_full_text_search import SqliteFullTextSearchRetriever
+
+_BUDGET = QueryBudget(max_total_items=10, maximum_total_characters=5000, max_items_per_source=5)
+
+
+def _corpus(context) -> Corpus:
+    return Corpus.open((context.workdir / "corpus").resolve())
+
+
+class _TracingConnection(sqlite3.Connection):
+    statements: list[str] = []
+    batched_inserts: list[int] = []
+
+    def execute(self, sql, *args):
+        _TracingConnection.statements.append(sql)
+        return super().execute(sql, *args)
+
+    def executemany(self, sql, rows):
+        rows = list(rows)
+        if rows and "INSERT INTO chunks_full_text_search" in sql:
+            _TracingConnection.batched_inserts.append(len(rows))
+        return super().executemany(sql, rows)
+
+
+@then("the latest snapshot has the same chunk count as the exact snapshot")
+def step_same_chunk_count(context) -> None:
+    corpus = _corpus(context)
+    exact = corpus.load_snapshot(context.exact_snapshot_id)
+    latest = corpus.load_snapshot(context.last_snapshot_id)
+    assert latest.stats["chunks"] == exact.stats["chunks"], (latest.stats, exact.stats)
+    assert latest.stats["text_items"] == exact.stats["text_items"]
+    assert latest.stats["chunks"] > latest.stats["text_items"]
+
+
+@then('full-text search queries "{queries}" match the exact snapshot')
+def step_fts_queries_match_exact(context, queries: str) -> None:
+    corpus = _corpus(context)
+    retriever = SqliteFullTextSearchRetriever()
+    query_texts = queries.split("|")
+    exact = retriever.query_batch(
+        corpus,
+        snapshot=corpus.load_snapshot(context.exact_snapshot_id),
+        query_texts=query_texts,
+        budget=_BUDGET,
+    )
+    latest = retriever.query_batch(
+        corpus,
+        snapshot=corpus.load_snapshot(context.last_snapshot_id),
+        query_texts=query_texts,
+        budget=_BUDGET,
+    )
+    for exact_result, latest_result in zip(exact, latest):
+        assert [
+            (evidence.item_id, evidence.span_start, evidence.text)
+            for evidence in latest_result.evidence
+        ] == [
+            (evidence.item_id, evidence.span_start, evidence.text)
+            for evidence in exact_result.evidence
+        ]
+    assert exact[0].evidence
+
+
+@when(
+    "I build a full-text search snapshot with insert batch size {batch_size:d} while tracing "
+    "statements"
+)
+def step_build_fts_tracing(context, batch_size: int) -> None:
+    original_connect = sqlite3.connect
+    _TracingConnection.statements = []
+    _TracingConnection.batched_inserts = []
+
+    def tracing_connect(database, *args, **kwargs):
+        return original_connect(database, *args, factory=_TracingConnection, **kwargs)
+
+    sqlite3.connect = tracing_connect
+    context.add_cleanup(setattr, sqlite3, "connect", original_connect)
+    SqliteFullTextSearchRetriever().build_snapshot(
+        _corpus(context),
+        configuration_name="bulk",
+        configuration={"insert_batch_size": batch_size},
+    )
+
+
+@then('the traced statements include "{fragment}"')
+def step_traced_statements_include(context, fragment: str) -> None:
+    assert any(
+        fragment in statement for statement in _TracingConnection.statements
+    ), _TracingConnection.statements
+
+
+@then("the traced build ran {count:d} batched inserts")
+def step_traced_batched_inserts(context, count: int) -> None:
+    assert len(_TracingConnection.batched_inserts) == count, _TracingConnection.batched_inserts
+    assert sum(_TracingConnection.batched_inserts) == 31
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+from behave import then, when
+
+from biblicus.corpus import Corpus
+from biblicus.models import QueryBudget
+from biblicus.retrievers import get_retriever
+from biblicus.retrievers.sqlite_full_text_search import SqliteFullTextSearchRetriever
+
+_BUDGET = QueryBudget(max_total_items=5, maximum_total_characters=2000, max_items_per_source=5)
+
+
+def _corpus(context) -> Corpus:
+    return Corpus.open((context.workdir / "corpus").resolve())
+
+
+def _pooled_retriever(context) -> SqliteFullTextSearchRetriever:
+    retriever = getattr(context, "pooled_retriever", None)
+    if retriever is None:
+        retriever = SqliteFullTextSearchRetriever()
+        context.pooled_retriever = retriever
+        context.add_cleanup(retriever.close)
+    return retriever
+
+
+def _query(context, query_text: str) -> None:
+    corpus = _corpus(context)
+    context.pooled_result = _pooled_retriever(context).query(
+        corpus,
+        snapshot=corpus.load_snapshot(context.last_snapshot_id),
+        query_text=query_text,
+        budget=_BUDGET,
+    )
+
+
+@when('I query the pooled retriever {count:d} times for "{query_text}"')
+def step_query_pooled_repeatedly(context, count: int, query_text: str) -> None:
+    for _ in range(count):
+        _query(context, query_text)
+
+
+@when('I query the pooled retriever for "{query_text}" from {count:d} threads')
+def step_query_pooled_from_threads(context, query_text: str, count: int) -> None:
+    _pooled_retriever(context)
+    errors = []
+
+    def run() -> None:
+        try:
+            _query(context, query_text)
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=run) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, errors
+
+
+@when("I close the pooled retriever")
+def step_close_pooled_retriever(context) -> None:
+    _pooled_retriever(context).close()
+
+
+@then("the pooled retriever opened {opened:d} connections and reused them {reused:d} times")
+def step_pooled_connection_stats(context, opened: int, reused: int) -> None:
+    stats = _pooled_retriever(context).connection_stats()
+    assert stats["connections_opened"] == opened, stats
+    assert stats["connection_reuses"] == reused, stats
+    expected_rate = reused / (opened + reused) if opened + reused else 0.0
+    assert stats["connection_reuse_rate"] == expected_rate, stats
+
+
+@then("the pooled retriever returned evidence")
+def step_pooled_returned_evidence(context) -> None:
+    assert context.pooled_result.evidence
+
+
+@then("pooled connections reject writes")
+def step_pooled_connections_reject_writes(context) -> None:
+    retriever = _pooled_retriever(context)
+    corpus = _corpus(context)
+    snapshot = corpus.load_snapshot(context.last_snapshot_id)
+    connection = retriever._connection_pool.acquire(corpus.root / snapshot.snapshot_artifacts[0])
+    try:
+        connection.execute("DELETE FROM chunks_full_text_search")
+    except sqlite3.OperationalError as error:
+        assert "readonly" in str(error), error
+    else:
+        raise AssertionError("pooled connection accepted a write")
+
+
+@then("closing a retriever without pooled resources succeeds")
+def step_close_plain_retriever(context) -> None:
+    assert get_retriever("scan").close() is None
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import sqlite3
+
+from behave import then, when
+
+from biblicus.corpus import Corpus
+from biblicus.retrievers.sqlite_full_text_search import SqliteFullTextSearchRetriever
+
+
+def _corpus(context) -> Corpus:
+    return Corpus.open((context.workdir / "corpus").resolve())
+
+
+@when("I remember the latest snapshot as the parent snapshot")
+def step_remember_parent_snapshot(context) -> None:
+    context.parent_snapshot_id = context.last_snapshot_id
+
+
+def _build_fts_snapshot(context, configuration: dict) -> None:
+    snapshot = SqliteFullTextSearchRetriever().build_snapshot(
+        _corpus(context),
+        configuration_name="incremental",
+        configuration=configuration,
+    )
+    context.last_snapshot = snapshot.model_dump()
+    context.last_snapshot_id = snapshot.snapshot_id
+
+
+@when("I build a full-text search snapshot with config:")
+def step_build_fts_with_config(context) -> None:
+    _build_fts_snapshot(context, {row["key"]: row["value"] for row in context.table})
+
+
+@when("I build a full-text search snapshot from the parent snapshot")
+def step_build_fts_from_parent(context) -> None:
+    _build_fts_snapshot(context, {"parent_snapshot": context.parent_snapshot_id})
+
+
+@when("I drop the item fingerprints from the latest snapshot database")
+def step_drop_item_fingerprints(context) -> None:
+    corpus = _corpus(context)
+    snapshot = corpus.load_snapshot(context.last_snapshot_id)
+    connection = sqlite3.connect(str(corpus.root / snapshot.snapshot_artifacts[0]))
+    try:
+        connection.execute("DROP TABLE indexed_items")
+        connection.commit()
+    finally:
+        connection.close()
+
+
+@then(
+    "the latest snapshot reused {reused:d} items, reindexed {reindexed:d}, and removed {removed:d}"
+)
+def step_incremental_stats(context, reused: int, reindexed: int, removed: int) -> None:
+    stats = context.last_snapshot["stats"]
+    assert stats["items"] - stats["reindexed_items"] == reused, stats
+    assert stats["reindexed_items"] == reindexed, stats
+    assert stats["removed_items"] == removed, stats
+
+
+@then("the latest snapshot was built from the parent snapshot")
+def step_latest_built_from_parent(context) -> None:
+    assert (
+        context.last_snapshot["parent_snapshot_id"] == context.parent_snapshot_id
+    ), context.last_snapshot
+
+
+@then("the latest snapshot has no parent snapshot")
+def step_latest_has_no_parent(context) -> None:
+    assert context.last_snapshot["parent_snapshot_id"] is None, context.last_snapshot
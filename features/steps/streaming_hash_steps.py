@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+from behave import given, then
+
+
+def _corpus_path(context, name: str) -> Path:
+    return (context.workdir / name).resolve()
+
+
+def _load_catalog_items(corpus: Path) -> dict:
+    catalog = json.loads((corpus / "metadata" / "catalog.json").read_text(encoding="utf-8"))
+    return catalog["items"]
+
+
+def _assert_item_matches_file(corpus: Path, item: dict) -> None:
+    with (corpus / item["relpath"]).open("rb") as handle:
+        data = handle.read()
+    assert item["sha256"] == hashlib.sha256(data).hexdigest(), item
+    assert item["bytes"] == len(data), item
+
+
+@given('a binary raw file named "{relpath}" of {size:d} bytes exists in corpus "{corpus_name}"')
+def step_binary_raw_file(context, relpath: str, size: int, corpus_name: str) -> None:
+    path = _corpus_path(context, corpus_name) / relpath
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pattern = bytes(range(256))
+    path.write_bytes((pattern * (size // len(pattern) + 1))[:size])
+
+
+@given("whole-file reads of non-Markdown files are disallowed")
+def step_disallow_whole_file_reads(context) -> None:
+    original_read_bytes = Path.read_bytes
+
+    def guarded_read_bytes(self: Path) -> bytes:
+        if self.suffix.lower() not in {".md", ".markdown"} and not self.name.endswith(".yml"):
+            raise AssertionError(f"Unexpected whole-file read of {self}")
+        return original_read_bytes(self)
+
+    Path.read_bytes = guarded_read_bytes
+    context.add_cleanup(setattr, Path, "read_bytes", original_read_bytes)
+
+
+@then(
+    'the catalog item "{item_id}" in corpus "{corpus_name}" records the digest and size of its '
+    "raw file"
+)
+def step_catalog_item_matches_file(context, item_id: str, corpus_name: str) -> None:
+    corpus = _corpus_path(context, corpus_name)
+    _assert_item_matches_file(corpus, _load_catalog_items(corpus)[item_id])
+
+
+@then('every catalog item in corpus "{corpus_name}" records the digest and size of its raw file')
+def step_every_catalog_item_matches_file(context, corpus_name: str) -> None:
+    corpus = _corpus_path(context, corpus_name)
+    items = _load_catalog_items(corpus)
+    assert items
+    for item in items.values():
+        _assert_item_matches_file(corpus, item)
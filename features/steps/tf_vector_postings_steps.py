@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from behave import then, when
+
+import biblicus.retrievers.tf_vector as tf_vector
+from biblicus.corpus import Corpus
+from biblicus.models import QueryBudget
+from biblicus.retrievers.tf_vector import TfVectorRetriever
+
+_BUDGET = QueryBudget(max_total_items=5, maximum_total_characters=2000, max_items_per_source=5)
+
+
+def _corpus(context) -> Corpus:
+    return Corpus.open((context.workdir / "corpus").resolve())
+
+
+def _evidence_keys(result) -> list[tuple]:
+    return [
+        (evidence.item_id, evidence.rank, evidence.score, evidence.text, evidence.span_start)
+        for evidence in result.evidence
+    ]
+
+
+@then("the latest snapshot stats include documents {count:d}")
+def step_snapshot_stats_documents(context, count: int) -> None:
+    stats = context.last_snapshot.get("stats") or {}
+    assert stats.get("documents") == count, stats
+
+
+@then("the latest snapshot stats include terms {count:d}")
+def step_snapshot_stats_terms(context, count: int) -> None:
+    stats = context.last_snapshot.get("stats") or {}
+    assert stats.get("terms") == count, stats
+
+
+@then("the latest snapshot records a postings index artifact")
+def step_snapshot_records_postings(context) -> None:
+    artifacts = context.last_snapshot.get("snapshot_artifacts") or []
+    assert len(artifacts) == 1
+    assert artifacts[0].endswith(".postings.json")
+    path = Path(context.workdir / "corpus" / artifacts[0])
+    postings_index = json.loads(path.read_text(encoding="utf-8"))
+    assert postings_index["schema_version"] == tf_vector.POSTINGS_SCHEMA_VERSION
+    assert len(postings_index["postings"]["zeta"]["documents"]) == 1
+    assert postings_index["postings"]["zeta"]["frequencies"] == [2]
+
+
+@when('I query the latest tf-vector snapshot for "{query_text}" while counting item text reads')
+def step_query_counting_text_reads(context, query_text: str) -> None:
+    corpus = _corpus(context)
+    snapshot = corpus.load_snapshot(context.last_snapshot_id)
+    original_load = tf_vector._load_text_from_item
+    context.item_text_reads = 0
+
+    def counting_load(*args, **kwargs):
+        context.item_text_reads += 1
+        return original_load(*args, **kwargs)
+
+    tf_vector._load_text_from_item = counting_load
+    context.add_cleanup(setattr, tf_vector, "_load_text_from_item", original_load)
+    context.tf_vector_result = TfVectorRetriever().query(
+        corpus, snapshot=snapshot, query_text=query_text, budget=_BUDGET
+    )
+
+
+@then("{count:d} item text was read")
+def step_item_text_reads(context, count: int) -> None:
+    assert context.item_text_reads == count, context.item_text_reads
+
+
+@then("the tf-vector query returned {count:d} evidence items")
+def step_tf_vector_query_evidence_count(context, count: int) -> None:
+    assert len(context.tf_vector_result.evidence) == count
+    assert context.tf_vector_result.stats["candidates"] == count
+
+
+@then('tf-vector queries "{queries}" match a snapshot without a postings index')
+def step_tf_vector_matches_full_scan(context, queries: str) -> None:
+    corpus = _corpus(context)
+    snapshot = corpus.load_snapshot(context.last_snapshot_id)
+    legacy_snapshot = snapshot.model_copy(update={"snapshot_artifacts": []})
+    retriever = TfVectorRetriever()
+    query_texts = queries.split("|")
+    indexed = retriever.query_batch(
+        corpus, snapshot=snapshot, query_texts=query_texts, budget=_BUDGET
+    )
+    scanned = retriever.query_batch(
+        corpus, snapshot=legacy_snapshot, query_texts=query_texts, budget=_BUDGET
+    )
+    for indexed_result, scanned_result in zip(indexed, scanned):
+        assert _evidence_keys(indexed_result) == _evidence_keys(scanned_result)
+        assert indexed_result.stats == scanned_result.stats
+
+
+@then("postings evidence for a removed item and a binary item is empty")
+def step_postings_evidence_skips_items(context) -> None:
+    corpus = _corpus(context)
+    binary = corpus.ingest_item(
+        b"\x00\x01", filename="data.bin", media_type="application/octet-stream"
+    )
+    catalog = corpus.load_catalog()
+    evidence = list(
+        tf_vector._iter_postings_evidence(
+            corpus,
+            catalog.items,
+            ranked_documents=[("removed-item", 1.0), (binary.item_id, 0.5)],
+            query_tokens=["zeta"],
+            extraction_reference=None,
+            snippet_characters=None,
+        )
+    )
+    assert evidence == []
+
+
+@when("I set the latest tf-vector postings index schema version to {version:d}")
+def step_set_postings_schema_version(context, version: int) -> None:
+    path = context.workdir / "corpus" / context.last_snapshot["snapshot_artifacts"][0]
+    postings_index = json.loads(path.read_text(encoding="utf-8"))
+    postings_index["schema_version"] = version
+    path.write_text(json.dumps(postings_index), encoding="utf-8")
+
+
+@when("I build a tf-vector snapshot before any extraction snapshot exists")
+def step_build_tf_vector_without_extraction(context) -> None:
+    corpus = _corpus(context)
+    assert corpus.latest_extraction_snapshot_reference() is None
+    snapshot = TfVectorRetriever().build_snapshot(
+        corpus, configuration_name="default", configuration={}
+    )
+    context.last_snapshot = snapshot.model_dump(mode="json")
+    context.last_snapshot_id = snapshot.snapshot_id
+
+
+@then("the latest snapshot stats record no extraction snapshot")
+def step_snapshot_records_no_extraction(context) -> None:
+    stats = context.last_snapshot.get("stats") or {}
+    assert "extraction_snapshot" in stats, stats
+    assert stats["extraction_snapshot"] is None, stats
+
+
+@then("the latest snapshot stats record the latest extraction snapshot")
+def step_snapshot_records_latest_extraction(context) -> None:
+    stats = context.last_snapshot.get("stats") or {}
+    expected = _corpus(context).latest_extraction_snapshot_reference()
+    assert stats.get("extraction_snapshot") == expected.as_string(), stats
+
+
+def _query_extraction_reference(context, snapshot, query_text: str):
+    opened = {}
+    original_open = tf_vector._open_snapshot
+
+    def recording_open(corpus, opened_snapshot):
+        state = original_open(corpus, opened_snapshot)
+        opened["extraction_reference"] = state[1]
+        return state
+
+    tf_vector._open_snapshot = recording_open
+    try:
+        TfVectorRetriever().query(
+            _corpus(context), snapshot=snapshot, query_text=query_text, budget=_BUDGET
+        )
+    finally:
+        tf_vector._open_snapshot = original_open
+    return opened["extraction_reference"]
+
+
+@then('tf-vector queries for "{query_text}" use the recorded extraction snapshot')
+def step_tf_vector_uses_recorded_extraction(context, query_text: str) -> None:
+    corpus = _corpus(context)
+    snapshot = corpus.load_snapshot(context.last_snapshot_id)
+    original_resolve = tf_vector._resolve_extraction_reference
+
+    def fail_resolve(*args, **kwargs):
+        raise AssertionError("extraction reference was resolved at query time")
+
+    tf_vector._resolve_extraction_reference = fail_resolve
+    try:
+        extraction_reference = _query_extraction_reference(context, snapshot, query_text)
+    finally:
+        tf_vector._resolve_extraction_reference = original_resolve
+    recorded = snapshot.stats["extraction_snapshot"]
+    if recorded is None:
+        assert extraction_reference is None
+    else:
+        assert extraction_reference.as_string() == recorded
+
+
+@then(
+    'tf-vector queries for "{query_text}" without a recorded extraction snapshot use the latest '
+    "extraction snapshot"
+)
+def step_tf_vector_resolves_unrecorded_extraction(context, query_text: str) -> None:
+    corpus = _corpus(context)
+    snapshot = corpus.load_snapshot(context.last_snapshot_id)
+    stats = {key: value for key, value in snapshot.stats.items() if key != "extraction_snapshot"}
+    legacy_snapshot = snapshot.model_copy(update={"stats": stats})
+    extraction_reference = _query_extraction_reference(context, legacy_snapshot, query_text)
+    expected = corpus.latest_extraction_snapshot_reference()
+    assert extraction_reference.as_string() == expected.as_string()
@@ -0,0 +1,19 @@
+Feature: Streaming content hashing
+  Reindex and folder tree import should hash content files in fixed-size chunks so memory use
+  does not grow with file size.
+
+  Scenario: Reindex hashes a large binary file without reading it whole
+    Given I initialized a corpus at "corpus"
+    And a binary raw file named "00000000-0000-0000-0000-000000000001--clip.bin" of 3000000 bytes exists in corpus "corpus"
+    And whole-file reads of non-Markdown files are disallowed
+    When I reindex corpus "corpus"
+    Then the command succeeds
+    And the catalog item "00000000-0000-0000-0000-000000000001" in corpus "corpus" records the digest and size of its raw file
+
+  Scenario: Import hashes a large binary file without reading it whole
+    Given I initialized a corpus at "corpus"
+    And a binary raw file named "source_tree/clip.bin" of 3000000 bytes exists in corpus "corpus"
+    And whole-file reads of non-Markdown files are disallowed
+    When I snapshot "import-tree corpus/source_tree" in corpus "corpus"
+    Then the command succeeds
+    And every catalog item in corpus "corpus" records the digest and size of its raw file
@@ -98,3 +98,69 @@ Feature: Faster-Whisper speech to text extraction
     When I ingest the file "clip.flac" into corpus "corpus"
     And I build a "stt-faster-whisper" extraction snapshot in corpus "corpus"
     Then the extracted text for the last ingested item equals "FLAC format test"
+
+  Scenario: Faster-Whisper loads its model once for a batch of audio items
+    Given I initialized a corpus at "corpus"
+    And a fake faster-whisper library is available
+    And a file "first.wav" exists with bytes:
+      """
+      RIFF\x00\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x40\x1f\x00\x00\x80\x3e\x00\x00\x02\x00\x10\x00data1
+      """
+    And a file "second.wav" exists with bytes:
+      """
+      RIFF\x00\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x40\x1f\x00\x00\x80\x3e\x00\x00\x02\x00\x10\x00data2
+      """
+    And a file "third.wav" exists with bytes:
+      """
+      RIFF\x00\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x40\x1f\x00\x00\x80\x3e\x00\x00\x02\x00\x10\x00data3
+      """
+    When I ingest the file "first.wav" into corpus "corpus"
+    And I ingest the file "second.wav" into corpus "corpus"
+    And I ingest the file "third.wav" into corpus "corpus"
+    And I build a "stt-faster-whisper" extraction snapshot in corpus "corpus"
+    Then the extraction snapshot stats include extracted_items 3
+    And the faster-whisper model was loaded 1 times
+
+  Scenario: Faster-Whisper records the error of one failing item in a batch
+    Given I initialized a corpus at "corpus"
+    And a fake faster-whisper library is available
+    And the fake faster-whisper library fails for filename "second.wav"
+    And a file "first.wav" exists with bytes:
+      """
+      RIFF\x00\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x40\x1f\x00\x00\x80\x3e\x00\x00\x02\x00\x10\x00data1
+      """
+    And a file "second.wav" exists with bytes:
+      """
+      RIFF\x00\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x40\x1f\x00\x00\x80\x3e\x00\x00\x02\x00\x10\x00data2
+      """
+    And a file "third.wav" exists with bytes:
+      """
+      RIFF\x00\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x40\x1f\x00\x00\x80\x3e\x00\x00\x02\x00\x10\x00data3
+      """
+    When I ingest the file "first.wav" into corpus "corpus"
+    And I ingest the file "second.wav" into corpus "corpus"
+    And I ingest the file "third.wav" into corpus "corpus"
+    And I build a "stt-faster-whisper" extraction snapshot in corpus "corpus"
+    Then the extraction snapshot stats include extracted_items 2
+    And the extraction snapshot stats include errored_items 1
+    And the extraction snapshot stats include batch_fallback_items 0
+    And the faster-whisper model was loaded 1 times
+
+  Scenario: Faster-Whisper transcribes the audio items of a mixed batch
+    Given I initialized a corpus at "corpus"
+    And a fake faster-whisper library is available
+    And the fake faster-whisper library fails for filename "second.wav"
+    And a file "first.wav" exists with bytes:
+      """
+      RIFF\x00\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x40\x1f\x00\x00\x80\x3e\x00\x00\x02\x00\x10\x00data1
+      """
+    And a file "second.wav" exists with bytes:
+      """
+      RIFF\x00\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x40\x1f\x00\x00\x80\x3e\x00\x00\x02\x00\x10\x00data2
+      """
+    When I ingest the file "first.wav" into corpus "corpus"
+    And I ingest the text "alpha" with title "Alpha" and tags "a" into corpus "corpus"
+    And I ingest the file "second.wav" into corpus "corpus"
+    And I extract every item of corpus "corpus" in one "stt-faster-whisper" batch
+    Then the batch extraction result types in ingestion order are "ExtractedText,NoneType,RuntimeError"
+    And the faster-whisper model was loaded 1 times
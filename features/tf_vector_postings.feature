@@ -0,0 +1,78 @@
+Feature: Term-frequency vector postings index
+  The tf-vector retriever writes a postings-list index when a snapshot is built so queries score
+  only the documents that share terms with the query instead of re-reading the whole corpus.
+
+  Background:
+    Given I have an initialized corpus at "corpus"
+    When I ingest 20 notes via the Python application programming interface
+    And I ingest the text "zeta alpha zeta" with title "Zeta" and tags "x" into corpus "corpus"
+
+  Scenario: Building a snapshot writes a postings index artifact
+    When I build a "tf-vector" retrieval snapshot in corpus "corpus"
+    Then the latest snapshot stats include documents 21
+    And the latest snapshot stats include terms 24
+    And the latest snapshot records a postings index artifact
+
+  Scenario: Queries read text only for documents that share query terms
+    When I build a "tf-vector" retrieval snapshot in corpus "corpus"
+    And I query the latest tf-vector snapshot for "zeta unseen" while counting item text reads
+    Then 1 item text was read
+    And the tf-vector query returned 1 evidence items
+
+  Scenario: Postings index scores match a full corpus scan
+    Given a binary file "data.bin" exists
+    When I ingest the file "data.bin" into corpus "corpus"
+    And I ingest the text "!!!" with title "Punctuation" and tags "x" into corpus "corpus"
+    And I build a "tf-vector" retrieval snapshot in corpus "corpus"
+    Then the latest snapshot stats include documents 21
+    And tf-vector queries "Note body 4|zeta|alpha note|unseen" match a snapshot without a postings index
+
+  Scenario: Postings evidence skips removed and non-text items
+    When I build a "tf-vector" retrieval snapshot in corpus "corpus"
+    Then postings evidence for a removed item and a binary item is empty
+
+  Scenario: Querying fails when the postings index is missing
+    When I build a "tf-vector" retrieval snapshot in corpus "corpus"
+    And I delete the latest snapshot artifacts
+    And I attempt to query with the latest snapshot for "zeta" and budget:
+      | key             | value |
+      | max_total_items | 3     |
+    Then the command fails with exit code 2
+    And standard error includes "postings index is missing"
+
+  Scenario: Querying rejects an unsupported postings index schema
+    When I build a "tf-vector" retrieval snapshot in corpus "corpus"
+    And I set the latest tf-vector postings index schema version to 99
+    And I attempt to query with the latest snapshot for "zeta" and budget:
+      | key             | value |
+      | max_total_items | 3     |
+    Then the command fails with exit code 2
+    And standard error includes "Unsupported tf-vector postings index schema version: 99"
+
+  Scenario: Queries keep the extraction snapshot resolved at build time
+    When I build a tf-vector snapshot before any extraction snapshot exists
+    And I build a "pass-through-text" extraction snapshot in corpus "corpus"
+    Then the latest snapshot stats record no extraction snapshot
+    And tf-vector queries for "zeta" use the recorded extraction snapshot
+
+  Scenario: Snapshots record the extraction snapshot they were built from
+    When I build a "pass-through-text" extraction snapshot in corpus "corpus"
+    And I build a "tf-vector" retrieval snapshot in corpus "corpus"
+    Then the latest snapshot stats record the latest extraction snapshot
+    And tf-vector queries for "zeta" use the recorded extraction snapshot
+
+  Scenario: Snapshots without a recorded extraction snapshot resolve it from configuration
+    When I build a "pass-through-text" extraction snapshot in corpus "corpus"
+    And I build a "tf-vector" retrieval snapshot in corpus "corpus"
+    Then tf-vector queries for "zeta" without a recorded extraction snapshot use the latest extraction snapshot
+
+  Scenario: Text items are counted while the postings index is built
+    Given a binary file "data.bin" exists
+    And a file "empty.md" exists with markdown front matter:
+      | key   | value |
+      | title | Empty |
+    When I ingest the file "data.bin" into corpus "corpus"
+    And I ingest the file "empty.md" into corpus "corpus"
+    And I build a "tf-vector" retrieval snapshot in corpus "corpus"
+    Then the latest snapshot stats include documents 21
+    And the latest snapshot stats include text items 22
@@ -5,10 +5,13 @@ Provider-backed text embeddings.
 from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, List, Sequence
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
 
 from .models import EmbeddingsClientConfig
 
+if TYPE_CHECKING:
+    from ..embedding_cache import EmbeddingCache
+
 
 def _require_dspy_embedder():
     try:
@@ -54,21 +57,45 @@ def _normalize_embeddings(embeddings: Any) -> List[List[float]]:
 
 
 def generate_embeddings_batch(
-    *, client: EmbeddingsClientConfig, texts: Sequence[str]
+    *,
+    client: EmbeddingsClientConfig,
+    texts: Sequence[str],
+    cache: Optional["EmbeddingCache"] = None,
 ) -> List[List[float]]:
     """
     Generate embeddings for a batch of texts.
 
-    The implementation performs batched requests and can run requests concurrently.
+    The implementation performs batched requests and can run requests concurrently. When a cache
+    is given, only texts without a cached vector for the same provider and model are requested.
 
     :param client: Embeddings client configuration.
     :type client: biblicus.ai.models.EmbeddingsClientConfig
     :param texts: Text inputs to embed.
     :type texts: Sequence[str]
+    :param cache: Optional embedding cache shared across runs.
+    :type cache: biblicus.embedding_cache.EmbeddingCache or None
     :return: Embedding vectors in input order.
     :rtype: list[list[float]]
     :raises ValueError: If required dependencies or credentials are missing.
     """
+    if cache is None or not texts:
+        return _generate_embeddings_batch(client=client, texts=texts)
+    from ..embedding_cache import embedding_cache_namespace
+
+    namespace = embedding_cache_namespace(
+        client.model_dump(mode="json", include={"provider", "model", "api_base", "extra_params"})
+    )
+    embeddings = cache.embed(
+        namespace,
+        texts,
+        lambda missing: _generate_embeddings_batch(client=client, texts=missing),
+    )
+    return embeddings.tolist()
+
+
+def _generate_embeddings_batch(
+    *, client: EmbeddingsClientConfig, texts: Sequence[str]
+) -> List[List[float]]:
     if not texts:
         return []
 
@@ -26,6 +26,7 @@ from ..context import (
     fit_context_pack_to_token_budget,
 )
 from ..corpus import Corpus
+from ..embedding_cache import EmbeddingCache
 from ..models import Evidence, ExtractionSnapshotReference, QueryBudget, RetrievalResult
 from ..retrieval import hash_text
 from ..text.annotate import TextAnnotateRequest, apply_text_annotate
@@ -253,11 +254,17 @@ def _run_markov(
             file=sys.stderr,
         )
     else:
-        observations = _build_observations(
-            segments=segments,
-            config=config,
-            cache_context=cache_context,
-        )
+        embedding_cache = EmbeddingCache.for_corpus(corpus) if config.embeddings.enabled else None
+        try:
+            observations = _build_observations(
+                segments=segments,
+                config=config,
+                cache_context=cache_context,
+                embedding_cache=embedding_cache,
+            )
+        finally:
+            if embedding_cache is not None:
+                embedding_cache.close()
         observations, topic_report = _apply_topic_modeling(
             observations=observations,
             config=config,
@@ -1001,6 +1008,7 @@ def _build_observations(
     segments: Sequence[MarkovAnalysisSegment],
     config: MarkovAnalysisConfiguration,
     cache_context: Optional[_LlmObservationCacheContext] = None,
+    embedding_cache: Optional[EmbeddingCache] = None,
 ) -> List[MarkovAnalysisObservation]:
     observations: List[MarkovAnalysisObservation] = []
     for segment in segments:
@@ -1243,7 +1251,9 @@ def _build_observations(
         if not embed_indices:
             raise ValueError("Embeddings require at least one non-boundary segment")
 
-        vectors = generate_embeddings_batch(client=embedding_config.client, texts=embed_texts)
+        vectors = generate_embeddings_batch(
+            client=embedding_config.client, texts=embed_texts, cache=embedding_cache
+        )
         if len(vectors) != len(embed_indices):
             raise ValueError(
                 "Embedding provider returned unexpected vector count: "
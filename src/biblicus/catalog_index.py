@@ -0,0 +1,121 @@
+"""
+Secondary lookup indexes over a corpus catalog.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional
+
+from .models import CatalogItem, CorpusCatalog
+
+
+class CatalogIndex:
+    """
+    In-memory secondary indexes mapping catalog attributes to item identifiers.
+
+    Each index maps a key to an insertion-ordered set of item identifiers so items can be added
+    and removed in constant time as the catalog changes.
+
+    :ivar by_source_uri: Item identifiers keyed by source uniform resource identifier.
+    :vartype by_source_uri: dict[str, dict[str, None]]
+    :ivar by_sha256: Item identifiers keyed by Secure Hash Algorithm 256 digest.
+    :vartype by_sha256: dict[str, dict[str, None]]
+    :ivar by_tag: Item identifiers keyed by tag.
+    :vartype by_tag: dict[str, dict[str, None]]
+    :ivar by_media_type: Item identifiers keyed by media type.
+    :vartype by_media_type: dict[str, dict[str, None]]
+    """
+
+    def __init__(self) -> None:
+        self.by_source_uri: Dict[str, Dict[str, None]] = {}
+        self.by_sha256: Dict[str, Dict[str, None]] = {}
+        self.by_tag: Dict[str, Dict[str, None]] = {}
+        self.by_media_type: Dict[str, Dict[str, None]] = {}
+
+    @classmethod
+    def from_catalog(cls, catalog: CorpusCatalog) -> "CatalogIndex":
+        """
+        Build indexes for every item in a catalog.
+
+        :param catalog: Catalog to index.
+        :type catalog: CorpusCatalog
+        :return: Populated catalog index.
+        :rtype: CatalogIndex
+        """
+        index = cls()
+        for item in catalog.items.values():
+            index.add(item)
+        return index
+
+    def add(self, item: CatalogItem) -> None:
+        """
+        Add an item to every index.
+
+        :param item: Catalog item to index.
+        :type item: CatalogItem
+        :return: None.
+        :rtype: None
+        """
+        for table, key in self._entries(item):
+            table.setdefault(key, {})[item.id] = None
+
+    def remove(self, item: CatalogItem) -> None:
+        """
+        Remove an item from every index.
+
+        :param item: Catalog item previously added to the index.
+        :type item: CatalogItem
+        :return: None.
+        :rtype: None
+        """
+        for table, key in self._entries(item):
+            item_ids = table.get(key)
+            if item_ids is None:
+                continue
+            item_ids.pop(item.id, None)
+            if not item_ids:
+                del table[key]
+
+    def first_by_source_uri(self, source_uri: str) -> Optional[str]:
+        """
+        Return the first indexed item identifier for a source uniform resource identifier.
+
+        :param source_uri: Source uniform resource identifier.
+        :type source_uri: str
+        :return: Item identifier or None.
+        :rtype: str or None
+        """
+        item_ids = self.by_source_uri.get(source_uri)
+        if not item_ids:
+            return None
+        return next(iter(item_ids))
+
+    @staticmethod
+    def lookup(table: Dict[str, Dict[str, None]], key: str) -> List[str]:
+        """
+        Return the item identifiers recorded for a key.
+
+        :param table: Index table to read.
+        :type table: dict[str, dict[str, None]]
+        :param key: Index key.
+        :type key: str
+        :return: Item identifiers in insertion order.
+        :rtype: list[str]
+        """
+        return list(table.get(key, {}))
+
+    def _entries(self, item: CatalogItem) -> Iterable[tuple[Dict[str, Dict[str, None]], str]]:
+        """
+        Yield the index tables and keys an item belongs to.
+
+        :param item: Catalog item.
+        :type item: CatalogItem
+        :return: Pairs of index table and key.
+        :rtype: Iterable[tuple[dict[str, dict[str, None]], str]]
+        """
+        if item.source_uri:
+            yield self.by_source_uri, item.source_uri
+        yield self.by_sha256, item.sha256
+        yield self.by_media_type, item.media_type
+        for tag in dict.fromkeys(item.tags):
+            yield self.by_tag, tag
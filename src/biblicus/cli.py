@@ -27,7 +27,11 @@ from .crawl import CrawlRequest, crawl_into_corpus
 from .errors import ExtractionSnapshotFatalError, IngestCollisionError
 from .evaluation.retrieval import evaluate_snapshot, load_dataset
 from .evidence_processing import apply_evidence_filter, apply_evidence_reranker
-from .extraction import build_extraction_snapshot, load_or_build_extraction_snapshot
+from .extraction import (
+    DEFAULT_EXTRACTION_BATCH_SIZE,
+    build_extraction_snapshot,
+    load_or_build_extraction_snapshot,
+)
 from .extraction_evaluation import (
     evaluate_extraction_snapshot,
     load_extraction_dataset,
@@ -41,6 +45,7 @@ from .models import (
     parse_extraction_snapshot_reference,
 )
 from .retrievers import get_retriever
+from .retrievers.opened_snapshots import opened_snapshots
 from .uris import corpus_ref_to_path
 
 
@@ -161,6 +166,8 @@ def cmd_ingest(arguments: argparse.Namespace) -> int:
             file=sys.stderr,
         )
         return 3
+    finally:
+        corpus.compact_catalog()
 
     if not results:
         print("Nothing to ingest: provide file paths, --note, or --stdin", file=sys.stderr)
@@ -225,7 +232,9 @@ def cmd_reindex(arguments: argparse.Namespace) -> int:
         if getattr(arguments, "corpus", None)
         else Corpus.find(Path.cwd())
     )
-    stats = corpus.reindex()
+    stats = corpus.reindex(
+        incremental=arguments.incremental, max_workers=arguments.max_workers
+    )
     print(json.dumps(stats, indent=2, sort_keys=False))
     return 0
 
@@ -245,7 +254,9 @@ def cmd_import_tree(arguments: argparse.Namespace) -> int:
         else Corpus.find(Path.cwd())
     )
     tags = _parse_tags(arguments.tags, arguments.tag)
-    stats = corpus.import_tree(Path(arguments.path), tags=tags)
+    stats = corpus.import_tree(
+        Path(arguments.path), tags=tags, max_workers=arguments.max_workers
+    )
     print(json.dumps(stats, indent=2, sort_keys=False))
     return 0
 
@@ -740,6 +751,9 @@ def cmd_extract_build(arguments: argparse.Namespace) -> int:
         load_handler_available=False,
         force=bool(arguments.force),
         max_workers=resolved_max_workers,
+        executor=arguments.executor,
+        cache=not arguments.no_cache,
+        batch_size=arguments.batch_size,
     )
     results = _execute_dependency_plan(
         extract_plan,
@@ -754,6 +768,9 @@ def cmd_extract_build(arguments: argparse.Namespace) -> int:
         configuration=config,
         force=bool(arguments.force),
         max_workers=resolved_max_workers,
+        executor=arguments.executor,
+        cache=not arguments.no_cache,
+        batch_size=arguments.batch_size,
     )
     print(manifest.model_dump_json(indent=2))
     return 0
@@ -1015,16 +1032,43 @@ def cmd_query(arguments: argparse.Namespace) -> int:
         raise ValueError(
             "No snapshot identifier provided and no latest snapshot is recorded for this corpus"
         )
-    snapshot = corpus.load_snapshot(snapshot_id)
-    if arguments.retriever and arguments.retriever != snapshot.configuration.retriever_id:
-        raise ValueError(
-            "Retriever mismatch: snapshot uses "
-            f"{snapshot.configuration.retriever_id!r} but {arguments.retriever!r} was requested"
-        )
-    retriever = get_retriever(snapshot.configuration.retriever_id)
-    query_text = arguments.query if arguments.query is not None else sys.stdin.read()
-    budget = _budget_from_args(arguments)
-    result = retriever.query(corpus, snapshot=snapshot, query_text=query_text, budget=budget)
+    with opened_snapshots().open(corpus, snapshot_id) as opened:
+        snapshot = opened.snapshot
+        if arguments.retriever and arguments.retriever != snapshot.configuration.retriever_id:
+            raise ValueError(
+                "Retriever mismatch: snapshot uses "
+                f"{snapshot.configuration.retriever_id!r} but {arguments.retriever!r} was requested"
+            )
+        budget = _budget_from_args(arguments)
+        if getattr(arguments, "query_file", None):
+            query_texts = [
+                line.strip()
+                for line in Path(arguments.query_file).read_text(encoding="utf-8").splitlines()
+                if line.strip()
+            ]
+            results = opened.query_batch(query_texts, budget=budget)
+            for result in results:
+                print(_postprocess_query_result(arguments, result).model_dump_json())
+            return 0
+        query_text = arguments.query if arguments.query is not None else sys.stdin.read()
+        result = opened.query(query_text, budget=budget)
+        print(_postprocess_query_result(arguments, result).model_dump_json(indent=2))
+        return 0
+
+
+def _postprocess_query_result(
+    arguments: argparse.Namespace, result: RetrievalResult
+) -> RetrievalResult:
+    """
+    Apply the optional reranker and minimum score filter to a retrieval result.
+
+    :param arguments: Parsed command-line interface arguments.
+    :type arguments: argparse.Namespace
+    :param result: Retrieval result to post-process.
+    :type result: RetrievalResult
+    :return: Retrieval result with processed evidence.
+    :rtype: RetrievalResult
+    """
     processed_evidence = result.evidence
     if getattr(arguments, "reranker_id", None):
         processed_evidence = apply_evidence_reranker(
@@ -1041,8 +1085,7 @@ def cmd_query(arguments: argparse.Namespace) -> int:
         )
     if processed_evidence is not result.evidence:
         result = result.model_copy(update={"evidence": processed_evidence})
-    print(result.model_dump_json(indent=2))
-    return 0
+    return result
 
 
 def cmd_context_pack_build(arguments: argparse.Namespace) -> int:
@@ -1115,7 +1158,13 @@ def cmd_eval(arguments: argparse.Namespace) -> int:
     snapshot = corpus.load_snapshot(snapshot_id)
     dataset = load_dataset(Path(arguments.dataset))
     budget = _budget_from_args(arguments)
-    result = evaluate_snapshot(corpus=corpus, snapshot=snapshot, dataset=dataset, budget=budget)
+    result = evaluate_snapshot(
+        corpus=corpus,
+        snapshot=snapshot,
+        dataset=dataset,
+        budget=budget,
+        batch_size=arguments.batch_size,
+    )
     print(result.model_dump_json(indent=2))
     return 0
 
@@ -1554,6 +1603,7 @@ def cmd_dashboard_sync(arguments: argparse.Namespace) -> int:
 
     # Sync catalog
     try:
+        corpus.compact_catalog()
         result = publisher.sync_catalog(corpus.catalog_path, force=arguments.force)
 
         if result.skipped:
@@ -1667,6 +1717,19 @@ def build_parser() -> argparse.ArgumentParser:
         "reindex", help="Rebuild/refresh the corpus catalog from the on-disk corpus."
     )
     _add_common_corpus_arg(p_reindex)
+    p_reindex.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip files whose size, modification time, and inode are unchanged since the last reindex.",
+    )
+    p_reindex.add_argument(
+        "--max-workers",
+        "--workers",
+        dest="max_workers",
+        type=int,
+        default=1,
+        help="Number of worker processes used to hash and parse files (default: 1).",
+    )
     p_reindex.set_defaults(func=cmd_reindex)
 
     p_import_tree = sub.add_parser("import-tree", help="Import a folder tree into the corpus.")
@@ -1678,6 +1741,14 @@ def build_parser() -> argparse.ArgumentParser:
     p_import_tree.add_argument(
         "--tag", action="append", help="Repeatable tag to apply to imported items."
     )
+    p_import_tree.add_argument(
+        "--max-workers",
+        "--workers",
+        dest="max_workers",
+        type=int,
+        default=1,
+        help="Number of worker processes used to register files (default: 1).",
+    )
     p_import_tree.set_defaults(func=cmd_import_tree)
 
     p_purge = sub.add_parser(
@@ -1754,6 +1825,26 @@ def build_parser() -> argparse.ArgumentParser:
             "(defaults to BIBLICUS_EXTRACT_MAX_WORKERS or CPU count)."
         ),
     )
+    p_extract_build.add_argument(
+        "--executor",
+        choices=["thread", "process"],
+        default="thread",
+        help="Run extraction workers as threads or as separate processes (default: thread).",
+    )
+    p_extract_build.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the corpus extraction cache.",
+    )
+    p_extract_build.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_EXTRACTION_BATCH_SIZE,
+        help=(
+            "Maximum number of items passed at once to extractors that batch items "
+            f"(default: {DEFAULT_EXTRACTION_BATCH_SIZE})."
+        ),
+    )
     p_extract_build.set_defaults(func=cmd_extract_build)
 
     p_extract_list = extract_sub.add_parser("list", help="List extraction snapshots.")
@@ -1868,6 +1959,14 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_query.add_argument("--retriever", default=None, help="Validate retriever identifier.")
     p_query.add_argument("--query", default=None, help="Query text (defaults to standard input).")
+    p_query.add_argument(
+        "--query-file",
+        default=None,
+        help=(
+            "Run every non-empty line of this file as a query in one batch and print one "
+            "result per line as JavaScript Object Notation Lines."
+        ),
+    )
     p_query.add_argument(
         "--offset",
         type=int,
@@ -1939,6 +2038,15 @@ def build_parser() -> argparse.ArgumentParser:
     p_eval.add_argument("--max-total-items", type=int, default=5)
     p_eval.add_argument("--maximum-total-characters", type=int, default=2000)
     p_eval.add_argument("--max-items-per-source", type=int, default=5)
+    p_eval.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help=(
+            "Number of dataset queries sent to the retriever per batch (default: 1). "
+            "Latencies of larger batches are amortized over the batch."
+        ),
+    )
     p_eval.set_defaults(func=cmd_eval)
 
     p_crawl = sub.add_parser("crawl", help="Crawl a website prefix into the corpus.")
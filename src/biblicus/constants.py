@@ -11,6 +11,11 @@ CORPUS_DIR_NAME = "metadata"
 LEGACY_CORPUS_DIR_NAME = ".biblicus"
 DEFAULT_RAW_DIR = "."
 SIDECAR_SUFFIX = ".biblicus.yml"
+CATALOG_JOURNAL_FILENAME = "catalog.journal.jsonl"
+CATALOG_JOURNAL_COMPACTION_THRESHOLD = 1000
+REINDEX_STATE_FILENAME = "reindex_state.json"
+EMBEDDING_CACHE_FILENAME = "embedding_cache.sqlite"
+EXTRACTION_CACHE_FILENAME = "extraction_cache.sqlite"
 SNAPSHOTS_DIR_NAME = "snapshots"
 EXTRACTION_SNAPSHOTS_DIR_NAME = "extraction"
 ANALYSIS_RUNS_DIR_NAME = "analysis"
@@ -16,6 +16,7 @@ from biblicus.context import (
 from biblicus.corpus import Corpus
 from biblicus.models import QueryBudget, RetrievalSnapshot
 from biblicus.retrievers import get_retriever
+from biblicus.retrievers.opened_snapshots import opened_snapshots
 
 from .models import ContextRetrieverRequest
 
@@ -29,7 +30,8 @@ def _resolve_snapshot(
     configuration: Optional[dict[str, Any]],
 ) -> RetrievalSnapshot:
     if snapshot_id:
-        return corpus.load_snapshot(snapshot_id)
+        with opened_snapshots().open(corpus, snapshot_id) as opened:
+            return opened.snapshot
 
     latest_snapshot_id = corpus.latest_snapshot_id
     if latest_snapshot_id:
@@ -110,13 +112,8 @@ def retrieve_context_pack(
         maximum_total_characters=maximum_total_characters,
         max_items_per_source=max_items_per_source,
     )
-    retriever = get_retriever(retriever_id)
-    result = retriever.query(
-        corpus,
-        snapshot=snapshot,
-        query_text=request.query,
-        budget=budget,
-    )
+    with opened_snapshots().open(corpus, snapshot.snapshot_id) as opened:
+        result = opened.query(request.query, budget=budget)
     policy = ContextPackPolicy(
         join_with=join_with,
         include_metadata=include_metadata,
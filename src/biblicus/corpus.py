@@ -8,21 +8,27 @@ import hashlib
 import json
 import mimetypes
 import shutil
+import time
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from urllib.parse import quote, unquote, urlparse
 
 import yaml
 from pydantic import ValidationError
 
+from .catalog_index import CatalogIndex
 from .constants import (
     ANALYSIS_DIR_NAME,
+    CATALOG_JOURNAL_COMPACTION_THRESHOLD,
+    CATALOG_JOURNAL_FILENAME,
     CORPUS_DIR_NAME,
     DEFAULT_RAW_DIR,
     EXTRACTED_DIR_NAME,
     GRAPH_DIR_NAME,
     LEGACY_CORPUS_DIR_NAME,
+    REINDEX_STATE_FILENAME,
     RETRIEVAL_DIR_NAME,
     SCHEMA_VERSION,
     SIDECAR_SUFFIX,
@@ -87,6 +93,35 @@ def _write_stream_and_hash(
     return {"sha256": hasher.hexdigest(), "bytes_written": bytes_written}
 
 
+def _hash_file(path: Path, *, chunk_size: int = 1024 * 1024) -> Dict[str, object]:
+    """
+    Compute a digest and size for a file without loading it into memory.
+
+    The file is read into one reusable fixed-size buffer, so memory use does not grow with the
+    file size.
+
+    :param path: File path to hash.
+    :type path: Path
+    :param chunk_size: Chunk size for reads.
+    :type chunk_size: int
+    :return: Mapping containing sha256 and bytes_read.
+    :rtype: dict[str, object]
+    :raises OSError: If the file cannot be read.
+    """
+    hasher = hashlib.sha256()
+    bytes_read = 0
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with path.open("rb") as source_handle:
+        while True:
+            count = source_handle.readinto(buffer)
+            if not count:
+                break
+            hasher.update(view[:count])
+            bytes_read += count
+    return {"sha256": hasher.hexdigest(), "bytes_read": bytes_read}
+
+
 def _sanitize_filename(name: str) -> str:
     """
     Sanitize a filename into a portable, filesystem-friendly form.
@@ -295,6 +330,251 @@ def _write_sidecar(content_path: Path, metadata: Dict[str, Any]) -> None:
     path.write_text(text + "\n", encoding="utf-8")
 
 
+def _stat_signature(path: Path) -> Optional[List[int]]:
+    """
+    Compute a stat signature used to detect file changes without reading content.
+
+    :param path: File path to inspect.
+    :type path: Path
+    :return: Size, modification time in nanoseconds, and inode, or None if the file is missing.
+    :rtype: list[int] or None
+    """
+    try:
+        file_stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return [file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino]
+
+
+def _ends_with_newline(path: Path) -> bool:
+    """
+    Return whether an append-only line file is empty, missing, or ends with a newline.
+
+    A file that does not end with a newline holds a line torn by an interrupted write.
+
+    :param path: Line file path.
+    :type path: Path
+    :return: True when a new line can be appended without merging into a torn line.
+    :rtype: bool
+    """
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        return True
+    if size == 0:
+        return True
+    with path.open("rb") as handle:
+        handle.seek(size - 1)
+        return handle.read(1) == b"\n"
+
+
+def _map_with_workers(
+    function: Callable[..., Any], arguments: Sequence[Tuple[Any, ...]], *, max_workers: int
+) -> Iterable[Any]:
+    """
+    Apply a module-level function to argument tuples, optionally in a process pool.
+
+    Results are returned in the same order as the arguments.
+
+    :param function: Picklable module-level function to call.
+    :type function: Callable[..., Any]
+    :param arguments: Positional argument tuples, one per call.
+    :type arguments: Sequence[tuple]
+    :param max_workers: Number of worker processes. One runs the calls in this process.
+    :type max_workers: int
+    :return: Function results in argument order.
+    :rtype: Iterable[Any]
+    """
+    if max_workers <= 1 or len(arguments) <= 1:
+        return [function(*call_arguments) for call_arguments in arguments]
+    chunk_size = max(1, len(arguments) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(function, *zip(*arguments), chunksize=chunk_size))
+
+
+def _item_id_from_metadata(metadata: Dict[str, Any], *, filename: str) -> Optional[str]:
+    """
+    Resolve an item identifier from a biblicus metadata block or a filename prefix.
+
+    :param metadata: Merged front matter and sidecar metadata.
+    :type metadata: dict[str, Any]
+    :param filename: Content filename.
+    :type filename: str
+    :return: Item identifier or None.
+    :rtype: str or None
+    """
+    biblicus_block = metadata.get("biblicus")
+    if isinstance(biblicus_block, dict):
+        biblicus_id = biblicus_block.get("id")
+        if isinstance(biblicus_id, str):
+            try:
+                return str(uuid.UUID(biblicus_id))
+            except ValueError:
+                pass
+    return _parse_uuid_prefix(filename)
+
+
+def _scan_content_file(content_path: Path, relpath: str) -> Dict[str, Any]:
+    """
+    Hash a content file and derive its catalog fields from front matter and sidecar metadata.
+
+    This runs in reindex worker processes, so it only depends on the file system.
+
+    :param content_path: Path to the content file.
+    :type content_path: Path
+    :param relpath: Content path relative to the corpus root.
+    :type relpath: str
+    :return: Mapping of scanned catalog fields; item_id is None when no identifier is found.
+    :rtype: dict[str, Any]
+    :raises ValueError: If a markdown file cannot be decoded as Unicode Transformation Format 8.
+    """
+    hash_result = _hash_file(content_path)
+
+    media_type, _ = mimetypes.guess_type(content_path.name)
+    media_type = media_type or "application/octet-stream"
+
+    sidecar = _load_sidecar(content_path)
+
+    frontmatter: Dict[str, Any] = {}
+    if content_path.suffix.lower() in {".md", ".markdown"}:
+        try:
+            text = content_path.read_bytes().decode("utf-8")
+        except UnicodeDecodeError as decode_error:
+            raise ValueError(
+                f"Markdown file must be Unicode Transformation Format 8: {relpath}"
+            ) from decode_error
+        parsed_document = parse_front_matter(text)
+        frontmatter = parsed_document.metadata
+        media_type = "text/markdown"
+
+    merged_metadata = _merge_metadata(frontmatter, sidecar)
+
+    if media_type != "text/markdown":
+        media_type_override = merged_metadata.get("media_type")
+        if isinstance(media_type_override, str) and media_type_override.strip():
+            media_type = media_type_override.strip()
+
+    title: Optional[str] = None
+    title_value = merged_metadata.get("title")
+    if isinstance(title_value, str) and title_value.strip():
+        title = title_value.strip()
+
+    source_uri: Optional[str] = None
+    biblicus_block = merged_metadata.get("biblicus")
+    if isinstance(biblicus_block, dict):
+        source_value = biblicus_block.get("source")
+        if isinstance(source_value, str) and source_value.strip():
+            source_uri = source_value.strip()
+
+    return {
+        "item_id": _item_id_from_metadata(merged_metadata, filename=content_path.name),
+        "sha256": str(hash_result["sha256"]),
+        "bytes": int(hash_result["bytes_read"]),
+        "media_type": media_type,
+        "title": title,
+        "tags": _merge_tags([], merged_metadata.get("tags")),
+        "metadata": merged_metadata,
+        "source_uri": source_uri,
+    }
+
+
+def _register_file_contents(
+    root: Path,
+    path: Path,
+    tags: Sequence[str],
+    metadata: Dict[str, Any],
+    source_uri: str,
+) -> CatalogItem:
+    """
+    Write biblicus metadata for an in-place file and build its catalog item.
+
+    Markdown files get a biblicus front matter block; other files get a sidecar. This runs in
+    import worker processes, so it only depends on the file system.
+
+    :param root: Corpus root directory.
+    :type root: Path
+    :param path: Path to the file under the corpus root.
+    :type path: Path
+    :param tags: Tags to associate with the item.
+    :type tags: Sequence[str]
+    :param metadata: Extra metadata to merge into the item metadata.
+    :type metadata: dict[str, Any]
+    :param source_uri: Source uniform resource identifier for provenance.
+    :type source_uri: str
+    :return: Catalog item for the registered file.
+    :rtype: CatalogItem
+    :raises ValueError: If a markdown file cannot be decoded as Unicode Transformation Format 8.
+    """
+    relpath = str(path.relative_to(root))
+
+    media_type, _ = mimetypes.guess_type(path.name)
+    media_type = media_type or "application/octet-stream"
+    if path.suffix.lower() in {".md", ".markdown"}:
+        media_type = "text/markdown"
+
+    frontmatter: Dict[str, Any] = {}
+    markdown_body: Optional[str] = None
+    if media_type == "text/markdown":
+        try:
+            decoded = path.read_bytes().decode("utf-8")
+            parsed_document = parse_front_matter(decoded)
+        except UnicodeDecodeError as decode_error:
+            raise ValueError("Markdown file must be Unicode Transformation Format 8") from decode_error
+        frontmatter = dict(parsed_document.metadata)
+        markdown_body = parsed_document.body
+
+    sidecar = _load_sidecar(path)
+    merged_metadata = _merge_metadata(frontmatter, sidecar)
+    resolved_tags = _merge_tags(_merge_tags([], tags), merged_metadata.get("tags"))
+    for metadata_key, metadata_value in metadata.items():
+        if metadata_key in {"tags", "biblicus"}:
+            continue
+        merged_metadata[metadata_key] = metadata_value
+
+    item_id = _item_id_from_metadata(merged_metadata, filename="") or str(uuid.uuid4())
+
+    if media_type == "text/markdown":
+        updated_metadata: Dict[str, Any] = dict(merged_metadata)
+        if resolved_tags:
+            updated_metadata["tags"] = resolved_tags
+        updated_metadata = _ensure_biblicus_block(
+            updated_metadata, item_id=item_id, source_uri=source_uri
+        )
+        if markdown_body is None:
+            markdown_body = ""
+        rendered_document = render_front_matter(updated_metadata, markdown_body)
+        data = rendered_document.encode("utf-8")
+        path.write_bytes(data)
+        sha256_digest = _sha256_bytes(data)
+        size_bytes = len(data)
+        merged_metadata = updated_metadata
+    else:
+        hash_result = _hash_file(path)
+        sha256_digest = str(hash_result["sha256"])
+        size_bytes = int(hash_result["bytes_read"])
+        sidecar_metadata: Dict[str, Any] = dict(merged_metadata)
+        sidecar_metadata["biblicus"] = {"id": item_id, "source": source_uri}
+        if resolved_tags:
+            sidecar_metadata["tags"] = resolved_tags
+        sidecar_metadata["media_type"] = media_type
+        _write_sidecar(path, sidecar_metadata)
+        merged_metadata = sidecar_metadata
+
+    title_value = merged_metadata.get("title")
+    return CatalogItem(
+        id=item_id,
+        relpath=relpath,
+        sha256=sha256_digest,
+        bytes=size_bytes,
+        media_type=media_type,
+        title=title_value if isinstance(title_value, str) else None,
+        tags=list(resolved_tags),
+        metadata=dict(merged_metadata),
+        created_at=utc_now_iso(),
+        source_uri=source_uri,
+    )
+
+
 def _ensure_biblicus_block(
     metadata: Dict[str, Any], *, item_id: str, source_uri: str
 ) -> Dict[str, Any]:
@@ -400,6 +680,11 @@ class Corpus:
         self.config = self._load_config()
         self.raw_dir = self._resolve_raw_dir()
         self._hooks = self._load_hooks()
+        self._catalog_journal_entries: Optional[int] = None
+        self._catalog_cache: Optional[CorpusCatalog] = None
+        self._catalog_cache_signature: Optional[Tuple[object, ...]] = None
+        self._catalog_index: Optional[CatalogIndex] = None
+        self._catalog_index_source: Optional[CorpusCatalog] = None
 
     def _resolve_raw_dir(self) -> Path:
         """
@@ -624,6 +909,19 @@ class Corpus:
         """
         return self.meta_dir / "catalog.json"
 
+    @property
+    def catalog_journal_path(self) -> Path:
+        """
+        Return the path to the append-only catalog journal.
+
+        Ingestion appends item upserts to this journal instead of rewriting the catalog file.
+        The journal is folded into the catalog file on compaction.
+
+        :return: Catalog journal file path.
+        :rtype: Path
+        """
+        return self.meta_dir / CATALOG_JOURNAL_FILENAME
+
     def _init_catalog(self) -> None:
         """
         Initialize the catalog if it does not already exist.
@@ -656,18 +954,213 @@ class Corpus:
         if not self.catalog_path.is_file():
             raise FileNotFoundError(f"Missing corpus catalog: {self.catalog_path}")
         catalog_data = json.loads(self.catalog_path.read_text(encoding="utf-8"))
-        return CorpusCatalog.model_validate(catalog_data)
+        catalog = CorpusCatalog.model_validate(catalog_data)
+        self._replay_catalog_journal(catalog)
+        return catalog
+
+    def _catalog_signature(self) -> Optional[Tuple[object, ...]]:
+        """
+        Compute a file signature for the catalog file and its journal.
+
+        The signature changes whenever either file is replaced, appended to, or edited in place.
+
+        :return: Signature tuple or None when the catalog file does not exist.
+        :rtype: tuple or None
+        """
+        try:
+            catalog_stat = self.catalog_path.stat()
+        except FileNotFoundError:
+            return None
+        journal_signature: Optional[Tuple[int, int, int]] = None
+        try:
+            journal_stat = self.catalog_journal_path.stat()
+            journal_signature = (
+                journal_stat.st_ino,
+                journal_stat.st_size,
+                journal_stat.st_mtime_ns,
+            )
+        except FileNotFoundError:
+            journal_signature = None
+        return (
+            (catalog_stat.st_ino, catalog_stat.st_size, catalog_stat.st_mtime_ns),
+            journal_signature,
+        )
+
+    def _catalog_view(self) -> CorpusCatalog:
+        """
+        Return a cached, read-only view of the corpus catalog.
+
+        The view is reused until the catalog file or its journal changes on disk, so repeated
+        lookups in a long-lived process do not re-parse the catalog. Callers must not mutate it.
+
+        :return: Parsed corpus catalog.
+        :rtype: CorpusCatalog
+        :raises FileNotFoundError: If the catalog file does not exist.
+        :raises ValueError: If the catalog schema is invalid.
+        """
+        signature = self._catalog_signature()
+        if (
+            signature is not None
+            and self._catalog_cache is not None
+            and signature == self._catalog_cache_signature
+        ):
+            return self._catalog_cache
+        catalog = self._load_catalog()
+        self._catalog_cache = catalog
+        self._catalog_cache_signature = signature
+        return catalog
+
+    def _catalog_index_view(self) -> Tuple[CorpusCatalog, CatalogIndex]:
+        """
+        Return the cached catalog view together with its secondary indexes.
+
+        Indexes are rebuilt only when the cached catalog view is reloaded from disk.
+
+        :return: Catalog view and matching catalog index.
+        :rtype: tuple[CorpusCatalog, CatalogIndex]
+        :raises FileNotFoundError: If the catalog file does not exist.
+        """
+        catalog = self._catalog_view()
+        if self._catalog_index is None or self._catalog_index_source is not catalog:
+            self._catalog_index = CatalogIndex.from_catalog(catalog)
+            self._catalog_index_source = catalog
+        return catalog, self._catalog_index
+
+    def _items_for_ids(self, catalog: CorpusCatalog, item_ids: Sequence[str]) -> List[CatalogItem]:
+        """
+        Resolve item identifiers to catalog items.
+
+        :param catalog: Catalog to read items from.
+        :type catalog: CorpusCatalog
+        :param item_ids: Item identifiers.
+        :type item_ids: Sequence[str]
+        :return: Catalog items for identifiers present in the catalog.
+        :rtype: list[CatalogItem]
+        """
+        return [catalog.items[item_id] for item_id in item_ids if item_id in catalog.items]
+
+    def find_by_sha256(self, sha256: str) -> List[CatalogItem]:
+        """
+        Find catalog items whose stored bytes have a given digest.
+
+        :param sha256: Secure Hash Algorithm 256 hex digest.
+        :type sha256: str
+        :return: Matching catalog items.
+        :rtype: list[CatalogItem]
+        """
+        catalog, index = self._catalog_index_view()
+        return self._items_for_ids(catalog, index.lookup(index.by_sha256, sha256))
+
+    def items_with_tag(self, tag: str) -> List[CatalogItem]:
+        """
+        Find catalog items carrying a tag.
+
+        :param tag: Tag to look up.
+        :type tag: str
+        :return: Matching catalog items.
+        :rtype: list[CatalogItem]
+        """
+        catalog, index = self._catalog_index_view()
+        return self._items_for_ids(catalog, index.lookup(index.by_tag, tag))
+
+    def items_by_media_type(self, media_type: str) -> List[CatalogItem]:
+        """
+        Find catalog items with a media type.
+
+        :param media_type: Internet Assigned Numbers Authority media type.
+        :type media_type: str
+        :return: Matching catalog items.
+        :rtype: list[CatalogItem]
+        """
+        catalog, index = self._catalog_index_view()
+        return self._items_for_ids(catalog, index.lookup(index.by_media_type, media_type))
+
+    def _replay_catalog_journal(self, catalog: CorpusCatalog) -> int:
+        """
+        Apply pending catalog journal entries to a catalog in place.
+
+        Undecodable lines, such as a torn trailing write, and lines without an item are ignored.
+
+        :param catalog: Catalog loaded from the catalog file.
+        :type catalog: CorpusCatalog
+        :return: Number of journal entries applied.
+        :rtype: int
+        :raises ValueError: If a journal entry does not match the catalog item schema.
+        """
+        journal_path = self.catalog_journal_path
+        if not journal_path.is_file():
+            return 0
+        upserted_ids: List[str] = []
+        with journal_path.open("r", encoding="utf-8") as journal_handle:
+            for line in journal_handle:
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                try:
+                    entry = json.loads(stripped)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(entry, dict) or not isinstance(entry.get("item"), dict):
+                    continue
+                item = CatalogItem.model_validate(entry["item"])
+                catalog.items[item.id] = item
+                catalog.generated_at = str(entry.get("generated_at") or catalog.generated_at)
+                upserted_ids.append(item.id)
+        if not upserted_ids:
+            return 0
+        seen_ids = set()
+        recent_ids: List[str] = []
+        for item_id in reversed(upserted_ids):
+            if item_id not in seen_ids:
+                seen_ids.add(item_id)
+                recent_ids.append(item_id)
+        catalog.order = recent_ids + [
+            item_id for item_id in catalog.order if item_id not in seen_ids
+        ]
+        catalog.latest_snapshot_id = None
+        return len(upserted_ids)
+
+    def _count_catalog_journal_entries(self) -> int:
+        """
+        Count the entries currently recorded in the catalog journal.
+
+        :return: Number of non-empty journal lines.
+        :rtype: int
+        """
+        journal_path = self.catalog_journal_path
+        if not journal_path.is_file():
+            return 0
+        with journal_path.open("r", encoding="utf-8") as journal_handle:
+            return sum(1 for line in journal_handle if line.strip())
+
+    def compact_catalog(self) -> None:
+        """
+        Fold pending catalog journal entries into the catalog file.
+
+        :return: None.
+        :rtype: None
+        :raises FileNotFoundError: If the catalog file does not exist.
+        """
+        if not self.catalog_journal_path.is_file():
+            return
+        self._write_catalog(self._catalog_view())
 
     def load_catalog(self) -> CorpusCatalog:
         """
         Load the current corpus catalog.
 
+        The returned catalog is a private snapshot built from the cached view, so later
+        ingestion into the corpus does not change a catalog a caller is already holding.
+
         :return: Parsed corpus catalog.
         :rtype: CorpusCatalog
         :raises FileNotFoundError: If the catalog file does not exist.
         :raises ValueError: If the catalog schema is invalid.
         """
-        return self._load_catalog()
+        catalog = self._catalog_view()
+        return catalog.model_copy(
+            update={"items": dict(catalog.items), "order": list(catalog.order)}
+        )
 
     def has_items(self) -> bool:
         """
@@ -676,7 +1169,7 @@ class Corpus:
         :return: True when the catalog has at least one item.
         :rtype: bool
         """
-        catalog = self._load_catalog()
+        catalog = self._catalog_view()
         return bool(catalog.items)
 
     def catalog_generated_at(self) -> str:
@@ -686,11 +1179,13 @@ class Corpus:
         :return: International Organization for Standardization 8601 timestamp.
         :rtype: str
         """
-        return self._load_catalog().generated_at
+        return self._catalog_view().generated_at
 
     def _write_catalog(self, catalog: CorpusCatalog) -> None:
         """
-        Atomically write a corpus catalog to disk.
+        Atomically write a corpus catalog to disk and clear the catalog journal.
+
+        The catalog passed in must already include any pending journal entries.
 
         :param catalog: Catalog to persist.
         :type catalog: CorpusCatalog
@@ -700,6 +1195,10 @@ class Corpus:
         temp_path = self.catalog_path.with_suffix(".json.tmp")
         temp_path.write_text(catalog.model_dump_json(indent=2) + "\n", encoding="utf-8")
         temp_path.replace(self.catalog_path)
+        self.catalog_journal_path.unlink(missing_ok=True)
+        self._catalog_journal_entries = 0
+        self._catalog_cache = catalog
+        self._catalog_cache_signature = self._catalog_signature()
 
     def _find_item_by_source_uri(self, source_uri: str) -> Optional[CatalogItem]:
         """
@@ -713,11 +1212,11 @@ class Corpus:
         if not source_uri:
             return None
         self._init_catalog()
-        catalog = self._load_catalog()
-        for item in catalog.items.values():
-            if item.source_uri == source_uri:
-                return item
-        return None
+        catalog, index = self._catalog_index_view()
+        item_id = index.first_by_source_uri(source_uri)
+        if item_id is None:
+            return None
+        return catalog.items.get(item_id)
 
     @property
     def snapshots_dir(self) -> Path:
@@ -1002,6 +1501,22 @@ class Corpus:
                 return RetrievalSnapshot.model_validate(data)
         raise FileNotFoundError(f"Missing snapshot manifest for: {snapshot_id}")
 
+    def latest_retriever_snapshot_id(self, retriever_id: str) -> Optional[str]:
+        """
+        Latest retrieval snapshot identifier recorded for one retriever.
+
+        :param retriever_id: Retriever identifier.
+        :type retriever_id: str
+        :return: Latest snapshot identifier for the retriever or None.
+        :rtype: str or None
+        """
+        latest_path = self.retrieval_dir / retriever_id / "latest.json"
+        if not latest_path.is_file():
+            return None
+        data = json.loads(latest_path.read_text(encoding="utf-8"))
+        snapshot_id = data.get("snapshot_id")
+        return snapshot_id if isinstance(snapshot_id, str) else None
+
     @property
     def latest_snapshot_id(self) -> Optional[str]:
         """
@@ -1010,28 +1525,73 @@ class Corpus:
         :return: Latest snapshot identifier or None.
         :rtype: str or None
         """
-        return self._load_catalog().latest_snapshot_id
+        return self._catalog_view().latest_snapshot_id
 
     def _upsert_catalog_item(self, item: CatalogItem) -> None:
         """
         Upsert a catalog item and reset the latest run pointer.
 
+        The upsert is appended to the catalog journal, on a fresh line when the journal ends in a
+        torn write. Once the journal reaches the compaction threshold it is folded into the
+        catalog file.
+
         :param item: Catalog item to insert or update.
         :type item: CatalogItem
         :return: None.
         :rtype: None
         """
         self._init_catalog()
-        catalog = self._load_catalog()
-        catalog.items[item.id] = item
+        generated_at = utc_now_iso()
+        entry = {
+            "op": "upsert",
+            "generated_at": generated_at,
+            "item": item.model_dump(mode="json"),
+        }
+        cache_is_current = (
+            self._catalog_cache is not None
+            and self._catalog_signature() == self._catalog_cache_signature
+        )
+        journal_line = json.dumps(entry) + "\n"
+        if not _ends_with_newline(self.catalog_journal_path):
+            journal_line = "\n" + journal_line
+        with self.catalog_journal_path.open("a", encoding="utf-8") as journal_handle:
+            journal_handle.write(journal_line)
+        if cache_is_current:
+            self._apply_upsert_to_cached_catalog(item, generated_at=generated_at)
+
+        if self._catalog_journal_entries is None:
+            self._catalog_journal_entries = self._count_catalog_journal_entries()
+        else:
+            self._catalog_journal_entries += 1
+        if self._catalog_journal_entries >= CATALOG_JOURNAL_COMPACTION_THRESHOLD:
+            self.compact_catalog()
 
-        ordered_ids = [item_id for item_id in catalog.order if item_id != item.id]
-        ordered_ids.insert(0, item.id)
-        catalog.order = ordered_ids
-        catalog.generated_at = utc_now_iso()
-        catalog.latest_snapshot_id = None
+    def _apply_upsert_to_cached_catalog(self, item: CatalogItem, *, generated_at: str) -> None:
+        """
+        Apply a journaled upsert to the cached catalog view, its indexes, and its signature.
 
-        self._write_catalog(catalog)
+        :param item: Catalog item that was appended to the journal.
+        :type item: CatalogItem
+        :param generated_at: Timestamp recorded in the journal entry.
+        :type generated_at: str
+        :return: None.
+        :rtype: None
+        """
+        catalog = self._catalog_cache
+        assert catalog is not None
+        index = self._catalog_index if self._catalog_index_source is catalog else None
+        previous_item = catalog.items.get(item.id)
+        if previous_item is not None:
+            catalog.order = [item_id for item_id in catalog.order if item_id != item.id]
+            if index is not None:
+                index.remove(previous_item)
+        if index is not None:
+            index.add(item)
+        catalog.items[item.id] = item
+        catalog.order.insert(0, item.id)
+        catalog.generated_at = generated_at
+        catalog.latest_snapshot_id = None
+        self._catalog_cache_signature = self._catalog_signature()
 
     def ingest_item(
         self,
@@ -1399,6 +1959,30 @@ class Corpus:
         metadata: Optional[Dict[str, Any]],
         source_uri: str,
     ) -> IngestResult:
+        path = self._claim_existing_file(path=path, source_uri=source_uri)
+        item_record = _register_file_contents(
+            self.root, path, tuple(tags), dict(metadata or {}), source_uri
+        )
+        self._upsert_catalog_item(item_record)
+        return IngestResult(
+            item_id=item_record.id, relpath=item_record.relpath, sha256=item_record.sha256
+        )
+
+    def _claim_existing_file(self, *, path: Path, source_uri: str) -> Path:
+        """
+        Prepare an in-place file for registration and check for collisions.
+
+        The file is renamed to a sanitized filename when needed.
+
+        :param path: Path to the file under the corpus root.
+        :type path: Path
+        :param source_uri: Source uniform resource identifier for provenance.
+        :type source_uri: str
+        :return: Path of the file after sanitization.
+        :rtype: Path
+        :raises IngestCollisionError: If the sanitized name or the source is already taken.
+        :raises ValueError: If the file lives inside a reserved corpus folder.
+        """
         sanitized_name = _sanitize_filename(path.name)
         if sanitized_name != path.name:
             destination = path.with_name(sanitized_name)
@@ -1418,90 +2002,7 @@ class Corpus:
                 existing_item_id=existing_item.id,
                 existing_relpath=existing_item.relpath,
             )
-
-        data = path.read_bytes()
-        relpath = str(path.relative_to(self.root))
-
-        media_type, _ = mimetypes.guess_type(path.name)
-        media_type = media_type or "application/octet-stream"
-        if path.suffix.lower() in {".md", ".markdown"}:
-            media_type = "text/markdown"
-
-        frontmatter: Dict[str, Any] = {}
-        markdown_body: Optional[str] = None
-        if media_type == "text/markdown":
-            try:
-                decoded = data.decode("utf-8")
-                parsed_document = parse_front_matter(decoded)
-            except UnicodeDecodeError as decode_error:
-                raise ValueError(
-                    "Markdown file must be Unicode Transformation Format 8"
-                ) from decode_error
-            frontmatter = dict(parsed_document.metadata)
-            markdown_body = parsed_document.body
-
-        sidecar = _load_sidecar(path)
-        merged_metadata = _merge_metadata(frontmatter, sidecar)
-        resolved_tags = _merge_tags(_merge_tags([], tags), merged_metadata.get("tags"))
-        if metadata:
-            for metadata_key, metadata_value in metadata.items():
-                if metadata_key in {"tags", "biblicus"}:
-                    continue
-                merged_metadata[metadata_key] = metadata_value
-
-        biblicus_block = merged_metadata.get("biblicus")
-        item_id: Optional[str] = None
-        if isinstance(biblicus_block, dict):
-            biblicus_id = biblicus_block.get("id")
-            if isinstance(biblicus_id, str):
-                try:
-                    item_id = str(uuid.UUID(biblicus_id))
-                except ValueError:
-                    item_id = None
-
-        if item_id is None:
-            item_id = str(uuid.uuid4())
-
-        if media_type == "text/markdown":
-            updated_metadata: Dict[str, Any] = dict(merged_metadata)
-            if resolved_tags:
-                updated_metadata["tags"] = resolved_tags
-            updated_metadata = _ensure_biblicus_block(
-                updated_metadata, item_id=item_id, source_uri=source_uri
-            )
-            if markdown_body is None:
-                markdown_body = ""
-            rendered_document = render_front_matter(updated_metadata, markdown_body)
-            path.write_text(rendered_document, encoding="utf-8")
-            data = rendered_document.encode("utf-8")
-            merged_metadata = updated_metadata
-        else:
-            sidecar_metadata: Dict[str, Any] = dict(merged_metadata)
-            sidecar_metadata["biblicus"] = {"id": item_id, "source": source_uri}
-            if resolved_tags:
-                sidecar_metadata["tags"] = resolved_tags
-            sidecar_metadata["media_type"] = media_type
-            _write_sidecar(path, sidecar_metadata)
-            merged_metadata = sidecar_metadata
-
-        sha256_digest = _sha256_bytes(data)
-        created_at = utc_now_iso()
-        item_record = CatalogItem(
-            id=item_id,
-            relpath=relpath,
-            sha256=sha256_digest,
-            bytes=len(data),
-            media_type=media_type,
-            title=merged_metadata.get("title")
-            if isinstance(merged_metadata.get("title"), str)
-            else None,
-            tags=list(resolved_tags),
-            metadata=dict(merged_metadata),
-            created_at=created_at,
-            source_uri=source_uri,
-        )
-        self._upsert_catalog_item(item_record)
-        return IngestResult(item_id=item_id, relpath=relpath, sha256=sha256_digest)
+        return path
 
     def ingest_source(
         self,
@@ -1564,22 +2065,32 @@ class Corpus:
             storage_subdir="imports",
         )
 
-    def import_tree(self, source_root: Path, *, tags: Sequence[str] = ()) -> Dict[str, int]:
+    def import_tree(
+        self, source_root: Path, *, tags: Sequence[str] = (), max_workers: int = 1
+    ) -> Dict[str, int]:
         """
         Import a folder tree into the corpus, preserving relative paths and provenance.
 
         Imported content must already live under the corpus root. The import registers files
         in-place and writes sidecars when needed.
 
+        With more than one worker, reading, hashing, and metadata writes run in a process pool
+        after every file has been checked for collisions. The catalog is written once at the end.
+
         :param source_root: Root directory of the folder tree to import.
         :type source_root: Path
         :param tags: Tags to associate with imported items.
         :type tags: Sequence[str]
+        :param max_workers: Number of worker processes used to register files.
+        :type max_workers: int
         :return: Import statistics.
         :rtype: dict[str, int]
         :raises FileNotFoundError: If the source_root does not exist.
         :raises ValueError: If the source root is outside the corpus root.
+        :raises ValueError: If max_workers is less than 1.
         """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
         source_root = source_root.resolve()
         if not source_root.is_dir():
             raise FileNotFoundError(f"Import source root does not exist: {source_root}")
@@ -1591,6 +2102,7 @@ class Corpus:
 
         ignore_spec = load_corpus_ignore_spec(self.root)
         stats = {"scanned": 0, "ignored": 0, "imported": 0}
+        claimed_files: List[Tuple[Path, Path, Tuple[str, ...], Dict[str, Any], str]] = []
 
         for source_path in sorted(source_root.rglob("*")):
             if not source_path.is_file():
@@ -1604,14 +2116,26 @@ class Corpus:
             if self._is_reserved_path(relative_root_path):
                 stats["ignored"] += 1
                 continue
-            self._register_existing_file(
-                path=source_path,
-                tags=tags,
-                metadata=None,
-                source_uri=source_path.as_uri(),
-            )
+            if max_workers == 1:
+                self._register_existing_file(
+                    path=source_path,
+                    tags=tags,
+                    metadata=None,
+                    source_uri=source_path.as_uri(),
+                )
+                stats["imported"] += 1
+                continue
+            source_uri = source_path.as_uri()
+            claimed_path = self._claim_existing_file(path=source_path, source_uri=source_uri)
+            claimed_files.append((self.root, claimed_path, tuple(tags), {}, source_uri))
+
+        for item_record in _map_with_workers(
+            _register_file_contents, claimed_files, max_workers=max_workers
+        ):
+            self._upsert_catalog_item(item_record)
             stats["imported"] += 1
 
+        self.compact_catalog()
         return stats
 
     def _import_file(
@@ -1645,9 +2169,6 @@ class Corpus:
         destination_path = (self.root / destination_relpath).resolve()
         destination_path.parent.mkdir(parents=True, exist_ok=True)
 
-        raw_bytes = source_path.read_bytes()
-        sha256_digest = _sha256_bytes(raw_bytes)
-
         media_type, _ = mimetypes.guess_type(source_path.name)
         media_type = media_type or "application/octet-stream"
         if source_path.suffix.lower() in {".md", ".markdown"}:
@@ -1657,7 +2178,7 @@ class Corpus:
         frontmatter_metadata: Dict[str, Any] = {}
         if media_type == "text/markdown":
             try:
-                text = raw_bytes.decode("utf-8")
+                text = source_path.read_bytes().decode("utf-8")
             except UnicodeDecodeError as decode_error:
                 raise ValueError(
                     f"Markdown file must be Unicode Transformation Format 8: {relative_source_path}"
@@ -1668,7 +2189,9 @@ class Corpus:
             if isinstance(title_value, str) and title_value.strip():
                 title = title_value.strip()
 
-        destination_path.write_bytes(raw_bytes)
+        with source_path.open("rb") as source_handle:
+            write_result = _write_stream_and_hash(source_handle, destination_path)
+        sha256_digest = str(write_result["sha256"])
 
         sidecar: Dict[str, Any] = {}
         if tags:
@@ -1685,7 +2208,7 @@ class Corpus:
             id=item_id,
             relpath=destination_relpath,
             sha256=sha256_digest,
-            bytes=len(raw_bytes),
+            bytes=int(write_result["bytes_written"]),
             media_type=media_type,
             title=title,
             tags=list(resolved_tags),
@@ -1704,7 +2227,7 @@ class Corpus:
         :return: Catalog items ordered by recency.
         :rtype: list[CatalogItem]
         """
-        catalog = self._load_catalog()
+        catalog = self._catalog_view()
         ordered_ids = catalog.order[:limit] if catalog.order else list(catalog.items.keys())[:limit]
         collected_items: List[CatalogItem] = []
         for item_id in ordered_ids:
@@ -1723,7 +2246,7 @@ class Corpus:
         :rtype: CatalogItem
         :raises KeyError: If the item identifier is unknown.
         """
-        catalog = self._load_catalog()
+        catalog = self._catalog_view()
         item = catalog.items.get(item_id)
         if item is None:
             raise KeyError(f"Unknown item identifier: {item_id}")
@@ -1804,20 +2327,93 @@ class Corpus:
         )
         self._upsert_catalog_item(item_record)
 
-    def reindex(self) -> Dict[str, int]:
+    @property
+    def reindex_state_path(self) -> Path:
+        """
+        Return the path to the reindex state file.
+
+        The state file records a stat signature for every content file seen by the last reindex.
+
+        :return: Reindex state file path.
+        :rtype: Path
+        """
+        return self.meta_dir / REINDEX_STATE_FILENAME
+
+    def _load_reindex_state(self) -> Dict[str, Any]:
+        """
+        Load the reindex state written by the previous reindex, if any.
+
+        :return: Reindex state mapping, empty when missing or unreadable.
+        :rtype: dict[str, Any]
+        """
+        if not self.reindex_state_path.is_file():
+            return {}
+        try:
+            data = json.loads(self.reindex_state_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            return {}
+        if not isinstance(data, dict) or not isinstance(data.get("files"), dict):
+            return {}
+        return data
+
+    def _write_reindex_state(self, *, scanned_at_ns: int, files: Dict[str, Any]) -> None:
+        """
+        Atomically write the reindex state file.
+
+        :param scanned_at_ns: Wall clock time in nanoseconds when the scan started.
+        :type scanned_at_ns: int
+        :param files: Stat signatures and item identifiers keyed by relative path.
+        :type files: dict[str, Any]
+        :return: None.
+        :rtype: None
+        """
+        temp_path = self.reindex_state_path.with_suffix(".json.tmp")
+        temp_path.write_text(
+            json.dumps({"scanned_at_ns": scanned_at_ns, "files": files}) + "\n",
+            encoding="utf-8",
+        )
+        temp_path.replace(self.reindex_state_path)
+
+    def reindex(self, *, incremental: bool = False, max_workers: int = 1) -> Dict[str, int]:
         """
         Rebuild/refresh the corpus catalog from the current on-disk corpus contents.
 
         This is the core "mutable corpus with re-indexing" loop: edit raw files or sidecars,
         then reindex to refresh the derived catalog.
 
+        In incremental mode, files whose content and sidecar stat signatures (size, modification
+        time, inode) match the previous reindex keep their existing catalog entry without being
+        read or hashed. Files modified during or after the previous scan are always re-read.
+
+        With more than one worker, hashing, media type detection, and metadata parsing run in a
+        process pool. Results are merged into a single catalog write in scan order.
+
+        :param incremental: Whether to skip files unchanged since the previous reindex.
+        :type incremental: bool
+        :param max_workers: Number of worker processes used to scan files.
+        :type max_workers: int
         :return: Reindex statistics.
         :rtype: dict[str, int]
         :raises ValueError: If a markdown file cannot be decoded as Unicode Transformation Format 8.
+        :raises ValueError: If max_workers is less than 1.
         """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
         self._init_catalog()
-        existing_catalog = self._load_catalog()
-        stats = {"scanned": 0, "skipped": 0, "inserted": 0, "updated": 0}
+        existing_catalog = self._catalog_view()
+        stats = {
+            "scanned": 0,
+            "skipped": 0,
+            "inserted": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "removed": 0,
+        }
+        scanned_at_ns = time.time_ns()
+        previous_state = self._load_reindex_state() if incremental else {}
+        previous_files: Dict[str, Any] = previous_state.get("files", {})
+        previous_scanned_at_ns = int(previous_state.get("scanned_at_ns", 0))
+        state_files: Dict[str, Any] = {}
 
         if self.raw_dir == self.root:
             content_files = [
@@ -1835,70 +2431,62 @@ class Corpus:
             ]
 
         new_items: Dict[str, CatalogItem] = {}
+        pending_files: List[Tuple[Path, str, Dict[str, Any]]] = []
 
         for content_path in content_files:
             stats["scanned"] += 1
             relpath = str(content_path.relative_to(self.root))
-            data = content_path.read_bytes()
-            sha256 = _sha256_bytes(data)
-
-            media_type, _ = mimetypes.guess_type(content_path.name)
-            media_type = media_type or "application/octet-stream"
-
-            sidecar = _load_sidecar(content_path)
-
-            frontmatter: Dict[str, Any] = {}
-            if content_path.suffix.lower() in {".md", ".markdown"}:
-                try:
-                    text = data.decode("utf-8")
-                except UnicodeDecodeError as decode_error:
-                    raise ValueError(
-                        f"Markdown file must be Unicode Transformation Format 8: {relpath}"
-                    ) from decode_error
-                parsed_document = parse_front_matter(text)
-                frontmatter = parsed_document.metadata
-                media_type = "text/markdown"
-
-            merged_metadata = _merge_metadata(frontmatter, sidecar)
-
-            if media_type != "text/markdown":
-                media_type_override = merged_metadata.get("media_type")
-                if isinstance(media_type_override, str) and media_type_override.strip():
-                    media_type = media_type_override.strip()
-
-            item_id: Optional[str] = None
-            biblicus_block = merged_metadata.get("biblicus")
-            if isinstance(biblicus_block, dict):
-                biblicus_id = biblicus_block.get("id")
-                if isinstance(biblicus_id, str):
-                    try:
-                        item_id = str(uuid.UUID(biblicus_id))
-                    except ValueError:
-                        item_id = None
+            content_signature = _stat_signature(content_path)
+            sidecar_signature = _stat_signature(_sidecar_path_for(content_path))
+            state_entry: Dict[str, Any] = {
+                "content": content_signature,
+                "sidecar": sidecar_signature,
+                "item_id": None,
+            }
+
+            latest_mtime_ns = max(
+                signature[1]
+                for signature in (content_signature, sidecar_signature, [0, 0, 0])
+                if signature is not None
+            )
+            previous_entry = previous_files.get(relpath)
+            if (
+                isinstance(previous_entry, dict)
+                and content_signature is not None
+                and previous_entry.get("content") == content_signature
+                and previous_entry.get("sidecar") == sidecar_signature
+                and latest_mtime_ns < previous_scanned_at_ns
+            ):
+                previous_item_id = previous_entry.get("item_id")
+                if previous_item_id is None:
+                    stats["skipped"] += 1
+                    state_files[relpath] = state_entry
+                    continue
+                unchanged_item = existing_catalog.items.get(previous_item_id)
+                if unchanged_item is not None and unchanged_item.relpath == relpath:
+                    stats["unchanged"] += 1
+                    new_items[unchanged_item.id] = unchanged_item
+                    state_entry["item_id"] = unchanged_item.id
+                    state_files[relpath] = state_entry
+                    continue
 
-            if item_id is None:
-                item_id = _parse_uuid_prefix(content_path.name)
+            pending_files.append((content_path, relpath, state_entry))
 
+        scanned_files = _map_with_workers(
+            _scan_content_file,
+            [(content_path, relpath) for content_path, relpath, _ in pending_files],
+            max_workers=max_workers,
+        )
+        for (_, relpath, state_entry), scanned in zip(pending_files, scanned_files):
+            state_files[relpath] = state_entry
+            item_id = scanned["item_id"]
             if item_id is None:
                 stats["skipped"] += 1
                 continue
 
-            title: Optional[str] = None
-            title_value = merged_metadata.get("title")
-            if isinstance(title_value, str) and title_value.strip():
-                title = title_value.strip()
-
-            resolved_tags = _merge_tags([], merged_metadata.get("tags"))
-
-            source_uri: Optional[str] = None
-            if isinstance(biblicus_block, dict):
-                source_value = biblicus_block.get("source")
-                if isinstance(source_value, str) and source_value.strip():
-                    source_uri = source_value.strip()
-
             previous_item = existing_catalog.items.get(item_id)
             created_at = previous_item.created_at if previous_item is not None else utc_now_iso()
-            source_uri = source_uri or (
+            source_uri = scanned["source_uri"] or (
                 previous_item.source_uri if previous_item is not None else None
             )
 
@@ -1910,15 +2498,18 @@ class Corpus:
             new_items[item_id] = CatalogItem(
                 id=item_id,
                 relpath=relpath,
-                sha256=sha256,
-                bytes=len(data),
-                media_type=media_type,
-                title=title,
-                tags=list(resolved_tags),
-                metadata=dict(merged_metadata or {}),
+                sha256=scanned["sha256"],
+                bytes=scanned["bytes"],
+                media_type=scanned["media_type"],
+                title=scanned["title"],
+                tags=list(scanned["tags"]),
+                metadata=dict(scanned["metadata"] or {}),
                 created_at=created_at,
                 source_uri=source_uri,
             )
+            state_entry["item_id"] = item_id
+
+        stats["removed"] = len(set(existing_catalog.items) - set(new_items))
 
         order = sorted(
             new_items.keys(),
@@ -1936,6 +2527,7 @@ class Corpus:
             order=order,
         )
         self._write_catalog(catalog)
+        self._write_reindex_state(scanned_at_ns=scanned_at_ns, files=state_files)
 
         return stats
 
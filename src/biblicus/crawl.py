@@ -175,6 +175,7 @@ def crawl_into_corpus(*, corpus, request: CrawlRequest) -> CrawlResult:  # type:
             for discovered in _discover_links(text, base_url=url):
                 queue.append(discovered)
 
+    corpus.compact_catalog()
     return CrawlResult(
         crawl_id=crawl_id,
         discovered_items=len(discovered_urls),
@@ -0,0 +1,253 @@
+"""
+Content-addressed embedding cache shared across snapshots and analysis runs of a corpus.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .constants import EMBEDDING_CACHE_FILENAME
+from .corpus import Corpus
+from .embedding_providers import EmbeddingProvider
+
+DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES = 1_000_000
+
+_LOOKUP_BATCH_SIZE = 500
+
+
+def embedding_cache_namespace(settings: Mapping[str, object]) -> str:
+    """
+    Derive a cache namespace from the settings that determine an embedding vector.
+
+    :param settings: Provider identifier, model, dimensions, and any other output-shaping values.
+    :type settings: Mapping[str, object]
+    :return: Namespace digest.
+    :rtype: str
+    """
+    payload = json.dumps(settings, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """
+    Counters for embedding cache lookups.
+
+    :ivar hits: Texts served from the cache, including repeats within one request.
+    :vartype hits: int
+    :ivar misses: Distinct texts that had to be embedded.
+    :vartype misses: int
+    :ivar evictions: Entries removed to stay within the size bound.
+    :vartype evictions: int
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def as_stats(self) -> Dict[str, int]:
+        """
+        Render the counters as snapshot statistics.
+
+        :return: Statistics keyed with an ``embedding_cache_`` prefix.
+        :rtype: dict[str, int]
+        """
+        return {
+            "embedding_cache_hits": self.hits,
+            "embedding_cache_misses": self.misses,
+            "embedding_cache_evictions": self.evictions,
+        }
+
+
+class EmbeddingCache:
+    """
+    Embedding vectors keyed by namespace and text hash, stored in a SQLite database.
+
+    Vectors are stored and returned in the data type the provider returned them in, so cached and
+    uncached embeddings are identical. When the cache holds more than ``max_entries`` vectors, the
+    least recently used entries are evicted.
+
+    :ivar path: SQLite database path.
+    :vartype path: Path
+    :ivar max_entries: Maximum number of cached vectors.
+    :vartype max_entries: int
+    :ivar stats: Lookup counters since the cache was opened.
+    :vartype stats: EmbeddingCacheStats
+    """
+
+    def __init__(self, path: Path, *, max_entries: int = DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.path = path
+        self.max_entries = max_entries
+        self.stats = EmbeddingCacheStats()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._entries = 0
+
+    @classmethod
+    def for_corpus(
+        cls, corpus: Corpus, *, max_entries: int = DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES
+    ) -> "EmbeddingCache":
+        """
+        Open the embedding cache stored in a corpus metadata directory.
+
+        :param corpus: Corpus that owns the cache.
+        :type corpus: Corpus
+        :param max_entries: Maximum number of cached vectors.
+        :type max_entries: int
+        :return: Embedding cache.
+        :rtype: EmbeddingCache
+        """
+        return cls(corpus.meta_dir / EMBEDDING_CACHE_FILENAME, max_entries=max_entries)
+
+    def embed(
+        self,
+        namespace: str,
+        texts: Sequence[str],
+        embed_missing: Callable[[List[str]], object],
+    ) -> np.ndarray:
+        """
+        Return embeddings for texts, embedding only the distinct texts not yet cached.
+
+        :param namespace: Cache namespace from :func:`embedding_cache_namespace`.
+        :type namespace: str
+        :param texts: Texts to embed.
+        :type texts: Sequence[str]
+        :param embed_missing: Callable that embeds a list of texts into a row per text.
+        :type embed_missing: Callable[[list[str]], object]
+        :return: Matrix with one row per text, in the data type ``embed_missing`` returns.
+        :rtype: numpy.ndarray
+        :raises ValueError: If ``embed_missing`` returns the wrong number of rows.
+        """
+        items = list(texts)
+        if not items:
+            return np.asarray(embed_missing([]))
+        connection = self._connect()
+        item_hashes = [hashlib.sha256(text.encode("utf-8")).hexdigest() for text in items]
+        text_by_hash = dict(zip(item_hashes, items))
+        hashes = list(text_by_hash)
+        vectors = self._lookup(connection, namespace, hashes)
+        missing = [text_hash for text_hash in hashes if text_hash not in vectors]
+        cached = list(vectors)
+        now = time.time_ns()
+        if missing:
+            embedded = np.asarray(embed_missing([text_by_hash[text_hash] for text_hash in missing]))
+            if embedded.ndim != 2 or embedded.shape[0] != len(missing):
+                raise ValueError("Embedding provider returned an invalid embedding shape")
+            cursor = connection.executemany(
+                "INSERT OR IGNORE INTO embeddings (namespace, text_hash, vector, dtype, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (namespace, text_hash, row.tobytes(), embedded.dtype.str, now)
+                    for text_hash, row in zip(missing, embedded)
+                ],
+            )
+            self._entries += cursor.rowcount
+            vectors.update(zip(missing, embedded))
+        connection.executemany(
+            "UPDATE embeddings SET last_used = ? WHERE namespace = ? AND text_hash = ?",
+            [(now, namespace, text_hash) for text_hash in cached],
+        )
+        self._evict(connection)
+        connection.commit()
+        self.stats.misses += len(missing)
+        self.stats.hits += len(items) - len(missing)
+        return np.stack([vectors[text_hash] for text_hash in item_hashes])
+
+    def close(self) -> None:
+        """
+        Close the cache database connection.
+
+        :return: None.
+        :rtype: None
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), timeout=30.0)
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    namespace TEXT NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    dtype TEXT NOT NULL,
+                    last_used INTEGER NOT NULL,
+                    PRIMARY KEY (namespace, text_hash)
+                )
+                """)
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)"
+            )
+            self._entries = connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            self._connection = connection
+        return self._connection
+
+    def _lookup(
+        self, connection: sqlite3.Connection, namespace: str, hashes: List[str]
+    ) -> Dict[str, np.ndarray]:
+        vectors: Dict[str, np.ndarray] = {}
+        for start in range(0, len(hashes), _LOOKUP_BATCH_SIZE):
+            batch = hashes[start : start + _LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" for _ in batch)
+            rows = connection.execute(
+                "SELECT text_hash, vector, dtype FROM embeddings "
+                f"WHERE namespace = ? AND text_hash IN ({placeholders})",
+                [namespace, *batch],
+            )
+            for text_hash, vector, dtype in rows:
+                vectors[text_hash] = np.frombuffer(vector, dtype=np.dtype(dtype))
+        return vectors
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        excess = self._entries - self.max_entries
+        if excess <= 0:
+            return
+        connection.execute(
+            "DELETE FROM embeddings WHERE rowid IN "
+            "(SELECT rowid FROM embeddings ORDER BY last_used, rowid LIMIT ?)",
+            (excess,),
+        )
+        self._entries -= excess
+        self.stats.evictions += excess
+
+
+class CachedEmbeddingProvider(EmbeddingProvider):
+    """
+    Embedding provider that consults an :class:`EmbeddingCache` before its wrapped provider.
+
+    :ivar provider: Wrapped embedding provider.
+    :vartype provider: EmbeddingProvider
+    :ivar cache: Embedding cache.
+    :vartype cache: EmbeddingCache
+    :ivar namespace: Cache namespace for the wrapped provider's settings.
+    :vartype namespace: str
+    """
+
+    def __init__(self, provider: EmbeddingProvider, *, cache: EmbeddingCache, namespace: str):
+        self.provider = provider
+        self.provider_id = provider.provider_id
+        self.cache = cache
+        self.namespace = namespace
+
+    def embed_texts(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed texts, reusing cached vectors.
+
+        :param texts: Text inputs.
+        :type texts: Sequence[str]
+        :return: Embedding matrix in the wrapped provider's data type.
+        :rtype: numpy.ndarray
+        """
+        return self.cache.embed(self.namespace, texts, self.provider.embed_texts)
@@ -21,7 +21,13 @@ from biblicus.evaluation.ocr_benchmark import (
     calculate_word_metrics,
     calculate_word_order_metrics,
 )
-from biblicus.evaluation.retrieval import _snapshot_artifact_bytes, evaluate_snapshot, load_dataset
+from biblicus.evaluation.retrieval import (
+    ApproximateRetrievalBenchmark,
+    _snapshot_artifact_bytes,
+    benchmark_approximate_snapshot,
+    evaluate_snapshot,
+    load_dataset,
+)
 
 __all__ = [
     "BenchmarkReport",
@@ -32,6 +38,8 @@ __all__ = [
     "calculate_word_metrics",
     "calculate_word_order_metrics",
     "evaluate_snapshot",
+    "benchmark_approximate_snapshot",
+    "ApproximateRetrievalBenchmark",
     "load_dataset",
     "_snapshot_artifact_bytes",
     # Multi-category benchmark
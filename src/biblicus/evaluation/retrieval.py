@@ -7,13 +7,14 @@ from __future__ import annotations
 import json
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from ..constants import DATASET_SCHEMA_VERSION
 from ..corpus import Corpus
 from ..models import QueryBudget, RetrievalResult, RetrievalSnapshot
+from ..retrieval import create_configuration_manifest
 from ..retrievers import get_retriever
 from ..time import utc_now_iso
 
@@ -107,6 +108,40 @@ class EvaluationResult(BaseModel):
     system: Dict[str, float]
 
 
+class ApproximateRetrievalBenchmark(BaseModel):
+    """
+    Recall and latency of an approximate retrieval snapshot compared with an exact snapshot.
+
+    :ivar approximate_snapshot_id: Approximate retrieval snapshot identifier.
+    :vartype approximate_snapshot_id: str
+    :ivar exact_snapshot_id: Exact retrieval snapshot identifier used as ground truth.
+    :vartype exact_snapshot_id: str
+    :ivar probes: Number of inverted lists scanned per query.
+    :vartype probes: int
+    :ivar k: Number of results compared per query.
+    :vartype k: int
+    :ivar queries: Number of benchmark queries.
+    :vartype queries: int
+    :ivar recall_at_k: Mean share of exact top-k evidence also returned by the approximate snapshot.
+    :vartype recall_at_k: float
+    :ivar approximate_latency: Average and percentile 95 approximate latency in milliseconds.
+    :vartype approximate_latency: dict[str, float]
+    :ivar exact_latency: Average and percentile 95 exact latency in milliseconds.
+    :vartype exact_latency: dict[str, float]
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    approximate_snapshot_id: str
+    exact_snapshot_id: str
+    probes: int
+    k: int
+    queries: int
+    recall_at_k: float
+    approximate_latency: Dict[str, float]
+    exact_latency: Dict[str, float]
+
+
 def load_dataset(path: Path) -> EvaluationDataset:
     """
     Load an evaluation dataset from JavaScript Object Notation.
@@ -126,10 +161,16 @@ def evaluate_snapshot(
     snapshot: RetrievalSnapshot,
     dataset: EvaluationDataset,
     budget: QueryBudget,
+    batch_size: int = 1,
 ) -> EvaluationResult:
     """
     Evaluate a retrieval snapshot against a dataset.
 
+    Queries run through the retriever's query_batch in groups of batch_size. With the default
+    batch size of 1 every latency sample is a single query. With larger batches each query's
+    sample is its batch's elapsed time divided by the batch size, so the latency figures are
+    batch-amortized and the batch size is recorded in the system metrics.
+
     :param corpus: Corpus associated with the snapshot.
     :type corpus: Corpus
     :param snapshot: Retrieval snapshot manifest.
@@ -138,27 +179,37 @@ def evaluate_snapshot(
     :type dataset: EvaluationDataset
     :param budget: Evidence selection budget.
     :type budget: QueryBudget
+    :param batch_size: Number of queries sent to the retriever per batch.
+    :type batch_size: int
     :return: Evaluation result bundle.
     :rtype: EvaluationResult
+    :raises ValueError: If batch_size is less than 1.
     """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
     retriever = get_retriever(snapshot.configuration.retriever_id)
     latency_seconds: List[float] = []
     hit_count = 0
     reciprocal_ranks: List[float] = []
 
-    for query in dataset.queries:
+    for batch_start in range(0, len(dataset.queries), batch_size):
+        batch = dataset.queries[batch_start : batch_start + batch_size]
         timer_start = time.perf_counter()
-        result = retriever.query(
-            corpus, snapshot=snapshot, query_text=query.query_text, budget=budget
+        results = retriever.query_batch(
+            corpus,
+            snapshot=snapshot,
+            query_texts=[query.query_text for query in batch],
+            budget=budget,
         )
         elapsed_seconds = time.perf_counter() - timer_start
-        latency_seconds.append(elapsed_seconds)
-        expected_rank = _expected_rank(result, query)
-        if expected_rank is not None:
-            hit_count += 1
-            reciprocal_ranks.append(1.0 / expected_rank)
-        else:
-            reciprocal_ranks.append(0.0)
+        latency_seconds.extend([elapsed_seconds / len(batch)] * len(batch))
+        for query, result in zip(batch, results):
+            expected_rank = _expected_rank(result, query)
+            if expected_rank is not None:
+                hit_count += 1
+                reciprocal_ranks.append(1.0 / expected_rank)
+            else:
+                reciprocal_ranks.append(0.0)
 
     total_queries = max(len(dataset.queries), 1)
     max_total_items = float(budget.max_total_items)
@@ -176,6 +227,8 @@ def evaluate_snapshot(
         "percentile_95_latency_milliseconds": _percentile_95_latency_milliseconds(latency_seconds),
         "index_bytes": float(_snapshot_artifact_bytes(corpus, snapshot)),
     }
+    if batch_size > 1:
+        system["query_batch_size"] = float(batch_size)
     dataset_meta = {
         "name": dataset.name,
         "description": dataset.description,
@@ -191,6 +244,134 @@ def evaluate_snapshot(
     )
 
 
+def benchmark_approximate_snapshot(
+    *,
+    corpus: Corpus,
+    approximate_snapshot: RetrievalSnapshot,
+    exact_snapshot: RetrievalSnapshot,
+    query_texts: Sequence[str],
+    budget: QueryBudget,
+    probes: Sequence[int] = (),
+) -> List[ApproximateRetrievalBenchmark]:
+    """
+    Compare recall at k and latency of an approximate snapshot against an exact snapshot.
+
+    The exact snapshot is queried once per query text. The approximate snapshot is queried once
+    per query text for each probe setting, without rebuilding its index.
+
+    :param corpus: Corpus associated with both snapshots.
+    :type corpus: Corpus
+    :param approximate_snapshot: Approximate retrieval snapshot, for example embedding-index-ann.
+    :type approximate_snapshot: RetrievalSnapshot
+    :param exact_snapshot: Exact retrieval snapshot built over the same chunks.
+    :type exact_snapshot: RetrievalSnapshot
+    :param query_texts: Benchmark query texts.
+    :type query_texts: Sequence[str]
+    :param budget: Evidence selection budget; k is its max_total_items.
+    :type budget: QueryBudget
+    :param probes: Probe settings to measure. Defaults to the snapshot configuration.
+    :type probes: Sequence[int]
+    :return: One benchmark result per probe setting.
+    :rtype: list[ApproximateRetrievalBenchmark]
+    """
+    exact_retriever = get_retriever(exact_snapshot.configuration.retriever_id)
+    exact_keys, exact_latencies = _timed_evidence_keys(
+        exact_retriever, corpus, snapshot=exact_snapshot, query_texts=query_texts, budget=budget
+    )
+
+    approximate_retriever = get_retriever(approximate_snapshot.configuration.retriever_id)
+    base_configuration = dict(approximate_snapshot.configuration.configuration)
+    probe_settings = list(probes) or [int(base_configuration.get("probes", 0))]
+    results: List[ApproximateRetrievalBenchmark] = []
+    for probe_count in probe_settings:
+        configuration = create_configuration_manifest(
+            retriever_id=approximate_snapshot.configuration.retriever_id,
+            name=approximate_snapshot.configuration.name,
+            configuration={**base_configuration, "probes": int(probe_count)},
+            description=approximate_snapshot.configuration.description,
+        )
+        probed_snapshot = approximate_snapshot.model_copy(update={"configuration": configuration})
+        approximate_keys, approximate_latencies = _timed_evidence_keys(
+            approximate_retriever,
+            corpus,
+            snapshot=probed_snapshot,
+            query_texts=query_texts,
+            budget=budget,
+        )
+        recalls = [
+            len(expected & returned) / len(expected)
+            for expected, returned in zip(exact_keys, approximate_keys)
+            if expected
+        ]
+        results.append(
+            ApproximateRetrievalBenchmark(
+                approximate_snapshot_id=approximate_snapshot.snapshot_id,
+                exact_snapshot_id=exact_snapshot.snapshot_id,
+                probes=int(probe_count),
+                k=budget.max_total_items,
+                queries=len(query_texts),
+                recall_at_k=sum(recalls) / len(recalls) if recalls else 1.0,
+                approximate_latency=_latency_summary(approximate_latencies),
+                exact_latency=_latency_summary(exact_latencies),
+            )
+        )
+    return results
+
+
+def _timed_evidence_keys(
+    retriever,
+    corpus: Corpus,
+    *,
+    snapshot: RetrievalSnapshot,
+    query_texts: Sequence[str],
+    budget: QueryBudget,
+) -> Tuple[List[Set[Tuple[str, Optional[int], Optional[int]]]], List[float]]:
+    """
+    Run queries against a snapshot and collect evidence keys and latencies.
+
+    :param retriever: Retriever for the snapshot.
+    :type retriever: object
+    :param corpus: Corpus associated with the snapshot.
+    :type corpus: Corpus
+    :param snapshot: Retrieval snapshot manifest.
+    :type snapshot: RetrievalSnapshot
+    :param query_texts: Query texts to run.
+    :type query_texts: Sequence[str]
+    :param budget: Evidence selection budget.
+    :type budget: QueryBudget
+    :return: Evidence keys per query and latency samples in seconds.
+    :rtype: tuple[list[set[tuple[str, int or None, int or None]]], list[float]]
+    """
+    keys: List[Set[Tuple[str, Optional[int], Optional[int]]]] = []
+    latencies: List[float] = []
+    for query_text in query_texts:
+        timer_start = time.perf_counter()
+        result = retriever.query(corpus, snapshot=snapshot, query_text=query_text, budget=budget)
+        latencies.append(time.perf_counter() - timer_start)
+        keys.append(
+            {
+                (evidence.item_id, evidence.span_start, evidence.span_end)
+                for evidence in result.evidence
+            }
+        )
+    return keys, latencies
+
+
+def _latency_summary(latencies: List[float]) -> Dict[str, float]:
+    """
+    Summarize latency samples in milliseconds.
+
+    :param latencies: Latency samples in seconds.
+    :type latencies: list[float]
+    :return: Average and percentile 95 latency in milliseconds.
+    :rtype: dict[str, float]
+    """
+    return {
+        "average_milliseconds": _average_latency_milliseconds(latencies),
+        "percentile_95_milliseconds": _percentile_95_latency_milliseconds(latencies),
+    }
+
+
 def _expected_rank(result: RetrievalResult, query: EvaluationQuery) -> Optional[int]:
     """
     Locate the first evidence rank that matches the expected item or source.
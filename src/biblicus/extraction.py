@@ -9,17 +9,40 @@ import os
 import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from itertools import groupby
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from .corpus import Corpus
+from .corpus import Corpus, _ends_with_newline
 from .errors import ExtractionSnapshotFatalError
+from .extraction_cache import ExtractionCache, extraction_cache_stage_hash
 from .extractors import get_extractor
+from .extractors.base import TextExtractor
 from .extractors.pipeline import PipelineExtractorConfig, PipelineStageSpec
-from .models import CatalogItem, ExtractionStageOutput
+from .models import CatalogItem, ExtractedText, ExtractionStageOutput
 from .retrieval import hash_text
 from .time import utc_now_iso
 
@@ -238,6 +261,57 @@ def write_extraction_snapshot_manifest(
     manifest_path.write_text(manifest.model_dump_json(indent=2) + "\n", encoding="utf-8")
 
 
+EXTRACTION_JOURNAL_FILENAME = "items.partial.jsonl"
+EXTRACTION_JOURNAL_FLUSH_ITEMS = 64
+EXTRACTION_JOURNAL_FLUSH_SECONDS = 5.0
+
+
+def append_extraction_journal(path: Path, items: Sequence[ExtractionItemResult]) -> None:
+    """
+    Append per-item results to an extraction snapshot journal.
+
+    The journal holds one JSON object per line, so each append costs only the new items. When
+    an interrupted write left a torn last line, the new items start on a fresh line.
+
+    :param path: Journal path inside the snapshot directory.
+    :type path: Path
+    :param items: Item results to append.
+    :type items: Sequence[ExtractionItemResult]
+    :return: None.
+    :rtype: None
+    """
+    if not items:
+        return
+    payload = "".join(item.model_dump_json() + "\n" for item in items)
+    if not _ends_with_newline(path):
+        payload = "\n" + payload
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(payload)
+
+
+def read_extraction_journal(path: Path) -> List[ExtractionItemResult]:
+    """
+    Read per-item results from an extraction snapshot journal.
+
+    Lines that do not parse, such as lines torn by interrupted writes, are skipped, so results
+    appended after a resumed run are still read.
+
+    :param path: Journal path inside the snapshot directory.
+    :type path: Path
+    :return: Item results in the order they were appended.
+    :rtype: list[ExtractionItemResult]
+    """
+    if not path.is_file():
+        return []
+    items: List[ExtractionItemResult] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            items.append(ExtractionItemResult.model_validate_json(line))
+        except ValueError:
+            continue
+    return items
+
+
 def write_extraction_latest_pointer(
     *, extractor_dir: Path, manifest: ExtractionSnapshotManifest
 ) -> None:
@@ -457,6 +531,972 @@ def _final_output_from_stages(
     return stage_outputs[-1]
 
 
+EXTRACTION_EXECUTORS = ("thread", "process")
+DEFAULT_EXTRACTION_BATCH_SIZE = 8
+
+
+@dataclass(frozen=True)
+class _ItemExtractionContext:
+    """
+    Snapshot state needed to extract one item.
+
+    :ivar corpus: Corpus being extracted.
+    :vartype corpus: Corpus
+    :ivar manifest: Extraction snapshot manifest.
+    :vartype manifest: ExtractionSnapshotManifest
+    :ivar snapshot_dir: Extraction snapshot directory.
+    :vartype snapshot_dir: Path
+    :ivar stages: Pipeline stages with their parsed configuration and extractor instance.
+    :vartype stages: list[tuple[PipelineStageSpec, BaseModel, TextExtractor]]
+    :ivar force: Whether to reprocess items even if artifacts already exist.
+    :vartype force: bool
+    :ivar cache: Corpus extraction cache, or None when the build does not use it.
+    :vartype cache: ExtractionCache or None
+    """
+
+    corpus: Corpus
+    manifest: ExtractionSnapshotManifest
+    snapshot_dir: Path
+    stages: List[Tuple[PipelineStageSpec, BaseModel, TextExtractor]]
+    force: bool
+    cache: Optional[ExtractionCache] = None
+
+
+def _item_is_text(item: CatalogItem) -> bool:
+    """
+    Report whether an item is already text and needs no conversion.
+
+    :param item: Catalog item.
+    :type item: CatalogItem
+    :return: True for text media types.
+    :rtype: bool
+    """
+    return item.media_type == "text/markdown" or item.media_type.startswith("text/")
+
+
+def _empty_stats_delta(item: CatalogItem) -> Dict[str, int]:
+    """
+    Build the stats contribution of an item before any extraction outcome is counted.
+
+    :param item: Catalog item.
+    :type item: CatalogItem
+    :return: Stats delta keyed like the snapshot stats.
+    :rtype: dict[str, int]
+    """
+    item_is_text = _item_is_text(item)
+    return {
+        "already_text_items": 1 if item_is_text else 0,
+        "needs_extraction_items": 0 if item_is_text else 1,
+        "extracted_items": 0,
+        "extracted_nonempty_items": 0,
+        "extracted_empty_items": 0,
+        "skipped_items": 0,
+        "errored_items": 0,
+        "converted_items": 0,
+        "extraction_cache_hits": 0,
+        "extraction_cache_misses": 0,
+        "extraction_cache_evictions": 0,
+        "routed_stage_skips": 0,
+        "batch_fallback_items": 0,
+        "extraction_nanoseconds": 0,
+    }
+
+
+def _media_type_throughput(totals: Dict[str, int]) -> Dict[str, Any]:
+    """
+    Render the per-media-type totals of a build as snapshot statistics.
+
+    :param totals: Item count, routed stage skips, and extraction time in nanoseconds.
+    :type totals: dict[str, int]
+    :return: Item count, routed stage skips, extraction seconds, and items per second.
+    :rtype: dict[str, Any]
+    """
+    seconds = totals["extraction_nanoseconds"] / 1_000_000_000
+    return {
+        "items": totals["items"],
+        "routed_stage_skips": totals["routed_stage_skips"],
+        "extraction_seconds": round(seconds, 6),
+        "items_per_second": round(totals["items"] / seconds, 3) if seconds > 0 else None,
+    }
+
+
+def _resolve_pipeline_stages(
+    pipeline_config: PipelineExtractorConfig,
+) -> List[Tuple[PipelineStageSpec, BaseModel, TextExtractor]]:
+    """
+    Validate each pipeline stage configuration and resolve its extractor.
+
+    :param pipeline_config: Pipeline extractor configuration.
+    :type pipeline_config: PipelineExtractorConfig
+    :return: Stages with their parsed configuration and extractor instance.
+    :rtype: list[tuple[PipelineStageSpec, BaseModel, TextExtractor]]
+    :raises KeyError: If a stage extractor identifier is unknown.
+    :raises ValueError: If a stage configuration is invalid.
+    """
+    stages: List[Tuple[PipelineStageSpec, BaseModel, TextExtractor]] = []
+    for stage in pipeline_config.stages:
+        stage_extractor = get_extractor(stage.extractor_id)
+        stages.append(
+            (stage, stage_extractor.validate_config(stage.configuration), stage_extractor)
+        )
+    return stages
+
+
+def _load_stage_cache(
+    snapshot_dir: Path, *, stage_index: int, extractor_id: str, item: CatalogItem
+) -> Optional[Tuple[ExtractionStageResult, ExtractionStageOutput]]:
+    """
+    Load a pipeline stage output already written for an item by an earlier build.
+
+    :param snapshot_dir: Extraction snapshot directory.
+    :type snapshot_dir: Path
+    :param stage_index: One-based pipeline stage index.
+    :type stage_index: int
+    :param extractor_id: Extractor identifier for the stage.
+    :type extractor_id: str
+    :param item: Catalog item being extracted.
+    :type item: CatalogItem
+    :return: Cached stage result and output, or None when the stage has no text artifact.
+    :rtype: tuple[ExtractionStageResult, biblicus.models.ExtractionStageOutput] or None
+    """
+    stage_dir_name = _pipeline_stage_dir_name(stage_index=stage_index, extractor_id=extractor_id)
+    text_relpath = str(Path("stages") / stage_dir_name / "text" / f"{item.id}.txt")
+    text_path = snapshot_dir / text_relpath
+    if not text_path.is_file():
+        return None
+    text_value = text_path.read_text(encoding="utf-8")
+    metadata_relpath = str(Path("stages") / stage_dir_name / "metadata" / f"{item.id}.json")
+    metadata_path = snapshot_dir / metadata_relpath
+    metadata_value: Dict[str, Any] = {}
+    if metadata_path.is_file():
+        metadata_value = json.loads(metadata_path.read_text(encoding="utf-8"))
+    stage_result = ExtractionStageResult(
+        stage_index=stage_index,
+        extractor_id=extractor_id,
+        status="extracted",
+        text_relpath=text_relpath,
+        text_characters=len(text_value),
+        producer_extractor_id=extractor_id,
+        source_stage_index=None,
+        confidence=None,
+        metadata_relpath=metadata_relpath if metadata_path.is_file() else None,
+        error_type=None,
+        error_message=None,
+    )
+    stage_output = ExtractionStageOutput(
+        stage_index=stage_index,
+        extractor_id=extractor_id,
+        status="extracted",
+        text=text_value,
+        text_characters=len(text_value),
+        producer_extractor_id=extractor_id,
+        source_stage_index=None,
+        confidence=None,
+        metadata=metadata_value,
+        error_type=None,
+        error_message=None,
+    )
+    return stage_result, stage_output
+
+
+@dataclass
+class _ItemStageState:
+    """
+    Pipeline progress of one item while its stages run.
+
+    :ivar item: Catalog item being extracted.
+    :vartype item: CatalogItem
+    :ivar stats_delta: Stats the item contributes.
+    :vartype stats_delta: dict[str, int]
+    :ivar stage_results: Results of the stages run so far.
+    :vartype stage_results: list[ExtractionStageResult]
+    :ivar stage_outputs: Outputs of the stages run so far, passed to later stages.
+    :vartype stage_outputs: list[biblicus.models.ExtractionStageOutput]
+    :ivar error_type: Error type of the last stage that errored, if any.
+    :vartype error_type: str or None
+    :ivar error_message: Error message of the last stage that errored, if any.
+    :vartype error_message: str or None
+    """
+
+    item: CatalogItem
+    stats_delta: Dict[str, int]
+    stage_results: List[ExtractionStageResult] = field(default_factory=list)
+    stage_outputs: List[ExtractionStageOutput] = field(default_factory=list)
+    error_type: Optional[str] = None
+    error_message: Optional[str] = None
+
+
+def _prefers_batches(extractor: TextExtractor) -> bool:
+    """
+    Report whether an extractor overrides :meth:`TextExtractor.extract_batch`.
+
+    :param extractor: Stage extractor.
+    :type extractor: TextExtractor
+    :return: True when the extractor handles several items in one call.
+    :rtype: bool
+    """
+    return type(extractor).extract_batch is not TextExtractor.extract_batch
+
+
+def _media_type_batches(items: Iterable[CatalogItem], batch_size: int) -> List[List[CatalogItem]]:
+    """
+    Group items by media type and split each group into batches.
+
+    :param items: Catalog items to extract.
+    :type items: Iterable[CatalogItem]
+    :param batch_size: Maximum number of items per batch.
+    :type batch_size: int
+    :return: Batches in media type order, each holding items of one media type.
+    :rtype: list[list[CatalogItem]]
+    """
+    batches: List[List[CatalogItem]] = []
+    ordered = sorted(items, key=lambda item: item.media_type)
+    for _media_type, group in groupby(ordered, key=lambda item: item.media_type):
+        group_items = list(group)
+        for start in range(0, len(group_items), batch_size):
+            batches.append(group_items[start : start + batch_size])
+    return batches
+
+
+def _run_stage_extractor(
+    context: _ItemExtractionContext,
+    states: Sequence[_ItemStageState],
+    *,
+    stage_extractor: TextExtractor,
+    stage_config: BaseModel,
+) -> List[Union[ExtractedText, None, Exception]]:
+    """
+    Call a stage extractor for several items, in one batch when the extractor supports it.
+
+    An error returned in place of an item's result is recorded for that item. An error raised by
+    the batch call is logged and recorded for every item in the batch. When a batch call returns
+    the wrong number of results, that is logged and the items are extracted one at a time; each
+    such item counts toward the ``batch_fallback_items`` snapshot stat.
+
+    :param context: Snapshot being built.
+    :type context: _ItemExtractionContext
+    :param states: Items to extract.
+    :type states: Sequence[_ItemStageState]
+    :param stage_extractor: Stage extractor.
+    :type stage_extractor: TextExtractor
+    :param stage_config: Parsed stage configuration.
+    :type stage_config: pydantic.BaseModel
+    :return: Extracted text, None, or the raised error for each item, in item order.
+    :rtype: list[ExtractedText or None or Exception]
+    :raises ExtractionSnapshotFatalError: If the extractor reports a fatal error.
+    """
+    if len(states) > 1 and _prefers_batches(stage_extractor):
+        try:
+            extracted_texts = list(
+                stage_extractor.extract_batch(
+                    corpus=context.corpus,
+                    items=[state.item for state in states],
+                    config=stage_config,
+                    previous_extractions=[state.stage_outputs for state in states],
+                )
+            )
+        except ExtractionSnapshotFatalError:
+            raise
+        except Exception as batch_error:
+            print(
+                f"[extract] batch of {len(states)} items failed in {stage_extractor.extractor_id}: "
+                f"{type(batch_error).__name__}: {batch_error}",
+                flush=True,
+                file=sys.stderr,
+            )
+            return [batch_error] * len(states)
+        for extracted_text in extracted_texts:
+            if isinstance(extracted_text, ExtractionSnapshotFatalError):
+                raise extracted_text
+        if len(extracted_texts) == len(states):
+            return extracted_texts
+        print(
+            f"[extract] batch of {len(states)} items in {stage_extractor.extractor_id} returned "
+            f"{len(extracted_texts)} results; extracting items one at a time",
+            flush=True,
+            file=sys.stderr,
+        )
+        for state in states:
+            state.stats_delta["batch_fallback_items"] += 1
+    outcomes: List[Union[ExtractedText, None, Exception]] = []
+    for state in states:
+        try:
+            outcomes.append(
+                stage_extractor.extract_text(
+                    corpus=context.corpus,
+                    item=state.item,
+                    config=stage_config,
+                    previous_extractions=state.stage_outputs,
+                )
+            )
+        except ExtractionSnapshotFatalError:
+            raise
+        except Exception as extraction_error:
+            outcomes.append(extraction_error)
+    return outcomes
+
+
+def _extract_stage_texts(
+    context: _ItemExtractionContext,
+    states: Sequence[_ItemStageState],
+    *,
+    stage_extractor: TextExtractor,
+    stage_config: BaseModel,
+) -> List[Union[ExtractedText, None, Exception]]:
+    """
+    Run one pipeline stage for several items, reusing outputs from the corpus extraction cache.
+
+    Cache lookups are skipped when the build forces reprocessing, but new outputs are still
+    stored. Only the cache misses are passed to the extractor.
+
+    :param context: Snapshot being built.
+    :type context: _ItemExtractionContext
+    :param states: Items to extract. Their stats are updated with cache hits, misses, and
+        evictions.
+    :type states: Sequence[_ItemStageState]
+    :param stage_extractor: Stage extractor.
+    :type stage_extractor: TextExtractor
+    :param stage_config: Parsed stage configuration.
+    :type stage_config: pydantic.BaseModel
+    :return: Extracted text, None, or the raised error for each item, in item order.
+    :rtype: list[ExtractedText or None or Exception]
+    :raises ExtractionSnapshotFatalError: If the extractor reports a fatal error.
+    """
+    cache = context.cache if stage_extractor.cacheable else None
+    outcomes: List[Union[ExtractedText, None, Exception]] = [None] * len(states)
+    stage_hashes: List[Optional[str]] = [None] * len(states)
+    misses: List[int] = []
+    for position, state in enumerate(states):
+        if cache is not None:
+            stage_hash = extraction_cache_stage_hash(
+                configuration=stage_config,
+                media_type=state.item.media_type,
+                previous_extractions=state.stage_outputs,
+            )
+            stage_hashes[position] = stage_hash
+            if not context.force:
+                cached = cache.get(state.item.sha256, stage_extractor.extractor_id, stage_hash)
+                if cached is not None:
+                    state.stats_delta["extraction_cache_hits"] += 1
+                    outcomes[position] = cached
+                    continue
+        misses.append(position)
+    extracted = _run_stage_extractor(
+        context,
+        [states[position] for position in misses],
+        stage_extractor=stage_extractor,
+        stage_config=stage_config,
+    )
+    for position, outcome in zip(misses, extracted):
+        outcomes[position] = outcome
+        stage_hash = stage_hashes[position]
+        if cache is None or stage_hash is None or isinstance(outcome, Exception):
+            continue
+        state = states[position]
+        state.stats_delta["extraction_cache_misses"] += 1
+        if outcome is not None:
+            state.stats_delta["extraction_cache_evictions"] += cache.put(
+                state.item.sha256, stage_extractor.extractor_id, stage_hash, outcome
+            )
+    return outcomes
+
+
+def _skipped_stage_result(stage_index: int, extractor_id: str) -> ExtractionStageResult:
+    """
+    Build the result of a stage that produced no text for an item.
+
+    :param stage_index: One-based pipeline stage index.
+    :type stage_index: int
+    :param extractor_id: Stage extractor identifier.
+    :type extractor_id: str
+    :return: Skipped stage result.
+    :rtype: ExtractionStageResult
+    """
+    return ExtractionStageResult(
+        stage_index=stage_index,
+        extractor_id=extractor_id,
+        status="skipped",
+        text_relpath=None,
+        text_characters=0,
+        producer_extractor_id=None,
+        source_stage_index=None,
+        error_type=None,
+        error_message=None,
+    )
+
+
+def _record_stage_outcome(
+    context: _ItemExtractionContext,
+    state: _ItemStageState,
+    *,
+    stage_index: int,
+    extractor_id: str,
+    outcome: Union[ExtractedText, None, Exception],
+) -> None:
+    """
+    Record the outcome of one stage for an item and write its stage artifacts.
+
+    :param context: Snapshot being built.
+    :type context: _ItemExtractionContext
+    :param state: Item progress to update.
+    :type state: _ItemStageState
+    :param stage_index: One-based pipeline stage index.
+    :type stage_index: int
+    :param extractor_id: Stage extractor identifier.
+    :type extractor_id: str
+    :param outcome: Extracted text, None when the stage skipped the item, or the raised error.
+    :type outcome: ExtractedText or None or Exception
+    :return: None.
+    :rtype: None
+    """
+    if isinstance(outcome, Exception):
+        state.error_type = outcome.__class__.__name__
+        state.error_message = str(outcome)
+        state.stage_results.append(
+            ExtractionStageResult(
+                stage_index=stage_index,
+                extractor_id=extractor_id,
+                status="errored",
+                text_relpath=None,
+                text_characters=0,
+                producer_extractor_id=None,
+                source_stage_index=None,
+                error_type=state.error_type,
+                error_message=state.error_message,
+            )
+        )
+        return
+    if outcome is None:
+        state.stage_results.append(_skipped_stage_result(stage_index, extractor_id))
+        return
+
+    item = state.item
+    relpath = write_pipeline_stage_text_artifact(
+        snapshot_dir=context.snapshot_dir,
+        stage_index=stage_index,
+        extractor_id=extractor_id,
+        item=item,
+        text=outcome.text,
+    )
+    metadata_relpath = write_pipeline_stage_metadata_artifact(
+        snapshot_dir=context.snapshot_dir,
+        stage_index=stage_index,
+        extractor_id=extractor_id,
+        item=item,
+        metadata=outcome.metadata,
+    )
+    text_characters = len(outcome.text)
+    state.stage_results.append(
+        ExtractionStageResult(
+            stage_index=stage_index,
+            extractor_id=extractor_id,
+            status="extracted",
+            text_relpath=relpath,
+            text_characters=text_characters,
+            producer_extractor_id=outcome.producer_extractor_id,
+            source_stage_index=outcome.source_stage_index,
+            confidence=outcome.confidence,
+            metadata_relpath=metadata_relpath,
+            error_type=None,
+            error_message=None,
+        )
+    )
+    state.stage_outputs.append(
+        ExtractionStageOutput(
+            stage_index=stage_index,
+            extractor_id=extractor_id,
+            status="extracted",
+            text=outcome.text,
+            text_characters=text_characters,
+            producer_extractor_id=outcome.producer_extractor_id,
+            source_stage_index=outcome.source_stage_index,
+            confidence=outcome.confidence,
+            metadata=outcome.metadata,
+            error_type=None,
+            error_message=None,
+        )
+    )
+
+
+def _extract_items(
+    context: _ItemExtractionContext,
+    items: Sequence[CatalogItem],
+    *,
+    cached_items: Dict[str, ExtractionItemResult],
+    on_stage: Optional[Callable[[str], None]] = None,
+) -> List[Tuple[ExtractionItemResult, Dict[str, int]]]:
+    """
+    Extract a batch of items and record how long they took in their stats deltas.
+
+    The batch duration is split evenly between its items.
+
+    :param context: Snapshot being built.
+    :type context: _ItemExtractionContext
+    :param items: Catalog items to extract.
+    :type items: Sequence[CatalogItem]
+    :param cached_items: Results recorded by an earlier build, keyed by item identifier.
+    :type cached_items: dict[str, ExtractionItemResult]
+    :param on_stage: Optional callback receiving a label for the stage being run.
+    :type on_stage: Callable[[str], None] or None
+    :return: Result and stats delta for each item, in item order.
+    :rtype: list[tuple[ExtractionItemResult, dict[str, int]]]
+    :raises ExtractionSnapshotFatalError: If a stage reports a fatal error.
+    """
+    started = time.perf_counter_ns()
+    results = _run_item_stages(context, items, cached_items=cached_items, on_stage=on_stage)
+    elapsed = time.perf_counter_ns() - started
+    for _item_result, stats_delta in results:
+        stats_delta["extraction_nanoseconds"] = elapsed // len(results)
+    return results
+
+
+def _reuse_final_text(
+    context: _ItemExtractionContext,
+    item: CatalogItem,
+    *,
+    cached_item: Optional[ExtractionItemResult],
+    stats_delta: Dict[str, int],
+) -> Optional[ExtractionItemResult]:
+    """
+    Reuse the final text an earlier build wrote for an item.
+
+    :param context: Snapshot being built.
+    :type context: _ItemExtractionContext
+    :param item: Catalog item to extract.
+    :type item: CatalogItem
+    :param cached_item: Result recorded for the item by an earlier build, if any.
+    :type cached_item: ExtractionItemResult or None
+    :param stats_delta: Item stats, updated when the final text is reused.
+    :type stats_delta: dict[str, int]
+    :return: Item result, or None when the item must be extracted.
+    :rtype: ExtractionItemResult or None
+    """
+    snapshot_dir = context.snapshot_dir
+    final_text_relpath = str(Path("text") / f"{item.id}.txt")
+    final_metadata_relpath = str(Path("metadata") / f"{item.id}.json")
+    final_text_path = snapshot_dir / final_text_relpath
+    if context.force or not final_text_path.is_file():
+        return None
+
+    final_text_value = final_text_path.read_text(encoding="utf-8")
+    if cached_item and cached_item.final_stage_extractor_id:
+        alias_snapshot_dir = _ensure_extraction_alias_snapshot_dir(
+            corpus=context.corpus,
+            stage_extractor_id=cached_item.final_stage_extractor_id,
+            manifest=context.manifest,
+        )
+        _write_alias_text_artifact(
+            alias_snapshot_dir=alias_snapshot_dir,
+            item=item,
+            text=final_text_value,
+        )
+        metadata_value: Dict[str, Any] = {}
+        metadata_path = snapshot_dir / final_metadata_relpath
+        if metadata_path.is_file():
+            metadata_value = json.loads(metadata_path.read_text(encoding="utf-8"))
+        _write_alias_metadata_artifact(
+            alias_snapshot_dir=alias_snapshot_dir,
+            item=item,
+            metadata=metadata_value,
+        )
+    stats_delta["extracted_items"] = 1
+    if final_text_value.strip():
+        stats_delta["extracted_nonempty_items"] = 1
+        if not _item_is_text(item):
+            stats_delta["converted_items"] = 1
+    else:
+        stats_delta["extracted_empty_items"] = 1
+    if cached_item is not None:
+        return cached_item
+    return ExtractionItemResult(
+        item_id=item.id,
+        status="extracted",
+        final_text_relpath=final_text_relpath,
+        final_metadata_relpath=(
+            final_metadata_relpath if (snapshot_dir / final_metadata_relpath).is_file() else None
+        ),
+        final_stage_index=None,
+        final_stage_extractor_id=None,
+        final_producer_extractor_id=None,
+        final_source_stage_index=None,
+        error_type=None,
+        error_message=None,
+        stage_results=[],
+    )
+
+
+def _finish_item(context: _ItemExtractionContext, state: _ItemStageState) -> ExtractionItemResult:
+    """
+    Write the final text of an item whose stages have all run.
+
+    :param context: Snapshot being built.
+    :type context: _ItemExtractionContext
+    :param state: Item progress after the last stage.
+    :type state: _ItemStageState
+    :return: Item result.
+    :rtype: ExtractionItemResult
+    """
+    item = state.item
+    stats_delta = state.stats_delta
+    final_output = _final_output_from_stages(state.stage_outputs)
+    if final_output is None:
+        status = "errored" if state.error_type else "skipped"
+        if status == "errored":
+            stats_delta["errored_items"] = 1
+        else:
+            stats_delta["skipped_items"] = 1
+        return ExtractionItemResult(
+            item_id=item.id,
+            status=status,
+            final_text_relpath=None,
+            final_metadata_relpath=None,
+            final_stage_index=None,
+            final_stage_extractor_id=None,
+            final_producer_extractor_id=None,
+            final_source_stage_index=None,
+            error_type=state.error_type if status == "errored" else None,
+            error_message=state.error_message if status == "errored" else None,
+            stage_results=state.stage_results,
+        )
+
+    final_text = final_output.text or ""
+    final_text_relpath = write_extracted_text_artifact(
+        snapshot_dir=context.snapshot_dir, item=item, text=final_text
+    )
+    final_metadata_relpath = write_extracted_metadata_artifact(
+        snapshot_dir=context.snapshot_dir, item=item, metadata=final_output.metadata
+    )
+    alias_snapshot_dir = _ensure_extraction_alias_snapshot_dir(
+        corpus=context.corpus,
+        stage_extractor_id=final_output.extractor_id,
+        manifest=context.manifest,
+    )
+    _write_alias_text_artifact(
+        alias_snapshot_dir=alias_snapshot_dir,
+        item=item,
+        text=final_text,
+    )
+    _write_alias_metadata_artifact(
+        alias_snapshot_dir=alias_snapshot_dir,
+        item=item,
+        metadata=final_output.metadata,
+    )
+    stats_delta["extracted_items"] = 1
+    if final_text.strip():
+        stats_delta["extracted_nonempty_items"] = 1
+        if not _item_is_text(item):
+            stats_delta["converted_items"] = 1
+    else:
+        stats_delta["extracted_empty_items"] = 1
+
+    return ExtractionItemResult(
+        item_id=item.id,
+        status="extracted",
+        final_text_relpath=final_text_relpath,
+        final_metadata_relpath=final_metadata_relpath,
+        final_stage_index=final_output.stage_index,
+        final_stage_extractor_id=final_output.extractor_id,
+        final_producer_extractor_id=final_output.producer_extractor_id,
+        final_source_stage_index=final_output.source_stage_index,
+        error_type=None,
+        error_message=None,
+        stage_results=state.stage_results,
+    )
+
+
+def _run_item_stages(
+    context: _ItemExtractionContext,
+    items: Sequence[CatalogItem],
+    *,
+    cached_items: Dict[str, ExtractionItemResult],
+    on_stage: Optional[Callable[[str], None]] = None,
+) -> List[Tuple[ExtractionItemResult, Dict[str, int]]]:
+    """
+    Run the pipeline stages for a batch of items and write their artifacts.
+
+    Each stage runs for every item of the batch before the next stage starts, so extractors that
+    override :meth:`TextExtractor.extract_batch` receive the batch in one call. Stages whose
+    extractor does not support an item media type are recorded as skipped without calling the
+    extractor or checking for stage artifacts.
+
+    :param context: Snapshot being built.
+    :type context: _ItemExtractionContext
+    :param items: Catalog items to extract.
+    :type items: Sequence[CatalogItem]
+    :param cached_items: Results recorded by an earlier build, keyed by item identifier.
+    :type cached_items: dict[str, ExtractionItemResult]
+    :param on_stage: Optional callback receiving a label for the stage being run.
+    :type on_stage: Callable[[str], None] or None
+    :return: Result and stats delta for each item, in item order.
+    :rtype: list[tuple[ExtractionItemResult, dict[str, int]]]
+    :raises ExtractionSnapshotFatalError: If a stage reports a fatal error.
+    """
+    reused: Dict[str, Tuple[ExtractionItemResult, Dict[str, int]]] = {}
+    states: List[_ItemStageState] = []
+    for item in items:
+        stats_delta = _empty_stats_delta(item)
+        reused_result = _reuse_final_text(
+            context, item, cached_item=cached_items.get(item.id), stats_delta=stats_delta
+        )
+        if reused_result is not None:
+            reused[item.id] = (reused_result, stats_delta)
+        else:
+            states.append(_ItemStageState(item=item, stats_delta=stats_delta))
+
+    for stage_index, (stage, parsed_stage_config, stage_extractor) in enumerate(
+        context.stages, start=1
+    ):
+        pending: List[_ItemStageState] = []
+        for state in states:
+            if not stage_extractor.supports_media_type(state.item.media_type):
+                state.stats_delta["routed_stage_skips"] += 1
+                state.stage_results.append(_skipped_stage_result(stage_index, stage.extractor_id))
+                continue
+            if on_stage is not None:
+                on_stage(f"{stage.extractor_id}:{stage_index}")
+            if not context.force:
+                cached = _load_stage_cache(
+                    context.snapshot_dir,
+                    stage_index=stage_index,
+                    extractor_id=stage.extractor_id,
+                    item=state.item,
+                )
+                if cached:
+                    if on_stage is not None:
+                        on_stage(f"{stage.extractor_id}:{stage_index}:cache")
+                    cached_result, cached_output = cached
+                    state.stage_results.append(cached_result)
+                    state.stage_outputs.append(cached_output)
+                    continue
+            pending.append(state)
+        if not pending:
+            continue
+        outcomes = _extract_stage_texts(
+            context,
+            pending,
+            stage_extractor=stage_extractor,
+            stage_config=parsed_stage_config,
+        )
+        for state, outcome in zip(pending, outcomes):
+            _record_stage_outcome(
+                context,
+                state,
+                stage_index=stage_index,
+                extractor_id=stage.extractor_id,
+                outcome=outcome,
+            )
+
+    finished = {
+        state.item.id: (_finish_item(context, state), state.stats_delta) for state in states
+    }
+    return [reused[item.id] if item.id in reused else finished[item.id] for item in items]
+
+
+_PROCESS_WORKER_CONTEXT: Optional[_ItemExtractionContext] = None
+
+
+def _initialize_process_worker(
+    corpus_root: str,
+    manifest: ExtractionSnapshotManifest,
+    snapshot_dir: Path,
+    force: bool,
+    use_cache: bool,
+) -> None:
+    """
+    Open the corpus and resolve the pipeline extractors once per worker process.
+
+    :param corpus_root: Corpus root directory.
+    :type corpus_root: str
+    :param manifest: Extraction snapshot manifest.
+    :type manifest: ExtractionSnapshotManifest
+    :param snapshot_dir: Extraction snapshot directory.
+    :type snapshot_dir: Path
+    :param force: Whether to reprocess items even if artifacts already exist.
+    :type force: bool
+    :param use_cache: Whether to use the corpus extraction cache.
+    :type use_cache: bool
+    :return: None.
+    :rtype: None
+    """
+    global _PROCESS_WORKER_CONTEXT
+    pipeline_config = PipelineExtractorConfig.model_validate(manifest.configuration.configuration)
+    corpus = Corpus.open(corpus_root)
+    _PROCESS_WORKER_CONTEXT = _ItemExtractionContext(
+        corpus=corpus,
+        manifest=manifest,
+        snapshot_dir=snapshot_dir,
+        stages=_resolve_pipeline_stages(pipeline_config),
+        force=force,
+        cache=ExtractionCache.for_corpus(corpus) if use_cache else None,
+    )
+
+
+def _extract_items_in_process(
+    items: List[CatalogItem], cached_items: Dict[str, ExtractionItemResult]
+) -> List[Tuple[ExtractionItemResult, Dict[str, int]]]:
+    """
+    Extract a batch of items in a worker process set up by ``_initialize_process_worker``.
+
+    :param items: Catalog items to extract.
+    :type items: list[CatalogItem]
+    :param cached_items: Results recorded for the items by an earlier build.
+    :type cached_items: dict[str, ExtractionItemResult]
+    :return: Result and stats delta for each item, in item order.
+    :rtype: list[tuple[ExtractionItemResult, dict[str, int]]]
+    """
+    assert _PROCESS_WORKER_CONTEXT is not None
+    return _extract_items(_PROCESS_WORKER_CONTEXT, items, cached_items=cached_items)
+
+
+def _crashed_item_result(item: CatalogItem) -> Tuple[ExtractionItemResult, Dict[str, int]]:
+    """
+    Record an item whose worker process exited while extracting it.
+
+    :param item: Catalog item that crashed its worker.
+    :type item: CatalogItem
+    :return: Errored item result and the stats it contributes.
+    :rtype: tuple[ExtractionItemResult, dict[str, int]]
+    """
+    stats_delta = _empty_stats_delta(item)
+    stats_delta["errored_items"] = 1
+    return (
+        ExtractionItemResult(
+            item_id=item.id,
+            status="errored",
+            final_text_relpath=None,
+            final_metadata_relpath=None,
+            final_stage_index=None,
+            final_stage_extractor_id=None,
+            final_producer_extractor_id=None,
+            final_source_stage_index=None,
+            error_type="BrokenProcessPool",
+            error_message="Extraction worker process exited while extracting this item",
+            stage_results=[],
+        ),
+        stats_delta,
+    )
+
+
+def _run_bounded(
+    submit: Callable[
+        [List[CatalogItem]], "Future[List[Tuple[ExtractionItemResult, Dict[str, int]]]]"
+    ],
+    pending: Deque[List[CatalogItem]],
+    *,
+    max_in_flight: int,
+    record: Callable[[ExtractionItemResult, Dict[str, int]], None],
+) -> List[List[CatalogItem]]:
+    """
+    Submit pending batches with at most ``max_in_flight`` futures outstanding.
+
+    Batches are taken from the left of ``pending``. When a worker process dies, the pool is
+    broken: submission stops, unsubmitted batches stay in ``pending``, and the batches that were
+    in flight are returned so the caller can retry them.
+
+    :param submit: Callable that submits one batch of items and returns its future.
+    :type submit: Callable[[list[CatalogItem]], Future]
+    :param pending: Batches still to submit.
+    :type pending: collections.deque[list[CatalogItem]]
+    :param max_in_flight: Maximum number of outstanding futures.
+    :type max_in_flight: int
+    :param record: Callable receiving each completed item result and stats delta.
+    :type record: Callable[[ExtractionItemResult, dict[str, int]], None]
+    :return: Batches that were in flight when the pool broke.
+    :rtype: list[list[CatalogItem]]
+    :raises ExtractionSnapshotFatalError: If an item reports a fatal error.
+    """
+    in_flight: Dict[Future, List[CatalogItem]] = {}
+    broken_batches: List[List[CatalogItem]] = []
+    while True:
+        while not broken_batches and pending and len(in_flight) < max_in_flight:
+            batch = pending.popleft()
+            try:
+                in_flight[submit(batch)] = batch
+            except BrokenProcessPool:
+                pending.appendleft(batch)
+                broken_batches.extend(in_flight.values())
+                in_flight.clear()
+        if not in_flight:
+            return broken_batches
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            batch = in_flight.pop(future)
+            try:
+                results = future.result()
+            except BrokenProcessPool:
+                broken_batches.append(batch)
+                continue
+            for item_result, stats_delta in results:
+                record(item_result, stats_delta)
+
+
+def _run_in_process_pool(
+    context: _ItemExtractionContext,
+    batches: Sequence[List[CatalogItem]],
+    *,
+    cached_items: Dict[str, ExtractionItemResult],
+    max_workers: int,
+    record: Callable[[ExtractionItemResult, Dict[str, int]], None],
+) -> None:
+    """
+    Extract batches of items in worker processes, isolating items that crash their worker.
+
+    After a worker dies, the items of the batches that were in flight are retried one at a time
+    in a single-worker pool. An item that crashes that pool too is recorded as errored, and the
+    remaining batches continue in a fresh pool.
+
+    :param context: Snapshot being built.
+    :type context: _ItemExtractionContext
+    :param batches: Batches of catalog items to extract.
+    :type batches: Sequence[list[CatalogItem]]
+    :param cached_items: Results recorded by an earlier build, keyed by item identifier.
+    :type cached_items: dict[str, ExtractionItemResult]
+    :param max_workers: Number of worker processes.
+    :type max_workers: int
+    :param record: Callable receiving each item result and stats delta.
+    :type record: Callable[[ExtractionItemResult, dict[str, int]], None]
+    :return: None.
+    :rtype: None
+    :raises ExtractionSnapshotFatalError: If an item reports a fatal error.
+    """
+    initargs = (
+        str(context.corpus.root),
+        context.manifest,
+        context.snapshot_dir,
+        context.force,
+        context.cache is not None,
+    )
+
+    def _submit(pool: ProcessPoolExecutor, batch: List[CatalogItem]) -> Future:
+        batch_cached_items = {
+            item.id: cached_items[item.id] for item in batch if item.id in cached_items
+        }
+        return pool.submit(_extract_items_in_process, batch, batch_cached_items)
+
+    def _run(
+        pending: Deque[List[CatalogItem]], workers: int, max_in_flight: int
+    ) -> List[List[CatalogItem]]:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_initialize_process_worker, initargs=initargs
+        ) as pool:
+            return _run_bounded(
+                lambda batch: _submit(pool, batch),
+                pending,
+                max_in_flight=max_in_flight,
+                record=record,
+            )
+
+    pending: Deque[List[CatalogItem]] = deque(batches)
+    while pending:
+        broken_batches = _run(pending, max_workers, 2 * max_workers)
+        suspects: Deque[List[CatalogItem]] = deque(
+            [item] for batch in broken_batches for item in batch
+        )
+        while suspects:
+            for crashed_batch in _run(suspects, 1, 1):
+                record(*_crashed_item_result(crashed_batch[0]))
+
+
 def build_extraction_snapshot(
     corpus: Corpus,
     *,
@@ -465,10 +1505,24 @@ def build_extraction_snapshot(
     configuration: Dict[str, Any],
     force: bool = False,
     max_workers: int = 1,
+    executor: str = "thread",
+    cache: bool = True,
+    batch_size: int = DEFAULT_EXTRACTION_BATCH_SIZE,
 ) -> ExtractionSnapshotManifest:
     """
     Build an extraction snapshot for a corpus using the pipeline extractor.
 
+    Stage outputs are reused from the corpus extraction cache when an item with the same bytes
+    went through the same stage configuration before, in this or any other snapshot.
+
+    With ``executor="process"`` items are extracted in worker processes. Each worker resolves
+    the pipeline extractors once, and an item that crashes its worker is recorded as errored
+    without failing the build.
+
+    When a stage extractor overrides :meth:`TextExtractor.extract_batch`, items of one media type
+    are extracted in batches of up to ``batch_size`` items, and each such stage receives a batch
+    in one call.
+
     :param corpus: Corpus to extract from.
     :type corpus: Corpus
     :param extractor_id: Extractor plugin identifier (must be ``pipeline``).
@@ -481,15 +1535,25 @@ def build_extraction_snapshot(
     :type force: bool
     :param max_workers: Maximum number of concurrent workers.
     :type max_workers: int
+    :param executor: Worker kind, ``thread`` or ``process``.
+    :type executor: str
+    :param cache: Whether to use the corpus extraction cache.
+    :type cache: bool
+    :param batch_size: Maximum number of items passed to a batching extractor at once.
+    :type batch_size: int
     :return: Extraction snapshot manifest describing the build.
     :rtype: ExtractionSnapshotManifest
     :raises KeyError: If the extractor identifier is unknown.
-    :raises ValueError: If the extractor configuration is invalid.
+    :raises ValueError: If the extractor configuration, executor, or batch size is invalid.
     :raises OSError: If the snapshot directory or artifacts cannot be written.
     :raises ExtractionSnapshotFatalError: If the extractor is not the pipeline.
     """
     if max_workers < 1:
         raise ValueError("max_workers must be at least 1")
+    if executor not in EXTRACTION_EXECUTORS:
+        raise ValueError(f"executor must be one of: {', '.join(EXTRACTION_EXECUTORS)}")
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
 
     extractor = get_extractor(extractor_id)
     parsed_config = extractor.validate_config(configuration)
@@ -522,13 +1586,18 @@ def build_extraction_snapshot(
         else PipelineExtractorConfig.model_validate(parsed_config)
     )
 
-    validated_stages: List[Tuple[PipelineStageSpec, BaseModel]] = []
-    for stage in pipeline_config.stages:
-        stage_extractor = get_extractor(stage.extractor_id)
-        parsed_stage_config = stage_extractor.validate_config(stage.configuration)
-        validated_stages.append((stage, parsed_stage_config))
+    item_context = _ItemExtractionContext(
+        corpus=corpus,
+        manifest=manifest,
+        snapshot_dir=snapshot_dir,
+        stages=_resolve_pipeline_stages(pipeline_config),
+        force=force,
+        cache=ExtractionCache.for_corpus(corpus) if cache else None,
+    )
 
+    journal_path = snapshot_dir / EXTRACTION_JOURNAL_FILENAME
     previous_items = {item.item_id: item for item in (manifest.items or [])}
+    previous_items.update((item.item_id, item) for item in read_extraction_journal(journal_path))
     extracted_items: List[ExtractionItemResult] = []
     extracted_count = 0
     skipped_count = 0
@@ -538,6 +1607,13 @@ def build_extraction_snapshot(
     already_text_item_count = 0
     needs_extraction_item_count = 0
     converted_item_count = 0
+    batch_fallback_count = 0
+    cache_stats = {
+        "extraction_cache_hits": 0,
+        "extraction_cache_misses": 0,
+        "extraction_cache_evictions": 0,
+    }
+    media_type_totals: Dict[str, Dict[str, int]] = {}
     total_item_count = len(catalog.items)
     if total_item_count <= 25:
         log_interval = 1
@@ -549,24 +1625,18 @@ def build_extraction_snapshot(
     processed_count = 0
     print(
         f"[extract] building snapshot {manifest.snapshot_id} items={total_item_count} "
-        f"workers={max_workers}",
+        f"workers={max_workers} executor={executor}",
         flush=True,
         file=sys.stderr,
     )
-    def _write_partial_manifest() -> None:
-        stats = {
-            "total_items": total_item_count,
-            "already_text_items": already_text_item_count,
-            "needs_extraction_items": needs_extraction_item_count,
-            "extracted_items": extracted_count,
-            "extracted_nonempty_items": extracted_nonempty_count,
-            "extracted_empty_items": extracted_empty_count,
-            "skipped_items": skipped_count,
-            "errored_items": errored_count,
-            "converted_items": converted_item_count,
-        }
-        partial_manifest = manifest.model_copy(update={"items": extracted_items, "stats": stats})
-        write_extraction_snapshot_manifest(snapshot_dir=snapshot_dir, manifest=partial_manifest)
+    pending_journal_items: List[ExtractionItemResult] = []
+    last_journal_flush = time.perf_counter()
+
+    def _flush_journal() -> None:
+        nonlocal last_journal_flush
+        append_extraction_journal(journal_path, pending_journal_items)
+        pending_journal_items.clear()
+        last_journal_flush = time.perf_counter()
 
     lock = threading.Lock()
     progress_lock = threading.Lock()
@@ -592,307 +1662,6 @@ def build_extraction_snapshot(
     heartbeat_thread = threading.Thread(target=_heartbeat, daemon=True)
     heartbeat_thread.start()
 
-    def _load_stage_cache(
-        *, stage_index: int, extractor_id: str, item: CatalogItem
-    ) -> Optional[Tuple[ExtractionStageResult, ExtractionStageOutput]]:
-        stage_dir_name = _pipeline_stage_dir_name(stage_index=stage_index, extractor_id=extractor_id)
-        text_relpath = str(Path("stages") / stage_dir_name / "text" / f"{item.id}.txt")
-        text_path = snapshot_dir / text_relpath
-        if not text_path.is_file():
-            return None
-        text_value = text_path.read_text(encoding="utf-8")
-        metadata_relpath = str(Path("stages") / stage_dir_name / "metadata" / f"{item.id}.json")
-        metadata_path = snapshot_dir / metadata_relpath
-        metadata_value: Dict[str, Any] = {}
-        if metadata_path.is_file():
-            metadata_value = json.loads(metadata_path.read_text(encoding="utf-8"))
-        stage_result = ExtractionStageResult(
-            stage_index=stage_index,
-            extractor_id=extractor_id,
-            status="extracted",
-            text_relpath=text_relpath,
-            text_characters=len(text_value),
-            producer_extractor_id=extractor_id,
-            source_stage_index=None,
-            confidence=None,
-            metadata_relpath=metadata_relpath if metadata_path.is_file() else None,
-            error_type=None,
-            error_message=None,
-        )
-        stage_output = ExtractionStageOutput(
-            stage_index=stage_index,
-            extractor_id=extractor_id,
-            status="extracted",
-            text=text_value,
-            text_characters=len(text_value),
-            producer_extractor_id=extractor_id,
-            source_stage_index=None,
-            confidence=None,
-            metadata=metadata_value,
-            error_type=None,
-            error_message=None,
-        )
-        return stage_result, stage_output
-
-    def _build_item_result(item: CatalogItem) -> Tuple[ExtractionItemResult, Dict[str, int]]:
-        nonlocal current_item_id
-        nonlocal current_stage_label
-        media_type = item.media_type
-        item_is_text = media_type == "text/markdown" or media_type.startswith("text/")
-        stats_delta = {
-            "already_text_items": 1 if item_is_text else 0,
-            "needs_extraction_items": 0 if item_is_text else 1,
-            "extracted_items": 0,
-            "extracted_nonempty_items": 0,
-            "extracted_empty_items": 0,
-            "skipped_items": 0,
-            "errored_items": 0,
-            "converted_items": 0,
-        }
-
-        with progress_lock:
-            current_item_id = item.id
-            current_stage_label = "prepare"
-
-        final_text_relpath = str(Path("text") / f"{item.id}.txt")
-        final_metadata_relpath = str(Path("metadata") / f"{item.id}.json")
-        final_text_path = snapshot_dir / final_text_relpath
-
-        if not force and final_text_path.is_file():
-            final_text_value = final_text_path.read_text(encoding="utf-8")
-            cached_item = previous_items.get(item.id)
-            if cached_item and cached_item.final_stage_extractor_id:
-                alias_snapshot_dir = _ensure_extraction_alias_snapshot_dir(
-                    corpus=corpus,
-                    stage_extractor_id=cached_item.final_stage_extractor_id,
-                    manifest=manifest,
-                )
-                _write_alias_text_artifact(
-                    alias_snapshot_dir=alias_snapshot_dir,
-                    item=item,
-                    text=final_text_value,
-                )
-                metadata_value: Dict[str, Any] = {}
-                metadata_path = snapshot_dir / final_metadata_relpath
-                if metadata_path.is_file():
-                    metadata_value = json.loads(metadata_path.read_text(encoding="utf-8"))
-                _write_alias_metadata_artifact(
-                    alias_snapshot_dir=alias_snapshot_dir,
-                    item=item,
-                    metadata=metadata_value,
-                )
-            stats_delta["extracted_items"] = 1
-            if final_text_value.strip():
-                stats_delta["extracted_nonempty_items"] = 1
-                if not item_is_text:
-                    stats_delta["converted_items"] = 1
-            else:
-                stats_delta["extracted_empty_items"] = 1
-            if cached_item is not None:
-                return cached_item, stats_delta
-            return (
-                ExtractionItemResult(
-                    item_id=item.id,
-                    status="extracted",
-                    final_text_relpath=final_text_relpath,
-                    final_metadata_relpath=(
-                        final_metadata_relpath
-                        if (snapshot_dir / final_metadata_relpath).is_file()
-                        else None
-                    ),
-                    final_stage_index=None,
-                    final_stage_extractor_id=None,
-                    final_producer_extractor_id=None,
-                    final_source_stage_index=None,
-                    error_type=None,
-                    error_message=None,
-                    stage_results=[],
-                ),
-                stats_delta,
-            )
-
-        stage_results: List[ExtractionStageResult] = []
-        stage_outputs: List[ExtractionStageOutput] = []
-        last_error_type: Optional[str] = None
-        last_error_message: Optional[str] = None
-
-        for stage_index, (stage, parsed_stage_config) in enumerate(validated_stages, start=1):
-            with progress_lock:
-                current_stage_label = f"{stage.extractor_id}:{stage_index}"
-            if not force:
-                cached = _load_stage_cache(
-                    stage_index=stage_index,
-                    extractor_id=stage.extractor_id,
-                    item=item,
-                )
-                if cached:
-                    with progress_lock:
-                        current_stage_label = f"{stage.extractor_id}:{stage_index}:cache"
-                    cached_result, cached_output = cached
-                    stage_results.append(cached_result)
-                    stage_outputs.append(cached_output)
-                    continue
-            try:
-                stage_extractor = get_extractor(stage.extractor_id)
-                extracted_text = stage_extractor.extract_text(
-                    corpus=corpus,
-                    item=item,
-                    config=parsed_stage_config,
-                    previous_extractions=stage_outputs,
-                )
-            except Exception as extraction_error:
-                if isinstance(extraction_error, ExtractionSnapshotFatalError):
-                    raise
-                last_error_type = extraction_error.__class__.__name__
-                last_error_message = str(extraction_error)
-                stage_results.append(
-                    ExtractionStageResult(
-                        stage_index=stage_index,
-                        extractor_id=stage.extractor_id,
-                        status="errored",
-                        text_relpath=None,
-                        text_characters=0,
-                        producer_extractor_id=None,
-                        source_stage_index=None,
-                        error_type=last_error_type,
-                        error_message=last_error_message,
-                    )
-                )
-                continue
-
-            if extracted_text is None:
-                stage_results.append(
-                    ExtractionStageResult(
-                        stage_index=stage_index,
-                        extractor_id=stage.extractor_id,
-                        status="skipped",
-                        text_relpath=None,
-                        text_characters=0,
-                        producer_extractor_id=None,
-                        source_stage_index=None,
-                        error_type=None,
-                        error_message=None,
-                    )
-                )
-                continue
-
-            relpath = write_pipeline_stage_text_artifact(
-                snapshot_dir=snapshot_dir,
-                stage_index=stage_index,
-                extractor_id=stage.extractor_id,
-                item=item,
-                text=extracted_text.text,
-            )
-            metadata_relpath = write_pipeline_stage_metadata_artifact(
-                snapshot_dir=snapshot_dir,
-                stage_index=stage_index,
-                extractor_id=stage.extractor_id,
-                item=item,
-                metadata=extracted_text.metadata,
-            )
-            text_characters = len(extracted_text.text)
-            stage_results.append(
-                ExtractionStageResult(
-                    stage_index=stage_index,
-                    extractor_id=stage.extractor_id,
-                    status="extracted",
-                    text_relpath=relpath,
-                    text_characters=text_characters,
-                    producer_extractor_id=extracted_text.producer_extractor_id,
-                    source_stage_index=extracted_text.source_stage_index,
-                    confidence=extracted_text.confidence,
-                    metadata_relpath=metadata_relpath,
-                    error_type=None,
-                    error_message=None,
-                )
-            )
-            stage_outputs.append(
-                ExtractionStageOutput(
-                    stage_index=stage_index,
-                    extractor_id=stage.extractor_id,
-                    status="extracted",
-                    text=extracted_text.text,
-                    text_characters=text_characters,
-                    producer_extractor_id=extracted_text.producer_extractor_id,
-                    source_stage_index=extracted_text.source_stage_index,
-                    confidence=extracted_text.confidence,
-                    metadata=extracted_text.metadata,
-                    error_type=None,
-                    error_message=None,
-                )
-            )
-
-        final_output = _final_output_from_stages(stage_outputs)
-        if final_output is None:
-            status = "errored" if last_error_type else "skipped"
-            if status == "errored":
-                stats_delta["errored_items"] = 1
-            else:
-                stats_delta["skipped_items"] = 1
-            return (
-                ExtractionItemResult(
-                    item_id=item.id,
-                    status=status,
-                    final_text_relpath=None,
-                    final_metadata_relpath=None,
-                    final_stage_index=None,
-                    final_stage_extractor_id=None,
-                    final_producer_extractor_id=None,
-                    final_source_stage_index=None,
-                    error_type=last_error_type if status == "errored" else None,
-                    error_message=last_error_message if status == "errored" else None,
-                    stage_results=stage_results,
-                ),
-                stats_delta,
-            )
-
-        final_text = final_output.text or ""
-        final_text_relpath = write_extracted_text_artifact(
-            snapshot_dir=snapshot_dir, item=item, text=final_text
-        )
-        final_metadata_relpath = write_extracted_metadata_artifact(
-            snapshot_dir=snapshot_dir, item=item, metadata=final_output.metadata
-        )
-        alias_snapshot_dir = _ensure_extraction_alias_snapshot_dir(
-            corpus=corpus,
-            stage_extractor_id=final_output.extractor_id,
-            manifest=manifest,
-        )
-        _write_alias_text_artifact(
-            alias_snapshot_dir=alias_snapshot_dir,
-            item=item,
-            text=final_text,
-        )
-        _write_alias_metadata_artifact(
-            alias_snapshot_dir=alias_snapshot_dir,
-            item=item,
-            metadata=final_output.metadata,
-        )
-        stats_delta["extracted_items"] = 1
-        if final_text.strip():
-            stats_delta["extracted_nonempty_items"] = 1
-            if not item_is_text:
-                stats_delta["converted_items"] = 1
-        else:
-            stats_delta["extracted_empty_items"] = 1
-
-        return (
-            ExtractionItemResult(
-                item_id=item.id,
-                status="extracted",
-                final_text_relpath=final_text_relpath,
-                final_metadata_relpath=final_metadata_relpath,
-                final_stage_index=final_output.stage_index,
-                final_stage_extractor_id=final_output.extractor_id,
-                final_producer_extractor_id=final_output.producer_extractor_id,
-                final_source_stage_index=final_output.source_stage_index,
-                error_type=None,
-                error_message=None,
-                stage_results=stage_results,
-            ),
-            stats_delta,
-        )
-
     def _apply_result(item_result: ExtractionItemResult, stats_delta: Dict[str, int]) -> None:
         nonlocal extracted_count
         nonlocal skipped_count
@@ -902,6 +1671,7 @@ def build_extraction_snapshot(
         nonlocal already_text_item_count
         nonlocal needs_extraction_item_count
         nonlocal converted_item_count
+        nonlocal batch_fallback_count
         nonlocal processed_count
 
         extracted_items.append(item_result)
@@ -913,6 +1683,16 @@ def build_extraction_snapshot(
         already_text_item_count += stats_delta["already_text_items"]
         needs_extraction_item_count += stats_delta["needs_extraction_items"]
         converted_item_count += stats_delta["converted_items"]
+        batch_fallback_count += stats_delta["batch_fallback_items"]
+        for name in cache_stats:
+            cache_stats[name] += stats_delta[name]
+        media_type = catalog.items[item_result.item_id].media_type
+        totals = media_type_totals.setdefault(
+            media_type, {"items": 0, "routed_stage_skips": 0, "extraction_nanoseconds": 0}
+        )
+        totals["items"] += 1
+        totals["routed_stage_skips"] += stats_delta["routed_stage_skips"]
+        totals["extraction_nanoseconds"] += stats_delta["extraction_nanoseconds"]
         processed_count += 1
         if processed_count % log_interval == 0 or processed_count == total_item_count:
             elapsed = time.perf_counter() - start_time
@@ -924,33 +1704,70 @@ def build_extraction_snapshot(
                 flush=True,
                 file=sys.stderr,
             )
-        _write_partial_manifest()
-
-    def _process_and_record(item: CatalogItem) -> None:
-        item_result, stats_delta = _build_item_result(item)
+        pending_journal_items.append(item_result)
+        if (
+            len(pending_journal_items) >= EXTRACTION_JOURNAL_FLUSH_ITEMS
+            or time.perf_counter() - last_journal_flush >= EXTRACTION_JOURNAL_FLUSH_SECONDS
+        ):
+            _flush_journal()
+
+    def _record(item_result: ExtractionItemResult, stats_delta: Dict[str, int]) -> None:
         with lock:
             _apply_result(item_result, stats_delta)
 
-    if max_workers == 1:
-        try:
-            for item in catalog.items.values():
-                _process_and_record(item)
-        finally:
-            stop_event.set()
-            heartbeat_thread.join(timeout=1)
-    else:
-        try:
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = [
-                    executor.submit(_build_item_result, item) for item in catalog.items.values()
-                ]
-                for future in as_completed(futures):
-                    item_result, stats_delta = future.result()
-                    with lock:
-                        _apply_result(item_result, stats_delta)
-        finally:
-            stop_event.set()
-            heartbeat_thread.join(timeout=1)
+    def _set_stage(stage_label: str) -> None:
+        nonlocal current_stage_label
+        with progress_lock:
+            current_stage_label = stage_label
+
+    def _extract_tracked(
+        items: List[CatalogItem],
+    ) -> List[Tuple[ExtractionItemResult, Dict[str, int]]]:
+        nonlocal current_item_id
+        nonlocal current_stage_label
+        with progress_lock:
+            current_item_id = items[0].id
+            current_stage_label = "prepare"
+        return _extract_items(item_context, items, cached_items=previous_items, on_stage=_set_stage)
+
+    # Items of one media type run the same stages, so submit them together. Batches only help
+    # stages that extract several items in one call.
+    batches = _media_type_batches(
+        catalog.items.values(),
+        (
+            batch_size
+            if any(_prefers_batches(extractor) for _, _, extractor in item_context.stages)
+            else 1
+        ),
+    )
+    try:
+        if executor == "process":
+            _run_in_process_pool(
+                item_context,
+                batches,
+                cached_items=previous_items,
+                max_workers=max_workers,
+                record=_record,
+            )
+        elif max_workers == 1:
+            for batch in batches:
+                for item_result, stats_delta in _extract_tracked(batch):
+                    _record(item_result, stats_delta)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as thread_pool:
+                _run_bounded(
+                    lambda batch: thread_pool.submit(_extract_tracked, batch),
+                    deque(batches),
+                    max_in_flight=2 * max_workers,
+                    record=_record,
+                )
+    finally:
+        stop_event.set()
+        heartbeat_thread.join(timeout=1)
+        with lock:
+            _flush_journal()
+        if item_context.cache is not None:
+            item_context.cache.close()
 
     stats = {
         "total_items": total_item_count,
@@ -962,10 +1779,17 @@ def build_extraction_snapshot(
         "skipped_items": skipped_count,
         "errored_items": errored_count,
         "converted_items": converted_item_count,
+        "batch_fallback_items": batch_fallback_count,
+        **cache_stats,
+        "media_types": {
+            media_type: _media_type_throughput(totals)
+            for media_type, totals in sorted(media_type_totals.items())
+        },
     }
     manifest = manifest.model_copy(update={"items": extracted_items, "stats": stats})
     write_extraction_snapshot_manifest(snapshot_dir=snapshot_dir, manifest=manifest)
     write_extraction_latest_pointer(extractor_dir=snapshot_dir.parent, manifest=manifest)
+    journal_path.unlink(missing_ok=True)
 
     # Auto-sync catalog to Amplify if configured
     if os.getenv('AMPLIFY_AUTO_SYNC_CATALOG', 'false').lower() == 'true':
@@ -996,6 +1820,9 @@ def load_or_build_extraction_snapshot(
     configuration_name: str,
     configuration: Dict[str, Any],
     max_workers: int = 1,
+    executor: str = "thread",
+    cache: bool = True,
+    batch_size: int = DEFAULT_EXTRACTION_BATCH_SIZE,
 ) -> ExtractionSnapshotManifest:
     """
     Load an extraction snapshot if it exists or build it when missing.
@@ -1010,6 +1837,12 @@ def load_or_build_extraction_snapshot(
     :type configuration: dict[str, Any]
     :param max_workers: Maximum number of concurrent workers.
     :type max_workers: int
+    :param executor: Worker kind, ``thread`` or ``process``.
+    :type executor: str
+    :param cache: Whether to use the corpus extraction cache.
+    :type cache: bool
+    :param batch_size: Maximum number of items passed to a batching extractor at once.
+    :type batch_size: int
     :return: Extraction snapshot manifest describing the build.
     :rtype: ExtractionSnapshotManifest
     """
@@ -1048,4 +1881,7 @@ def load_or_build_extraction_snapshot(
         configuration_name=configuration_name,
         configuration=configuration,
         max_workers=max_workers,
+        executor=executor,
+        cache=cache,
+        batch_size=batch_size,
     )
@@ -0,0 +1,287 @@
+"""
+Content-addressed extraction cache shared across extraction snapshots of a corpus.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+
+from .constants import EXTRACTION_CACHE_FILENAME
+from .corpus import Corpus
+from .models import ExtractedText, ExtractionStageOutput
+
+DEFAULT_EXTRACTION_CACHE_MAX_ENTRIES = 100_000
+DEFAULT_EXTRACTION_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+EXTRACTION_CACHE_TOUCH_BATCH = 256
+
+
+def extraction_cache_stage_hash(
+    *,
+    configuration: BaseModel,
+    media_type: str,
+    previous_extractions: Sequence[ExtractionStageOutput],
+) -> str:
+    """
+    Derive the cache key component for a pipeline stage from everything its output depends on.
+
+    :param configuration: Parsed stage configuration.
+    :type configuration: pydantic.BaseModel
+    :param media_type: Item media type.
+    :type media_type: str
+    :param previous_extractions: Outputs of the earlier stages for the item.
+    :type previous_extractions: Sequence[biblicus.models.ExtractionStageOutput]
+    :return: Stage digest.
+    :rtype: str
+    """
+    payload = json.dumps(
+        {
+            "configuration": configuration.model_dump(mode="json"),
+            "media_type": media_type,
+            "previous_extractions": [
+                output.model_dump(mode="json") for output in previous_extractions
+            ],
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ExtractionCache:
+    """
+    Extracted text keyed by item content hash, extractor identifier, and stage hash.
+
+    Entries are stored in a SQLite database. When the cache holds more than ``max_entries``
+    entries or more than ``max_bytes`` of text and metadata, the least recently used entries are
+    evicted. One cache may be shared by several threads.
+
+    Hits are marked as recently used in memory and written in batches: by the next
+    :meth:`put`, by :meth:`close`, or once ``EXTRACTION_CACHE_TOUCH_BATCH`` hits are pending.
+    Hits that are never written only affect which entries are evicted first.
+
+    :ivar path: SQLite database path.
+    :vartype path: Path
+    :ivar max_entries: Maximum number of cached entries.
+    :vartype max_entries: int
+    :ivar max_bytes: Maximum total size of cached text and metadata, in bytes.
+    :vartype max_bytes: int
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_entries: int = DEFAULT_EXTRACTION_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_EXTRACTION_CACHE_MAX_BYTES,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._entries = 0
+        self._bytes = 0
+        self._touched: Dict[Tuple[str, str, str], int] = {}
+
+    @classmethod
+    def for_corpus(
+        cls,
+        corpus: Corpus,
+        *,
+        max_entries: int = DEFAULT_EXTRACTION_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_EXTRACTION_CACHE_MAX_BYTES,
+    ) -> "ExtractionCache":
+        """
+        Open the extraction cache stored in a corpus metadata directory.
+
+        :param corpus: Corpus that owns the cache.
+        :type corpus: Corpus
+        :param max_entries: Maximum number of cached entries.
+        :type max_entries: int
+        :param max_bytes: Maximum total size of cached text and metadata, in bytes.
+        :type max_bytes: int
+        :return: Extraction cache.
+        :rtype: ExtractionCache
+        """
+        return cls(
+            corpus.meta_dir / EXTRACTION_CACHE_FILENAME,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+        )
+
+    def get(self, item_sha256: str, extractor_id: str, stage_hash: str) -> Optional[ExtractedText]:
+        """
+        Return the cached output for a stage and mark it as recently used.
+
+        :param item_sha256: Secure Hash Algorithm 256 digest of the item bytes.
+        :type item_sha256: str
+        :param extractor_id: Stage extractor identifier.
+        :type extractor_id: str
+        :param stage_hash: Stage digest from :func:`extraction_cache_stage_hash`.
+        :type stage_hash: str
+        :return: Cached extracted text, or None on a miss.
+        :rtype: biblicus.models.ExtractedText or None
+        """
+        key = (item_sha256, extractor_id, stage_hash)
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT text, producer_extractor_id, source_stage_index, confidence, metadata "
+                "FROM extractions WHERE item_sha256 = ? AND extractor_id = ? AND stage_hash = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+            self._touched[key] = time.time_ns()
+            if len(self._touched) >= EXTRACTION_CACHE_TOUCH_BATCH:
+                self._write_touches(connection)
+                connection.commit()
+        text, producer_extractor_id, source_stage_index, confidence, metadata = row
+        return ExtractedText(
+            text=text,
+            producer_extractor_id=producer_extractor_id,
+            source_stage_index=source_stage_index,
+            confidence=confidence,
+            metadata=json.loads(metadata),
+        )
+
+    def put(
+        self, item_sha256: str, extractor_id: str, stage_hash: str, extracted: ExtractedText
+    ) -> int:
+        """
+        Store the output of a stage, evicting least recently used entries beyond the size bounds.
+
+        Outputs larger than ``max_bytes`` on their own are not stored.
+
+        :param item_sha256: Secure Hash Algorithm 256 digest of the item bytes.
+        :type item_sha256: str
+        :param extractor_id: Stage extractor identifier.
+        :type extractor_id: str
+        :param stage_hash: Stage digest from :func:`extraction_cache_stage_hash`.
+        :type stage_hash: str
+        :param extracted: Extracted text to store.
+        :type extracted: biblicus.models.ExtractedText
+        :return: Number of entries evicted.
+        :rtype: int
+        """
+        metadata = json.dumps(extracted.metadata, sort_keys=True)
+        size = len(extracted.text.encode("utf-8")) + len(metadata.encode("utf-8"))
+        if size > self.max_bytes:
+            return 0
+        key = (item_sha256, extractor_id, stage_hash)
+        with self._lock:
+            connection = self._connect()
+            self._write_touches(connection)
+            previous = connection.execute(
+                "SELECT size FROM extractions "
+                "WHERE item_sha256 = ? AND extractor_id = ? AND stage_hash = ?",
+                key,
+            ).fetchone()
+            connection.execute(
+                "INSERT OR REPLACE INTO extractions (item_sha256, extractor_id, stage_hash, text, "
+                "producer_extractor_id, source_stage_index, confidence, metadata, size, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    item_sha256,
+                    extractor_id,
+                    stage_hash,
+                    extracted.text,
+                    extracted.producer_extractor_id,
+                    extracted.source_stage_index,
+                    extracted.confidence,
+                    metadata,
+                    size,
+                    time.time_ns(),
+                ),
+            )
+            if previous is None:
+                self._entries += 1
+                self._bytes += size
+            else:
+                self._bytes += size - previous[0]
+            evicted = self._evict(connection)
+            connection.commit()
+        return evicted
+
+    def close(self) -> None:
+        """
+        Write pending hits and close the cache database connection.
+
+        :return: None.
+        :rtype: None
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._write_touches(self._connection)
+                self._connection.commit()
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), timeout=30.0, check_same_thread=False)
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS extractions (
+                    item_sha256 TEXT NOT NULL,
+                    extractor_id TEXT NOT NULL,
+                    stage_hash TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    producer_extractor_id TEXT NOT NULL,
+                    source_stage_index INTEGER,
+                    confidence REAL,
+                    metadata TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_used INTEGER NOT NULL,
+                    PRIMARY KEY (item_sha256, extractor_id, stage_hash)
+                )
+                """)
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS extractions_last_used ON extractions (last_used)"
+            )
+            self._count(connection)
+            self._connection = connection
+        return self._connection
+
+    def _count(self, connection: sqlite3.Connection) -> None:
+        self._entries, self._bytes = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM extractions"
+        ).fetchone()
+
+    def _write_touches(self, connection: sqlite3.Connection) -> None:
+        if not self._touched:
+            return
+        connection.executemany(
+            "UPDATE extractions SET last_used = ? "
+            "WHERE item_sha256 = ? AND extractor_id = ? AND stage_hash = ?",
+            [(last_used, *key) for key, last_used in self._touched.items()],
+        )
+        self._touched.clear()
+
+    def _evict(self, connection: sqlite3.Connection) -> int:
+        if self._entries <= self.max_entries and self._bytes <= self.max_bytes:
+            return 0
+        # Other processes may share the database, so recount before choosing what to evict.
+        self._count(connection)
+        rowids: List[int] = []
+        rows = connection.execute("SELECT rowid, size FROM extractions ORDER BY last_used, rowid")
+        while self._entries > self.max_entries or self._bytes > self.max_bytes:
+            rowid, size = rows.fetchone()
+            rowids.append(rowid)
+            self._entries -= 1
+            self._bytes -= size
+        rows.close()
+        connection.executemany("DELETE FROM extractions WHERE rowid = ?", [(r,) for r in rowids])
+        return len(rowids)
@@ -50,9 +50,15 @@ class AudioFormatConverterExtractor(TextExtractor):
 
     :ivar extractor_id: Extractor identifier.
     :vartype extractor_id: str
+    :ivar cacheable: False because extraction ingests the converted item.
+    :vartype cacheable: bool
+    :ivar supported_media_types: Media type patterns the extractor can produce text for.
+    :vartype supported_media_types: tuple[str, ...]
     """
 
     extractor_id = "audio-format-converter"
+    cacheable = False
+    supported_media_types = ("audio/*",)
 
     def validate_config(self, config: Dict[str, Any]) -> BaseModel:
         """
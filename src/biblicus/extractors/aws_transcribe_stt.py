@@ -64,9 +64,12 @@ class AwsTranscribeSpeechToTextExtractor(TextExtractor):
 
     :ivar extractor_id: Extractor identifier.
     :vartype extractor_id: str
+    :ivar supported_media_types: Media type patterns the extractor can produce text for.
+    :vartype supported_media_types: tuple[str, ...]
     """
 
     extractor_id = "stt-aws-transcribe"
+    supported_media_types = ("audio/*",)
 
     def validate_config(self, config: Dict[str, Any]) -> BaseModel:
         """
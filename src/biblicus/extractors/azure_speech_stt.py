@@ -51,9 +51,12 @@ class AzureSpeechToTextExtractor(TextExtractor):
 
     :ivar extractor_id: Extractor identifier.
     :vartype extractor_id: str
+    :ivar supported_media_types: Media type patterns the extractor can produce text for.
+    :vartype supported_media_types: tuple[str, ...]
     """
 
     extractor_id = "stt-azure-speech"
+    supported_media_types = ("audio/*",)
 
     def validate_config(self, config: Dict[str, Any]) -> BaseModel:
         """
@@ -5,7 +5,8 @@ Base interfaces for text extraction plugins.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from fnmatch import fnmatchcase
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -23,9 +24,36 @@ class TextExtractor(ABC):
 
     :ivar extractor_id: Identifier string for the extractor plugin.
     :vartype extractor_id: str
+    :ivar cacheable: Whether outputs may be reused from the corpus extraction cache. Outputs are
+        keyed by item bytes, media type, configuration, and earlier stage outputs, so extractors
+        that read other item fields, have side effects, or are cheaper than a cache lookup set
+        this to False.
+    :vartype cacheable: bool
+    :ivar supported_media_types: Media type patterns (for example ``audio/*``) the extractor can
+        produce text for, or None when it decides per item. Pipelines record stages as skipped
+        without calling the extractor for items whose media type matches none of the patterns.
+    :vartype supported_media_types: tuple[str, ...] or None
+
+    Extractors that load a model can override :meth:`extract_batch` to run several items through
+    it at once. Extraction builds call it when it is overridden.
     """
 
     extractor_id: str
+    cacheable: bool = True
+    supported_media_types: Optional[Tuple[str, ...]] = None
+
+    def supports_media_type(self, media_type: str) -> bool:
+        """
+        Report whether the extractor may produce text for a media type.
+
+        :param media_type: Item media type.
+        :type media_type: str
+        :return: False when the extractor declares media types and none match.
+        :rtype: bool
+        """
+        if self.supported_media_types is None:
+            return True
+        return any(fnmatchcase(media_type, pattern) for pattern in self.supported_media_types)
 
     @abstractmethod
     def validate_config(self, config: Dict[str, Any]) -> BaseModel:
@@ -66,3 +94,43 @@ class TextExtractor(ABC):
         :rtype: ExtractedText or None
         """
         raise NotImplementedError
+
+    def extract_batch(
+        self,
+        *,
+        corpus: Corpus,
+        items: Sequence[CatalogItem],
+        config: BaseModel,
+        previous_extractions: Sequence[List[ExtractionStageOutput]],
+    ) -> List[Union[ExtractedText, None, Exception]]:
+        """
+        Derive text for several catalog items with one configuration.
+
+        The default implementation calls :meth:`extract_text` once per item. Extractors override
+        it to load a model once or to run items through a model together. An override returns the
+        error an item raised in place of its result, so extraction builds record the error for
+        that item alone. An error the override raises, other than
+        :class:`biblicus.errors.ExtractionSnapshotFatalError`, is recorded for every item in the
+        batch. When an override returns the wrong number of results, extraction builds retry the
+        items one at a time with :meth:`extract_text`.
+
+        :param corpus: Corpus containing the item bytes.
+        :type corpus: Corpus
+        :param items: Catalog items to process.
+        :type items: Sequence[CatalogItem]
+        :param config: Parsed extractor configuration.
+        :type config: pydantic.BaseModel
+        :param previous_extractions: Prior stage outputs for each item, in item order.
+        :type previous_extractions: Sequence[list[biblicus.models.ExtractionStageOutput]]
+        :return: Extracted text payload, None, or the item's error for each item, in item order.
+        :rtype: list[ExtractedText or None or Exception]
+        """
+        return [
+            self.extract_text(
+                corpus=corpus,
+                item=item,
+                config=config,
+                previous_extractions=item_previous_extractions,
+            )
+            for item, item_previous_extractions in zip(items, previous_extractions)
+        ]
@@ -7,7 +7,7 @@ It supports PDF, Office documents (DOCX, XLSX, PPTX), HTML, and image formats.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -59,9 +59,12 @@ class DoclingGraniteExtractor(TextExtractor):
 
     :ivar extractor_id: Extractor identifier.
     :vartype extractor_id: str
+    :ivar supported_media_types: Media type patterns the extractor can produce text for.
+    :vartype supported_media_types: tuple[str, ...]
     """
 
     extractor_id = "docling-granite"
+    supported_media_types = (*sorted(DOCLING_SUPPORTED_MEDIA_TYPES), "image/*")
 
     def validate_config(self, config: Dict[str, Any]) -> BaseModel:
         """
@@ -139,16 +142,76 @@ class DoclingGraniteExtractor(TextExtractor):
         if not self._is_supported_media_type(item.media_type):
             return None
 
-        parsed_config = (
-            config
-            if isinstance(config, DoclingGraniteExtractorConfig)
-            else DoclingGraniteExtractorConfig.model_validate(config)
-        )
+        parsed_config = self._parse_config(config)
 
         source_path = corpus.root / item.relpath
         text = self._convert_document(source_path, parsed_config)
         return ExtractedText(text=text.strip(), producer_extractor_id=self.extractor_id)
 
+    def extract_batch(
+        self,
+        *,
+        corpus: Corpus,
+        items: Sequence[CatalogItem],
+        config: BaseModel,
+        previous_extractions: Sequence[List[ExtractionStageOutput]],
+    ) -> List[Union[ExtractedText, None, Exception]]:
+        """
+        Convert several document items with one Docling converter.
+
+        The supported items are passed to ``DocumentConverter.convert_all`` together, so the
+        vision-language model is loaded once per batch.
+
+        :param corpus: Corpus containing the item bytes.
+        :type corpus: Corpus
+        :param items: Catalog items being processed.
+        :type items: Sequence[CatalogItem]
+        :param config: Parsed configuration model.
+        :type config: DoclingGraniteExtractorConfig
+        :param previous_extractions: Prior stage outputs for each item within the pipeline.
+        :type previous_extractions: Sequence[list[biblicus.models.ExtractionStageOutput]]
+        :return: Extracted text payload, None for items that are not supported, or the error of
+            a document that failed to convert, in item order.
+        :rtype: list[ExtractedText or None or Exception]
+        """
+        _ = previous_extractions
+        parsed_config = self._parse_config(config)
+        results: List[Union[ExtractedText, None, Exception]] = [None] * len(items)
+        positions = [
+            position
+            for position, item in enumerate(items)
+            if self._is_supported_media_type(item.media_type)
+        ]
+        if not positions:
+            return results
+
+        from docling.document_converter import DocumentConverter
+
+        conversions = DocumentConverter().convert_all(
+            [str(corpus.root / items[position].relpath) for position in positions],
+            raises_on_error=False,
+        )
+        for position, conversion in zip(positions, conversions):
+            if conversion.status.name in ("SUCCESS", "PARTIAL_SUCCESS"):
+                text = self._export_document(conversion.document, parsed_config)
+                results[position] = ExtractedText(
+                    text=text.strip(), producer_extractor_id=self.extractor_id
+                )
+            else:
+                messages = "; ".join(error.error_message for error in conversion.errors)
+                results[position] = RuntimeError(
+                    f"Docling conversion {conversion.status.name.lower()}: {messages}"
+                )
+        return results
+
+    @staticmethod
+    def _parse_config(config: BaseModel) -> DoclingGraniteExtractorConfig:
+        return (
+            config
+            if isinstance(config, DoclingGraniteExtractorConfig)
+            else DoclingGraniteExtractorConfig.model_validate(config)
+        )
+
     def _is_supported_media_type(self, media_type: str) -> bool:
         """
         Check if a media type is supported by this extractor.
@@ -182,10 +245,13 @@ class DoclingGraniteExtractor(TextExtractor):
         # or model selection, not via explicit pipeline options
         converter = DocumentConverter()
         result = converter.convert(str(source_path))
+        return self._export_document(result.document, config)
 
+    @staticmethod
+    def _export_document(document: Any, config: DoclingGraniteExtractorConfig) -> str:
         if config.output_format == "html":
-            return result.document.export_to_html()
+            return document.export_to_html()
         elif config.output_format == "text":
-            return result.document.export_to_text()
+            return document.export_to_text()
         else:
-            return result.document.export_to_markdown()
+            return document.export_to_markdown()
@@ -8,7 +8,7 @@ No API costs, fully offline capable.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -53,9 +53,12 @@ class FasterWhisperSpeechToTextExtractor(TextExtractor):
 
     :ivar extractor_id: Extractor identifier.
     :vartype extractor_id: str
+    :ivar supported_media_types: Media type patterns the extractor can produce text for.
+    :vartype supported_media_types: tuple[str, ...]
     """
 
     extractor_id = "stt-faster-whisper"
+    supported_media_types = ("audio/*",)
 
     def validate_config(self, config: Dict[str, Any]) -> BaseModel:
         """
@@ -104,12 +107,60 @@ class FasterWhisperSpeechToTextExtractor(TextExtractor):
         if not item.media_type.startswith("audio/"):
             return None
 
-        parsed_config = (
+        parsed_config = self._parse_config(config)
+        model = self._load_model(parsed_config)
+        return self._transcribe(model, corpus=corpus, item=item, config=parsed_config)
+
+    def extract_batch(
+        self,
+        *,
+        corpus: Corpus,
+        items: Sequence[CatalogItem],
+        config: BaseModel,
+        previous_extractions: Sequence[List[ExtractionStageOutput]],
+    ) -> List[Union[ExtractedText, None, Exception]]:
+        """
+        Transcribe several audio items with one loaded Whisper model.
+
+        :param corpus: Corpus containing the item bytes.
+        :type corpus: Corpus
+        :param items: Catalog items being processed.
+        :type items: Sequence[CatalogItem]
+        :param config: Parsed configuration model.
+        :type config: FasterWhisperSpeechToTextExtractorConfig
+        :param previous_extractions: Prior stage outputs for each item within the pipeline.
+        :type previous_extractions: Sequence[list[biblicus.models.ExtractionStageOutput]]
+        :return: Extracted text payload, None for items that are not audio, or the error an
+            item raised, in item order.
+        :rtype: list[ExtractedText or None or Exception]
+        :raises ExtractionSnapshotFatalError: If the optional dependency is missing.
+        """
+        _ = previous_extractions
+        parsed_config = self._parse_config(config)
+        model = self._load_model(parsed_config)
+        results: List[Union[ExtractedText, None, Exception]] = []
+        for item in items:
+            if not item.media_type.startswith("audio/"):
+                results.append(None)
+                continue
+            try:
+                results.append(
+                    self._transcribe(model, corpus=corpus, item=item, config=parsed_config)
+                )
+            except Exception as transcription_error:
+                results.append(transcription_error)
+        return results
+
+    @staticmethod
+    def _parse_config(config: BaseModel) -> FasterWhisperSpeechToTextExtractorConfig:
+        return (
             config
             if isinstance(config, FasterWhisperSpeechToTextExtractorConfig)
             else FasterWhisperSpeechToTextExtractorConfig.model_validate(config)
         )
 
+    @staticmethod
+    def _load_model(config: FasterWhisperSpeechToTextExtractorConfig) -> Any:
         try:
             from faster_whisper import WhisperModel
         except ImportError as import_error:
@@ -118,20 +169,27 @@ class FasterWhisperSpeechToTextExtractor(TextExtractor):
                 'Install it with pip install "biblicus[faster-whisper]" or pip install faster-whisper.'
             ) from import_error
 
-        # Initialize model (cached per process)
-        model = WhisperModel(
-            parsed_config.model_size,
-            device=parsed_config.device,
-            compute_type=parsed_config.compute_type
+        return WhisperModel(
+            config.model_size,
+            device=config.device,
+            compute_type=config.compute_type
         )
 
+    def _transcribe(
+        self,
+        model: Any,
+        *,
+        corpus: Corpus,
+        item: CatalogItem,
+        config: FasterWhisperSpeechToTextExtractorConfig,
+    ) -> ExtractedText:
         source_path = corpus.root / item.relpath
 
         # Transcribe audio
         segments, info = model.transcribe(
             str(source_path),
-            language=parsed_config.language,
-            beam_size=parsed_config.beam_size
+            language=config.language,
+            beam_size=config.beam_size
         )
 
         # Collect all segments
@@ -145,9 +203,9 @@ class FasterWhisperSpeechToTextExtractor(TextExtractor):
             text=transcript_text.strip(),
             producer_extractor_id=self.extractor_id,
             metadata={
-                "model": parsed_config.model_size,
+                "model": config.model_size,
                 "language": info.language,
                 "language_probability": info.language_probability,
-                "duration": info.duration
-            }
+                "duration": info.duration,
+            },
         )
@@ -12,7 +12,7 @@ then pass region metadata to downstream OCR extractors.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -54,9 +54,12 @@ class HeronLayoutExtractor(TextExtractor):
 
     :ivar extractor_id: Extractor identifier.
     :vartype extractor_id: str
+    :ivar supported_media_types: Media type patterns the extractor can produce text for.
+    :vartype supported_media_types: tuple[str, ...]
     """
 
     extractor_id = "heron-layout"
+    supported_media_types = ("image/*",)
 
     def validate_config(self, config: Dict[str, Any]) -> BaseModel:
         """
@@ -109,20 +112,70 @@ class HeronLayoutExtractor(TextExtractor):
         _ = previous_extractions
 
         # Only process image files
-        if not item.media_type or not item.media_type.startswith("image/"):
+        if not _is_image(item):
             return None
 
-        parsed_config = (
+        parsed_config = self._parse_config(config)
+        image = self._open_image(corpus.root / item.relpath)
+        image_processor, model = self._load_model(parsed_config)
+        layout_result = self._detect_layouts(image_processor, model, [image], parsed_config)[0]
+        return self._layout_text(layout_result)
+
+    def extract_batch(
+        self,
+        *,
+        corpus: Corpus,
+        items: Sequence[CatalogItem],
+        config: BaseModel,
+        previous_extractions: Sequence[List[ExtractionStageOutput]],
+    ) -> List[Union[ExtractedText, None, Exception]]:
+        """
+        Detect the layout of several document images with one loaded Heron model.
+
+        The images are passed through the model together.
+
+        :param corpus: Corpus containing the item bytes.
+        :type corpus: Corpus
+        :param items: Catalog items being processed.
+        :type items: Sequence[CatalogItem]
+        :param config: Parsed configuration model.
+        :type config: HeronLayoutConfig
+        :param previous_extractions: Prior stage outputs for each item within the pipeline.
+        :type previous_extractions: Sequence[list[biblicus.models.ExtractionStageOutput]]
+        :return: ExtractedText with layout metadata, None for items that are not images, or the
+            error an image raised when it was read, in item order.
+        :rtype: list[ExtractedText or None or Exception]
+        """
+        _ = previous_extractions
+        parsed_config = self._parse_config(config)
+        results: List[Union[ExtractedText, None, Exception]] = [None] * len(items)
+        positions: List[int] = []
+        images: List[Any] = []
+        for position, item in enumerate(items):
+            if not _is_image(item):
+                continue
+            try:
+                images.append(self._open_image(corpus.root / item.relpath))
+            except Exception as image_error:
+                results[position] = image_error
+                continue
+            positions.append(position)
+        if images:
+            image_processor, model = self._load_model(parsed_config)
+            layout_results = self._detect_layouts(image_processor, model, images, parsed_config)
+            for position, layout_result in zip(positions, layout_results):
+                results[position] = self._layout_text(layout_result)
+        return results
+
+    @staticmethod
+    def _parse_config(config: BaseModel) -> HeronLayoutConfig:
+        return (
             config
             if isinstance(config, HeronLayoutConfig)
             else HeronLayoutConfig.model_validate(config)
         )
 
-        source_path = corpus.root / item.relpath
-
-        # Detect layout
-        layout_result = self._detect_layout(source_path, parsed_config)
-
+    def _layout_text(self, layout_result: Dict[str, Any]) -> ExtractedText:
         # Return empty text with layout metadata
         return ExtractedText(
             text="",  # Layout detection doesn't produce text, only metadata
@@ -130,21 +183,17 @@ class HeronLayoutExtractor(TextExtractor):
             producer_extractor_id=self.extractor_id,
         )
 
-    def _detect_layout(
-        self, source_path: Path, config: HeronLayoutConfig
-    ) -> Dict[str, Any]:
-        """
-        Detect document layout using IBM Heron models.
-
-        :param source_path: Path to the source image.
-        :type source_path: pathlib.Path
-        :param config: Parsed configuration.
-        :type config: HeronLayoutConfig
-        :return: Layout metadata with regions and reading order.
-        :rtype: dict
-        """
-        import torch
+    @staticmethod
+    def _open_image(source_path: Path) -> Any:
         from PIL import Image
+
+        image = Image.open(source_path).convert("RGB")
+        if image is None:
+            raise ValueError(f"Failed to read image: {source_path}")
+        return image
+
+    @staticmethod
+    def _load_model(config: HeronLayoutConfig) -> Tuple[Any, Any]:
         from transformers import RTDetrImageProcessor, RTDetrV2ForObjectDetection
 
         # Select model based on variant
@@ -157,61 +206,79 @@ class HeronLayoutExtractor(TextExtractor):
         # Note: First run will download models (~150MB for heron-101)
         image_processor = RTDetrImageProcessor.from_pretrained(model_name)
         model = RTDetrV2ForObjectDetection.from_pretrained(model_name)
+        return image_processor, model
 
-        # Read image
-        image = Image.open(source_path).convert("RGB")
-        if image is None:
-            raise ValueError(f"Failed to read image: {source_path}")
+    def _detect_layouts(
+        self, image_processor: Any, model: Any, images: List[Any], config: HeronLayoutConfig
+    ) -> List[Dict[str, Any]]:
+        """
+        Detect document layout for several images using IBM Heron models.
+
+        :param image_processor: Loaded Heron image processor.
+        :type image_processor: Any
+        :param model: Loaded Heron detection model.
+        :type model: Any
+        :param images: Images in RGB mode.
+        :type images: list[Any]
+        :param config: Parsed configuration.
+        :type config: HeronLayoutConfig
+        :return: Layout metadata with regions and reading order for each image, in image order.
+        :rtype: list[dict]
+        """
+        import torch
 
         # Prepare inputs
-        inputs = image_processor(images=[image], return_tensors="pt")
+        inputs = image_processor(images=images, return_tensors="pt")
 
         # Detect layout
         with torch.no_grad():
             outputs = model(**inputs)
 
         # Post-process detections
-        target_sizes = torch.tensor([image.size[::-1]])  # (height, width)
+        target_sizes = torch.tensor([image.size[::-1] for image in images])  # (height, width)
         results = image_processor.post_process_object_detection(
             outputs,
             target_sizes=target_sizes,
             threshold=config.confidence_threshold
         )
 
+        # Get label names from model config
+        id2label = model.config.id2label
+        return [self._layout_metadata(result, id2label, config) for result in results]
+
+    @staticmethod
+    def _layout_metadata(
+        result: Dict[str, Any], id2label: Dict[int, str], config: HeronLayoutConfig
+    ) -> Dict[str, Any]:
         # Extract regions from results
         regions = []
-        if results:
-            result = results[0]
-            boxes = result.get("boxes", [])
-            scores = result.get("scores", [])
-            labels = result.get("labels", [])
-
-            # Get label names from model config
-            id2label = model.config.id2label
-
-            # Sort by reading order (top to bottom, left to right)
-            detections = list(zip(boxes, scores, labels))
-            detections.sort(key=lambda x: (x[0][1].item(), x[0][0].item()))  # Sort by y, then x
-
-            for idx, (box, score, label_id) in enumerate(detections):
-                # Convert box tensor to list [x1, y1, x2, y2]
-                bbox = [
-                    float(box[0].item()),
-                    float(box[1].item()),
-                    float(box[2].item()),
-                    float(box[3].item())
-                ]
-
-                # Get label name
-                label_name = id2label.get(int(label_id.item()), "unknown")
-
-                regions.append({
-                    "id": idx + 1,
-                    "type": label_name,
-                    "bbox": bbox,
-                    "score": float(score.item()),
-                    "order": idx + 1,
-                })
+        boxes = result.get("boxes", [])
+        scores = result.get("scores", [])
+        labels = result.get("labels", [])
+
+        # Sort by reading order (top to bottom, left to right)
+        detections = list(zip(boxes, scores, labels))
+        detections.sort(key=lambda x: (x[0][1].item(), x[0][0].item()))  # Sort by y, then x
+
+        for idx, (box, score, label_id) in enumerate(detections):
+            # Convert box tensor to list [x1, y1, x2, y2]
+            bbox = [
+                float(box[0].item()),
+                float(box[1].item()),
+                float(box[2].item()),
+                float(box[3].item())
+            ]
+
+            # Get label name
+            label_name = id2label.get(int(label_id.item()), "unknown")
+
+            regions.append({
+                "id": idx + 1,
+                "type": label_name,
+                "bbox": bbox,
+                "score": float(score.item()),
+                "order": idx + 1,
+            })
 
         return {
             "layout_detector": f"heron-{config.model_variant}",
@@ -220,3 +287,7 @@ class HeronLayoutExtractor(TextExtractor):
             "num_regions": len(regions),
             "confidence_threshold": config.confidence_threshold,
         }
+
+
+def _is_image(item: CatalogItem) -> bool:
+    return bool(item.media_type) and item.media_type.startswith("image/")
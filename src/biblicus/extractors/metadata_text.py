@@ -47,9 +47,12 @@ class MetadataTextExtractor(TextExtractor):
 
     :ivar extractor_id: Extractor identifier.
     :vartype extractor_id: str
+    :ivar cacheable: False because the output depends on item metadata, not item bytes.
+    :vartype cacheable: bool
     """
 
     extractor_id = "metadata-text"
+    cacheable = False
 
     def validate_config(self, config: Dict[str, Any]) -> BaseModel:
         """
@@ -46,9 +46,12 @@ class PaddleOCRLayoutExtractor(TextExtractor):
 
     :ivar extractor_id: Extractor identifier.
     :vartype extractor_id: str
+    :ivar supported_media_types: Media type patterns the extractor can produce text for.
+    :vartype supported_media_types: tuple[str, ...]
     """
 
     extractor_id = "paddleocr-layout"
+    supported_media_types = ("image/*",)
 
     def validate_config(self, config: Dict[str, Any]) -> BaseModel:
         """
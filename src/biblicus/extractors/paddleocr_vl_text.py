@@ -58,9 +58,12 @@ class PaddleOcrVlExtractor(TextExtractor):
 
     :ivar extractor_id: Extractor identifier.
     :vartype extractor_id: str
+    :ivar supported_media_types: Media type patterns the extractor can produce text for.
+    :vartype supported_media_types: tuple[str, ...]
     """
 
     extractor_id = "ocr-paddleocr-vl"
+    supported_media_types = ("image/*",)
 
     _model_cache: ClassVar[Dict[Tuple[str, bool], Any]] = {}
 
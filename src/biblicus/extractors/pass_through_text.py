@@ -32,9 +32,15 @@ class PassThroughTextExtractor(TextExtractor):
 
     :ivar extractor_id: Extractor identifier.
     :vartype extractor_id: str
+    :ivar cacheable: False because reading the item is as cheap as a cache lookup.
+    :vartype cacheable: bool
+    :ivar supported_media_types: Media type patterns the extractor can produce text for.
+    :vartype supported_media_types: tuple[str, ...]
     """
 
     extractor_id = "pass-through-text"
+    cacheable = False
+    supported_media_types = ("text/*",)
 
     def validate_config(self, config: Dict[str, Any]) -> BaseModel:
         """
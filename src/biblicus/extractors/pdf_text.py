@@ -36,9 +36,12 @@ class PortableDocumentFormatTextExtractor(TextExtractor):
 
     :ivar extractor_id: Extractor identifier.
     :vartype extractor_id: str
+    :ivar supported_media_types: Media type patterns the extractor can produce text for.
+    :vartype supported_media_types: tuple[str, ...]
     """
 
     extractor_id = "pdf-text"
+    supported_media_types = ("application/pdf",)
 
     def validate_config(self, config: Dict[str, Any]) -> BaseModel:
         """
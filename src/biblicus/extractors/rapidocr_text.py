@@ -7,7 +7,7 @@ from image items without requiring a separate daemon.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -42,9 +42,12 @@ class RapidOcrExtractor(TextExtractor):
 
     :ivar extractor_id: Extractor identifier.
     :vartype extractor_id: str
+    :ivar supported_media_types: Media type patterns the extractor can produce text for.
+    :vartype supported_media_types: tuple[str, ...]
     """
 
     extractor_id = "ocr-rapidocr"
+    supported_media_types = ("image/*",)
 
     def validate_config(self, config: Dict[str, Any]) -> BaseModel:
         """
@@ -89,20 +92,71 @@ class RapidOcrExtractor(TextExtractor):
         :rtype: ExtractedText or None
         """
         _ = previous_extractions
-        media_type = item.media_type
-        if not media_type.startswith("image/"):
+        if not item.media_type.startswith("image/"):
             return None
 
-        parsed_config = (
+        from rapidocr_onnxruntime import RapidOCR
+
+        return self._recognize(
+            RapidOCR(), corpus=corpus, item=item, config=self._parse_config(config)
+        )
+
+    def extract_batch(
+        self,
+        *,
+        corpus: Corpus,
+        items: Sequence[CatalogItem],
+        config: BaseModel,
+        previous_extractions: Sequence[List[ExtractionStageOutput]],
+    ) -> List[Union[ExtractedText, None, Exception]]:
+        """
+        Extract text from several image items with one optical character recognition engine.
+
+        :param corpus: Corpus containing the item bytes.
+        :type corpus: Corpus
+        :param items: Catalog items being processed.
+        :type items: Sequence[CatalogItem]
+        :param config: Parsed configuration model.
+        :type config: RapidOcrExtractorConfig
+        :param previous_extractions: Prior stage outputs for each item within the pipeline.
+        :type previous_extractions: Sequence[list[biblicus.models.ExtractionStageOutput]]
+        :return: Extracted text payload, None for items that are not images, or the error an
+            item raised, in item order.
+        :rtype: list[ExtractedText or None or Exception]
+        """
+        _ = previous_extractions
+        from rapidocr_onnxruntime import RapidOCR
+
+        parsed_config = self._parse_config(config)
+        ocr = RapidOCR()
+        results: List[Union[ExtractedText, None, Exception]] = []
+        for item in items:
+            if not item.media_type.startswith("image/"):
+                results.append(None)
+                continue
+            try:
+                results.append(self._recognize(ocr, corpus=corpus, item=item, config=parsed_config))
+            except Exception as recognition_error:
+                results.append(recognition_error)
+        return results
+
+    @staticmethod
+    def _parse_config(config: BaseModel) -> RapidOcrExtractorConfig:
+        return (
             config
             if isinstance(config, RapidOcrExtractorConfig)
             else RapidOcrExtractorConfig.model_validate(config)
         )
 
-        from rapidocr_onnxruntime import RapidOCR
-
+    def _recognize(
+        self,
+        ocr: Any,
+        *,
+        corpus: Corpus,
+        item: CatalogItem,
+        config: RapidOcrExtractorConfig,
+    ) -> ExtractedText:
         source_path = corpus.root / item.relpath
-        ocr = RapidOCR()
         result, _elapsed = ocr(str(source_path))
 
         if result is None:
@@ -120,14 +174,14 @@ class RapidOcrExtractor(TextExtractor):
             if not isinstance(confidence_value, (int, float)):
                 continue
             confidence = float(confidence_value)
-            if confidence < parsed_config.min_confidence:
+            if confidence < config.min_confidence:
                 continue
             cleaned = text_value.strip()
             if cleaned:
                 lines.append(cleaned)
                 confidences.append(confidence)
 
-        text = parsed_config.joiner.join(lines).strip()
+        text = config.joiner.join(lines).strip()
         avg_confidence = sum(confidences) / len(confidences) if confidences else None
         return ExtractedText(
             text=text,
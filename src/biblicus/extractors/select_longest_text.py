@@ -40,9 +40,12 @@ class SelectLongestTextExtractor(TextExtractor):
 
     :ivar extractor_id: Extractor identifier.
     :vartype extractor_id: str
+    :ivar cacheable: False because selection is cheaper than a cache lookup.
+    :vartype cacheable: bool
     """
 
     extractor_id = "select-longest-text"
+    cacheable = False
 
     def validate_config(self, config: Dict[str, Any]) -> BaseModel:
         """
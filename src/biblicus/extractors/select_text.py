@@ -35,9 +35,12 @@ class SelectTextExtractor(TextExtractor):
 
     :ivar extractor_id: Extractor identifier.
     :vartype extractor_id: str
+    :ivar cacheable: False because selection is cheaper than a cache lookup.
+    :vartype cacheable: bool
     """
 
     extractor_id = "select-text"
+    cacheable = False
 
     def validate_config(self, config: Dict[str, Any]) -> BaseModel:
         """
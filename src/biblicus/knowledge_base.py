@@ -21,6 +21,7 @@ from .context import (
 from .corpus import Corpus
 from .models import QueryBudget, RetrievalResult, RetrievalSnapshot
 from .retrievers import get_retriever
+from .retrievers.opened_snapshots import opened_snapshots
 
 
 class KnowledgeBaseDefaults(BaseModel):
@@ -153,6 +154,9 @@ class KnowledgeBase:
         """
         Query the knowledge base for evidence.
 
+        The snapshot stays open in the process-wide registry, so repeated queries reuse its
+        loaded artifacts.
+
         :param query_text: Query text to execute.
         :type query_text: str
         :param budget: Optional budget override.
@@ -160,14 +164,8 @@ class KnowledgeBase:
         :return: Retrieval result containing evidence.
         :rtype: RetrievalResult
         """
-        retriever = get_retriever(self.retriever_id)
-        resolved_budget = budget or self.defaults.query_budget
-        return retriever.query(
-            self.corpus,
-            snapshot=self.snapshot,
-            query_text=query_text,
-            budget=resolved_budget,
-        )
+        with opened_snapshots().open(self.corpus, self.snapshot.snapshot_id) as opened:
+            return opened.query(query_text, budget=budget or self.defaults.query_budget)
 
     def context_pack(
         self,
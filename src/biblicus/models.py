@@ -360,6 +360,8 @@ class RetrievalSnapshot(BaseModel):
     :vartype snapshot_artifacts: list[str]
     :ivar stats: Retriever-specific snapshot statistics.
     :vartype stats: dict[str, Any]
+    :ivar parent_snapshot_id: Snapshot this one was built from incrementally, if any.
+    :vartype parent_snapshot_id: str or None
     """
 
     model_config = ConfigDict(extra="forbid")
@@ -371,6 +373,7 @@ class RetrievalSnapshot(BaseModel):
     created_at: str
     snapshot_artifacts: List[str] = Field(default_factory=list)
     stats: Dict[str, Any] = Field(default_factory=dict)
+    parent_snapshot_id: Optional[str] = None
 
 
 class RetrievalResult(BaseModel):
@@ -7,6 +7,7 @@ from __future__ import annotations
 from typing import Dict, Type
 
 from .base import Retriever
+from .embedding_index_ann import EmbeddingIndexAnnRetriever
 from .embedding_index_file import EmbeddingIndexFileRetriever
 from .embedding_index_inmemory import EmbeddingIndexInMemoryRetriever
 from .hybrid import HybridRetriever
@@ -23,6 +24,7 @@ def available_retrievers() -> Dict[str, Type[Retriever]]:
     :rtype: dict[str, Type[Retriever]]
     """
     return {
+        EmbeddingIndexAnnRetriever.retriever_id: EmbeddingIndexAnnRetriever,
         EmbeddingIndexFileRetriever.retriever_id: EmbeddingIndexFileRetriever,
         EmbeddingIndexInMemoryRetriever.retriever_id: EmbeddingIndexInMemoryRetriever,
         HybridRetriever.retriever_id: HybridRetriever,
@@ -5,22 +5,55 @@ Retriever interface for Biblicus retrieval engines.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Dict, List, Sequence, Tuple, TypeVar
 
 from ..corpus import Corpus
 from ..models import QueryBudget, RetrievalResult, RetrievalSnapshot
 
+StateT = TypeVar("StateT")
+
+SNAPSHOT_STATE_LIMIT = 4
+
+_SNAPSHOT_STATE_CACHE_LOCK = Lock()
+
 
 class Retriever(ABC):
     """
     Abstract interface for retrievers.
 
+    A retriever instance may keep state opened for the snapshots it queries, such as parsed
+    configuration and memory-mapped artifacts, so long-lived processes do not reload them on
+    every query. Snapshot artifacts are immutable once built, but anything resolved from the
+    corpus while opening the state, such as the latest extraction snapshot for a manifest that
+    does not record one, is kept as it was until the state is dropped or :meth:`close` is called.
+
     :ivar retriever_id: Identifier string for the retriever.
     :vartype retriever_id: str
     """
 
     retriever_id: str
 
+    def _snapshot_state_cache(
+        self,
+    ) -> "Tuple[OrderedDict[Tuple[str, str, Tuple[str, ...]], object], Lock]":
+        """
+        Return the snapshot state cache and its lock, creating them on first use.
+
+        The cache is created lazily so subclasses that define ``__init__`` without calling
+        ``super().__init__()`` still get one.
+
+        :return: Snapshot states keyed by snapshot, configuration, and artifacts, and the lock
+            guarding them.
+        :rtype: tuple[collections.OrderedDict[tuple, object], threading.Lock]
+        """
+        cache = self.__dict__.get("_snapshot_states")
+        if cache is None:
+            with _SNAPSHOT_STATE_CACHE_LOCK:
+                cache = self.__dict__.setdefault("_snapshot_states", (OrderedDict(), Lock()))
+        return cache
+
     @abstractmethod
     def build_snapshot(
         self, corpus: Corpus, *, configuration_name: str, configuration: Dict[str, object]
@@ -63,3 +96,80 @@ class Retriever(ABC):
         :rtype: RetrievalResult
         """
         raise NotImplementedError
+
+    def query_batch(
+        self,
+        corpus: Corpus,
+        *,
+        snapshot: RetrievalSnapshot,
+        query_texts: Sequence[str],
+        budget: QueryBudget,
+    ) -> List[RetrievalResult]:
+        """
+        Run several retrieval queries against a retriever with one budget.
+
+        The default implementation calls :meth:`query` once per query text. Retrievers override
+        it to share artifact loading, embedding calls, or connections across the batch.
+
+        :param corpus: Corpus associated with the snapshot.
+        :type corpus: Corpus
+        :param snapshot: Snapshot manifest to use for querying.
+        :type snapshot: RetrievalSnapshot
+        :param query_texts: Query texts to execute.
+        :type query_texts: Sequence[str]
+        :param budget: Evidence selection budget applied to every query.
+        :type budget: QueryBudget
+        :return: Retrieval results in query order.
+        :rtype: list[RetrievalResult]
+        """
+        return [
+            self.query(corpus, snapshot=snapshot, query_text=query_text, budget=budget)
+            for query_text in query_texts
+        ]
+
+    def close(self) -> None:
+        """
+        Release resources the retriever keeps between queries, such as open connections.
+
+        The default implementation drops the state opened for snapshots. The retriever stays
+        usable after closing and reacquires resources on the next query.
+
+        :return: None.
+        :rtype: None
+        """
+        states, lock = self._snapshot_state_cache()
+        with lock:
+            states.clear()
+
+    def snapshot_state(self, snapshot: RetrievalSnapshot, load: Callable[[], StateT]) -> StateT:
+        """
+        Return the state opened for a snapshot, loading it on first use.
+
+        State is keyed by snapshot identifier, configuration identifier, and artifact paths, so a
+        manifest whose configuration or artifacts were replaced in memory gets its own state. Up
+        to ``SNAPSHOT_STATE_LIMIT`` states are kept per retriever; the least recently used one is
+        dropped beyond that.
+
+        :param snapshot: Snapshot the state belongs to.
+        :type snapshot: RetrievalSnapshot
+        :param load: Callable that opens the state.
+        :type load: Callable[[], StateT]
+        :return: Opened state.
+        :rtype: StateT
+        """
+        key = (
+            snapshot.snapshot_id,
+            snapshot.configuration.configuration_id,
+            tuple(snapshot.snapshot_artifacts),
+        )
+        states, lock = self._snapshot_state_cache()
+        with lock:
+            if key in states:
+                states.move_to_end(key)
+                return states[key]  # type: ignore[return-value]
+        state = load()
+        with lock:
+            states[key] = state
+            while len(states) > SNAPSHOT_STATE_LIMIT:
+                states.popitem(last=False)
+        return state
@@ -0,0 +1,437 @@
+"""
+Embedding-index retriever that answers queries from an inverted-file approximate index.
+"""
+
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from pydantic import ConfigDict, Field
+
+from ..corpus import Corpus
+from ..embedding_providers import _l2_normalize_rows
+from ..models import (
+    Evidence,
+    ExtractionSnapshotReference,
+    QueryBudget,
+    RetrievalResult,
+    RetrievalSnapshot,
+)
+from ..retrieval import (
+    apply_budget,
+    create_configuration_manifest,
+    create_snapshot_manifest,
+    hash_text,
+)
+from ..time import utc_now_iso
+from .base import Retriever
+from .embedding_index_common import (
+    ChunkRecord,
+    EmbeddingIndexConfiguration,
+    OpenedEmbeddingIndex,
+    _build_snippet,
+    _load_text_from_item,
+    artifact_paths_for_snapshot,
+    build_embedding_provider,
+    chunks_to_records,
+    collect_chunks,
+    cosine_similarity_matrix,
+    cosine_similarity_scores,
+    embed_queries,
+    embedding_cache_stats,
+    open_embedding_index,
+    top_k_positions,
+    write_chunk_table,
+    write_embeddings,
+)
+
+
+class EmbeddingIndexAnnConfiguration(EmbeddingIndexConfiguration):
+    """
+    Configuration for embedding-index-ann retrieval.
+
+    :ivar lists: Number of inverted lists (clusters). Defaults to the square root of the chunk count.
+    :vartype lists: int or None
+    :ivar probes: Number of inverted lists scanned per query. Higher values raise recall.
+    :vartype probes: int
+    :ivar training_iterations: Number of k-means iterations used to train list centroids.
+    :vartype training_iterations: int
+    :ivar training_rows_per_list: Maximum sampled rows per list used to train centroids.
+    :vartype training_rows_per_list: int
+    :ivar seed: Random seed for centroid training.
+    :vartype seed: int
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    lists: Optional[int] = Field(default=None, ge=1)
+    probes: int = Field(default=8, ge=1)
+    training_iterations: int = Field(default=10, ge=1)
+    training_rows_per_list: int = Field(default=256, ge=1)
+    seed: int = 0
+
+
+class EmbeddingIndexAnnRetriever(Retriever):
+    """
+    Embedding retrieval retriever using an inverted-file approximate nearest neighbor index.
+
+    Chunk embeddings are clustered with spherical k-means. A query scores the list centroids,
+    then scans only the rows of the closest lists.
+    """
+
+    retriever_id = "embedding-index-ann"
+
+    def build_snapshot(
+        self, corpus: Corpus, *, configuration_name: str, configuration: Dict[str, object]
+    ) -> RetrievalSnapshot:
+        """
+        Build an embedding index snapshot and an inverted-file index over its rows.
+
+        :param corpus: Corpus to build against.
+        :type corpus: Corpus
+        :param configuration_name: Human-readable configuration name.
+        :type configuration_name: str
+        :param configuration: Retriever-specific configuration values.
+        :type configuration: dict[str, object]
+        :return: Snapshot manifest describing the build.
+        :rtype: biblicus.models.RetrievalSnapshot
+        """
+        parsed_config = EmbeddingIndexAnnConfiguration.model_validate(configuration)
+        chunks, text_items = collect_chunks(corpus, configuration=parsed_config)
+
+        with build_embedding_provider(corpus, parsed_config) as provider:
+            embeddings = provider.embed_texts([chunk.text for chunk in chunks]).astype(np.float32)
+
+        configuration_manifest = create_configuration_manifest(
+            retriever_id=self.retriever_id,
+            name=configuration_name,
+            configuration=parsed_config.model_dump(),
+        )
+        snapshot = create_snapshot_manifest(
+            corpus,
+            configuration=configuration_manifest,
+            stats={},
+            snapshot_artifacts=[],
+        )
+
+        paths = _artifact_paths(snapshot_id=snapshot.snapshot_id)
+        embeddings_path = corpus.root / paths["embeddings"]
+        chunks_path = corpus.root / paths["chunks"]
+        lists_path = corpus.root / paths["lists"]
+        embeddings_path.parent.mkdir(parents=True, exist_ok=True)
+
+        write_embeddings(embeddings_path, embeddings, dtype=parsed_config.embedding_dtype)
+        write_chunk_table(
+            chunks_path,
+            corpus.root / paths["chunk_item_ids"],
+            chunks_to_records(chunks),
+            count=len(chunks),
+        )
+
+        normalized = _l2_normalize_rows(embeddings) if embeddings.size else embeddings
+        centroids = _train_centroids(normalized, configuration=parsed_config)
+        assignments = _assign_lists(normalized, centroids)
+        write_inverted_lists(lists_path, centroids=centroids, assignments=assignments)
+
+        stats = {
+            "items": len(corpus.load_catalog().items),
+            "text_items": text_items,
+            "chunks": len(chunks),
+            "dimensions": (
+                int(embeddings.shape[1])
+                if embeddings.size
+                else parsed_config.embedding_provider.dimensions
+            ),
+            "lists": int(centroids.shape[0]),
+            **embedding_cache_stats(provider),
+        }
+        snapshot = snapshot.model_copy(
+            update={
+                "snapshot_artifacts": [
+                    paths["embeddings"],
+                    paths["chunks"],
+                    paths["chunk_item_ids"],
+                    paths["lists"],
+                ],
+                "stats": stats,
+            }
+        )
+        corpus.write_snapshot(snapshot)
+        return snapshot
+
+    def query(
+        self,
+        corpus: Corpus,
+        *,
+        snapshot: RetrievalSnapshot,
+        query_text: str,
+        budget: QueryBudget,
+    ) -> RetrievalResult:
+        """
+        Query an approximate embedding index snapshot and return ranked evidence.
+
+        :param corpus: Corpus associated with the snapshot.
+        :type corpus: Corpus
+        :param snapshot: Snapshot manifest to use for querying.
+        :type snapshot: biblicus.models.RetrievalSnapshot
+        :param query_text: Query text to embed.
+        :type query_text: str
+        :param budget: Evidence selection budget.
+        :type budget: biblicus.models.QueryBudget
+        :return: Retrieval results containing evidence.
+        :rtype: biblicus.models.RetrievalResult
+        """
+        results = self.query_batch(
+            corpus, snapshot=snapshot, query_texts=[query_text], budget=budget
+        )
+        return results[0]
+
+    def query_batch(
+        self,
+        corpus: Corpus,
+        *,
+        snapshot: RetrievalSnapshot,
+        query_texts: Sequence[str],
+        budget: QueryBudget,
+    ) -> List[RetrievalResult]:
+        """
+        Query an approximate embedding index snapshot with several query texts.
+
+        Artifacts are opened once per snapshot and kept on this retriever, queries are embedded
+        with one provider call, and centroids are scored against every query with one matrix
+        multiply.
+
+        :param corpus: Corpus associated with the snapshot.
+        :type corpus: Corpus
+        :param snapshot: Snapshot manifest to use for querying.
+        :type snapshot: biblicus.models.RetrievalSnapshot
+        :param query_texts: Query texts to embed.
+        :type query_texts: Sequence[str]
+        :param budget: Evidence selection budget applied to every query.
+        :type budget: biblicus.models.QueryBudget
+        :return: Retrieval results in query order.
+        :rtype: list[biblicus.models.RetrievalResult]
+        """
+        opened, (centroids, offsets, rows) = self.snapshot_state(
+            snapshot, lambda: _open_ann_index(corpus, snapshot)
+        )
+        parsed_config = opened.configuration
+        embeddings = opened.embeddings
+
+        query_embeddings = embed_queries(parsed_config, query_texts)
+        centroid_scores = cosine_similarity_matrix(centroids, query_embeddings)
+
+        results: List[RetrievalResult] = []
+        for query_index, query_text in enumerate(query_texts):
+            query_vector = query_embeddings[query_index]
+            probed_lists = top_k_positions(
+                centroid_scores[:, query_index], limit=parsed_config.probes
+            )
+            candidate_rows = _rows_for_lists(probed_lists, offsets=offsets, rows=rows)
+            candidate_scores = cosine_similarity_scores(
+                np.asarray(embeddings[candidate_rows], dtype=np.float32), query_vector
+            )
+            best = top_k_positions(
+                candidate_scores,
+                limit=_candidate_limit(budget.max_total_items + budget.offset),
+                indices=candidate_rows,
+            )
+            evidence_items = _build_evidence(
+                corpus,
+                snapshot=snapshot,
+                configuration=parsed_config,
+                candidates=[
+                    (int(candidate_rows[position]), float(candidate_scores[position]))
+                    for position in best
+                ],
+                chunk_records=opened.chunk_records,
+                extraction_reference=opened.extraction_reference,
+            )
+            ranked = [
+                item.model_copy(
+                    update={
+                        "rank": index,
+                        "configuration_id": snapshot.configuration.configuration_id,
+                        "snapshot_id": snapshot.snapshot_id,
+                    }
+                )
+                for index, item in enumerate(evidence_items, start=1)
+            ]
+            evidence = apply_budget(ranked, budget)
+            results.append(
+                RetrievalResult(
+                    query_text=query_text,
+                    budget=budget,
+                    snapshot_id=snapshot.snapshot_id,
+                    configuration_id=snapshot.configuration.configuration_id,
+                    retriever_id=snapshot.configuration.retriever_id,
+                    generated_at=utc_now_iso(),
+                    evidence=evidence,
+                    stats={
+                        "candidates": len(evidence_items),
+                        "returned": len(evidence),
+                        "probed_lists": int(probed_lists.size),
+                        "scanned_chunks": int(candidate_rows.size),
+                    },
+                )
+            )
+        return results
+
+
+def write_inverted_lists(path: Path, *, centroids: np.ndarray, assignments: np.ndarray) -> None:
+    """
+    Write list centroids and row membership in compressed sparse row layout.
+
+    :param path: Destination path.
+    :type path: pathlib.Path
+    :param centroids: Centroid matrix of shape (lists, d).
+    :type centroids: numpy.ndarray
+    :param assignments: List index assigned to each embedding row.
+    :type assignments: numpy.ndarray
+    :return: None.
+    :rtype: None
+    """
+    counts = np.bincount(assignments, minlength=centroids.shape[0])
+    offsets = np.concatenate([np.zeros(1, dtype=np.int64), np.cumsum(counts, dtype=np.int64)])
+    rows = np.argsort(assignments, kind="stable").astype(np.int64)
+    with path.open("wb") as handle:
+        np.savez(handle, centroids=centroids.astype(np.float32), offsets=offsets, rows=rows)
+
+
+def read_inverted_lists(path: Path) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Read list centroids and row membership written by write_inverted_lists.
+
+    :param path: Source path.
+    :type path: pathlib.Path
+    :return: (centroids, offsets, rows)
+    :rtype: tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+    """
+    with np.load(path) as archive:
+        return archive["centroids"], archive["offsets"], archive["rows"]
+
+
+def _artifact_paths(*, snapshot_id: str) -> Dict[str, str]:
+    paths = artifact_paths_for_snapshot(
+        snapshot_id=snapshot_id, retriever_id=EmbeddingIndexAnnRetriever.retriever_id
+    )
+    prefix = paths["embeddings"][: -len(".embeddings.npy")]
+    paths["lists"] = f"{prefix}.lists.npz"
+    return paths
+
+
+def _open_ann_index(
+    corpus: Corpus, snapshot: RetrievalSnapshot
+) -> Tuple[OpenedEmbeddingIndex, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    paths = _artifact_paths(snapshot_id=snapshot.snapshot_id)
+    lists_path = corpus.root / paths["lists"]
+    if not lists_path.is_file():
+        raise FileNotFoundError("Embedding index artifacts are missing for this snapshot")
+    opened = open_embedding_index(
+        corpus,
+        snapshot,
+        configuration_class=EmbeddingIndexAnnConfiguration,
+        paths=paths,
+        mmap=True,
+    )
+    return opened, read_inverted_lists(lists_path)
+
+
+def _list_count(row_count: int, configuration: EmbeddingIndexAnnConfiguration) -> int:
+    if row_count == 0:
+        return 0
+    requested = configuration.lists or int(round(math.sqrt(row_count)))
+    return max(1, min(int(requested), row_count))
+
+
+def _train_centroids(
+    embeddings: np.ndarray, *, configuration: EmbeddingIndexAnnConfiguration
+) -> np.ndarray:
+    row_count = int(embeddings.shape[0])
+    dimensions = int(embeddings.shape[1]) if embeddings.ndim == 2 else 0
+    lists = _list_count(row_count, configuration)
+    if lists == 0:
+        return np.zeros((0, dimensions), dtype=np.float32)
+
+    generator = np.random.default_rng(configuration.seed)
+    sample_size = min(row_count, lists * configuration.training_rows_per_list)
+    sample = embeddings[np.sort(generator.choice(row_count, size=sample_size, replace=False))]
+    centroids = sample[generator.choice(sample_size, size=lists, replace=False)].copy()
+    for _ in range(configuration.training_iterations):
+        assignments = _assign_lists(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, sample)
+        counts = np.bincount(assignments, minlength=lists)
+        sums[counts == 0] = centroids[counts == 0]
+        centroids = _l2_normalize_rows(sums).astype(np.float32)
+    return centroids
+
+
+def _assign_lists(
+    embeddings: np.ndarray, centroids: np.ndarray, *, batch_rows: int = 4096
+) -> np.ndarray:
+    assignments = np.zeros(int(embeddings.shape[0]), dtype=np.int64)
+    for start in range(0, int(embeddings.shape[0]), batch_rows):
+        batch = embeddings[start : start + batch_rows]
+        assignments[start : start + batch.shape[0]] = np.argmax(batch @ centroids.T, axis=1)
+    return assignments
+
+
+def _rows_for_lists(lists: np.ndarray, *, offsets: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    if lists.size == 0:
+        return np.empty(0, dtype=np.int64)
+    selected = [rows[offsets[list_index] : offsets[list_index + 1]] for list_index in lists]
+    return np.sort(np.concatenate(selected))
+
+
+def _candidate_limit(max_total_items: int, *, multiplier: int = 10) -> int:
+    return max(1, int(max_total_items) * int(multiplier))
+
+
+def _build_evidence(
+    corpus: Corpus,
+    *,
+    snapshot: RetrievalSnapshot,
+    configuration: EmbeddingIndexAnnConfiguration,
+    candidates: List[Tuple[int, float]],
+    chunk_records: Sequence[ChunkRecord],
+    extraction_reference: Optional[ExtractionSnapshotReference],
+) -> List[Evidence]:
+    catalog = corpus.load_catalog()
+    evidence_items: List[Evidence] = []
+    for idx, score in candidates:
+        record = chunk_records[idx]
+        catalog_item = catalog.items[record.item_id]
+        text = _load_text_from_item(
+            corpus,
+            item_id=record.item_id,
+            relpath=str(getattr(catalog_item, "relpath")),
+            media_type=str(getattr(catalog_item, "media_type")),
+            extraction_reference=extraction_reference,
+        )
+        span_text = _build_snippet(
+            text, (record.span_start, record.span_end), configuration.snippet_characters
+        )
+        evidence_items.append(
+            Evidence(
+                item_id=record.item_id,
+                source_uri=getattr(catalog_item, "source_uri", None),
+                media_type=str(getattr(catalog_item, "media_type")),
+                score=score,
+                rank=1,
+                text=span_text,
+                content_ref=None,
+                span_start=record.span_start,
+                span_end=record.span_end,
+                stage=EmbeddingIndexAnnRetriever.retriever_id,
+                stage_scores=None,
+                configuration_id=snapshot.configuration.configuration_id,
+                snapshot_id=snapshot.snapshot_id,
+                metadata=getattr(catalog_item, "metadata", {}) or {},
+                hash=hash_text(span_text or ""),
+            )
+        )
+    return evidence_items
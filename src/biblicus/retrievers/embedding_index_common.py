@@ -4,9 +4,25 @@ Shared primitives for embedding-index retrievers.
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import shutil
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from typing import (
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field, model_validator
@@ -14,9 +30,19 @@ from pydantic import BaseModel, ConfigDict, Field, model_validator
 from ..chunking import ChunkerConfig, TextChunk, TokenizerConfig
 from ..constants import RETRIEVAL_DIR_NAME
 from ..corpus import Corpus
-from ..embedding_providers import EmbeddingProviderConfig, _l2_normalize_rows
+from ..embedding_cache import (
+    DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES,
+    CachedEmbeddingProvider,
+    EmbeddingCache,
+    embedding_cache_namespace,
+)
+from ..embedding_providers import EmbeddingProvider, EmbeddingProviderConfig, _l2_normalize_rows
 from ..frontmatter import parse_front_matter
-from ..models import ExtractionSnapshotReference, parse_extraction_snapshot_reference
+from ..models import (
+    ExtractionSnapshotReference,
+    RetrievalSnapshot,
+    parse_extraction_snapshot_reference,
+)
 
 
 class ChunkRecord(BaseModel):
@@ -62,6 +88,15 @@ class EmbeddingIndexConfiguration(BaseModel):
     :vartype maximum_cache_total_items: int or None
     :ivar maximum_cache_total_characters: Optional maximum characters cached per scan batch.
     :vartype maximum_cache_total_characters: int or None
+    :ivar embedding_dtype: On-disk element type for the embedding matrix.
+    :vartype embedding_dtype: str
+    :ivar embedding_batch_size: Number of chunks embedded and written per batch during streaming
+        builds.
+    :vartype embedding_batch_size: int
+    :ivar embedding_cache: Whether builds reuse chunk vectors from the corpus embedding cache.
+    :vartype embedding_cache: bool
+    :ivar embedding_cache_max_entries: Maximum number of vectors kept in the corpus embedding cache.
+    :vartype embedding_cache_max_entries: int
     """
 
     model_config = ConfigDict(extra="forbid")
@@ -69,6 +104,10 @@ class EmbeddingIndexConfiguration(BaseModel):
     snippet_characters: Optional[int] = Field(default=None, ge=1)
     maximum_cache_total_items: Optional[int] = Field(default=None, ge=1)
     maximum_cache_total_characters: Optional[int] = Field(default=None, ge=1)
+    embedding_dtype: Literal["float32", "float16"] = "float32"
+    embedding_batch_size: int = Field(default=256, ge=1)
+    embedding_cache: bool = True
+    embedding_cache_max_entries: int = Field(default=DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES, ge=1)
     extraction_snapshot: Optional[str] = None
     chunker: ChunkerConfig = Field(default_factory=lambda: ChunkerConfig(chunker_id="paragraph"))
     tokenizer: Optional[TokenizerConfig] = None
@@ -154,7 +193,10 @@ def _load_text_from_item(
 
 
 def iter_text_payloads(
-    corpus: Corpus, *, extraction_reference: Optional[ExtractionSnapshotReference]
+    corpus: Corpus,
+    *,
+    extraction_reference: Optional[ExtractionSnapshotReference],
+    after_item_id: Optional[str] = None,
 ) -> Iterator[Tuple[object, str]]:
     """
     Yield catalog items and their text payloads.
@@ -163,12 +205,19 @@ def iter_text_payloads(
     :type corpus: Corpus
     :param extraction_reference: Optional extraction reference.
     :type extraction_reference: ExtractionSnapshotReference or None
+    :param after_item_id: Optional item identifier; items up to and including it are skipped
+        without reading their text.
+    :type after_item_id: str or None
     :yield: (catalog_item, text) pairs.
     :rtype: Iterator[tuple[object, str]]
     """
     catalog = corpus.load_catalog()
+    skipping = after_item_id is not None
     for catalog_item in catalog.items.values():
         item_id = str(getattr(catalog_item, "id", ""))
+        if skipping:
+            skipping = item_id != after_item_id
+            continue
         relpath = str(getattr(catalog_item, "relpath", ""))
         media_type = str(getattr(catalog_item, "media_type", ""))
         if not item_id or not relpath or not media_type:
@@ -271,18 +320,140 @@ def read_chunks_jsonl(path: Path) -> List[ChunkRecord]:
     return records
 
 
-def write_embeddings(path: Path, embeddings: np.ndarray) -> None:
+class ChunkTable(Sequence[ChunkRecord]):
+    """
+    Columnar chunk records backed by fixed-width arrays.
+
+    Each row of ``spans`` holds an item index, span start, and span end. Item identifiers are
+    stored once in ``item_ids``. Records are only materialized when a row is accessed, so a
+    memory-mapped table costs nothing per chunk until a query reads its top candidates.
+
+    :ivar spans: Integer array of shape (chunks, 3).
+    :vartype spans: numpy.ndarray
+    :ivar item_ids: Item identifiers referenced by the item index column.
+    :vartype item_ids: list[str]
     """
-    Write embeddings to disk.
+
+    def __init__(self, spans: np.ndarray, item_ids: List[str]):
+        self.spans = spans
+        self.item_ids = item_ids
+
+    @classmethod
+    def from_records(cls, records: Iterable[ChunkRecord]) -> "ChunkTable":
+        """
+        Build an in-memory table from chunk records.
+
+        :param records: Chunk records.
+        :type records: Iterable[ChunkRecord]
+        :return: Chunk table.
+        :rtype: ChunkTable
+        """
+        item_indexes: Dict[str, int] = {}
+        rows = [
+            (item_indexes.setdefault(record.item_id, len(item_indexes)),)
+            + (record.span_start, record.span_end)
+            for record in records
+        ]
+        spans = np.array(rows, dtype=np.int64).reshape(len(rows), 3)
+        return cls(spans, list(item_indexes))
+
+    def __len__(self) -> int:
+        return int(self.spans.shape[0])
+
+    def __getitem__(self, index: int) -> ChunkRecord:  # type: ignore[override]
+        item_index, span_start, span_end = (int(value) for value in self.spans[index])
+        return ChunkRecord.model_construct(
+            item_id=self.item_ids[item_index], span_start=span_start, span_end=span_end
+        )
+
+
+def write_chunk_table(
+    chunks_path: Path, item_ids_path: Path, records: Iterable[ChunkRecord], *, count: int
+) -> None:
+    """
+    Write chunk records as a columnar table without holding them all in memory.
+
+    :param chunks_path: Destination ``.npy`` path for the span columns.
+    :type chunks_path: pathlib.Path
+    :param item_ids_path: Destination JSON path for the item identifier table.
+    :type item_ids_path: pathlib.Path
+    :param records: Chunk records in row order.
+    :type records: Iterable[ChunkRecord]
+    :param count: Number of records.
+    :type count: int
+    :return: None.
+    :rtype: None
+    """
+    item_indexes: Dict[str, int] = {}
+    if count == 0:
+        np.save(chunks_path, np.zeros((0, 3), dtype=np.int64))
+    else:
+        spans = np.lib.format.open_memmap(chunks_path, mode="w+", dtype=np.int64, shape=(count, 3))
+        for row, record in enumerate(records):
+            item_index = item_indexes.setdefault(record.item_id, len(item_indexes))
+            spans[row] = (item_index, record.span_start, record.span_end)
+        spans.flush()
+        del spans
+    item_ids_path.write_text(json.dumps(list(item_indexes)), encoding="utf-8")
+
+
+def read_chunk_table(chunks_path: Path, item_ids_path: Path) -> ChunkTable:
+    """
+    Memory-map a columnar chunk table.
+
+    :param chunks_path: Span column ``.npy`` path.
+    :type chunks_path: pathlib.Path
+    :param item_ids_path: Item identifier table path.
+    :type item_ids_path: pathlib.Path
+    :return: Chunk table.
+    :rtype: ChunkTable
+    """
+    spans = np.load(chunks_path, mmap_mode="r")
+    item_ids = json.loads(item_ids_path.read_text(encoding="utf-8"))
+    return ChunkTable(spans, item_ids)
+
+
+def load_snapshot_chunks(corpus: Corpus, paths: Dict[str, str]) -> Optional[ChunkTable]:
+    """
+    Load the chunk table of an embedding index snapshot.
+
+    Snapshots built before chunk tables were columnar store chunk records as JSON Lines; those
+    are read into an in-memory table.
+
+    :param corpus: Corpus that owns the snapshot.
+    :type corpus: Corpus
+    :param paths: Artifact paths from :func:`artifact_paths_for_snapshot`.
+    :type paths: dict[str, str]
+    :return: Chunk table, or None if the snapshot has no chunk artifacts.
+    :rtype: ChunkTable or None
+    """
+    chunks_path = corpus.root / paths["chunks"]
+    item_ids_path = corpus.root / paths["chunk_item_ids"]
+    if chunks_path.is_file() and item_ids_path.is_file():
+        return read_chunk_table(chunks_path, item_ids_path)
+    legacy_path = corpus.root / paths["legacy_chunks"]
+    if legacy_path.is_file():
+        return ChunkTable.from_records(read_chunks_jsonl(legacy_path))
+    return None
+
+
+def write_embeddings(path: Path, embeddings: np.ndarray, *, dtype: str = "float32") -> None:
+    """
+    Write embeddings to disk as L2-normalized rows.
+
+    Rows are normalized before they are stored so queries can score memory-mapped rows directly.
 
     :param path: Destination path.
     :type path: pathlib.Path
     :param embeddings: Embedding matrix.
     :type embeddings: numpy.ndarray
+    :param dtype: On-disk element type, float32 or float16.
+    :type dtype: str
     :return: None.
     :rtype: None
     """
-    np.save(path, embeddings.astype(np.float32))
+    normalized = _l2_normalize_rows(np.asarray(embeddings, dtype=np.float32))
+    np.save(path, normalized.astype(dtype, copy=False))
 
 
 def read_embeddings(path: Path, *, mmap: bool) -> np.ndarray:
@@ -300,6 +471,25 @@ def read_embeddings(path: Path, *, mmap: bool) -> np.ndarray:
     return np.load(path, mmap_mode=mode)
 
 
+def float32_rows(embeddings: np.ndarray, start: int, end: int) -> np.ndarray:
+    """
+    Read a slice of embedding rows as float32.
+
+    Only the requested rows are materialized, so memory-mapped matrices stay on disk and
+    float16 matrices are upcast one batch at a time.
+
+    :param embeddings: Embedding matrix, possibly memory-mapped.
+    :type embeddings: numpy.ndarray
+    :param start: Inclusive start row.
+    :type start: int
+    :param end: Exclusive end row.
+    :type end: int
+    :return: Float32 matrix of shape (end - start, d).
+    :rtype: numpy.ndarray
+    """
+    return np.asarray(embeddings[start:end], dtype=np.float32)
+
+
 def cosine_similarity_scores(embeddings: np.ndarray, query_vector: np.ndarray) -> np.ndarray:
     """
     Compute cosine similarity scores for a query vector.
@@ -318,6 +508,122 @@ def cosine_similarity_scores(embeddings: np.ndarray, query_vector: np.ndarray) -
     return embeddings @ query_vector
 
 
+def cosine_similarity_matrix(embeddings: np.ndarray, query_vectors: np.ndarray) -> np.ndarray:
+    """
+    Compute cosine similarity scores for several query vectors at once.
+
+    The embedding matrix must already be L2-normalized.
+
+    :param embeddings: Embedding matrix of shape (n, d).
+    :type embeddings: numpy.ndarray
+    :param query_vectors: Query matrix of shape (q, d).
+    :type query_vectors: numpy.ndarray
+    :return: Score matrix of shape (n, q).
+    :rtype: numpy.ndarray
+    """
+    normalized = _l2_normalize_rows(np.asarray(query_vectors, dtype=np.float32))
+    return embeddings @ normalized.T
+
+
+@contextmanager
+def build_embedding_provider(
+    corpus: Corpus, configuration: EmbeddingIndexConfiguration
+) -> Iterator[EmbeddingProvider]:
+    """
+    Build the embedding provider for a snapshot build, backed by the corpus embedding cache.
+
+    The cache is keyed by the full provider configuration, so vectors are shared by every
+    snapshot and retriever that embeds the same text with the same provider settings.
+
+    :param corpus: Corpus being indexed.
+    :type corpus: Corpus
+    :param configuration: Parsed embedding-index configuration.
+    :type configuration: EmbeddingIndexConfiguration
+    :return: Context manager yielding the provider; the cache is closed on exit.
+    :rtype: Iterator[EmbeddingProvider]
+    """
+    provider = configuration.embedding_provider.build_provider()
+    if not configuration.embedding_cache:
+        yield provider
+        return
+    cache = EmbeddingCache.for_corpus(corpus, max_entries=configuration.embedding_cache_max_entries)
+    try:
+        yield CachedEmbeddingProvider(
+            provider,
+            cache=cache,
+            namespace=embedding_cache_namespace(configuration.embedding_provider.model_dump()),
+        )
+    finally:
+        cache.close()
+
+
+def embedding_cache_stats(provider: EmbeddingProvider) -> Dict[str, int]:
+    """
+    Snapshot statistics for the embedding cache behind a provider, if any.
+
+    :param provider: Provider yielded by :func:`build_embedding_provider`.
+    :type provider: EmbeddingProvider
+    :return: Cache hit, miss, and eviction counts, or an empty mapping without a cache.
+    :rtype: dict[str, int]
+    """
+    if isinstance(provider, CachedEmbeddingProvider):
+        return provider.cache.stats.as_stats()
+    return {}
+
+
+def embed_queries(
+    configuration: EmbeddingIndexConfiguration, query_texts: Sequence[str]
+) -> np.ndarray:
+    """
+    Embed query texts with one provider call.
+
+    :param configuration: Parsed embedding-index configuration.
+    :type configuration: EmbeddingIndexConfiguration
+    :param query_texts: Query texts to embed.
+    :type query_texts: Sequence[str]
+    :return: Query matrix of shape (len(query_texts), d).
+    :rtype: numpy.ndarray
+    :raises ValueError: If the provider returns a matrix with the wrong number of rows.
+    """
+    provider = configuration.embedding_provider.build_provider()
+    query_embeddings = provider.embed_texts(list(query_texts)).astype(np.float32)
+    if query_embeddings.shape[0] != len(query_texts):
+        raise ValueError("Embedding provider returned an invalid query embedding shape")
+    return query_embeddings
+
+
+def top_k_positions(
+    scores: np.ndarray, *, limit: int, indices: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Select the positions of the highest scores, ordered by score then index.
+
+    Candidates are narrowed with a partition before sorting, so the cost is linear in the number
+    of scores plus a sort of the selected positions. Ties are broken by ascending index.
+
+    :param scores: Score vector.
+    :type scores: numpy.ndarray
+    :param limit: Maximum number of positions to return.
+    :type limit: int
+    :param indices: Optional index vector aligned with scores used to break ties.
+    :type indices: numpy.ndarray or None
+    :return: Positions into scores, best first.
+    :rtype: numpy.ndarray
+    """
+    limit = min(int(limit), int(scores.size))
+    if limit <= 0:
+        return np.empty(0, dtype=np.int64)
+    if indices is None:
+        indices = np.arange(scores.size)
+    if scores.size > limit:
+        threshold = np.partition(scores, scores.size - limit)[scores.size - limit]
+        positions = np.flatnonzero(scores >= threshold)
+    else:
+        positions = np.arange(scores.size)
+    order = np.lexsort((indices[positions], -scores[positions]))
+    return positions[order[:limit]]
+
+
 def artifact_paths_for_snapshot(*, snapshot_id: str, retriever_id: str) -> Dict[str, str]:
     """
     Build deterministic artifact relative paths for an embedding index snapshot.
@@ -326,11 +632,402 @@ def artifact_paths_for_snapshot(*, snapshot_id: str, retriever_id: str) -> Dict[
     :type snapshot_id: str
     :param retriever_id: Retriever identifier.
     :type retriever_id: str
-    :return: Mapping with keys embeddings and chunks.
+    :return: Mapping with keys embeddings, chunks, chunk_item_ids, and legacy_chunks.
     :rtype: dict[str, str]
     """
     prefix = f"{snapshot_id}.{retriever_id}"
     base_dir = Path(RETRIEVAL_DIR_NAME) / retriever_id / snapshot_id
-    embeddings_relpath = str(base_dir / f"{prefix}.embeddings.npy")
-    chunks_relpath = str(base_dir / f"{prefix}.chunks.jsonl")
-    return {"embeddings": embeddings_relpath, "chunks": chunks_relpath}
+    return {
+        "embeddings": str(base_dir / f"{prefix}.embeddings.npy"),
+        "chunks": str(base_dir / f"{prefix}.chunks.npy"),
+        "chunk_item_ids": str(base_dir / f"{prefix}.chunk_item_ids.json"),
+        "legacy_chunks": str(base_dir / f"{prefix}.chunks.jsonl"),
+    }
+
+
+@dataclass(frozen=True)
+class OpenedEmbeddingIndex:
+    """
+    Embedding index snapshot opened for querying.
+
+    :ivar configuration: Parsed snapshot configuration.
+    :vartype configuration: EmbeddingIndexConfiguration
+    :ivar extraction_reference: Extraction snapshot the index was built from, if any.
+    :vartype extraction_reference: biblicus.models.ExtractionSnapshotReference or None
+    :ivar embeddings: Embedding matrix, memory-mapped or loaded.
+    :vartype embeddings: numpy.ndarray
+    :ivar chunk_records: Chunk table aligned with the embedding rows.
+    :vartype chunk_records: ChunkTable
+    """
+
+    configuration: EmbeddingIndexConfiguration
+    extraction_reference: Optional[ExtractionSnapshotReference]
+    embeddings: np.ndarray
+    chunk_records: ChunkTable
+
+
+def open_embedding_index(
+    corpus: Corpus,
+    snapshot: RetrievalSnapshot,
+    *,
+    configuration_class: Type[EmbeddingIndexConfiguration],
+    paths: Dict[str, str],
+    mmap: bool,
+) -> OpenedEmbeddingIndex:
+    """
+    Open the artifacts of an embedding index snapshot for querying.
+
+    :param corpus: Corpus that owns the snapshot.
+    :type corpus: Corpus
+    :param snapshot: Snapshot manifest to open.
+    :type snapshot: biblicus.models.RetrievalSnapshot
+    :param configuration_class: Configuration model of the retriever.
+    :type configuration_class: type[EmbeddingIndexConfiguration]
+    :param paths: Artifact paths from :func:`artifact_paths_for_snapshot`.
+    :type paths: dict[str, str]
+    :param mmap: Whether to memory-map the embeddings instead of loading them as float32.
+    :type mmap: bool
+    :return: Opened embedding index.
+    :rtype: OpenedEmbeddingIndex
+    :raises FileNotFoundError: If the snapshot artifacts are missing.
+    :raises ValueError: If the embeddings and chunk table disagree.
+    """
+    configuration = configuration_class.model_validate(snapshot.configuration.configuration)
+    extraction_reference = resolve_extraction_reference(corpus, configuration)
+    embeddings_path = corpus.root / paths["embeddings"]
+    chunk_records = load_snapshot_chunks(corpus, paths)
+    if not embeddings_path.is_file() or chunk_records is None:
+        raise FileNotFoundError("Embedding index artifacts are missing for this snapshot")
+
+    embeddings = read_embeddings(embeddings_path, mmap=mmap)
+    if not mmap:
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+    if embeddings.shape[0] != len(chunk_records):
+        raise ValueError(
+            "Embedding index artifacts are inconsistent: "
+            "embeddings row count does not match chunk record count"
+        )
+    return OpenedEmbeddingIndex(
+        configuration=configuration,
+        extraction_reference=extraction_reference,
+        embeddings=embeddings,
+        chunk_records=chunk_records,
+    )
+
+
+EMBEDDING_BUILD_DIR_NAME = ".partial"
+EMBEDDING_BUILD_CHECKPOINT_FILE_NAME = "checkpoint.json"
+
+
+@dataclass
+class EmbeddingBuildCheckpoint:
+    """
+    Progress of a streaming embedding build, persisted after every batch.
+
+    :ivar last_item_id: Identifier of the last catalog item whose chunks were written.
+    :vartype last_item_id: str or None
+    :ivar text_items: Items with text processed so far.
+    :vartype text_items: int
+    :ivar chunks: Chunk rows written so far.
+    :vartype chunks: int
+    :ivar dimensions: Embedding dimensionality, or zero before the first batch.
+    :vartype dimensions: int
+    :ivar embeddings_bytes: Committed length of the partial embedding file.
+    :vartype embeddings_bytes: int
+    :ivar chunks_bytes: Committed length of the partial chunks file.
+    :vartype chunks_bytes: int
+    """
+
+    last_item_id: Optional[str] = None
+    text_items: int = 0
+    chunks: int = 0
+    dimensions: int = 0
+    embeddings_bytes: int = 0
+    chunks_bytes: int = 0
+
+
+def embedding_build_dir(
+    corpus: Corpus, *, retriever_id: str, configuration_id: str, catalog_generated_at: str
+) -> Path:
+    """
+    Directory holding the partial artifacts of a streaming embedding build.
+
+    The directory is keyed by configuration and catalog, so an interrupted build is resumed only
+    by a later build of the same configuration over the same catalog.
+
+    :param corpus: Corpus being indexed.
+    :type corpus: Corpus
+    :param retriever_id: Retriever identifier.
+    :type retriever_id: str
+    :param configuration_id: Deterministic configuration identifier.
+    :type configuration_id: str
+    :param catalog_generated_at: Catalog timestamp the build reads.
+    :type catalog_generated_at: str
+    :return: Build directory path.
+    :rtype: pathlib.Path
+    """
+    build_key = hashlib.sha256(
+        f"{configuration_id}:{catalog_generated_at}".encode("utf-8")
+    ).hexdigest()
+    return corpus.retrieval_dir / retriever_id / EMBEDDING_BUILD_DIR_NAME / build_key
+
+
+def read_embedding_build_checkpoint(build_dir: Path) -> EmbeddingBuildCheckpoint:
+    """
+    Read the checkpoint of a streaming embedding build.
+
+    :param build_dir: Build directory.
+    :type build_dir: pathlib.Path
+    :return: Persisted checkpoint, or an empty checkpoint for a fresh build.
+    :rtype: EmbeddingBuildCheckpoint
+    """
+    path = build_dir / EMBEDDING_BUILD_CHECKPOINT_FILE_NAME
+    if not path.is_file():
+        return EmbeddingBuildCheckpoint()
+    return EmbeddingBuildCheckpoint(**json.loads(path.read_text(encoding="utf-8")))
+
+
+def write_embedding_build_checkpoint(build_dir: Path, checkpoint: EmbeddingBuildCheckpoint) -> None:
+    """
+    Atomically persist the checkpoint of a streaming embedding build.
+
+    :param build_dir: Build directory.
+    :type build_dir: pathlib.Path
+    :param checkpoint: Checkpoint to persist.
+    :type checkpoint: EmbeddingBuildCheckpoint
+    :return: None.
+    :rtype: None
+    """
+    path = build_dir / EMBEDDING_BUILD_CHECKPOINT_FILE_NAME
+    temp_path = path.with_suffix(".tmp")
+    temp_path.write_text(json.dumps(asdict(checkpoint)), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def stream_embedding_artifacts(
+    corpus: Corpus,
+    *,
+    configuration: EmbeddingIndexConfiguration,
+    provider: EmbeddingProvider,
+    build_dir: Path,
+    embeddings_path: Path,
+    chunks_path: Path,
+    chunk_item_ids_path: Path,
+) -> EmbeddingBuildCheckpoint:
+    """
+    Chunk, embed, and write an embedding index in bounded memory, resuming interrupted builds.
+
+    Text payloads are chunked item by item and embedded in batches of roughly
+    ``embedding_batch_size`` chunks. Each batch is appended to partial files in the build
+    directory as L2-normalized float32 rows and chunk records, followed by a checkpoint. A later
+    call with the same build directory truncates anything written after the last checkpoint and
+    continues after its last item. Once every item is written, the rows are copied into the
+    final ``.npy`` file in the configured dtype, the chunk records are converted into a columnar
+    chunk table, and the build directory is removed.
+
+    :param corpus: Corpus to index.
+    :type corpus: Corpus
+    :param configuration: Parsed embedding-index configuration.
+    :type configuration: EmbeddingIndexConfiguration
+    :param provider: Embedding provider for chunk texts.
+    :type provider: EmbeddingProvider
+    :param build_dir: Directory for partial artifacts and the checkpoint.
+    :type build_dir: pathlib.Path
+    :param embeddings_path: Destination embedding matrix path.
+    :type embeddings_path: pathlib.Path
+    :param chunks_path: Destination chunk table span column path.
+    :type chunks_path: pathlib.Path
+    :param chunk_item_ids_path: Destination chunk table item identifier path.
+    :type chunk_item_ids_path: pathlib.Path
+    :return: Final checkpoint with item, chunk, and dimension counts.
+    :rtype: EmbeddingBuildCheckpoint
+    :raises ValueError: If the provider returns a matrix with the wrong number of rows.
+    """
+    tokenizer = configuration.tokenizer.build_tokenizer() if configuration.tokenizer else None
+    chunker = configuration.chunker.build_chunker(tokenizer=tokenizer)
+    extraction_reference = resolve_extraction_reference(corpus, configuration)
+
+    build_dir.mkdir(parents=True, exist_ok=True)
+    checkpoint = read_embedding_build_checkpoint(build_dir)
+    partial_embeddings_path = build_dir / "embeddings.f32"
+    partial_chunks_path = build_dir / "chunks.jsonl"
+    with partial_embeddings_path.open("ab") as embeddings_handle:
+        with partial_chunks_path.open("ab") as chunks_handle:
+            # Drop anything written after the last checkpoint of an interrupted build.
+            for handle, committed_bytes in (
+                (embeddings_handle, checkpoint.embeddings_bytes),
+                (chunks_handle, checkpoint.chunks_bytes),
+            ):
+                handle.truncate(committed_bytes)
+                handle.seek(0, os.SEEK_END)
+            pending: List[TextChunk] = []
+            pending_items = 0
+            last_item_id = checkpoint.last_item_id
+            for catalog_item, text in iter_text_payloads(
+                corpus,
+                extraction_reference=extraction_reference,
+                after_item_id=checkpoint.last_item_id,
+            ):
+                last_item_id = str(getattr(catalog_item, "id"))
+                pending.extend(
+                    chunker.chunk_text(
+                        item_id=last_item_id,
+                        text=text,
+                        starting_chunk_id=checkpoint.chunks + len(pending),
+                    )
+                )
+                pending_items += 1
+                if len(pending) >= configuration.embedding_batch_size:
+                    checkpoint = _write_embedding_batch(
+                        pending,
+                        provider=provider,
+                        checkpoint=checkpoint,
+                        text_items=pending_items,
+                        last_item_id=last_item_id,
+                        embeddings_handle=embeddings_handle,
+                        chunks_handle=chunks_handle,
+                    )
+                    write_embedding_build_checkpoint(build_dir, checkpoint)
+                    pending = []
+                    pending_items = 0
+            checkpoint = _write_embedding_batch(
+                pending,
+                provider=provider,
+                checkpoint=checkpoint,
+                text_items=pending_items,
+                last_item_id=last_item_id,
+                embeddings_handle=embeddings_handle,
+                chunks_handle=chunks_handle,
+            )
+            write_embedding_build_checkpoint(build_dir, checkpoint)
+
+    if not checkpoint.dimensions:
+        checkpoint.dimensions = configuration.embedding_provider.dimensions
+    _finalize_embeddings(
+        partial_embeddings_path,
+        embeddings_path,
+        rows=checkpoint.chunks,
+        dimensions=checkpoint.dimensions,
+        dtype=configuration.embedding_dtype,
+        block_rows=configuration.embedding_batch_size,
+    )
+    write_chunk_table(
+        chunks_path,
+        chunk_item_ids_path,
+        _iter_partial_chunk_records(partial_chunks_path),
+        count=checkpoint.chunks,
+    )
+    shutil.rmtree(build_dir)
+    return checkpoint
+
+
+def _write_embedding_batch(
+    chunks: List[TextChunk],
+    *,
+    provider: EmbeddingProvider,
+    checkpoint: EmbeddingBuildCheckpoint,
+    text_items: int,
+    last_item_id: Optional[str],
+    embeddings_handle: BinaryIO,
+    chunks_handle: BinaryIO,
+) -> EmbeddingBuildCheckpoint:
+    """
+    Embed one batch of chunks and append it to the partial artifacts.
+
+    :param chunks: Chunks to embed; may be empty.
+    :type chunks: list[TextChunk]
+    :param provider: Embedding provider.
+    :type provider: biblicus.embedding_providers.EmbeddingProvider
+    :param checkpoint: Checkpoint before this batch.
+    :type checkpoint: EmbeddingBuildCheckpoint
+    :param text_items: Items with text covered by this batch.
+    :type text_items: int
+    :param last_item_id: Identifier of the last item covered by this batch.
+    :type last_item_id: str or None
+    :param embeddings_handle: Partial embedding file opened for appending.
+    :type embeddings_handle: typing.BinaryIO
+    :param chunks_handle: Partial chunks file opened for appending.
+    :type chunks_handle: typing.BinaryIO
+    :return: Checkpoint after this batch.
+    :rtype: EmbeddingBuildCheckpoint
+    :raises ValueError: If the provider returns a matrix with the wrong number of rows.
+    """
+    dimensions = checkpoint.dimensions
+    if chunks:
+        embeddings = provider.embed_texts([chunk.text for chunk in chunks])
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if embeddings.ndim != 2 or embeddings.shape[0] != len(chunks):
+            raise ValueError("Embedding provider returned an invalid chunk embedding shape")
+        dimensions = int(embeddings.shape[1])
+        embeddings_handle.write(np.ascontiguousarray(_l2_normalize_rows(embeddings)).tobytes())
+        records = chunks_to_records(chunks)
+        chunks_handle.write(
+            "".join(
+                json.dumps(record.model_dump(), separators=(",", ":")) + "\n" for record in records
+            ).encode("utf-8")
+        )
+    embeddings_handle.flush()
+    chunks_handle.flush()
+    return EmbeddingBuildCheckpoint(
+        last_item_id=last_item_id,
+        text_items=checkpoint.text_items + text_items,
+        chunks=checkpoint.chunks + len(chunks),
+        dimensions=dimensions,
+        embeddings_bytes=embeddings_handle.tell(),
+        chunks_bytes=chunks_handle.tell(),
+    )
+
+
+def _iter_partial_chunk_records(path: Path) -> Iterator[ChunkRecord]:
+    """
+    Yield chunk records from a partial build without validating them again.
+
+    :param path: Partial chunk records file written by :func:`_write_embedding_batch`.
+    :type path: pathlib.Path
+    :yield: Chunk records in row order.
+    :rtype: Iterator[ChunkRecord]
+    """
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            yield ChunkRecord.model_construct(**json.loads(line))
+
+
+def _finalize_embeddings(
+    partial_path: Path,
+    embeddings_path: Path,
+    *,
+    rows: int,
+    dimensions: int,
+    dtype: str,
+    block_rows: int,
+) -> None:
+    """
+    Copy raw float32 rows into a ``.npy`` matrix of the configured dtype, one block at a time.
+
+    :param partial_path: Raw float32 row file.
+    :type partial_path: pathlib.Path
+    :param embeddings_path: Destination ``.npy`` path.
+    :type embeddings_path: pathlib.Path
+    :param rows: Number of rows.
+    :type rows: int
+    :param dimensions: Row width.
+    :type dimensions: int
+    :param dtype: On-disk element type.
+    :type dtype: str
+    :param block_rows: Rows copied per block.
+    :type block_rows: int
+    :return: None.
+    :rtype: None
+    """
+    if rows == 0:
+        np.save(embeddings_path, np.zeros((0, dimensions), dtype=dtype))
+        return
+    source = np.memmap(partial_path, dtype=np.float32, mode="r", shape=(rows, dimensions))
+    destination = np.lib.format.open_memmap(
+        embeddings_path, mode="w+", dtype=dtype, shape=(rows, dimensions)
+    )
+    for start in range(0, rows, block_rows):
+        destination[start : start + block_rows] = source[start : start + block_rows]
+    destination.flush()
+    del destination
+    del source
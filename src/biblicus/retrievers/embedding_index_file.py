@@ -4,8 +4,7 @@ Embedding-index retriever that reads the embedding matrix via memory mapping.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import numpy as np
 
@@ -24,26 +23,33 @@ from ..retrieval import (
     hash_text,
 )
 from ..time import utc_now_iso
+from .base import Retriever
 from .embedding_index_common import (
     ChunkRecord,
     EmbeddingIndexConfiguration,
     _build_snippet,
     _extract_span_text,
     artifact_paths_for_snapshot,
-    chunks_to_records,
-    collect_chunks,
+    build_embedding_provider,
+    cosine_similarity_matrix,
     cosine_similarity_scores,
-    read_chunks_jsonl,
-    read_embeddings,
-    resolve_extraction_reference,
-    write_chunks_jsonl,
-    write_embeddings,
+    embed_queries,
+    embedding_build_dir,
+    embedding_cache_stats,
+    float32_rows,
+    open_embedding_index,
+    read_embedding_build_checkpoint,
+    stream_embedding_artifacts,
+    top_k_positions,
 )
 
 
-class EmbeddingIndexFileRetriever:
+class EmbeddingIndexFileRetriever(Retriever):
     """
     Embedding retrieval retriever using memory-mapped similarity scanning.
+
+    Snapshots are built by streaming chunks through the embedding provider in batches, so build
+    memory does not grow with the corpus and interrupted builds resume from their last batch.
     """
 
     retriever_id = "embedding-index-file"
@@ -64,11 +70,6 @@ class EmbeddingIndexFileRetriever:
         :rtype: biblicus.models.RetrievalSnapshot
         """
         parsed_config = EmbeddingIndexConfiguration.model_validate(configuration)
-        chunks, text_items = collect_chunks(corpus, configuration=parsed_config)
-
-        provider = parsed_config.embedding_provider.build_provider()
-        embeddings = provider.embed_texts([chunk.text for chunk in chunks]).astype(np.float32)
-
         configuration_manifest = create_configuration_manifest(
             retriever_id=self.retriever_id,
             name=configuration_name,
@@ -85,25 +86,40 @@ class EmbeddingIndexFileRetriever:
             snapshot_id=snapshot.snapshot_id, retriever_id=self.retriever_id
         )
         embeddings_path = corpus.root / paths["embeddings"]
-        chunks_path = corpus.root / paths["chunks"]
         embeddings_path.parent.mkdir(parents=True, exist_ok=True)
-
-        write_embeddings(embeddings_path, embeddings)
-        write_chunks_jsonl(chunks_path, chunks_to_records(chunks))
+        build_dir = embedding_build_dir(
+            corpus,
+            retriever_id=self.retriever_id,
+            configuration_id=configuration_manifest.configuration_id,
+            catalog_generated_at=snapshot.catalog_generated_at,
+        )
+        resumed_chunks = read_embedding_build_checkpoint(build_dir).chunks
+        with build_embedding_provider(corpus, parsed_config) as provider:
+            progress = stream_embedding_artifacts(
+                corpus,
+                configuration=parsed_config,
+                provider=provider,
+                build_dir=build_dir,
+                embeddings_path=embeddings_path,
+                chunks_path=corpus.root / paths["chunks"],
+                chunk_item_ids_path=corpus.root / paths["chunk_item_ids"],
+            )
 
         stats = {
             "items": len(corpus.load_catalog().items),
-            "text_items": text_items,
-            "chunks": len(chunks),
-            "dimensions": (
-                int(embeddings.shape[1])
-                if embeddings.size
-                else parsed_config.embedding_provider.dimensions
-            ),
+            "text_items": progress.text_items,
+            "chunks": progress.chunks,
+            "dimensions": progress.dimensions,
+            "resumed_chunks": resumed_chunks,
+            **embedding_cache_stats(provider),
         }
         snapshot = snapshot.model_copy(
             update={
-                "snapshot_artifacts": [paths["embeddings"], paths["chunks"]],
+                "snapshot_artifacts": [
+                    paths["embeddings"],
+                    paths["chunks"],
+                    paths["chunk_item_ids"],
+                ],
                 "stats": stats,
             }
         )
@@ -132,103 +148,138 @@ class EmbeddingIndexFileRetriever:
         :return: Retrieval results containing evidence.
         :rtype: biblicus.models.RetrievalResult
         """
-        parsed_config = EmbeddingIndexConfiguration.model_validate(
-            snapshot.configuration.configuration
+        results = self.query_batch(
+            corpus, snapshot=snapshot, query_texts=[query_text], budget=budget
         )
-        extraction_reference = resolve_extraction_reference(corpus, parsed_config)
+        return results[0]
 
-        paths = artifact_paths_for_snapshot(
-            snapshot_id=snapshot.snapshot_id, retriever_id=self.retriever_id
-        )
-        embeddings_path = corpus.root / paths["embeddings"]
-        chunks_path = corpus.root / paths["chunks"]
-        if not embeddings_path.is_file() or not chunks_path.is_file():
-            raise FileNotFoundError("Embedding index artifacts are missing for this snapshot")
+    def query_batch(
+        self,
+        corpus: Corpus,
+        *,
+        snapshot: RetrievalSnapshot,
+        query_texts: Sequence[str],
+        budget: QueryBudget,
+    ) -> List[RetrievalResult]:
+        """
+        Query an embedding index snapshot with several query texts in one scan.
 
-        embeddings = read_embeddings(embeddings_path, mmap=True).astype(np.float32)
-        chunk_records = read_chunks_jsonl(chunks_path)
-        if embeddings.shape[0] != len(chunk_records):
-            raise ValueError(
-                "Embedding index artifacts are inconsistent: "
-                "embeddings row count does not match chunk record count"
-            )
+        Queries are embedded with one provider call, and each batch of memory-mapped rows is
+        scored against every query with one matrix multiply. The memory-mapped artifacts stay open
+        on this retriever for later queries of the same snapshot.
 
-        provider = parsed_config.embedding_provider.build_provider()
-        query_embedding = provider.embed_texts([query_text]).astype(np.float32)
-        if query_embedding.shape[0] != 1:
-            raise ValueError("Embedding provider returned an invalid query embedding shape")
+        :param corpus: Corpus associated with the snapshot.
+        :type corpus: Corpus
+        :param snapshot: Snapshot manifest to use for querying.
+        :type snapshot: biblicus.models.RetrievalSnapshot
+        :param query_texts: Query texts to embed.
+        :type query_texts: Sequence[str]
+        :param budget: Evidence selection budget applied to every query.
+        :type budget: biblicus.models.QueryBudget
+        :return: Retrieval results in query order.
+        :rtype: list[biblicus.models.RetrievalResult]
+        """
+        opened = self.snapshot_state(
+            snapshot,
+            lambda: open_embedding_index(
+                corpus,
+                snapshot,
+                configuration_class=EmbeddingIndexConfiguration,
+                paths=artifact_paths_for_snapshot(
+                    snapshot_id=snapshot.snapshot_id, retriever_id=self.retriever_id
+                ),
+                mmap=True,
+            ),
+        )
+        parsed_config = opened.configuration
+        embeddings = opened.embeddings
 
+        query_embeddings = embed_queries(parsed_config, query_texts)
         batch_rows = parsed_config.maximum_cache_total_items or 4096
-        candidates = _top_indices_batched(
+        candidates_per_query = _top_indices_batched_many(
             embeddings=embeddings,
-            query_vector=query_embedding[0],
+            query_vectors=query_embeddings,
             limit=_candidate_limit(budget.max_total_items + budget.offset),
             batch_rows=batch_rows,
         )
-        evidence_items = _build_evidence(
-            corpus,
-            snapshot=snapshot,
-            configuration=parsed_config,
-            candidates=candidates,
-            embeddings=embeddings,
-            query_vector=query_embedding[0],
-            chunk_records=chunk_records,
-            extraction_reference=extraction_reference,
-        )
-        ranked = [
-            item.model_copy(
-                update={
-                    "rank": index,
-                    "configuration_id": snapshot.configuration.configuration_id,
-                    "snapshot_id": snapshot.snapshot_id,
-                }
+        results: List[RetrievalResult] = []
+        for query_text, query_vector, candidates in zip(
+            query_texts, query_embeddings, candidates_per_query
+        ):
+            evidence_items = _build_evidence(
+                corpus,
+                snapshot=snapshot,
+                configuration=parsed_config,
+                candidates=candidates,
+                embeddings=embeddings,
+                query_vector=query_vector,
+                chunk_records=opened.chunk_records,
+                extraction_reference=opened.extraction_reference,
             )
-            for index, item in enumerate(evidence_items, start=1)
-        ]
-        evidence = apply_budget(ranked, budget)
-        return RetrievalResult(
-            query_text=query_text,
-            budget=budget,
-            snapshot_id=snapshot.snapshot_id,
-            configuration_id=snapshot.configuration.configuration_id,
-            retriever_id=snapshot.configuration.retriever_id,
-            generated_at=utc_now_iso(),
-            evidence=evidence,
-            stats={"candidates": len(evidence_items), "returned": len(evidence)},
-        )
+            ranked = [
+                item.model_copy(
+                    update={
+                        "rank": index,
+                        "configuration_id": snapshot.configuration.configuration_id,
+                        "snapshot_id": snapshot.snapshot_id,
+                    }
+                )
+                for index, item in enumerate(evidence_items, start=1)
+            ]
+            evidence = apply_budget(ranked, budget)
+            results.append(
+                RetrievalResult(
+                    query_text=query_text,
+                    budget=budget,
+                    snapshot_id=snapshot.snapshot_id,
+                    configuration_id=snapshot.configuration.configuration_id,
+                    retriever_id=snapshot.configuration.retriever_id,
+                    generated_at=utc_now_iso(),
+                    evidence=evidence,
+                    stats={"candidates": len(evidence_items), "returned": len(evidence)},
+                )
+            )
+        return results
 
 
 def _candidate_limit(max_total_items: int, *, multiplier: int = 10) -> int:
     return max(1, int(max_total_items) * int(multiplier))
 
 
-@dataclass(frozen=True)
-class _ScoredIndex:
-    score: float
-    index: int
-
-
 def _top_indices_batched(
     *, embeddings: np.ndarray, query_vector: np.ndarray, limit: int, batch_rows: int = 4096
 ) -> List[int]:
+    return _top_indices_batched_many(
+        embeddings=embeddings,
+        query_vectors=np.asarray(query_vector).reshape(1, -1),
+        limit=limit,
+        batch_rows=batch_rows,
+    )[0]
+
+
+def _top_indices_batched_many(
+    *, embeddings: np.ndarray, query_vectors: np.ndarray, limit: int, batch_rows: int = 4096
+) -> List[List[int]]:
+    query_count = int(query_vectors.shape[0])
     if embeddings.size == 0:
-        return []
+        return [[] for _ in range(query_count)]
     limit = min(int(limit), int(embeddings.shape[0]))
 
-    best: List[_ScoredIndex] = []
+    best_scores = [np.empty(0, dtype=np.float32) for _ in range(query_count)]
+    best_indices = [np.empty(0, dtype=np.int64) for _ in range(query_count)]
     for start in range(0, embeddings.shape[0], int(batch_rows)):
         end = min(start + int(batch_rows), embeddings.shape[0])
-        scores = cosine_similarity_scores(embeddings[start:end], query_vector)
-        batch_limit = min(limit, int(scores.size))
-        if batch_limit <= 0:
-            continue
-        indices = np.argpartition(-scores, batch_limit - 1)[:batch_limit]
-        for local_index in indices:
-            global_index = int(start + int(local_index))
-            best.append(_ScoredIndex(score=float(scores[int(local_index)]), index=global_index))
+        score_matrix = cosine_similarity_matrix(float32_rows(embeddings, start, end), query_vectors)
+        for query_index in range(query_count):
+            scores = score_matrix[:, query_index]
+            batch_positions = top_k_positions(scores, limit=limit)
+            candidate_scores = np.concatenate([best_scores[query_index], scores[batch_positions]])
+            candidate_indices = np.concatenate([best_indices[query_index], batch_positions + start])
+            keep = top_k_positions(candidate_scores, limit=limit, indices=candidate_indices)
+            best_scores[query_index] = candidate_scores[keep]
+            best_indices[query_index] = candidate_indices[keep]
 
-    best.sort(key=lambda item: (-item.score, item.index))
-    return [int(item.index) for item in best[:limit]]
+    return [[int(index) for index in indices] for indices in best_indices]
 
 
 def _build_evidence(
@@ -239,7 +290,7 @@ def _build_evidence(
     candidates: List[int],
     embeddings: np.ndarray,
     query_vector: np.ndarray,
-    chunk_records: List[ChunkRecord],
+    chunk_records: Sequence[ChunkRecord],
     extraction_reference: Optional[ExtractionSnapshotReference],
 ) -> List[Evidence]:
     catalog = corpus.load_catalog()
@@ -259,7 +310,9 @@ def _build_evidence(
         )
         if span_text is None:
             span_text = _extract_span_text(text, (record.span_start, record.span_end))
-        score = float(cosine_similarity_scores(embeddings[idx : idx + 1], query_vector)[0])
+        score = float(
+            cosine_similarity_scores(float32_rows(embeddings, idx, idx + 1), query_vector)[0]
+        )
         evidence_items.append(
             Evidence(
                 item_id=record.item_id,
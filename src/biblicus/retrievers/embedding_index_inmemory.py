@@ -4,7 +4,7 @@ Embedding-index retriever that loads the full embedding matrix into memory at qu
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import numpy as np
 from pydantic import ConfigDict, Field
@@ -24,19 +24,22 @@ from ..retrieval import (
     hash_text,
 )
 from ..time import utc_now_iso
+from .base import Retriever
 from .embedding_index_common import (
     ChunkRecord,
     EmbeddingIndexConfiguration,
     _build_snippet,
     _extract_span_text,
     artifact_paths_for_snapshot,
+    build_embedding_provider,
     chunks_to_records,
     collect_chunks,
-    cosine_similarity_scores,
-    read_chunks_jsonl,
-    read_embeddings,
-    resolve_extraction_reference,
-    write_chunks_jsonl,
+    cosine_similarity_matrix,
+    embed_queries,
+    embedding_cache_stats,
+    open_embedding_index,
+    top_k_positions,
+    write_chunk_table,
     write_embeddings,
 )
 
@@ -54,7 +57,7 @@ class EmbeddingIndexInMemoryConfiguration(EmbeddingIndexConfiguration):
     maximum_cache_total_items: int = Field(default=25000, ge=1)
 
 
-class EmbeddingIndexInMemoryRetriever:
+class EmbeddingIndexInMemoryRetriever(Retriever):
     """
     Embedding retrieval retriever using an in-memory similarity scan.
     """
@@ -84,9 +87,9 @@ class EmbeddingIndexInMemoryRetriever:
                 "Use embedding-index-file or increase maximum_cache_total_items."
             )
 
-        provider = parsed_config.embedding_provider.build_provider()
         chunk_texts = [chunk.text for chunk in chunks]
-        embeddings = provider.embed_texts(chunk_texts)
+        with build_embedding_provider(corpus, parsed_config) as provider:
+            embeddings = provider.embed_texts(chunk_texts)
         embeddings = embeddings.astype(np.float32)
 
         configuration_manifest = create_configuration_manifest(
@@ -108,8 +111,13 @@ class EmbeddingIndexInMemoryRetriever:
         chunks_path = corpus.root / paths["chunks"]
         embeddings_path.parent.mkdir(parents=True, exist_ok=True)
 
-        write_embeddings(embeddings_path, embeddings)
-        write_chunks_jsonl(chunks_path, chunks_to_records(chunks))
+        write_embeddings(embeddings_path, embeddings, dtype=parsed_config.embedding_dtype)
+        write_chunk_table(
+            chunks_path,
+            corpus.root / paths["chunk_item_ids"],
+            chunks_to_records(chunks),
+            count=len(chunks),
+        )
 
         stats = {
             "items": len(corpus.load_catalog().items),
@@ -120,10 +128,15 @@ class EmbeddingIndexInMemoryRetriever:
                 if embeddings.size
                 else parsed_config.embedding_provider.dimensions
             ),
+            **embedding_cache_stats(provider),
         }
         snapshot = snapshot.model_copy(
             update={
-                "snapshot_artifacts": [paths["embeddings"], paths["chunks"]],
+                "snapshot_artifacts": [
+                    paths["embeddings"],
+                    paths["chunks"],
+                    paths["chunk_item_ids"],
+                ],
                 "stats": stats,
             }
         )
@@ -152,67 +165,94 @@ class EmbeddingIndexInMemoryRetriever:
         :return: Retrieval results containing evidence.
         :rtype: biblicus.models.RetrievalResult
         """
-        parsed_config = EmbeddingIndexInMemoryConfiguration.model_validate(
-            snapshot.configuration.configuration
+        results = self.query_batch(
+            corpus, snapshot=snapshot, query_texts=[query_text], budget=budget
         )
-        extraction_reference = resolve_extraction_reference(corpus, parsed_config)
-
-        paths = artifact_paths_for_snapshot(
-            snapshot_id=snapshot.snapshot_id, retriever_id=self.retriever_id
-        )
-        embeddings_path = corpus.root / paths["embeddings"]
-        chunks_path = corpus.root / paths["chunks"]
-        if not embeddings_path.is_file() or not chunks_path.is_file():
-            raise FileNotFoundError("Embedding index artifacts are missing for this snapshot")
+        return results[0]
 
-        embeddings = read_embeddings(embeddings_path, mmap=False).astype(np.float32)
-        chunk_records = read_chunks_jsonl(chunks_path)
-        if embeddings.shape[0] != len(chunk_records):
-            raise ValueError(
-                "Embedding index artifacts are inconsistent: "
-                "embeddings row count does not match chunk record count"
-            )
+    def query_batch(
+        self,
+        corpus: Corpus,
+        *,
+        snapshot: RetrievalSnapshot,
+        query_texts: Sequence[str],
+        budget: QueryBudget,
+    ) -> List[RetrievalResult]:
+        """
+        Query an embedding index snapshot with several query texts at once.
 
-        provider = parsed_config.embedding_provider.build_provider()
-        query_embedding = provider.embed_texts([query_text]).astype(np.float32)
-        if query_embedding.shape[0] != 1:
-            raise ValueError("Embedding provider returned an invalid query embedding shape")
-        scores = cosine_similarity_scores(embeddings, query_embedding[0])
+        The embedding matrix is loaded once per snapshot and kept on this retriever, queries are
+        embedded with one provider call, and all scores are computed with one matrix multiply.
 
-        candidates = _top_indices(
-            scores,
-            limit=_candidate_limit(budget.max_total_items + budget.offset),
-        )
-        evidence_items = _build_evidence(
-            corpus,
-            snapshot=snapshot,
-            configuration=parsed_config,
-            candidates=candidates,
-            scores=scores,
-            chunk_records=chunk_records,
-            extraction_reference=extraction_reference,
+        :param corpus: Corpus associated with the snapshot.
+        :type corpus: Corpus
+        :param snapshot: Snapshot manifest to use for querying.
+        :type snapshot: biblicus.models.RetrievalSnapshot
+        :param query_texts: Query texts to embed.
+        :type query_texts: Sequence[str]
+        :param budget: Evidence selection budget applied to every query.
+        :type budget: biblicus.models.QueryBudget
+        :return: Retrieval results in query order.
+        :rtype: list[biblicus.models.RetrievalResult]
+        """
+        opened = self.snapshot_state(
+            snapshot,
+            lambda: open_embedding_index(
+                corpus,
+                snapshot,
+                configuration_class=EmbeddingIndexInMemoryConfiguration,
+                paths=artifact_paths_for_snapshot(
+                    snapshot_id=snapshot.snapshot_id, retriever_id=self.retriever_id
+                ),
+                mmap=False,
+            ),
         )
-        ranked = [
-            item.model_copy(
-                update={
-                    "rank": index,
-                    "configuration_id": snapshot.configuration.configuration_id,
-                    "snapshot_id": snapshot.snapshot_id,
-                }
+        parsed_config = opened.configuration
+        embeddings = opened.embeddings
+
+        query_embeddings = embed_queries(parsed_config, query_texts)
+        score_matrix = cosine_similarity_matrix(embeddings, query_embeddings)
+
+        results: List[RetrievalResult] = []
+        for query_index, query_text in enumerate(query_texts):
+            scores = score_matrix[:, query_index]
+            candidates = _top_indices(
+                scores,
+                limit=_candidate_limit(budget.max_total_items + budget.offset),
             )
-            for index, item in enumerate(evidence_items, start=1)
-        ]
-        evidence = apply_budget(ranked, budget)
-        return RetrievalResult(
-            query_text=query_text,
-            budget=budget,
-            snapshot_id=snapshot.snapshot_id,
-            configuration_id=snapshot.configuration.configuration_id,
-            retriever_id=snapshot.configuration.retriever_id,
-            generated_at=utc_now_iso(),
-            evidence=evidence,
-            stats={"candidates": len(evidence_items), "returned": len(evidence)},
-        )
+            evidence_items = _build_evidence(
+                corpus,
+                snapshot=snapshot,
+                configuration=parsed_config,
+                candidates=candidates,
+                scores=scores,
+                chunk_records=opened.chunk_records,
+                extraction_reference=opened.extraction_reference,
+            )
+            ranked = [
+                item.model_copy(
+                    update={
+                        "rank": index,
+                        "configuration_id": snapshot.configuration.configuration_id,
+                        "snapshot_id": snapshot.snapshot_id,
+                    }
+                )
+                for index, item in enumerate(evidence_items, start=1)
+            ]
+            evidence = apply_budget(ranked, budget)
+            results.append(
+                RetrievalResult(
+                    query_text=query_text,
+                    budget=budget,
+                    snapshot_id=snapshot.snapshot_id,
+                    configuration_id=snapshot.configuration.configuration_id,
+                    retriever_id=snapshot.configuration.retriever_id,
+                    generated_at=utc_now_iso(),
+                    evidence=evidence,
+                    stats={"candidates": len(evidence_items), "returned": len(evidence)},
+                )
+            )
+        return results
 
 
 def _candidate_limit(max_total_items: int, *, multiplier: int = 10) -> int:
@@ -220,12 +260,7 @@ def _candidate_limit(max_total_items: int, *, multiplier: int = 10) -> int:
 
 
 def _top_indices(scores: np.ndarray, *, limit: int) -> List[int]:
-    if scores.size == 0:
-        return []
-    limit = min(int(limit), int(scores.size))
-    indices = np.argpartition(-scores, limit - 1)[:limit]
-    sorted_indices = indices[np.argsort(-scores[indices])]
-    return [int(index) for index in sorted_indices]
+    return [int(index) for index in top_k_positions(scores, limit=limit)]
 
 
 def _build_evidence(
@@ -235,7 +270,7 @@ def _build_evidence(
     configuration: EmbeddingIndexInMemoryConfiguration,
     candidates: List[int],
     scores: np.ndarray,
-    chunk_records: List[ChunkRecord],
+    chunk_records: Sequence[ChunkRecord],
     extraction_reference: Optional[ExtractionSnapshotReference],
 ) -> List[Evidence]:
     catalog = corpus.load_catalog()
@@ -4,7 +4,11 @@ Hybrid retriever combining lexical and vector results.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import math
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from threading import BoundedSemaphore, Lock
+from typing import Callable, Dict, List, Literal, Optional, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -12,6 +16,11 @@ from ..corpus import Corpus
 from ..models import Evidence, QueryBudget, RetrievalResult, RetrievalSnapshot
 from ..retrieval import apply_budget, create_configuration_manifest, create_snapshot_manifest
 from ..time import utc_now_iso
+from .base import Retriever
+
+HybridFusion = Literal["weighted", "reciprocal_rank", "min_max", "z_score"]
+
+HYBRID_COMPONENT_WORKERS = 4
 
 
 class HybridConfiguration(BaseModel):
@@ -30,6 +39,20 @@ class HybridConfiguration(BaseModel):
     :vartype lexical_configuration: dict[str, object]
     :ivar embedding_configuration: Optional embedding retriever configuration.
     :vartype embedding_configuration: dict[str, object]
+    :ivar fusion: How component scores are combined: ``weighted`` sums raw scores,
+        ``reciprocal_rank`` sums weighted reciprocal ranks, and ``min_max`` and ``z_score`` sum
+        weighted scores normalized per component.
+    :vartype fusion: str
+    :ivar reciprocal_rank_k: Rank offset for reciprocal rank fusion.
+    :vartype reciprocal_rank_k: int
+    :ivar candidate_multiplier: Factor by which component budgets exceed the final budget.
+    :vartype candidate_multiplier: int
+    :ivar parallel_components: Whether the lexical and embedding queries run concurrently.
+    :vartype parallel_components: bool
+    :ivar component_timeout_seconds: Optional time the query waits for component queries.
+        Components that have not finished by then are left out of the fused result. Their queries
+        are not interrupted; they finish in the background on the retriever's component pool.
+    :vartype component_timeout_seconds: float or None
     """
 
     model_config = ConfigDict(extra="forbid")
@@ -40,6 +63,11 @@ class HybridConfiguration(BaseModel):
     embedding_weight: float = Field(default=0.5, ge=0, le=1)
     lexical_configuration: Dict[str, object] = Field(default_factory=dict)
     embedding_configuration: Dict[str, object] = Field(default_factory=dict)
+    fusion: HybridFusion = "weighted"
+    reciprocal_rank_k: int = Field(default=60, ge=1)
+    candidate_multiplier: int = Field(default=5, ge=1)
+    parallel_components: bool = True
+    component_timeout_seconds: Optional[float] = Field(default=None, gt=0)
 
     @model_validator(mode="after")
     def _validate_weights(self) -> "HybridConfiguration":
@@ -48,16 +76,28 @@ class HybridConfiguration(BaseModel):
         return self
 
 
-class HybridRetriever:
+class HybridRetriever(Retriever):
     """
     Hybrid retriever that fuses lexical and embedding retrieval.
 
+    Component retrievers, and the thread pool that queries them, are kept between queries so they
+    can reuse connections and caches, and are released by :meth:`close`. The lexical component is
+    queried on the caller's thread while the embedding component runs on a pool shared by all
+    callers. The pool takes at most ``HYBRID_COMPONENT_WORKERS`` component queries at a time, so
+    queries abandoned by a time limit cannot pile up, and never queue behind each other.
+
     :ivar retriever_id: Retriever identifier.
     :vartype retriever_id: str
     """
 
     retriever_id = "hybrid"
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._components: Dict[str, Retriever] = {}
+        self._component_pool: Optional[_ComponentPool] = None
+        self._component_pool_lock = Lock()
+
     def build_snapshot(
         self, corpus: Corpus, *, configuration_name: str, configuration: Dict[str, object]
     ) -> RetrievalSnapshot:
@@ -116,6 +156,10 @@ class HybridRetriever:
         """
         Query using both lexical and embedding retrievers and fuse scores.
 
+        The component queries run concurrently unless ``parallel_components`` is false. The
+        result stats report each component's query time in ``component_seconds``, and the
+        components left out by the time limit in ``timed_out_components``.
+
         :param corpus: Corpus associated with the snapshot.
         :type corpus: Corpus
         :param snapshot: Snapshot manifest to use for querying.
@@ -127,28 +171,31 @@ class HybridRetriever:
         :return: Retrieval results containing evidence.
         :rtype: RetrievalResult
         """
-        configuration = HybridConfiguration.model_validate(snapshot.configuration.configuration)
-        _ensure_retriever_supported(configuration)
-        lexical_retriever = _resolve_retriever(configuration.lexical_retriever)
-        embedding_retriever = _resolve_retriever(configuration.embedding_retriever)
-        lexical_snapshot_id = snapshot.stats.get("lexical_snapshot_id")
-        embedding_snapshot_id = snapshot.stats.get("embedding_snapshot_id")
-        if not lexical_snapshot_id or not embedding_snapshot_id:
-            raise ValueError("Hybrid snapshot missing lexical or embedding snapshot identifiers")
-        lexical_snapshot = corpus.load_snapshot(str(lexical_snapshot_id))
-        embedding_snapshot = corpus.load_snapshot(str(embedding_snapshot_id))
-        component_budget = _expand_component_budget(budget)
-        lexical_result = lexical_retriever.query(
-            corpus, snapshot=lexical_snapshot, query_text=query_text, budget=component_budget
+        configuration, lexical_snapshot, embedding_snapshot = self.snapshot_state(
+            snapshot, lambda: _open_snapshot(corpus, snapshot)
         )
-        embedding_result = embedding_retriever.query(
-            corpus, snapshot=embedding_snapshot, query_text=query_text, budget=component_budget
+        component_budget = _expand_component_budget(
+            budget, multiplier=configuration.candidate_multiplier
+        )
+        components = {
+            "lexical": (self._component(configuration.lexical_retriever), lexical_snapshot),
+            "embedding": (self._component(configuration.embedding_retriever), embedding_snapshot),
+        }
+        results, component_seconds = _query_components(
+            corpus,
+            components=components,
+            query_text=query_text,
+            budget=component_budget,
+            pool=self._pool() if configuration.parallel_components else None,
+            timeout_seconds=configuration.component_timeout_seconds,
         )
         candidates = _fuse_evidence(
-            lexical_result.evidence,
-            embedding_result.evidence,
+            results["lexical"].evidence if "lexical" in results else [],
+            results["embedding"].evidence if "embedding" in results else [],
             lexical_weight=configuration.lexical_weight,
             embedding_weight=configuration.embedding_weight,
+            fusion=configuration.fusion,
+            reciprocal_rank_k=configuration.reciprocal_rank_k,
         )
         sorted_candidates = sorted(
             candidates,
@@ -168,10 +215,13 @@ class HybridRetriever:
         stats = {
             "candidates": len(sorted_candidates),
             "returned": len(evidence),
+            "fusion": configuration.fusion,
             "fusion_weights": {
                 "lexical": configuration.lexical_weight,
                 "embedding": configuration.embedding_weight,
             },
+            "component_seconds": component_seconds,
+            "timed_out_components": [name for name in components if name not in results],
         }
         return RetrievalResult(
             query_text=query_text,
@@ -184,6 +234,172 @@ class HybridRetriever:
             stats=stats,
         )
 
+    def close(self) -> None:
+        """
+        Close and release the component retrievers kept between queries.
+
+        Component queries still running after a time limit are waited for before the component
+        retrievers are closed.
+
+        :return: None.
+        :rtype: None
+        """
+        super().close()
+        with self._component_pool_lock:
+            pool, self._component_pool = self._component_pool, None
+        if pool is not None:
+            pool.shutdown()
+        components, self._components = self._components, {}
+        for retriever in components.values():
+            retriever.close()
+
+    def _pool(self) -> "_ComponentPool":
+        with self._component_pool_lock:
+            if self._component_pool is None:
+                self._component_pool = _ComponentPool(HYBRID_COMPONENT_WORKERS)
+            return self._component_pool
+
+    def _component(self, retriever_id: str) -> Retriever:
+        retriever = self._components.get(retriever_id)
+        if retriever is None:
+            retriever = _resolve_retriever(retriever_id)
+            self._components[retriever_id] = retriever
+        return retriever
+
+
+class _ComponentPool:
+    """
+    Thread pool for component queries that never queues work behind busy threads.
+
+    :param workers: Number of component queries that may run at once.
+    :type workers: int
+    """
+
+    def __init__(self, workers: int) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="biblicus-hybrid"
+        )
+        self._slots = BoundedSemaphore(workers)
+
+    def submit(self, function: Callable[..., object], *args: object) -> Optional[Future]:
+        """
+        Run a function on an idle pool thread.
+
+        :param function: Function to run.
+        :type function: Callable[..., object]
+        :param args: Positional arguments for the function.
+        :type args: object
+        :return: Future for the call, or None when every thread is busy.
+        :rtype: concurrent.futures.Future or None
+        """
+        if not self._slots.acquire(blocking=False):
+            return None
+        future = self._executor.submit(function, *args)
+        future.add_done_callback(lambda _future: self._slots.release())
+        return future
+
+    def shutdown(self) -> None:
+        """
+        Cancel queued calls and wait for running ones to finish.
+
+        :return: None.
+        :rtype: None
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _open_snapshot(
+    corpus: Corpus, snapshot: RetrievalSnapshot
+) -> Tuple[HybridConfiguration, RetrievalSnapshot, RetrievalSnapshot]:
+    """
+    Parse a hybrid snapshot configuration and load its component snapshot manifests.
+
+    :param corpus: Corpus associated with the snapshot.
+    :type corpus: Corpus
+    :param snapshot: Hybrid snapshot manifest.
+    :type snapshot: RetrievalSnapshot
+    :return: Parsed configuration, lexical snapshot, and embedding snapshot.
+    :rtype: tuple[HybridConfiguration, RetrievalSnapshot, RetrievalSnapshot]
+    :raises ValueError: If the snapshot does not record its component snapshots.
+    """
+    configuration = HybridConfiguration.model_validate(snapshot.configuration.configuration)
+    _ensure_retriever_supported(configuration)
+    lexical_snapshot_id = snapshot.stats.get("lexical_snapshot_id")
+    embedding_snapshot_id = snapshot.stats.get("embedding_snapshot_id")
+    if not lexical_snapshot_id or not embedding_snapshot_id:
+        raise ValueError("Hybrid snapshot missing lexical or embedding snapshot identifiers")
+    lexical_snapshot = corpus.load_snapshot(str(lexical_snapshot_id))
+    embedding_snapshot = corpus.load_snapshot(str(embedding_snapshot_id))
+    return configuration, lexical_snapshot, embedding_snapshot
+
+
+def _query_components(
+    corpus: Corpus,
+    *,
+    components: Dict[str, Tuple[Retriever, RetrievalSnapshot]],
+    query_text: str,
+    budget: QueryBudget,
+    pool: Optional[_ComponentPool],
+    timeout_seconds: Optional[float],
+) -> Tuple[Dict[str, RetrievalResult], Dict[str, float]]:
+    """
+    Query component retrievers, waiting up to an optional time limit.
+
+    The first component runs on the caller's thread. With a pool, the other components run on it
+    meanwhile; without one, or when every pool thread is busy and no time limit is set, they run
+    on the caller's thread in turn. Components left out of the results are those that had not
+    started by the time limit, those still running on the pool at the time limit, which finish in
+    the background, and those that found every pool thread busy while a time limit was set.
+
+    :param corpus: Corpus associated with the snapshots.
+    :type corpus: Corpus
+    :param components: Retriever and snapshot keyed by component name.
+    :type components: dict[str, tuple[Retriever, RetrievalSnapshot]]
+    :param query_text: Query text to execute.
+    :type query_text: str
+    :param budget: Component evidence budget.
+    :type budget: QueryBudget
+    :param pool: Pool for components after the first, or None to query them in turn.
+    :type pool: _ComponentPool or None
+    :param timeout_seconds: Optional time limit for all component queries.
+    :type timeout_seconds: float or None
+    :return: Results of the components that finished, and query seconds per finished component.
+    :rtype: tuple[dict[str, RetrievalResult], dict[str, float]]
+    """
+
+    def timed_query(retriever: Retriever, snapshot: RetrievalSnapshot):
+        started = time.perf_counter()
+        result = retriever.query(corpus, snapshot=snapshot, query_text=query_text, budget=budget)
+        return result, time.perf_counter() - started
+
+    deadline = None if timeout_seconds is None else time.perf_counter() + timeout_seconds
+    first, *others = components
+    inline = [first]
+    futures: Dict[str, Future] = {}
+    for name in others:
+        future = pool.submit(timed_query, *components[name]) if pool is not None else None
+        if future is not None:
+            futures[name] = future
+        elif pool is None or deadline is None:
+            inline.append(name)
+    finished: Dict[str, Tuple[RetrievalResult, float]] = {}
+    try:
+        for name in inline:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            finished[name] = timed_query(*components[name])
+        remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+        wait(futures.values(), timeout=remaining)
+        for name, future in futures.items():
+            if future.done():
+                finished[name] = future.result()
+    finally:
+        for future in futures.values():
+            future.cancel()
+    results = {name: finished[name][0] for name in components if name in finished}
+    component_seconds = {name: finished[name][1] for name in components if name in finished}
+    return results, component_seconds
+
 
 def _ensure_retriever_supported(configuration: HybridConfiguration) -> None:
     """
@@ -250,10 +466,17 @@ def _fuse_evidence(
     *,
     lexical_weight: float,
     embedding_weight: float,
+    fusion: HybridFusion = "weighted",
+    reciprocal_rank_k: int = 60,
 ) -> List[Evidence]:
     """
     Fuse lexical and embedding evidence lists into hybrid candidates.
 
+    Each component contributes one evidence item per item identifier, chosen by
+    :func:`_item_evidence`; it supplies the fusion score, the stage score, and the evidence text.
+    Items missing from one component receive that component's lowest fusion score: zero for raw,
+    reciprocal rank, and min-max scores, and the minimum z-score for z-score fusion.
+
     :param lexical: Lexical evidence list.
     :type lexical: list[Evidence]
     :param embedding: Embedding evidence list.
@@ -262,22 +485,36 @@ def _fuse_evidence(
     :type lexical_weight: float
     :param embedding_weight: Embedding score weight.
     :type embedding_weight: float
+    :param fusion: Score fusion mode.
+    :type fusion: str
+    :param reciprocal_rank_k: Rank offset for reciprocal rank fusion.
+    :type reciprocal_rank_k: int
     :return: Hybrid evidence list.
     :rtype: list[Evidence]
     """
+    lexical_items = _item_evidence(lexical, fusion=fusion)
+    embedding_items = _item_evidence(embedding, fusion=fusion)
     merged: Dict[str, Dict[str, Optional[Evidence]]] = {}
-    for evidence_item in lexical:
-        merged.setdefault(evidence_item.item_id, {})["lexical"] = evidence_item
-    for evidence_item in embedding:
-        merged.setdefault(evidence_item.item_id, {})["embedding"] = evidence_item
+    for item_id, evidence_item in lexical_items.items():
+        merged.setdefault(item_id, {})["lexical"] = evidence_item
+    for item_id, evidence_item in embedding_items.items():
+        merged.setdefault(item_id, {})["embedding"] = evidence_item
 
+    lexical_fused, lexical_floor = _fusion_scores(
+        lexical_items, fusion=fusion, reciprocal_rank_k=reciprocal_rank_k
+    )
+    embedding_fused, embedding_floor = _fusion_scores(
+        embedding_items, fusion=fusion, reciprocal_rank_k=reciprocal_rank_k
+    )
     candidates: List[Evidence] = []
     for item_id, sources in merged.items():
         lexical_evidence = sources.get("lexical")
         embedding_evidence = sources.get("embedding")
         lexical_score = lexical_evidence.score if lexical_evidence else 0.0
         embedding_score = embedding_evidence.score if embedding_evidence else 0.0
-        combined_score = (lexical_score * lexical_weight) + (embedding_score * embedding_weight)
+        combined_score = (lexical_fused.get(item_id, lexical_floor) * lexical_weight) + (
+            embedding_fused.get(item_id, embedding_floor) * embedding_weight
+        )
         base_evidence = lexical_evidence or embedding_evidence
         candidates.append(
             Evidence(
@@ -299,3 +536,66 @@ def _fuse_evidence(
             )
         )
     return candidates
+
+
+def _item_evidence(evidence: List[Evidence], *, fusion: HybridFusion) -> Dict[str, Evidence]:
+    """
+    Choose the evidence that represents each item in one component's ranked list.
+
+    Rank-based and normalized fusion represent an item with several chunks by its first, best
+    ranked chunk. Weighted fusion keeps its original behavior of using the item's last chunk.
+
+    :param evidence: Component evidence in rank order.
+    :type evidence: list[Evidence]
+    :param fusion: Score fusion mode.
+    :type fusion: str
+    :return: Evidence keyed by item identifier, in the order items first appear.
+    :rtype: dict[str, Evidence]
+    """
+    if fusion == "weighted":
+        return {evidence_item.item_id: evidence_item for evidence_item in evidence}
+    items: Dict[str, Evidence] = {}
+    for evidence_item in evidence:
+        items.setdefault(evidence_item.item_id, evidence_item)
+    return items
+
+
+def _fusion_scores(
+    items: Dict[str, Evidence], *, fusion: HybridFusion, reciprocal_rank_k: int
+) -> Tuple[Dict[str, float], float]:
+    """
+    Score one component's evidence for fusion.
+
+    :param items: Evidence representing each item, in rank order.
+    :type items: dict[str, Evidence]
+    :param fusion: Score fusion mode.
+    :type fusion: str
+    :param reciprocal_rank_k: Rank offset for reciprocal rank fusion.
+    :type reciprocal_rank_k: int
+    :return: Fusion score keyed by item identifier, and the score for items not in the list.
+    :rtype: tuple[dict[str, float], float]
+    """
+    scores = {item_id: evidence_item.score for item_id, evidence_item in items.items()}
+    if fusion == "weighted":
+        return scores, 0.0
+    if fusion == "reciprocal_rank":
+        return {
+            item_id: 1.0 / (reciprocal_rank_k + rank)
+            for rank, item_id in enumerate(scores, start=1)
+        }, 0.0
+    if not scores:
+        return scores, 0.0
+    values = list(scores.values())
+    if fusion == "min_max":
+        low, high = min(values), max(values)
+        spread = high - low
+        return {
+            item_id: (score - low) / spread if spread else 1.0 for item_id, score in scores.items()
+        }, 0.0
+    mean = sum(values) / len(values)
+    deviation = math.sqrt(sum((value - mean) ** 2 for value in values) / len(values))
+    normalized = {
+        item_id: (score - mean) / deviation if deviation else 0.0
+        for item_id, score in scores.items()
+    }
+    return normalized, min(normalized.values())
@@ -0,0 +1,307 @@
+"""
+Process-wide registry of retrieval snapshots opened for querying.
+
+Long-lived processes answer many queries against a few snapshots. Snapshots are immutable once
+built, so the registry keeps each one open with its retriever, and the retriever keeps the parsed
+configuration, memory-mapped artifacts, and connections it opened on earlier queries. Callers
+lease a snapshot for the duration of their queries, so evicting it never closes a retriever that
+another thread is still querying.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..corpus import Corpus
+from ..models import QueryBudget, RetrievalResult, RetrievalSnapshot
+from . import get_retriever
+from .base import Retriever
+
+DEFAULT_OPENED_SNAPSHOT_LIMIT = 8
+
+
+@dataclass(frozen=True)
+class OpenedSnapshot:
+    """
+    Retrieval snapshot opened for querying.
+
+    :ivar corpus: Corpus that owns the snapshot.
+    :vartype corpus: Corpus
+    :ivar snapshot: Snapshot manifest.
+    :vartype snapshot: RetrievalSnapshot
+    :ivar retriever: Retriever instance that keeps the snapshot state between queries.
+    :vartype retriever: Retriever
+    """
+
+    corpus: Corpus
+    snapshot: RetrievalSnapshot
+    retriever: Retriever
+
+    def query(self, query_text: str, *, budget: QueryBudget) -> RetrievalResult:
+        """
+        Query the snapshot.
+
+        :param query_text: Query text to execute.
+        :type query_text: str
+        :param budget: Evidence selection budget.
+        :type budget: QueryBudget
+        :return: Retrieval results containing evidence.
+        :rtype: RetrievalResult
+        """
+        return self.retriever.query(
+            self.corpus, snapshot=self.snapshot, query_text=query_text, budget=budget
+        )
+
+    def query_batch(
+        self, query_texts: Sequence[str], *, budget: QueryBudget
+    ) -> List[RetrievalResult]:
+        """
+        Query the snapshot with several query texts.
+
+        :param query_texts: Query texts to execute.
+        :type query_texts: Sequence[str]
+        :param budget: Evidence selection budget applied to every query.
+        :type budget: QueryBudget
+        :return: Retrieval results in query order.
+        :rtype: list[RetrievalResult]
+        """
+        return self.retriever.query_batch(
+            self.corpus, snapshot=self.snapshot, query_texts=query_texts, budget=budget
+        )
+
+
+@dataclass
+class _RegisteredSnapshot:
+    """
+    Registry bookkeeping for one opened snapshot.
+
+    :ivar opened: Opened snapshot.
+    :vartype opened: OpenedSnapshot
+    :ivar leases: Number of leases not yet released.
+    :vartype leases: int
+    :ivar retired: Whether the snapshot left the registry and closes on its last release.
+    :vartype retired: bool
+    """
+
+    opened: OpenedSnapshot
+    leases: int = 0
+    retired: bool = False
+
+
+class OpenedSnapshotLease:
+    """
+    Lease on an opened snapshot, released when the caller is done querying.
+
+    A snapshot evicted from the registry stays open until every lease on it is released. Use the
+    lease as a context manager, or call :meth:`release` once.
+
+    :param registry: Registry that issued the lease.
+    :type registry: OpenedSnapshotRegistry
+    :param entry: Registered snapshot the lease holds open.
+    :type entry: _RegisteredSnapshot
+    """
+
+    def __init__(self, registry: "OpenedSnapshotRegistry", entry: _RegisteredSnapshot) -> None:
+        self._registry = registry
+        self._entry = entry
+        self._released = False
+
+    @property
+    def snapshot(self) -> RetrievalSnapshot:
+        """
+        Snapshot manifest.
+
+        :return: Snapshot manifest.
+        :rtype: RetrievalSnapshot
+        """
+        return self._entry.opened.snapshot
+
+    @property
+    def retriever(self) -> Retriever:
+        """
+        Retriever instance that keeps the snapshot state between queries.
+
+        :return: Retriever.
+        :rtype: Retriever
+        """
+        return self._entry.opened.retriever
+
+    def query(self, query_text: str, *, budget: QueryBudget) -> RetrievalResult:
+        """
+        Query the leased snapshot.
+
+        :param query_text: Query text to execute.
+        :type query_text: str
+        :param budget: Evidence selection budget.
+        :type budget: QueryBudget
+        :return: Retrieval results containing evidence.
+        :rtype: RetrievalResult
+        :raises ValueError: If the lease was released.
+        """
+        return self._opened().query(query_text, budget=budget)
+
+    def query_batch(
+        self, query_texts: Sequence[str], *, budget: QueryBudget
+    ) -> List[RetrievalResult]:
+        """
+        Query the leased snapshot with several query texts.
+
+        :param query_texts: Query texts to execute.
+        :type query_texts: Sequence[str]
+        :param budget: Evidence selection budget applied to every query.
+        :type budget: QueryBudget
+        :return: Retrieval results in query order.
+        :rtype: list[RetrievalResult]
+        :raises ValueError: If the lease was released.
+        """
+        return self._opened().query_batch(query_texts, budget=budget)
+
+    def release(self) -> None:
+        """
+        Release the lease. Releasing a lease more than once has no effect.
+
+        :return: None.
+        :rtype: None
+        """
+        if self._released:
+            return
+        self._released = True
+        self._registry._release(self._entry)
+
+    def _opened(self) -> OpenedSnapshot:
+        if self._released:
+            raise ValueError("Opened snapshot lease was already released")
+        return self._entry.opened
+
+    def __enter__(self) -> "OpenedSnapshotLease":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release()
+
+
+class OpenedSnapshotRegistry:
+    """
+    Bounded registry of opened snapshots keyed by corpus root and snapshot identifier.
+
+    The least recently used snapshot leaves the registry when more than ``max_snapshots`` are
+    open. Its retriever is closed once every lease on it has been released, so queries that are
+    still running against it finish first.
+
+    :param max_snapshots: Maximum number of snapshots kept open.
+    :type max_snapshots: int
+    :raises ValueError: If max_snapshots is not positive.
+    """
+
+    def __init__(self, max_snapshots: int = DEFAULT_OPENED_SNAPSHOT_LIMIT) -> None:
+        if max_snapshots < 1:
+            raise ValueError("max_snapshots must be at least 1")
+        self._max_snapshots = max_snapshots
+        self._lock = Lock()
+        self._snapshots: "OrderedDict[Tuple[str, str], _RegisteredSnapshot]" = OrderedDict()
+        self._opened = 0
+        self._reused = 0
+        self._evicted = 0
+
+    def open(self, corpus: Corpus, snapshot_id: str) -> OpenedSnapshotLease:
+        """
+        Lease the opened snapshot, loading its manifest and retriever on first use.
+
+        Release the returned lease when done querying.
+
+        :param corpus: Corpus that owns the snapshot.
+        :type corpus: Corpus
+        :param snapshot_id: Snapshot identifier.
+        :type snapshot_id: str
+        :return: Lease on the opened snapshot.
+        :rtype: OpenedSnapshotLease
+        :raises FileNotFoundError: If the snapshot manifest does not exist.
+        """
+        key = (str(corpus.root), snapshot_id)
+        closable: List[OpenedSnapshot] = []
+        with self._lock:
+            entry = self._snapshots.get(key)
+            if entry is not None:
+                self._snapshots.move_to_end(key)
+                self._reused += 1
+            else:
+                snapshot = corpus.load_snapshot(snapshot_id)
+                entry = _RegisteredSnapshot(
+                    opened=OpenedSnapshot(
+                        corpus=corpus,
+                        snapshot=snapshot,
+                        retriever=get_retriever(snapshot.configuration.retriever_id),
+                    )
+                )
+                self._snapshots[key] = entry
+                self._opened += 1
+                while len(self._snapshots) > self._max_snapshots:
+                    closable.extend(self._retire(self._snapshots.popitem(last=False)[1]))
+                    self._evicted += 1
+            entry.leases += 1
+        for stale in closable:
+            stale.retriever.close()
+        return OpenedSnapshotLease(self, entry)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report registry counters.
+
+        :return: Snapshots opened, snapshot reuses, evictions, and snapshots currently open.
+        :rtype: dict[str, int]
+        """
+        with self._lock:
+            return {
+                "snapshots_opened": self._opened,
+                "snapshot_reuses": self._reused,
+                "snapshot_evictions": self._evicted,
+                "open_snapshots": len(self._snapshots),
+            }
+
+    def close(self) -> None:
+        """
+        Close every opened snapshot. Snapshots still leased close when their last lease is
+        released.
+
+        :return: None.
+        :rtype: None
+        """
+        closable: List[OpenedSnapshot] = []
+        with self._lock:
+            for entry in self._snapshots.values():
+                closable.extend(self._retire(entry))
+            self._snapshots.clear()
+        for opened in closable:
+            opened.retriever.close()
+
+    def _retire(self, entry: _RegisteredSnapshot) -> List[OpenedSnapshot]:
+        entry.retired = True
+        return [entry.opened] if entry.leases == 0 else []
+
+    def _release(self, entry: _RegisteredSnapshot) -> None:
+        with self._lock:
+            entry.leases -= 1
+            closable = entry.retired and entry.leases == 0
+        if closable:
+            entry.opened.retriever.close()
+
+
+_REGISTRY: Optional[OpenedSnapshotRegistry] = None
+_REGISTRY_LOCK = Lock()
+
+
+def opened_snapshots() -> OpenedSnapshotRegistry:
+    """
+    Return the process-wide opened snapshot registry.
+
+    :return: Shared registry.
+    :rtype: OpenedSnapshotRegistry
+    """
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            _REGISTRY = OpenedSnapshotRegistry()
+        return _REGISTRY
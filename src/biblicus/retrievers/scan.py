@@ -4,13 +4,22 @@ Naive full-scan retriever.
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional, Tuple
-
+import mmap
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
+from ..constants import RETRIEVAL_DIR_NAME
 from ..corpus import Corpus
 from ..frontmatter import parse_front_matter
 from ..models import (
+    CatalogItem,
     Evidence,
     ExtractionSnapshotReference,
     QueryBudget,
@@ -25,6 +34,7 @@ from ..retrieval import (
     hash_text,
 )
 from ..time import utc_now_iso
+from .base import Retriever
 
 
 class ScanConfiguration(BaseModel):
@@ -35,29 +45,42 @@ class ScanConfiguration(BaseModel):
     :vartype snippet_characters: int
     :ivar extraction_snapshot: Optional extraction snapshot reference in the form extractor_id:snapshot_id.
     :vartype extraction_snapshot: str or None
+    :ivar scoring_workers: Number of worker processes that score the packed text store per query.
+    :vartype scoring_workers: int
     """
 
     model_config = ConfigDict(extra="forbid")
 
     snippet_characters: int = Field(default=400, ge=1)
     extraction_snapshot: Optional[str] = None
+    scoring_workers: int = Field(default=1, ge=1)
 
 
-class ScanRetriever:
+class ScanRetriever(Retriever):
     """
     Naive retriever that scans all text items at query time.
 
+    Snapshots configured with more than one scoring worker share a process pool that is kept
+    between queries and shut down by :meth:`close`.
+
     :ivar retriever_id: Retriever identifier.
     :vartype retriever_id: str
     """
 
     retriever_id = "scan"
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._scoring_pool: Optional[ProcessPoolExecutor] = None
+        self._scoring_pool_workers = 0
+        self._retired_scoring_pools: List[ProcessPoolExecutor] = []
+        self._scoring_pool_lock = Lock()
+
     def build_snapshot(
         self, corpus: Corpus, *, configuration_name: str, configuration: Dict[str, object]
     ) -> RetrievalSnapshot:
         """
-        Register a scan retriever snapshot (no snapshot artifacts).
+        Pack every text item into a snapshot text store and register a scan snapshot.
 
         :param corpus: Corpus to build against.
         :type corpus: Corpus
@@ -75,16 +98,33 @@ class ScanRetriever:
             name=configuration_name,
             configuration=parsed_config.model_dump(),
         )
-        stats = {
-            "items": len(catalog.items),
-            "text_items": _count_text_items(corpus, catalog.items.values(), parsed_config),
-        }
         snapshot = create_snapshot_manifest(
             corpus,
             configuration=configuration_manifest,
-            stats=stats,
+            stats={},
             snapshot_artifacts=[],
         )
+        paths = _text_store_paths(snapshot_id=snapshot.snapshot_id, retriever_id=self.retriever_id)
+        extraction_reference = _resolve_extraction_reference(corpus, parsed_config)
+        documents, text_items, text_bytes = _write_text_store(
+            corpus,
+            catalog.items.values(),
+            root=corpus.root,
+            paths=paths,
+            extraction_reference=extraction_reference,
+        )
+        stats = {
+            "items": len(catalog.items),
+            "text_items": text_items,
+            "documents": documents,
+            "text_bytes": text_bytes,
+        }
+        snapshot = snapshot.model_copy(
+            update={
+                "snapshot_artifacts": [paths["index"], paths["lower"], paths["text"]],
+                "stats": stats,
+            }
+        )
         corpus.write_snapshot(snapshot)
         return snapshot
 
@@ -110,43 +150,136 @@ class ScanRetriever:
         :return: Retrieval results containing evidence.
         :rtype: RetrievalResult
         """
-        parsed_config = ScanConfiguration.model_validate(snapshot.configuration.configuration)
-        catalog = corpus.load_catalog()
-        extraction_reference = _resolve_extraction_reference(corpus, parsed_config)
-        query_tokens = _tokenize_query(query_text)
-        scored_candidates = _score_items(
-            corpus,
-            catalog.items.values(),
-            query_tokens,
-            parsed_config.snippet_characters,
-            extraction_reference=extraction_reference,
+        results = self.query_batch(
+            corpus, snapshot=snapshot, query_texts=[query_text], budget=budget
         )
-        sorted_candidates = sorted(
-            scored_candidates,
-            key=lambda evidence_item: (-evidence_item.score, evidence_item.item_id),
+        return results[0]
+
+    def query_batch(
+        self,
+        corpus: Corpus,
+        *,
+        snapshot: RetrievalSnapshot,
+        query_texts: Sequence[str],
+        budget: QueryBudget,
+    ) -> List[RetrievalResult]:
+        """
+        Query the corpus with a full scan of the packed text store for each query text.
+
+        Snapshots built without a text store fall back to reading every catalog item.
+
+        :param corpus: Corpus associated with the snapshot.
+        :type corpus: Corpus
+        :param snapshot: Snapshot manifest to use for querying.
+        :type snapshot: RetrievalSnapshot
+        :param query_texts: Query texts to execute.
+        :type query_texts: Sequence[str]
+        :param budget: Evidence selection budget applied to every query.
+        :type budget: QueryBudget
+        :return: Retrieval results in query order.
+        :rtype: list[RetrievalResult]
+        """
+        parsed_config, text_store, extraction_reference = self.snapshot_state(
+            snapshot, lambda: _open_snapshot(corpus, snapshot)
         )
-        ranked = [
-            evidence_item.model_copy(
-                update={
-                    "rank": index,
-                    "configuration_id": snapshot.configuration.configuration_id,
-                    "snapshot_id": snapshot.snapshot_id,
-                }
+        catalog = corpus.load_catalog()
+        results: List[RetrievalResult] = []
+        for query_text in query_texts:
+            query_tokens = _tokenize_query(query_text)
+            if text_store is None:
+                scored_candidates = _score_items(
+                    corpus,
+                    catalog.items.values(),
+                    query_tokens,
+                    parsed_config.snippet_characters,
+                    extraction_reference=extraction_reference,
+                )
+                sorted_candidates: Iterable[Evidence] = sorted(
+                    scored_candidates,
+                    key=lambda evidence_item: (-evidence_item.score, evidence_item.item_id),
+                )
+                candidate_count = len(scored_candidates)
+            else:
+                ranked_documents = _rank_text_store(
+                    text_store,
+                    query_tokens,
+                    workers=parsed_config.scoring_workers,
+                    executor=self._scoring_executor(parsed_config.scoring_workers),
+                )
+                sorted_candidates = _iter_text_store_evidence(
+                    text_store,
+                    catalog.items,
+                    ranked_documents=ranked_documents,
+                    query_tokens=query_tokens,
+                    snippet_characters=parsed_config.snippet_characters,
+                )
+                candidate_count = len(ranked_documents)
+            ranked = (
+                evidence_item.model_copy(
+                    update={
+                        "rank": index,
+                        "configuration_id": snapshot.configuration.configuration_id,
+                        "snapshot_id": snapshot.snapshot_id,
+                    }
+                )
+                for index, evidence_item in enumerate(sorted_candidates, start=1)
             )
-            for index, evidence_item in enumerate(sorted_candidates, start=1)
-        ]
-        evidence = apply_budget(ranked, budget)
-        stats = {"candidates": len(sorted_candidates), "returned": len(evidence)}
-        return RetrievalResult(
-            query_text=query_text,
-            budget=budget,
-            snapshot_id=snapshot.snapshot_id,
-            configuration_id=snapshot.configuration.configuration_id,
-            retriever_id=snapshot.configuration.retriever_id,
-            generated_at=utc_now_iso(),
-            evidence=evidence,
-            stats=stats,
-        )
+            evidence = apply_budget(ranked, budget)
+            stats = {"candidates": candidate_count, "returned": len(evidence)}
+            results.append(
+                RetrievalResult(
+                    query_text=query_text,
+                    budget=budget,
+                    snapshot_id=snapshot.snapshot_id,
+                    configuration_id=snapshot.configuration.configuration_id,
+                    retriever_id=snapshot.configuration.retriever_id,
+                    generated_at=utc_now_iso(),
+                    evidence=evidence,
+                    stats=stats,
+                )
+            )
+        return results
+
+    def close(self) -> None:
+        """
+        Shut down the scoring process pools kept between queries.
+
+        :return: None.
+        :rtype: None
+        """
+        super().close()
+        with self._scoring_pool_lock:
+            pools = self._retired_scoring_pools
+            if self._scoring_pool is not None:
+                pools.append(self._scoring_pool)
+            self._scoring_pool = None
+            self._scoring_pool_workers = 0
+            self._retired_scoring_pools = []
+        for pool in pools:
+            pool.shutdown()
+
+    def _scoring_executor(self, workers: int) -> Optional[ProcessPoolExecutor]:
+        """
+        Return the shared scoring process pool, starting it on first use.
+
+        A pool started for fewer workers is replaced for later queries but kept open until
+        :meth:`close`, since queries on other threads may still be submitting to it.
+
+        :param workers: Number of scoring worker processes the query needs.
+        :type workers: int
+        :return: Process pool, or None when scoring runs in this process.
+        :rtype: ProcessPoolExecutor or None
+        """
+        if workers <= 1:
+            return None
+        with self._scoring_pool_lock:
+            if self._scoring_pool is not None and self._scoring_pool_workers >= workers:
+                return self._scoring_pool
+            if self._scoring_pool is not None:
+                self._retired_scoring_pools.append(self._scoring_pool)
+            self._scoring_pool = ProcessPoolExecutor(max_workers=workers)
+            self._scoring_pool_workers = workers
+            return self._scoring_pool
 
 
 def _resolve_extraction_reference(
@@ -175,42 +308,6 @@ def _resolve_extraction_reference(
     return extraction_reference
 
 
-def _count_text_items(
-    corpus: Corpus, items: Iterable[object], configuration: ScanConfiguration
-) -> int:
-    """
-    Count catalog items that represent text content.
-
-    When an extraction snapshot is configured, extracted artifacts are treated as text.
-
-    :param corpus: Corpus containing the items.
-    :type corpus: Corpus
-    :param items: Catalog items to inspect.
-    :type items: Iterable[object]
-    :param configuration: Parsed scan configuration.
-    :type configuration: ScanConfiguration
-    :return: Number of text items.
-    :rtype: int
-    """
-    text_item_count = 0
-    extraction_reference = _resolve_extraction_reference(corpus, configuration)
-    for catalog_item in items:
-        item_id = str(getattr(catalog_item, "id", ""))
-        if extraction_reference and item_id:
-            extracted_text = corpus.read_extracted_text(
-                extractor_id=extraction_reference.extractor_id,
-                snapshot_id=extraction_reference.snapshot_id,
-                item_id=item_id,
-            )
-            if isinstance(extracted_text, str) and extracted_text.strip():
-                text_item_count += 1
-                continue
-        media_type = getattr(catalog_item, "media_type", "")
-        if media_type == "text/markdown" or str(media_type).startswith("text/"):
-            text_item_count += 1
-    return text_item_count
-
-
 def _tokenize_query(query_text: str) -> List[str]:
     """
     Tokenize a query string for naive text matching.
@@ -360,27 +457,383 @@ def _score_items(
         match_score = sum(lower_text.count(token) for token in tokens)
         if match_score <= 0:
             continue
-        span = _find_first_match(item_text, tokens)
-        snippet = _build_snippet(item_text, span, max_chars=snippet_characters)
-        span_start = span[0] if span else None
-        span_end = span[1] if span else None
         evidence_items.append(
-            Evidence(
-                item_id=str(getattr(catalog_item, "id")),
-                source_uri=getattr(catalog_item, "source_uri", None),
-                media_type=str(media_type),
-                score=float(match_score),
-                rank=1,
-                text=snippet,
-                content_ref=None,
-                span_start=span_start,
-                span_end=span_end,
-                stage="scan",
-                configuration_id="",
-                snapshot_id="",
-                metadata=getattr(catalog_item, "metadata", {}) or {},
-                hash=hash_text(snippet),
+            _build_evidence(
+                catalog_item,
+                item_text=item_text,
+                match_score=match_score,
+                tokens=tokens,
+                snippet_characters=snippet_characters,
             )
         )
 
     return evidence_items
+
+
+def _build_evidence(
+    catalog_item: object,
+    *,
+    item_text: str,
+    match_score: int,
+    tokens: List[str],
+    snippet_characters: int,
+) -> Evidence:
+    """
+    Build an evidence candidate for a matching catalog item.
+
+    :param catalog_item: Catalog item the evidence refers to.
+    :type catalog_item: object
+    :param item_text: Text payload of the item.
+    :type item_text: str
+    :param match_score: Total count of query token occurrences.
+    :type match_score: int
+    :param tokens: Query tokens.
+    :type tokens: list[str]
+    :param snippet_characters: Snippet length budget.
+    :type snippet_characters: int
+    :return: Evidence candidate with a provisional rank.
+    :rtype: Evidence
+    """
+    span = _find_first_match(item_text, tokens)
+    snippet = _build_snippet(item_text, span, max_chars=snippet_characters)
+    span_start = span[0] if span else None
+    span_end = span[1] if span else None
+    return Evidence(
+        item_id=str(getattr(catalog_item, "id")),
+        source_uri=getattr(catalog_item, "source_uri", None),
+        media_type=str(getattr(catalog_item, "media_type", "")),
+        score=float(match_score),
+        rank=1,
+        text=snippet,
+        content_ref=None,
+        span_start=span_start,
+        span_end=span_end,
+        stage="scan",
+        configuration_id="",
+        snapshot_id="",
+        metadata=getattr(catalog_item, "metadata", {}) or {},
+        hash=hash_text(snippet),
+    )
+
+
+def _text_store_paths(*, snapshot_id: str, retriever_id: str) -> Dict[str, str]:
+    """
+    Build deterministic artifact relative paths for a packed text store.
+
+    :param snapshot_id: Snapshot identifier.
+    :type snapshot_id: str
+    :param retriever_id: Retriever identifier.
+    :type retriever_id: str
+    :return: Mapping with keys index, lower, and text.
+    :rtype: dict[str, str]
+    """
+    base_dir = Path(RETRIEVAL_DIR_NAME) / retriever_id / snapshot_id
+    return {
+        "index": str(base_dir / f"{snapshot_id}.text-index.npz"),
+        "lower": str(base_dir / f"{snapshot_id}.lower.bin"),
+        "text": str(base_dir / f"{snapshot_id}.text.bin"),
+    }
+
+
+def _write_text_store(
+    corpus: Corpus,
+    items: Iterable[object],
+    *,
+    root: Path,
+    paths: Dict[str, str],
+    extraction_reference: Optional[ExtractionSnapshotReference],
+) -> Tuple[int, int, int]:
+    """
+    Pack item text into a lowercase blob, an original-case blob, and an offset table.
+
+    Both blobs hold UTF-8 text back to back, one document after another. The lowercase blob is
+    what queries scan; the original-case blob is only read to build snippets for matches. Items
+    with text are counted in the same pass, including text items whose text is empty.
+
+    :param corpus: Corpus containing the items.
+    :type corpus: Corpus
+    :param items: Catalog items to pack.
+    :type items: Iterable[object]
+    :param root: Corpus root the artifact paths are relative to.
+    :type root: Path
+    :param paths: Artifact relative paths from _text_store_paths.
+    :type paths: dict[str, str]
+    :param extraction_reference: Optional extraction snapshot reference.
+    :type extraction_reference: ExtractionSnapshotReference or None
+    :return: Packed document count, text item count, and original-case text bytes.
+    :rtype: tuple[int, int, int]
+    """
+    text_items = 0
+    item_ids: List[str] = []
+    lower_offsets: List[int] = [0]
+    text_offsets: List[int] = [0]
+    (root / paths["index"]).parent.mkdir(parents=True, exist_ok=True)
+    with (root / paths["lower"]).open("wb") as lower_handle:
+        with (root / paths["text"]).open("wb") as text_handle:
+            for catalog_item in sorted(items, key=lambda item: str(getattr(item, "id", ""))):
+                item_id = str(getattr(catalog_item, "id", ""))
+                item_text = _load_text_from_item(
+                    corpus,
+                    item_id=item_id,
+                    relpath=getattr(catalog_item, "relpath", ""),
+                    media_type=str(getattr(catalog_item, "media_type", "")),
+                    extraction_reference=extraction_reference,
+                )
+                if item_text is None:
+                    continue
+                text_items += 1
+                if not item_text:
+                    continue
+                lower_bytes = item_text.lower().encode("utf-8")
+                text_bytes = item_text.encode("utf-8")
+                lower_handle.write(lower_bytes)
+                text_handle.write(text_bytes)
+                item_ids.append(item_id)
+                lower_offsets.append(lower_offsets[-1] + len(lower_bytes))
+                text_offsets.append(text_offsets[-1] + len(text_bytes))
+    with (root / paths["index"]).open("wb") as handle:
+        np.savez(
+            handle,
+            item_ids=np.array(item_ids, dtype=str),
+            lower_offsets=np.array(lower_offsets, dtype=np.int64),
+            text_offsets=np.array(text_offsets, dtype=np.int64),
+        )
+    return len(item_ids), text_items, text_offsets[-1]
+
+
+@dataclass
+class _TextStore:
+    """
+    Paths and offset tables for a packed text store.
+
+    :ivar item_ids: Item identifier for each packed document.
+    :vartype item_ids: list[str]
+    :ivar lower_path: Path to the lowercase blob.
+    :vartype lower_path: Path
+    :ivar lower_offsets: Document boundaries in the lowercase blob, length documents + 1.
+    :vartype lower_offsets: numpy.ndarray
+    :ivar text_path: Path to the original-case blob.
+    :vartype text_path: Path
+    :ivar text_offsets: Document boundaries in the original-case blob, length documents + 1.
+    :vartype text_offsets: numpy.ndarray
+    """
+
+    item_ids: List[str]
+    lower_path: Path
+    lower_offsets: np.ndarray
+    text_path: Path
+    text_offsets: np.ndarray
+
+
+def _open_snapshot(
+    corpus: Corpus, snapshot: RetrievalSnapshot
+) -> Tuple[ScanConfiguration, Optional[_TextStore], Optional[ExtractionSnapshotReference]]:
+    """
+    Open the configuration and text store of a snapshot for querying.
+
+    :param corpus: Corpus associated with the snapshot.
+    :type corpus: Corpus
+    :param snapshot: Snapshot manifest.
+    :type snapshot: RetrievalSnapshot
+    :return: Parsed configuration, text store, and the extraction reference used when the
+        snapshot has no text store.
+    :rtype: tuple[ScanConfiguration, _TextStore or None, ExtractionSnapshotReference or None]
+    """
+    parsed_config = ScanConfiguration.model_validate(snapshot.configuration.configuration)
+    text_store = _load_text_store(corpus, snapshot)
+    extraction_reference = (
+        _resolve_extraction_reference(corpus, parsed_config) if text_store is None else None
+    )
+    return parsed_config, text_store, extraction_reference
+
+
+def _load_text_store(corpus: Corpus, snapshot: RetrievalSnapshot) -> Optional[_TextStore]:
+    """
+    Load the packed text store recorded for a snapshot.
+
+    :param corpus: Corpus associated with the snapshot.
+    :type corpus: Corpus
+    :param snapshot: Snapshot manifest.
+    :type snapshot: RetrievalSnapshot
+    :return: Text store, or None for snapshots built without one.
+    :rtype: _TextStore or None
+    :raises FileNotFoundError: If the snapshot records a text store that is missing.
+    """
+    if not snapshot.snapshot_artifacts:
+        return None
+    index_path, lower_path, text_path = (
+        corpus.root / relpath for relpath in snapshot.snapshot_artifacts
+    )
+    if not (index_path.is_file() and lower_path.is_file() and text_path.is_file()):
+        raise FileNotFoundError("Scan text store artifacts are missing for this snapshot")
+    with np.load(index_path) as archive:
+        return _TextStore(
+            item_ids=[str(item_id) for item_id in archive["item_ids"]],
+            lower_path=lower_path,
+            lower_offsets=archive["lower_offsets"],
+            text_path=text_path,
+            text_offsets=archive["text_offsets"],
+        )
+
+
+def _count_packed_matches(lower_path: str, offsets: np.ndarray, tokens: List[bytes]) -> np.ndarray:
+    """
+    Count query token occurrences for a contiguous range of packed documents.
+
+    The lowercase blob is memory-mapped and scanned once per token across the whole range, and
+    each match is assigned to its document with a binary search over the offsets. Counts match
+    bytes.count on each document, which matches str.count on the decoded text because UTF-8
+    matches always align to characters.
+
+    :param lower_path: Path to the lowercase blob.
+    :type lower_path: str
+    :param offsets: Document boundaries for the range, length documents + 1.
+    :type offsets: numpy.ndarray
+    :param tokens: UTF-8 encoded query tokens.
+    :type tokens: list[bytes]
+    :return: Match count for each document in the range.
+    :rtype: numpy.ndarray
+    """
+    counts = np.zeros(len(offsets) - 1, dtype=np.int64)
+    start, end = int(offsets[0]), int(offsets[-1])
+    if end <= start:
+        return counts
+    with open(lower_path, "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as blob:
+            for token in tokens:
+                counts += _count_token_matches(blob, offsets, token, start=start, end=end)
+    return counts
+
+
+def _count_token_matches(
+    blob: mmap.mmap, offsets: np.ndarray, token: bytes, *, start: int, end: int
+) -> np.ndarray:
+    """
+    Count the non-overlapping occurrences of one token in each document of a blob range.
+
+    A match that runs past the end of its document is not counted. Such a match can hide a match
+    that starts in the next document, so the documents it reaches into are counted on their own.
+
+    :param blob: Memory-mapped lowercase blob.
+    :type blob: mmap.mmap
+    :param offsets: Document boundaries for the range, length documents + 1.
+    :type offsets: numpy.ndarray
+    :param token: UTF-8 encoded query token.
+    :type token: bytes
+    :param start: Blob position of the first document.
+    :type start: int
+    :param end: Blob position after the last document.
+    :type end: int
+    :return: Match count for each document in the range.
+    :rtype: numpy.ndarray
+    """
+    document_count = len(offsets) - 1
+    pattern = re.compile(re.escape(token))
+    positions = np.fromiter(
+        (match.start() for match in pattern.finditer(blob, start, end)), dtype=np.int64
+    )
+    documents = np.searchsorted(offsets, positions, side="right") - 1
+    within = positions + len(token) <= offsets[documents + 1]
+    counts = np.bincount(documents[within], minlength=document_count).astype(np.int64)
+    for position in positions[~within]:
+        first = int(np.searchsorted(offsets, position, side="right"))
+        last = int(np.searchsorted(offsets, position + len(token), side="left"))
+        for document in range(first, min(last, document_count)):
+            document_bytes = blob[offsets[document] : offsets[document + 1]]
+            counts[document] = document_bytes.count(token)
+    return counts
+
+
+def _rank_text_store(
+    text_store: _TextStore,
+    tokens: List[str],
+    *,
+    workers: int,
+    executor: Optional[ProcessPoolExecutor] = None,
+) -> List[Tuple[str, int]]:
+    """
+    Score every packed document and return the matching ones in rank order.
+
+    With more than one worker and a process pool, the documents are split into contiguous
+    ranges that are counted in the pool.
+
+    :param text_store: Packed text store.
+    :type text_store: _TextStore
+    :param tokens: Query tokens.
+    :type tokens: list[str]
+    :param workers: Number of ranges the documents are split into.
+    :type workers: int
+    :param executor: Process pool that counts the ranges.
+    :type executor: ProcessPoolExecutor or None
+    :return: Item identifiers and match counts, highest count first.
+    :rtype: list[tuple[str, int]]
+    """
+    encoded_tokens = [token.encode("utf-8") for token in tokens]
+    offsets = text_store.lower_offsets
+    document_count = len(offsets) - 1
+    if not encoded_tokens or document_count == 0:
+        return []
+    lower_path = str(text_store.lower_path)
+    if executor is None or workers <= 1 or document_count <= 1:
+        counts = _count_packed_matches(lower_path, offsets, encoded_tokens)
+    else:
+        boundaries = np.linspace(0, document_count, num=min(workers, document_count) + 1)
+        boundaries = boundaries.astype(np.int64)
+        ranges = [offsets[start : end + 1] for start, end in zip(boundaries, boundaries[1:])]
+        partial_counts = list(
+            executor.map(
+                _count_packed_matches,
+                [lower_path] * len(ranges),
+                ranges,
+                [encoded_tokens] * len(ranges),
+            )
+        )
+        counts = np.concatenate(partial_counts)
+    matched = np.flatnonzero(counts)
+    ranked = [(text_store.item_ids[document], int(counts[document])) for document in matched]
+    return sorted(ranked, key=lambda pair: (-pair[1], pair[0]))
+
+
+def _iter_text_store_evidence(
+    text_store: _TextStore,
+    catalog_items: Dict[str, CatalogItem],
+    *,
+    ranked_documents: List[Tuple[str, int]],
+    query_tokens: List[str],
+    snippet_characters: int,
+) -> Iterator[Evidence]:
+    """
+    Yield evidence for ranked documents, decoding original text only when a candidate is consumed.
+
+    Documents whose catalog item was removed are skipped.
+
+    :param text_store: Packed text store.
+    :type text_store: _TextStore
+    :param catalog_items: Catalog items keyed by identifier.
+    :type catalog_items: dict[str, CatalogItem]
+    :param ranked_documents: Item identifiers and match counts, highest count first.
+    :type ranked_documents: list[tuple[str, int]]
+    :param query_tokens: Query tokens.
+    :type query_tokens: list[str]
+    :param snippet_characters: Snippet length budget.
+    :type snippet_characters: int
+    :return: Evidence candidates in ranked order.
+    :rtype: Iterator[Evidence]
+    """
+    positions = {item_id: document for document, item_id in enumerate(text_store.item_ids)}
+    offsets = text_store.text_offsets
+    with text_store.text_path.open("rb") as handle:
+        for item_id, match_score in ranked_documents:
+            catalog_item = catalog_items.get(item_id)
+            if catalog_item is None:
+                continue
+            document = positions[item_id]
+            handle.seek(int(offsets[document]))
+            item_text = handle.read(int(offsets[document + 1] - offsets[document])).decode("utf-8")
+            yield _build_evidence(
+                catalog_item,
+                item_text=item_text,
+                match_score=match_score,
+                tokens=query_tokens,
+                snippet_characters=snippet_characters,
+            )
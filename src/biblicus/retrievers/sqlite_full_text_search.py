@@ -4,10 +4,16 @@ SQLite full-text search version five retriever for Biblicus.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
+import shutil
 import sqlite3
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
@@ -29,6 +35,7 @@ from ..retrieval import (
     hash_text,
 )
 from ..time import utc_now_iso
+from .base import Retriever
 
 
 class SqliteFullTextSearchConfiguration(BaseModel):
@@ -65,6 +72,13 @@ class SqliteFullTextSearchConfiguration(BaseModel):
     :vartype rerank_top_k: int
     :ivar extraction_snapshot: Optional extraction snapshot reference in the form extractor_id:snapshot_id.
     :vartype extraction_snapshot: str or None
+    :ivar build_workers: Number of threads that load and chunk item text during index builds.
+    :vartype build_workers: int
+    :ivar insert_batch_size: Number of chunk rows written per batched insert during index builds.
+    :vartype insert_batch_size: int
+    :ivar parent_snapshot: Snapshot identifier to update incrementally, or ``latest`` for this
+        retriever's most recent snapshot.
+    :vartype parent_snapshot: str or None
     """
 
     model_config = ConfigDict(extra="forbid")
@@ -84,6 +98,9 @@ class SqliteFullTextSearchConfiguration(BaseModel):
     rerank_model: Optional[str] = None
     rerank_top_k: int = Field(default=10, ge=1)
     extraction_snapshot: Optional[str] = None
+    build_workers: int = Field(default=1, ge=1)
+    insert_batch_size: int = Field(default=1000, ge=1)
+    parent_snapshot: Optional[str] = None
 
     @field_validator("stop_words")
     @classmethod
@@ -148,7 +165,7 @@ _ENGLISH_STOP_WORDS: Set[str] = {
 }
 
 
-class SqliteFullTextSearchRetriever:
+class SqliteFullTextSearchRetriever(Retriever):
     """
     SQLite full-text search version five retriever for practical local retrieval.
 
@@ -158,6 +175,10 @@ class SqliteFullTextSearchRetriever:
 
     retriever_id = "sqlite-full-text-search"
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._connection_pool = _ReadOnlyConnectionPool()
+
     def build_snapshot(
         self, corpus: Corpus, *, configuration_name: str, configuration: Dict[str, object]
     ) -> RetrievalSnapshot:
@@ -195,14 +216,29 @@ class SqliteFullTextSearchRetriever:
         db_path = corpus.root / db_relpath
         db_path.parent.mkdir(parents=True, exist_ok=True)
         extraction_reference = _resolve_extraction_reference(corpus, parsed_config)
+        parent_snapshot = _resolve_parent_snapshot(
+            corpus, parsed_config, retriever_id=self.retriever_id
+        )
+        parent_db_path = _incremental_parent_db_path(corpus, parent_snapshot, parsed_config)
         stats = _build_full_text_search_index(
             db_path=db_path,
             corpus=corpus,
             items=catalog.items.values(),
             configuration=parsed_config,
             extraction_reference=extraction_reference,
+            parent_db_path=parent_db_path,
+        )
+        snapshot = snapshot.model_copy(
+            update={
+                "snapshot_artifacts": [db_relpath],
+                "stats": stats,
+                "parent_snapshot_id": (
+                    parent_snapshot.snapshot_id
+                    if parent_snapshot is not None and parent_db_path is not None
+                    else None
+                ),
+            }
         )
-        snapshot = snapshot.model_copy(update={"snapshot_artifacts": [db_relpath], "stats": stats})
         corpus.write_snapshot(snapshot)
         return snapshot
 
@@ -228,52 +264,213 @@ class SqliteFullTextSearchRetriever:
         :return: Retrieval results containing evidence.
         :rtype: RetrievalResult
         """
-        parsed_config = SqliteFullTextSearchConfiguration.model_validate(
-            snapshot.configuration.configuration
+        results = self.query_batch(
+            corpus, snapshot=snapshot, query_texts=[query_text], budget=budget
         )
-        query_tokens = _tokenize_query(query_text)
-        stop_words = _resolve_stop_words(parsed_config.stop_words)
-        filtered_tokens = _apply_stop_words(query_tokens, stop_words)
-        if not filtered_tokens:
-            return RetrievalResult(
-                query_text=query_text,
+        return results[0]
+
+    def query_batch(
+        self,
+        corpus: Corpus,
+        *,
+        snapshot: RetrievalSnapshot,
+        query_texts: Sequence[str],
+        budget: QueryBudget,
+    ) -> List[RetrievalResult]:
+        """
+        Query the SQLite full-text search index with several query texts over one connection.
+
+        Connections are taken from this retriever's pool, so repeated queries against the same
+        snapshot on the same thread reuse one read-only connection until :meth:`close`.
+
+        :param corpus: Corpus associated with the snapshot.
+        :type corpus: Corpus
+        :param snapshot: Snapshot manifest to use for querying.
+        :type snapshot: RetrievalSnapshot
+        :param query_texts: Query texts to execute.
+        :type query_texts: Sequence[str]
+        :param budget: Evidence selection budget applied to every query.
+        :type budget: QueryBudget
+        :return: Retrieval results in query order.
+        :rtype: list[RetrievalResult]
+        """
+        parsed_config, stop_words = self.snapshot_state(
+            snapshot, lambda: _open_snapshot_configuration(snapshot)
+        )
+        connection: Optional[sqlite3.Connection] = None
+        results: List[RetrievalResult] = []
+        for query_text in query_texts:
+            filtered_tokens = _apply_stop_words(_tokenize_query(query_text), stop_words)
+            if not filtered_tokens:
+                results.append(
+                    RetrievalResult(
+                        query_text=query_text,
+                        budget=budget,
+                        snapshot_id=snapshot.snapshot_id,
+                        configuration_id=snapshot.configuration.configuration_id,
+                        retriever_id=snapshot.configuration.retriever_id,
+                        generated_at=utc_now_iso(),
+                        evidence=[],
+                        stats={"candidates": 0, "returned": 0},
+                    )
+                )
+                continue
+            if connection is None:
+                connection = self._connection_pool.acquire(
+                    _resolve_snapshot_db_path(corpus, snapshot)
+                )
+            candidates = _query_full_text_search_connection(
+                connection,
+                query_text=" ".join(filtered_tokens),
+                limit=_candidate_limit(budget.max_total_items + budget.offset),
+                snippet_characters=parsed_config.snippet_characters,
+            )
+            sorted_candidates = _rank_candidates(candidates)
+            evidence = _apply_rerank_if_enabled(
+                sorted_candidates,
+                query_tokens=filtered_tokens,
+                snapshot=snapshot,
                 budget=budget,
-                snapshot_id=snapshot.snapshot_id,
-                configuration_id=snapshot.configuration.configuration_id,
-                retriever_id=snapshot.configuration.retriever_id,
-                generated_at=utc_now_iso(),
-                evidence=[],
-                stats={"candidates": 0, "returned": 0},
+                rerank_enabled=parsed_config.rerank_enabled,
+                rerank_top_k=parsed_config.rerank_top_k,
             )
-        db_path = _resolve_snapshot_db_path(corpus, snapshot)
-        candidates = _query_full_text_search_index(
-            db_path=db_path,
-            query_text=" ".join(filtered_tokens),
-            limit=_candidate_limit(budget.max_total_items + budget.offset),
-            snippet_characters=parsed_config.snippet_characters,
-        )
-        sorted_candidates = _rank_candidates(candidates)
-        evidence = _apply_rerank_if_enabled(
-            sorted_candidates,
-            query_tokens=filtered_tokens,
-            snapshot=snapshot,
-            budget=budget,
-            rerank_enabled=parsed_config.rerank_enabled,
-            rerank_top_k=parsed_config.rerank_top_k,
-        )
-        stats: Dict[str, object] = {"candidates": len(sorted_candidates), "returned": len(evidence)}
-        if parsed_config.rerank_enabled:
-            stats["reranked_candidates"] = min(len(sorted_candidates), parsed_config.rerank_top_k)
-        return RetrievalResult(
-            query_text=query_text,
-            budget=budget,
-            snapshot_id=snapshot.snapshot_id,
-            configuration_id=snapshot.configuration.configuration_id,
-            retriever_id=snapshot.configuration.retriever_id,
-            generated_at=utc_now_iso(),
-            evidence=evidence,
-            stats=stats,
+            stats: Dict[str, object] = {
+                "candidates": len(sorted_candidates),
+                "returned": len(evidence),
+            }
+            if parsed_config.rerank_enabled:
+                stats["reranked_candidates"] = min(
+                    len(sorted_candidates), parsed_config.rerank_top_k
+                )
+            results.append(
+                RetrievalResult(
+                    query_text=query_text,
+                    budget=budget,
+                    snapshot_id=snapshot.snapshot_id,
+                    configuration_id=snapshot.configuration.configuration_id,
+                    retriever_id=snapshot.configuration.retriever_id,
+                    generated_at=utc_now_iso(),
+                    evidence=evidence,
+                    stats=stats,
+                )
+            )
+        return results
+
+    def connection_stats(self) -> Dict[str, float]:
+        """
+        Report how often queries reused a pooled connection.
+
+        :return: Connections opened, connection reuses, and the reuse rate.
+        :rtype: dict[str, float]
+        """
+        return self._connection_pool.stats()
+
+    def close(self) -> None:
+        """
+        Close every pooled connection held by this retriever.
+
+        :return: None.
+        :rtype: None
+        """
+        super().close()
+        self._connection_pool.close()
+
+
+_QUERY_MMAP_BYTES = 256 * 1024 * 1024
+
+
+def _open_read_only_connection(db_path: Path) -> sqlite3.Connection:
+    """
+    Open a read-only connection to a snapshot database.
+
+    Snapshot databases are never modified after their build, so the connection is opened with
+    ``immutable=1``, which skips file locking and change detection, and memory-maps the file.
+
+    :param db_path: SQLite database path.
+    :type db_path: Path
+    :return: Read-only connection usable from any thread.
+    :rtype: sqlite3.Connection
+    """
+    connection = sqlite3.connect(
+        f"{db_path.resolve().as_uri()}?mode=ro&immutable=1",
+        uri=True,
+        check_same_thread=False,
+    )
+    connection.execute(f"PRAGMA mmap_size={_QUERY_MMAP_BYTES}")
+    return connection
+
+
+class _ReadOnlyConnectionPool:
+    """
+    Thread-local read-only connections keyed by snapshot database path.
+
+    Each thread gets its own connection per database, and every connection is tracked so
+    :meth:`close` can release them all from the owning thread.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+        self._opened = 0
+        self._reused = 0
+
+    def acquire(self, db_path: Path) -> sqlite3.Connection:
+        """
+        Return this thread's connection to a database, opening it on first use.
+
+        :param db_path: SQLite database path.
+        :type db_path: Path
+        :return: Read-only connection.
+        :rtype: sqlite3.Connection
+        """
+        connections: Optional[Dict[str, sqlite3.Connection]] = getattr(
+            self._local, "connections", None
         )
+        if connections is None:
+            connections = {}
+            self._local.connections = connections
+        key = str(db_path)
+        connection = connections.get(key)
+        if connection is not None:
+            with self._lock:
+                self._reused += 1
+            return connection
+        connection = _open_read_only_connection(db_path)
+        connections[key] = connection
+        with self._lock:
+            self._connections.append(connection)
+            self._opened += 1
+        return connection
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Report connection reuse counters.
+
+        :return: Connections opened, connection reuses, and the reuse rate.
+        :rtype: dict[str, float]
+        """
+        with self._lock:
+            acquired = self._opened + self._reused
+            return {
+                "connections_opened": self._opened,
+                "connection_reuses": self._reused,
+                "connection_reuse_rate": self._reused / acquired if acquired else 0.0,
+            }
+
+    def close(self) -> None:
+        """
+        Close every pooled connection. Call only when no queries are running.
+
+        :return: None.
+        :rtype: None
+        """
+        with self._lock:
+            connections = self._connections
+            self._connections = []
+            self._local = threading.local()
+        for connection in connections:
+            connection.close()
 
 
 def _candidate_limit(max_total_items: int) -> int:
@@ -431,6 +628,23 @@ def _apply_rerank_if_enabled(
     return apply_budget(ranked, budget)
 
 
+def _open_snapshot_configuration(
+    snapshot: RetrievalSnapshot,
+) -> Tuple[SqliteFullTextSearchConfiguration, Set[str]]:
+    """
+    Parse the configuration of a snapshot and resolve its stop words.
+
+    :param snapshot: Snapshot manifest.
+    :type snapshot: RetrievalSnapshot
+    :return: Parsed configuration and stop words.
+    :rtype: tuple[SqliteFullTextSearchConfiguration, set[str]]
+    """
+    parsed_config = SqliteFullTextSearchConfiguration.model_validate(
+        snapshot.configuration.configuration
+    )
+    return parsed_config, _resolve_stop_words(parsed_config.stop_words)
+
+
 def _resolve_snapshot_db_path(corpus: Corpus, snapshot: RetrievalSnapshot) -> Path:
     """
     Resolve the SQLite index path for a retrieval snapshot.
@@ -495,6 +709,57 @@ def _create_full_text_search_schema(conn: sqlite3.Connection) -> None:
     )
 
 
+def _create_item_fingerprint_schema(conn: sqlite3.Connection) -> None:
+    """
+    Create the table that records which chunk rows belong to each indexed item.
+
+    Incremental builds compare these fingerprints with the current catalog and delete chunk
+    rows by rowid range for items that changed or were removed.
+
+    :param conn: SQLite connection for schema creation.
+    :type conn: sqlite3.Connection
+    :return: None.
+    :rtype: None
+    """
+    conn.execute(
+        """
+        CREATE TABLE indexed_items (
+            item_id TEXT PRIMARY KEY,
+            fingerprint TEXT NOT NULL,
+            has_text INTEGER NOT NULL,
+            first_rowid INTEGER,
+            last_rowid INTEGER
+        )
+        """
+    )
+
+
+_BUILD_PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA journal_mode=OFF",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA cache_size=-262144",
+    "PRAGMA temp_store=MEMORY",
+)
+
+_INSERT_CHUNK_SQL = """
+    INSERT INTO chunks_full_text_search (
+        rowid,
+        content,
+        item_id,
+        source_uri,
+        media_type,
+        relpath,
+        title,
+        start_offset,
+        end_offset
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INDEX_BUILD_ONLY_FIELDS = frozenset({"build_workers", "insert_batch_size", "parent_snapshot"})
+
+ChunkRow = Tuple[str, str, Optional[str], str, str, Optional[str], int, int]
+
+
 def _build_full_text_search_index(
     *,
     db_path: Path,
@@ -502,10 +767,18 @@ def _build_full_text_search_index(
     items: Iterable[object],
     configuration: SqliteFullTextSearchConfiguration,
     extraction_reference: Optional[ExtractionSnapshotReference],
+    parent_db_path: Optional[Path] = None,
 ) -> Dict[str, int]:
     """
     Build a full-text search index from corpus items.
 
+    The index is written in one transaction with journaling and fsync disabled, since a failed
+    build leaves nothing worth recovering. Chunk rows are inserted in batches with executemany,
+    and the full-text search segments are merged with the optimize command before closing.
+
+    When a parent database is given it is copied first, and only items whose fingerprint
+    changed are re-chunked; chunks of changed and removed items are deleted by rowid range.
+
     :param db_path: Destination SQLite database path.
     :type db_path: Path
     :param corpus: Corpus containing the items.
@@ -514,74 +787,311 @@ def _build_full_text_search_index(
     :type items: Iterable[object]
     :param configuration: Chunking and snippet configuration.
     :type configuration: SqliteFullTextSearchConfiguration
+    :param extraction_reference: Optional extraction snapshot reference.
+    :type extraction_reference: ExtractionSnapshotReference or None
+    :param parent_db_path: Optional database of a compatible parent snapshot to update.
+    :type parent_db_path: Path or None
     :return: Index statistics.
     :rtype: dict[str, int]
     """
     if db_path.exists():
         db_path.unlink()
+    if parent_db_path is not None:
+        shutil.copyfile(parent_db_path, db_path)
     connection = sqlite3.connect(str(db_path))
     try:
-        _ensure_full_text_search_version_five(connection)
-        _create_full_text_search_schema(connection)
-        chunk_count = 0
-        item_count = 0
-        text_item_count = 0
-        for catalog_item in items:
-            item_count += 1
-            media_type = getattr(catalog_item, "media_type", "")
-            relpath = getattr(catalog_item, "relpath", "")
-            item_text = _load_text_from_item(
-                corpus,
-                item_id=str(getattr(catalog_item, "id", "")),
-                relpath=str(relpath),
-                media_type=str(media_type),
-                extraction_reference=extraction_reference,
+        if parent_db_path is None:
+            # The probe creates and drops the chunks table, so it only runs on fresh databases.
+            _ensure_full_text_search_version_five(connection)
+        for pragma in _BUILD_PRAGMAS:
+            connection.execute(pragma)
+        if parent_db_path is None:
+            _create_full_text_search_schema(connection)
+            _create_item_fingerprint_schema(connection)
+        indexed = {
+            item_id: (fingerprint, first_rowid, last_rowid)
+            for item_id, fingerprint, first_rowid, last_rowid in connection.execute(
+                "SELECT item_id, fingerprint, first_rowid, last_rowid FROM indexed_items"
+            )
+        }
+        catalog_items = list(items)
+        fingerprints = {
+            str(getattr(catalog_item, "id", "")): _item_fingerprint(
+                catalog_item, extraction_reference
             )
-            if item_text is None:
+            for catalog_item in catalog_items
+        }
+        stale_item_ids = {
+            item_id
+            for item_id, (fingerprint, _, _) in indexed.items()
+            if fingerprints.get(item_id) != fingerprint
+        }
+        connection.executemany(
+            "DELETE FROM chunks_full_text_search WHERE rowid BETWEEN ? AND ?",
+            [
+                (indexed[item_id][1], indexed[item_id][2])
+                for item_id in stale_item_ids
+                if indexed[item_id][1] is not None
+            ],
+        )
+        connection.executemany(
+            "DELETE FROM indexed_items WHERE item_id = ?",
+            [(item_id,) for item_id in stale_item_ids],
+        )
+        changed_items = [
+            catalog_item
+            for catalog_item in catalog_items
+            if str(getattr(catalog_item, "id", "")) not in indexed
+            or str(getattr(catalog_item, "id", "")) in stale_item_ids
+        ]
+        max_rowid = connection.execute("SELECT MAX(rowid) FROM chunks_full_text_search").fetchone()
+        next_rowid = (max_rowid[0] or 0) + 1
+        pending_rows: List[Tuple[object, ...]] = []
+        item_records: List[Tuple[str, str, int, Optional[int], Optional[int]]] = []
+        for catalog_item, item_rows in _iter_item_chunk_rows(
+            corpus,
+            changed_items,
+            configuration=configuration,
+            extraction_reference=extraction_reference,
+        ):
+            item_id = str(getattr(catalog_item, "id", ""))
+            if item_rows is None:
+                item_records.append((item_id, fingerprints[item_id], 0, None, None))
                 continue
-            text_item_count += 1
-            title = getattr(catalog_item, "title", None)
-            for start_offset, end_offset, chunk in _iter_chunks(
-                item_text,
-                chunk_size=configuration.chunk_size,
-                chunk_overlap=configuration.chunk_overlap,
-            ):
-                connection.execute(
-                    """
-                    INSERT INTO chunks_full_text_search (
-                        content,
-                        item_id,
-                        source_uri,
-                        media_type,
-                        relpath,
-                        title,
-                        start_offset,
-                        end_offset
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        chunk,
-                        str(getattr(catalog_item, "id")),
-                        getattr(catalog_item, "source_uri", None),
-                        str(media_type),
-                        str(relpath),
-                        str(title) if title is not None else None,
-                        start_offset,
-                        end_offset,
-                    ),
-                )
-                chunk_count += 1
+            first_rowid = next_rowid if item_rows else None
+            for row in item_rows:
+                pending_rows.append((next_rowid,) + row)
+                next_rowid += 1
+            last_rowid = next_rowid - 1 if item_rows else None
+            item_records.append((item_id, fingerprints[item_id], 1, first_rowid, last_rowid))
+            if len(pending_rows) >= configuration.insert_batch_size:
+                connection.executemany(_INSERT_CHUNK_SQL, pending_rows)
+                pending_rows = []
+        connection.executemany(_INSERT_CHUNK_SQL, pending_rows)
+        connection.executemany(
+            "INSERT INTO indexed_items (item_id, fingerprint, has_text, first_rowid, last_rowid) "
+            "VALUES (?, ?, ?, ?, ?)",
+            item_records,
+        )
+        connection.execute(
+            "INSERT INTO chunks_full_text_search(chunks_full_text_search) VALUES ('optimize')"
+        )
         connection.commit()
+        text_item_count, chunk_count = connection.execute(
+            """
+            SELECT
+                COALESCE(SUM(has_text), 0),
+                COALESCE(SUM(last_rowid - first_rowid + 1), 0)
+            FROM indexed_items
+            """
+        ).fetchone()
         return {
-            "items": item_count,
+            "items": len(catalog_items),
             "text_items": text_item_count,
             "chunks": chunk_count,
             "bytes": db_path.stat().st_size if db_path.exists() else 0,
+            "reindexed_items": len(changed_items),
+            "removed_items": len(stale_item_ids - fingerprints.keys()),
         }
     finally:
         connection.close()
 
 
+def _item_fingerprint(
+    catalog_item: object, extraction_reference: Optional[ExtractionSnapshotReference]
+) -> str:
+    """
+    Fingerprint everything about a catalog item that ends up in its indexed chunk rows.
+
+    :param catalog_item: Catalog item.
+    :type catalog_item: object
+    :param extraction_reference: Optional extraction snapshot reference used for item text.
+    :type extraction_reference: ExtractionSnapshotReference or None
+    :return: Hex digest that changes whenever the item's chunk rows would change.
+    :rtype: str
+    """
+    title = getattr(catalog_item, "title", None)
+    payload = [
+        str(getattr(catalog_item, "sha256", "")),
+        str(getattr(catalog_item, "relpath", "")),
+        str(getattr(catalog_item, "media_type", "")),
+        str(title) if title is not None else None,
+        getattr(catalog_item, "source_uri", None),
+        extraction_reference.as_string() if extraction_reference else None,
+    ]
+    return hashlib.sha256(json.dumps(payload).encode("utf-8")).hexdigest()
+
+
+def _resolve_parent_snapshot(
+    corpus: Corpus, configuration: SqliteFullTextSearchConfiguration, *, retriever_id: str
+) -> Optional[RetrievalSnapshot]:
+    """
+    Resolve the parent snapshot named by a configuration.
+
+    :param corpus: Corpus associated with the configuration.
+    :type corpus: Corpus
+    :param configuration: Parsed retriever configuration.
+    :type configuration: SqliteFullTextSearchConfiguration
+    :param retriever_id: Retriever identifier used to resolve ``latest``.
+    :type retriever_id: str
+    :return: Parent snapshot or None when no parent is configured or none exists yet.
+    :rtype: RetrievalSnapshot or None
+    :raises FileNotFoundError: If an explicitly named parent snapshot does not exist.
+    """
+    if not configuration.parent_snapshot:
+        return None
+    snapshot_id: Optional[str] = configuration.parent_snapshot
+    if snapshot_id == "latest":
+        snapshot_id = corpus.latest_retriever_snapshot_id(retriever_id)
+        if snapshot_id is None:
+            return None
+    return corpus.load_snapshot(snapshot_id)
+
+
+def _incremental_parent_db_path(
+    corpus: Corpus,
+    parent_snapshot: Optional[RetrievalSnapshot],
+    configuration: SqliteFullTextSearchConfiguration,
+) -> Optional[Path]:
+    """
+    Return the parent database to update, or None when a full build is required.
+
+    A parent is usable when it was built by this retriever with the same index configuration
+    (ignoring build-only fields), its database exists, and it records item fingerprints.
+
+    :param corpus: Corpus associated with the snapshots.
+    :type corpus: Corpus
+    :param parent_snapshot: Candidate parent snapshot.
+    :type parent_snapshot: RetrievalSnapshot or None
+    :param configuration: Parsed configuration for the new snapshot.
+    :type configuration: SqliteFullTextSearchConfiguration
+    :return: Parent database path or None.
+    :rtype: Path or None
+    """
+    if parent_snapshot is None or not parent_snapshot.snapshot_artifacts:
+        return None
+    if parent_snapshot.configuration.retriever_id != SqliteFullTextSearchRetriever.retriever_id:
+        return None
+    parent_configuration = SqliteFullTextSearchConfiguration.model_validate(
+        parent_snapshot.configuration.configuration
+    )
+    if parent_configuration.model_dump(
+        exclude=_INDEX_BUILD_ONLY_FIELDS
+    ) != configuration.model_dump(exclude=_INDEX_BUILD_ONLY_FIELDS):
+        return None
+    parent_db_path = corpus.root / parent_snapshot.snapshot_artifacts[0]
+    if not parent_db_path.is_file():
+        return None
+    connection = sqlite3.connect(str(parent_db_path))
+    try:
+        has_fingerprints = connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'indexed_items'"
+        ).fetchone()
+    finally:
+        connection.close()
+    return parent_db_path if has_fingerprints else None
+
+
+def _iter_item_chunk_rows(
+    corpus: Corpus,
+    items: Iterable[object],
+    *,
+    configuration: SqliteFullTextSearchConfiguration,
+    extraction_reference: Optional[ExtractionSnapshotReference],
+) -> Iterator[Tuple[object, Optional[List[ChunkRow]]]]:
+    """
+    Load and chunk catalog items, yielding each item with its chunk rows in catalog order.
+
+    With more than one build worker, items are loaded and chunked in a thread pool that runs
+    ahead of the caller by a bounded number of items, so the SQLite writer never waits on
+    file reads while memory stays bounded.
+
+    :param corpus: Corpus containing the items.
+    :type corpus: Corpus
+    :param items: Catalog items to load.
+    :type items: Iterable[object]
+    :param configuration: Chunking configuration.
+    :type configuration: SqliteFullTextSearchConfiguration
+    :param extraction_reference: Optional extraction snapshot reference.
+    :type extraction_reference: ExtractionSnapshotReference or None
+    :return: Each item paired with its chunk rows, or None for items without text.
+    :rtype: Iterator[tuple[object, list[tuple] or None]]
+    """
+    if configuration.build_workers <= 1:
+        for catalog_item in items:
+            yield catalog_item, _item_chunk_rows(
+                corpus,
+                catalog_item,
+                configuration=configuration,
+                extraction_reference=extraction_reference,
+            )
+        return
+    max_pending = configuration.build_workers * 4
+    pending: Deque[Tuple[object, Future]] = deque()
+    with ThreadPoolExecutor(max_workers=configuration.build_workers) as executor:
+        for catalog_item in items:
+            future = executor.submit(
+                _item_chunk_rows,
+                corpus,
+                catalog_item,
+                configuration=configuration,
+                extraction_reference=extraction_reference,
+            )
+            pending.append((catalog_item, future))
+            if len(pending) >= max_pending:
+                pending_item, pending_future = pending.popleft()
+                yield pending_item, pending_future.result()
+        while pending:
+            pending_item, pending_future = pending.popleft()
+            yield pending_item, pending_future.result()
+
+
+def _item_chunk_rows(
+    corpus: Corpus,
+    catalog_item: object,
+    *,
+    configuration: SqliteFullTextSearchConfiguration,
+    extraction_reference: Optional[ExtractionSnapshotReference],
+) -> Optional[List[ChunkRow]]:
+    """
+    Load one catalog item and split its text into chunk rows.
+
+    :param corpus: Corpus containing the item.
+    :type corpus: Corpus
+    :param catalog_item: Catalog item to load.
+    :type catalog_item: object
+    :param configuration: Chunking configuration.
+    :type configuration: SqliteFullTextSearchConfiguration
+    :param extraction_reference: Optional extraction snapshot reference.
+    :type extraction_reference: ExtractionSnapshotReference or None
+    :return: Chunk rows ready for insertion, or None if the item has no text.
+    :rtype: list[tuple] or None
+    """
+    media_type = str(getattr(catalog_item, "media_type", ""))
+    relpath = str(getattr(catalog_item, "relpath", ""))
+    item_id = str(getattr(catalog_item, "id", ""))
+    item_text = _load_text_from_item(
+        corpus,
+        item_id=item_id,
+        relpath=relpath,
+        media_type=media_type,
+        extraction_reference=extraction_reference,
+    )
+    if item_text is None:
+        return None
+    source_uri = getattr(catalog_item, "source_uri", None)
+    title = getattr(catalog_item, "title", None)
+    title_text = str(title) if title is not None else None
+    return [
+        (chunk, item_id, source_uri, media_type, relpath, title_text, start_offset, end_offset)
+        for start_offset, end_offset, chunk in _iter_chunks(
+            item_text,
+            chunk_size=configuration.chunk_size,
+            chunk_overlap=configuration.chunk_overlap,
+        )
+    ]
+
+
 def _load_text_from_item(
     corpus: Corpus,
     *,
@@ -701,53 +1211,82 @@ def _query_full_text_search_index(
     :return: Evidence candidates.
     :rtype: list[Evidence]
     """
-    connection = sqlite3.connect(str(db_path))
+    connection = _open_read_only_connection(db_path)
     try:
-        rows = connection.execute(
-            """
-            SELECT
-                content,
-                item_id,
-                source_uri,
-                media_type,
-                start_offset,
-                end_offset,
-                bm25(chunks_full_text_search) AS score
-            FROM chunks_full_text_search
-            WHERE chunks_full_text_search MATCH ?
-            ORDER BY score
-            LIMIT ?
-            """,
-            (query_text, limit),
-        ).fetchall()
-        evidence_items: List[Evidence] = []
-        for (
+        return _query_full_text_search_connection(
+            connection,
+            query_text=query_text,
+            limit=limit,
+            snippet_characters=snippet_characters,
+        )
+    finally:
+        connection.close()
+
+
+def _query_full_text_search_connection(
+    connection: sqlite3.Connection,
+    *,
+    query_text: str,
+    limit: int,
+    snippet_characters: int,
+) -> List[Evidence]:
+    """
+    Query an open SQLite full-text search connection for evidence candidates.
+
+    :param connection: Open SQLite connection to the snapshot database.
+    :type connection: sqlite3.Connection
+    :param query_text: Query text to execute.
+    :type query_text: str
+    :param limit: Maximum number of candidates to return.
+    :type limit: int
+    :param snippet_characters: Snippet length budget.
+    :type snippet_characters: int
+    :return: Evidence candidates.
+    :rtype: list[Evidence]
+    """
+    rows = connection.execute(
+        """
+        SELECT
             content,
             item_id,
             source_uri,
             media_type,
             start_offset,
             end_offset,
-            score,
-        ) in rows:
-            snippet_text = content[:snippet_characters]
-            evidence_items.append(
-                Evidence(
-                    item_id=str(item_id),
-                    source_uri=str(source_uri) if source_uri is not None else None,
-                    media_type=str(media_type),
-                    score=float(-score),
-                    rank=1,
-                    text=snippet_text,
-                    content_ref=None,
-                    span_start=int(start_offset) if start_offset is not None else None,
-                    span_end=int(end_offset) if end_offset is not None else None,
-                    stage="full-text-search",
-                    configuration_id="",
-                    snapshot_id="",
-                    hash=hash_text(snippet_text),
-                )
+            bm25(chunks_full_text_search) AS score
+        FROM chunks_full_text_search
+        WHERE chunks_full_text_search MATCH ?
+        ORDER BY score
+        LIMIT ?
+        """,
+        (query_text, limit),
+    ).fetchall()
+    evidence_items: List[Evidence] = []
+    for (
+        content,
+        item_id,
+        source_uri,
+        media_type,
+        start_offset,
+        end_offset,
+        score,
+    ) in rows:
+        snippet_text = content[:snippet_characters]
+        evidence_items.append(
+            Evidence(
+                item_id=str(item_id),
+                source_uri=str(source_uri) if source_uri is not None else None,
+                media_type=str(media_type),
+                score=float(-score),
+                rank=1,
+                text=snippet_text,
+                content_ref=None,
+                span_start=int(start_offset) if start_offset is not None else None,
+                span_end=int(end_offset) if end_offset is not None else None,
+                stage="full-text-search",
+                configuration_id="",
+                snapshot_id="",
+                hash=hash_text(snippet_text),
             )
-        return evidence_items
-    finally:
-        connection.close()
+        )
+    return evidence_items
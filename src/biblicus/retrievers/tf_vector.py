@@ -4,15 +4,19 @@ Deterministic term-frequency vector retriever.
 
 from __future__ import annotations
 
+import json
 import math
 import re
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from pydantic import BaseModel, ConfigDict, model_validator
 
+from ..constants import RETRIEVAL_DIR_NAME
 from ..corpus import Corpus
 from ..frontmatter import parse_front_matter
 from ..models import (
+    CatalogItem,
     Evidence,
     ExtractionSnapshotReference,
     QueryBudget,
@@ -27,6 +31,9 @@ from ..retrieval import (
     hash_text,
 )
 from ..time import utc_now_iso
+from .base import Retriever
+
+POSTINGS_SCHEMA_VERSION = 1
 
 
 class TfVectorConfiguration(BaseModel):
@@ -61,7 +68,7 @@ class TfVectorConfiguration(BaseModel):
         return self
 
 
-class TfVectorRetriever:
+class TfVectorRetriever(Retriever):
     """
     Deterministic vector retriever using term-frequency cosine similarity.
 
@@ -75,7 +82,7 @@ class TfVectorRetriever:
         self, corpus: Corpus, *, configuration_name: str, configuration: Dict[str, object]
     ) -> RetrievalSnapshot:
         """
-        Register a vector retriever snapshot (no snapshot artifacts).
+        Build a postings-list index over the corpus and register a snapshot.
 
         :param corpus: Corpus to build against.
         :type corpus: Corpus
@@ -93,16 +100,35 @@ class TfVectorRetriever:
             name=configuration_name,
             configuration=parsed_config.model_dump(),
         )
-        stats = {
-            "items": len(catalog.items),
-            "text_items": _count_text_items(corpus, catalog.items.values(), parsed_config),
-        }
         snapshot = create_snapshot_manifest(
             corpus,
             configuration=configuration_manifest,
-            stats=stats,
+            stats={},
             snapshot_artifacts=[],
         )
+        postings_relpath = str(
+            Path(RETRIEVAL_DIR_NAME)
+            / self.retriever_id
+            / snapshot.snapshot_id
+            / f"{snapshot.snapshot_id}.postings.json"
+        )
+        extraction_reference = _resolve_extraction_reference(corpus, parsed_config)
+        postings_index, text_items = _build_postings_index(
+            corpus, catalog.items.values(), extraction_reference=extraction_reference
+        )
+        _write_postings_index(corpus.root / postings_relpath, postings_index)
+        stats = {
+            "items": len(catalog.items),
+            "text_items": text_items,
+            "documents": len(postings_index["item_ids"]),
+            "terms": len(postings_index["postings"]),
+            "extraction_snapshot": (
+                extraction_reference.as_string() if extraction_reference is not None else None
+            ),
+        }
+        snapshot = snapshot.model_copy(
+            update={"snapshot_artifacts": [postings_relpath], "stats": stats}
+        )
         corpus.write_snapshot(snapshot)
         return snapshot
 
@@ -128,58 +154,113 @@ class TfVectorRetriever:
         :return: Retrieval results containing evidence.
         :rtype: RetrievalResult
         """
-        parsed_config = TfVectorConfiguration.model_validate(snapshot.configuration.configuration)
-        query_tokens = _tokenize_text(query_text)
-        if not query_tokens:
-            return RetrievalResult(
-                query_text=query_text,
-                budget=budget,
-                snapshot_id=snapshot.snapshot_id,
-                configuration_id=snapshot.configuration.configuration_id,
-                retriever_id=snapshot.configuration.retriever_id,
-                generated_at=utc_now_iso(),
-                evidence=[],
-                stats={"candidates": 0, "returned": 0},
-            )
-        query_vector = _term_frequencies(query_tokens)
-        query_norm = _vector_norm(query_vector)
-        catalog = corpus.load_catalog()
-        extraction_reference = _resolve_extraction_reference(corpus, parsed_config)
-        scored_candidates = _score_items(
-            corpus,
-            catalog.items.values(),
-            query_tokens=query_tokens,
-            query_vector=query_vector,
-            query_norm=query_norm,
-            extraction_reference=extraction_reference,
-            snippet_characters=parsed_config.snippet_characters,
+        results = self.query_batch(
+            corpus, snapshot=snapshot, query_texts=[query_text], budget=budget
         )
-        sorted_candidates = sorted(
-            scored_candidates,
-            key=lambda evidence_item: (-evidence_item.score, evidence_item.item_id),
+        return results[0]
+
+    def query_batch(
+        self,
+        corpus: Corpus,
+        *,
+        snapshot: RetrievalSnapshot,
+        query_texts: Sequence[str],
+        budget: QueryBudget,
+    ) -> List[RetrievalResult]:
+        """
+        Query the corpus with several query texts, loading the postings index once.
+
+        Only documents that share at least one term with a query are scored, and item text is
+        read only for candidates the budget inspects. Snapshots built without a postings index
+        fall back to scoring every catalog item.
+
+        :param corpus: Corpus associated with the snapshot.
+        :type corpus: Corpus
+        :param snapshot: Snapshot manifest to use for querying.
+        :type snapshot: RetrievalSnapshot
+        :param query_texts: Query texts to execute.
+        :type query_texts: Sequence[str]
+        :param budget: Evidence selection budget applied to every query.
+        :type budget: QueryBudget
+        :return: Retrieval results in query order.
+        :rtype: list[RetrievalResult]
+        """
+        parsed_config, extraction_reference, postings_index = self.snapshot_state(
+            snapshot, lambda: _open_snapshot(corpus, snapshot)
         )
-        ranked = [
-            evidence_item.model_copy(
-                update={
-                    "rank": index,
-                    "configuration_id": snapshot.configuration.configuration_id,
-                    "snapshot_id": snapshot.snapshot_id,
-                }
+        catalog = corpus.load_catalog()
+        results: List[RetrievalResult] = []
+        for query_text in query_texts:
+            query_tokens = _tokenize_text(query_text)
+            if not query_tokens:
+                results.append(
+                    RetrievalResult(
+                        query_text=query_text,
+                        budget=budget,
+                        snapshot_id=snapshot.snapshot_id,
+                        configuration_id=snapshot.configuration.configuration_id,
+                        retriever_id=snapshot.configuration.retriever_id,
+                        generated_at=utc_now_iso(),
+                        evidence=[],
+                        stats={"candidates": 0, "returned": 0},
+                    )
+                )
+                continue
+            query_vector = _term_frequencies(query_tokens)
+            query_norm = _vector_norm(query_vector)
+            if postings_index is None:
+                scored_candidates = _score_items(
+                    corpus,
+                    catalog.items.values(),
+                    query_tokens=query_tokens,
+                    query_vector=query_vector,
+                    query_norm=query_norm,
+                    extraction_reference=extraction_reference,
+                    snippet_characters=parsed_config.snippet_characters,
+                )
+                sorted_candidates: Iterable[Evidence] = sorted(
+                    scored_candidates,
+                    key=lambda evidence_item: (-evidence_item.score, evidence_item.item_id),
+                )
+                candidate_count = len(scored_candidates)
+            else:
+                ranked_documents = _score_postings(
+                    postings_index, query_vector=query_vector, query_norm=query_norm
+                )
+                sorted_candidates = _iter_postings_evidence(
+                    corpus,
+                    catalog.items,
+                    ranked_documents=ranked_documents,
+                    query_tokens=query_tokens,
+                    extraction_reference=extraction_reference,
+                    snippet_characters=parsed_config.snippet_characters,
+                )
+                candidate_count = len(ranked_documents)
+            ranked = (
+                evidence_item.model_copy(
+                    update={
+                        "rank": index,
+                        "configuration_id": snapshot.configuration.configuration_id,
+                        "snapshot_id": snapshot.snapshot_id,
+                    }
+                )
+                for index, evidence_item in enumerate(sorted_candidates, start=1)
             )
-            for index, evidence_item in enumerate(sorted_candidates, start=1)
-        ]
-        evidence = apply_budget(ranked, budget)
-        stats = {"candidates": len(sorted_candidates), "returned": len(evidence)}
-        return RetrievalResult(
-            query_text=query_text,
-            budget=budget,
-            snapshot_id=snapshot.snapshot_id,
-            configuration_id=snapshot.configuration.configuration_id,
-            retriever_id=snapshot.configuration.retriever_id,
-            generated_at=utc_now_iso(),
-            evidence=evidence,
-            stats=stats,
-        )
+            evidence = apply_budget(ranked, budget)
+            stats = {"candidates": candidate_count, "returned": len(evidence)}
+            results.append(
+                RetrievalResult(
+                    query_text=query_text,
+                    budget=budget,
+                    snapshot_id=snapshot.snapshot_id,
+                    configuration_id=snapshot.configuration.configuration_id,
+                    retriever_id=snapshot.configuration.retriever_id,
+                    generated_at=utc_now_iso(),
+                    evidence=evidence,
+                    stats=stats,
+                )
+            )
+        return results
 
 
 def _resolve_extraction_reference(
@@ -208,40 +289,6 @@ def _resolve_extraction_reference(
     return extraction_reference
 
 
-def _count_text_items(
-    corpus: Corpus, items: Iterable[object], configuration: TfVectorConfiguration
-) -> int:
-    """
-    Count catalog items that represent text content.
-
-    :param corpus: Corpus containing the items.
-    :type corpus: Corpus
-    :param items: Catalog items to inspect.
-    :type items: Iterable[object]
-    :param configuration: Parsed vector configuration.
-    :type configuration: TfVectorConfiguration
-    :return: Number of text items.
-    :rtype: int
-    """
-    text_item_count = 0
-    extraction_reference = _resolve_extraction_reference(corpus, configuration)
-    for catalog_item in items:
-        item_id = str(getattr(catalog_item, "id", ""))
-        if extraction_reference and item_id:
-            extracted_text = corpus.read_extracted_text(
-                extractor_id=extraction_reference.extractor_id,
-                snapshot_id=extraction_reference.snapshot_id,
-                item_id=item_id,
-            )
-            if isinstance(extracted_text, str) and extracted_text.strip():
-                text_item_count += 1
-                continue
-        media_type = getattr(catalog_item, "media_type", "")
-        if media_type == "text/markdown" or str(media_type).startswith("text/"):
-            text_item_count += 1
-    return text_item_count
-
-
 def _tokenize_text(text: str) -> List[str]:
     """
     Tokenize text into lowercase word tokens.
@@ -454,26 +501,288 @@ def _score_items(
         )
         if similarity <= 0:
             continue
-        span = _find_first_match(item_text, query_tokens)
-        span_start = span[0] if span else None
-        span_end = span[1] if span else None
-        evidence_text = _build_snippet(item_text, span, max_chars=snippet_characters)
         evidence_items.append(
-            Evidence(
-                item_id=str(getattr(catalog_item, "id")),
-                source_uri=getattr(catalog_item, "source_uri", None),
-                media_type=str(media_type),
-                score=float(similarity),
-                rank=1,
-                text=evidence_text,
-                content_ref=None,
-                span_start=span_start,
-                span_end=span_end,
-                stage="tf-vector",
-                configuration_id="",
-                snapshot_id="",
-                metadata=getattr(catalog_item, "metadata", {}) or {},
-                hash=hash_text(evidence_text or ""),
+            _build_evidence(
+                catalog_item,
+                item_text=item_text,
+                similarity=similarity,
+                query_tokens=query_tokens,
+                snippet_characters=snippet_characters,
             )
         )
     return evidence_items
+
+
+def _build_evidence(
+    catalog_item: object,
+    *,
+    item_text: str,
+    similarity: float,
+    query_tokens: List[str],
+    snippet_characters: Optional[int],
+) -> Evidence:
+    """
+    Build an evidence candidate for a scored catalog item.
+
+    :param catalog_item: Catalog item the evidence refers to.
+    :type catalog_item: object
+    :param item_text: Text payload of the item.
+    :type item_text: str
+    :param similarity: Cosine similarity between the query and the item.
+    :type similarity: float
+    :param query_tokens: Tokenized query text.
+    :type query_tokens: list[str]
+    :param snippet_characters: Optional maximum character count for returned evidence text.
+    :type snippet_characters: int or None
+    :return: Evidence candidate with a provisional rank.
+    :rtype: Evidence
+    """
+    span = _find_first_match(item_text, query_tokens)
+    span_start = span[0] if span else None
+    span_end = span[1] if span else None
+    evidence_text = _build_snippet(item_text, span, max_chars=snippet_characters)
+    return Evidence(
+        item_id=str(getattr(catalog_item, "id")),
+        source_uri=getattr(catalog_item, "source_uri", None),
+        media_type=str(getattr(catalog_item, "media_type", "")),
+        score=float(similarity),
+        rank=1,
+        text=evidence_text,
+        content_ref=None,
+        span_start=span_start,
+        span_end=span_end,
+        stage="tf-vector",
+        configuration_id="",
+        snapshot_id="",
+        metadata=getattr(catalog_item, "metadata", {}) or {},
+        hash=hash_text(evidence_text or ""),
+    )
+
+
+def _build_postings_index(
+    corpus: Corpus,
+    items: Iterable[object],
+    *,
+    extraction_reference: Optional[ExtractionSnapshotReference],
+) -> Tuple[Dict[str, Any], int]:
+    """
+    Build a postings-list index from catalog items.
+
+    Each term maps to parallel lists of document positions and term frequencies, and each
+    document records its item identifier and term-frequency vector norm. Items with text are
+    counted in the same pass, including text items without any tokens.
+
+    :param corpus: Corpus containing the items.
+    :type corpus: Corpus
+    :param items: Catalog items to index.
+    :type items: Iterable[object]
+    :param extraction_reference: Optional extraction snapshot reference.
+    :type extraction_reference: ExtractionSnapshotReference or None
+    :return: Postings index with schema_version, item_ids, norms, and postings keys, and the
+        text item count.
+    :rtype: tuple[dict[str, Any], int]
+    """
+    text_items = 0
+    item_ids: List[str] = []
+    norms: List[float] = []
+    postings: Dict[str, Dict[str, List[int]]] = {}
+    for catalog_item in sorted(items, key=lambda item: str(getattr(item, "id", ""))):
+        item_id = str(getattr(catalog_item, "id", ""))
+        item_text = _load_text_from_item(
+            corpus,
+            item_id=item_id,
+            relpath=getattr(catalog_item, "relpath", ""),
+            media_type=str(getattr(catalog_item, "media_type", "")),
+            extraction_reference=extraction_reference,
+        )
+        if item_text is None:
+            continue
+        text_items += 1
+        tokens = _tokenize_text(item_text)
+        if not tokens:
+            continue
+        vector = _term_frequencies(tokens)
+        document = len(item_ids)
+        item_ids.append(item_id)
+        norms.append(_vector_norm(vector))
+        for term, frequency in vector.items():
+            posting = postings.setdefault(term, {"documents": [], "frequencies": []})
+            posting["documents"].append(document)
+            posting["frequencies"].append(int(frequency))
+    postings_index = {
+        "schema_version": POSTINGS_SCHEMA_VERSION,
+        "item_ids": item_ids,
+        "norms": norms,
+        "postings": postings,
+    }
+    return postings_index, text_items
+
+
+def _write_postings_index(path: Path, postings_index: Dict[str, Any]) -> None:
+    """
+    Write a postings index artifact as JavaScript Object Notation.
+
+    :param path: Destination path.
+    :type path: Path
+    :param postings_index: Postings index to write.
+    :type postings_index: dict[str, Any]
+    :return: None.
+    :rtype: None
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(postings_index, sort_keys=True, separators=(",", ":")), encoding="utf-8"
+    )
+
+
+def _read_postings_index(path: Path) -> Dict[str, Any]:
+    """
+    Read a postings index artifact.
+
+    :param path: Artifact path.
+    :type path: Path
+    :return: Postings index.
+    :rtype: dict[str, Any]
+    :raises ValueError: If the artifact schema version is not supported.
+    """
+    postings_index = json.loads(path.read_text(encoding="utf-8"))
+    if postings_index.get("schema_version") != POSTINGS_SCHEMA_VERSION:
+        raise ValueError(
+            f"Unsupported tf-vector postings index schema version: "
+            f"{postings_index.get('schema_version')}"
+        )
+    return postings_index
+
+
+def _open_snapshot(
+    corpus: Corpus, snapshot: RetrievalSnapshot
+) -> Tuple[TfVectorConfiguration, Optional[ExtractionSnapshotReference], Optional[Dict[str, Any]]]:
+    """
+    Open the configuration and postings index of a snapshot for querying.
+
+    Evidence text is read from the extraction snapshot recorded when the postings index was
+    built, so it always matches the text that was scored. Snapshots that do not record one
+    resolve the reference from their configuration.
+
+    :param corpus: Corpus associated with the snapshot.
+    :type corpus: Corpus
+    :param snapshot: Snapshot manifest.
+    :type snapshot: RetrievalSnapshot
+    :return: Parsed configuration, extraction reference, and postings index.
+    :rtype: tuple[TfVectorConfiguration, ExtractionSnapshotReference or None, dict or None]
+    """
+    parsed_config = TfVectorConfiguration.model_validate(snapshot.configuration.configuration)
+    if "extraction_snapshot" in snapshot.stats:
+        recorded_reference = snapshot.stats["extraction_snapshot"]
+        extraction_reference = (
+            parse_extraction_snapshot_reference(str(recorded_reference))
+            if recorded_reference
+            else None
+        )
+    else:
+        extraction_reference = _resolve_extraction_reference(corpus, parsed_config)
+    return parsed_config, extraction_reference, _load_snapshot_postings_index(corpus, snapshot)
+
+
+def _load_snapshot_postings_index(
+    corpus: Corpus, snapshot: RetrievalSnapshot
+) -> Optional[Dict[str, Any]]:
+    """
+    Load the postings index recorded for a snapshot.
+
+    :param corpus: Corpus associated with the snapshot.
+    :type corpus: Corpus
+    :param snapshot: Snapshot manifest.
+    :type snapshot: RetrievalSnapshot
+    :return: Postings index, or None for snapshots built without one.
+    :rtype: dict[str, Any] or None
+    :raises FileNotFoundError: If the snapshot records a postings index that is missing.
+    """
+    if not snapshot.snapshot_artifacts:
+        return None
+    postings_path = corpus.root / snapshot.snapshot_artifacts[0]
+    if not postings_path.is_file():
+        raise FileNotFoundError("Tf-vector postings index is missing for this snapshot")
+    return _read_postings_index(postings_path)
+
+
+def _score_postings(
+    postings_index: Dict[str, Any], *, query_vector: Dict[str, float], query_norm: float
+) -> List[Tuple[str, float]]:
+    """
+    Score the documents that share at least one term with a query.
+
+    :param postings_index: Postings index.
+    :type postings_index: dict[str, Any]
+    :param query_vector: Query term-frequency vector.
+    :type query_vector: dict[str, float]
+    :param query_norm: Query vector norm.
+    :type query_norm: float
+    :return: Item identifiers and cosine similarities, highest score first.
+    :rtype: list[tuple[str, float]]
+    """
+    postings = postings_index["postings"]
+    dots: Dict[int, float] = {}
+    for term, query_frequency in query_vector.items():
+        posting = postings.get(term)
+        if posting is None:
+            continue
+        for document, frequency in zip(posting["documents"], posting["frequencies"]):
+            dots[document] = dots.get(document, 0.0) + query_frequency * frequency
+    item_ids = postings_index["item_ids"]
+    norms = postings_index["norms"]
+    scored = [
+        (item_ids[document], dot / (query_norm * norms[document])) for document, dot in dots.items()
+    ]
+    return sorted(scored, key=lambda pair: (-pair[1], pair[0]))
+
+
+def _iter_postings_evidence(
+    corpus: Corpus,
+    catalog_items: Dict[str, CatalogItem],
+    *,
+    ranked_documents: List[Tuple[str, float]],
+    query_tokens: List[str],
+    extraction_reference: Optional[ExtractionSnapshotReference],
+    snippet_characters: Optional[int],
+) -> Iterator[Evidence]:
+    """
+    Yield evidence for ranked documents, reading item text only when a candidate is consumed.
+
+    Documents whose catalog item was removed or is no longer readable as text are skipped.
+
+    :param corpus: Corpus containing the items.
+    :type corpus: Corpus
+    :param catalog_items: Catalog items keyed by identifier.
+    :type catalog_items: dict[str, CatalogItem]
+    :param ranked_documents: Item identifiers and similarities, highest score first.
+    :type ranked_documents: list[tuple[str, float]]
+    :param query_tokens: Tokenized query text.
+    :type query_tokens: list[str]
+    :param extraction_reference: Optional extraction snapshot reference.
+    :type extraction_reference: ExtractionSnapshotReference or None
+    :param snippet_characters: Optional maximum character count for returned evidence text.
+    :type snippet_characters: int or None
+    :return: Evidence candidates in ranked order.
+    :rtype: Iterator[Evidence]
+    """
+    for item_id, similarity in ranked_documents:
+        catalog_item = catalog_items.get(item_id)
+        if catalog_item is None:
+            continue
+        item_text = _load_text_from_item(
+            corpus,
+            item_id=item_id,
+            relpath=catalog_item.relpath,
+            media_type=catalog_item.media_type,
+            extraction_reference=extraction_reference,
+        )
+        if item_text is None:
+            continue
+        yield _build_evidence(
+            catalog_item,
+            item_text=item_text,
+            similarity=similarity,
+            query_tokens=query_tokens,
+            snippet_characters=snippet_characters,
+        )
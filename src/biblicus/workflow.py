@@ -9,7 +9,11 @@ from typing import Any, Callable, Dict, List, Optional
 from pydantic import BaseModel, ConfigDict, Field
 
 from .corpus import Corpus
-from .extraction import build_extraction_snapshot, create_extraction_configuration_manifest
+from .extraction import (
+    DEFAULT_EXTRACTION_BATCH_SIZE,
+    build_extraction_snapshot,
+    create_extraction_configuration_manifest,
+)
 from .models import ExtractionSnapshotListEntry, RetrievalSnapshot
 from .retrieval import create_configuration_manifest
 from .retrievers import get_retriever
@@ -279,6 +283,9 @@ def build_default_handler_registry(
         pipeline_config = task.metadata.get("pipeline") or _default_pipeline_config()
         force = bool(task.metadata.get("force", False))
         max_workers = int(task.metadata.get("max_workers", 1))
+        executor = str(task.metadata.get("executor", "thread"))
+        cache = bool(task.metadata.get("cache", True))
+        batch_size = int(task.metadata.get("batch_size", DEFAULT_EXTRACTION_BATCH_SIZE))
         return build_extraction_snapshot(
             corpus,
             extractor_id="pipeline",
@@ -286,6 +293,9 @@ def build_default_handler_registry(
             configuration=pipeline_config,
             force=force,
             max_workers=max_workers,
+            executor=executor,
+            cache=cache,
+            batch_size=batch_size,
         )
 
     def _handle_index(task: Task) -> Any:
@@ -308,6 +318,9 @@ def build_plan_for_extract(
     load_handler_available: bool = False,
     force: bool = False,
     max_workers: int = 1,
+    executor: str = "thread",
+    cache: bool = True,
+    batch_size: int = DEFAULT_EXTRACTION_BATCH_SIZE,
 ) -> Plan:
     """
     Build a dependency plan for corpus extraction.
@@ -322,6 +335,12 @@ def build_plan_for_extract(
     :type force: bool
     :param max_workers: Maximum number of concurrent extraction workers.
     :type max_workers: int
+    :param executor: Extraction worker kind, ``thread`` or ``process``.
+    :type executor: str
+    :param cache: Whether extraction uses the corpus extraction cache.
+    :type cache: bool
+    :param batch_size: Maximum number of items passed to a batching extractor at once.
+    :type batch_size: int
     :return: Planned task graph for extraction.
     :rtype: Plan
     """
@@ -346,6 +365,9 @@ def build_plan_for_extract(
             "pipeline": pipeline_config,
             "force": force,
             "max_workers": max_workers,
+            "executor": executor,
+            "cache": cache,
+            "batch_size": batch_size,
         },
     )
 